@@ -0,0 +1,72 @@
+"""
+Cold-start import time of dri, measured with ``python -X importtime``.
+
+Every statement runs in a fresh interpreter so that nothing is cached in
+``sys.modules``. ``import dri.dri`` loads every submodule and matches what
+``import dri`` used to cost before the package was split.
+
+Usage::
+
+    python benchmarks/import_time.py [--runs 20]
+
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+STATEMENTS = (
+    "import dri",
+    "from dri import Resolve",
+    "from dri import Timeline",
+    "import dri.dri",
+)
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def cumulative_us(statement: str) -> int:
+    """
+    Returns the cumulative import time of the ``dri`` package and its submodules in
+    microseconds, as reported by ``-X importtime``.
+
+    """
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented and already counted in their parent's time.
+        if name.startswith(" dri"):
+            total += int(cumulative)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'statement':<28}{'median':>12}{'min':>12}")
+    for statement in STATEMENTS:
+        samples = [cumulative_us(statement) for _ in range(args.runs)]
+        print(
+            f"{statement:<28}{statistics.median(samples) / 1000:>10.2f}ms"
+            f"{min(samples) / 1000:>10.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
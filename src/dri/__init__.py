@@ -1 +1,115 @@
-from dri.dri import *
+"""
+Python type stubs for the DaVinci Resolve scripting API.
+
+Every class lives in its own submodule, which is imported on first attribute access
+(PEP 562), so that ``from dri import Resolve`` does not load the whole API.
+
+"""
+
+import importlib
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from dri._types import (
+        LiteralMarkerColor,
+        LiteralFlagColor,
+        LiteralClipColor,
+        RenderSetting,
+        TimelineImportOption,
+        ClipInfo,
+        Metadata,
+        ThumbnailData,
+        ImportOption,
+    )
+    from dri.color_group import ColorGroup
+    from dri.enums import KeyframeMode, ExportType, CloudSync, SyncMode
+    from dri.errors import (
+        DriError,
+        FusionScriptError,
+        FusionScriptNotFoundError,
+        FusionScriptLoadError,
+        UnsupportedPlatformError,
+        ResolveConnectionError,
+        RenderJobError,
+        MissingMediaError,
+        TimelineExportError,
+        RenderSettingsError,
+    )
+    from dri.folder import Folder
+    from dri.fusion_comp import FusionComp
+    from dri.gallery import Gallery, GalleryStillAlbum, GalleryStill
+    from dri.graph import Graph
+    from dri.loader import (
+        FUSIONSCRIPT_PATHS,
+        fusionscript_path,
+        load_dynamic_lib,
+        clear_dynamic_lib_cache,
+    )
+    from dri.media_pool import MediaPool
+    from dri.media_pool_item import MediaPoolItem
+    from dri.media_storage import MediaStorage
+    from dri.project import Project
+    from dri.project_manager import ProjectManager
+    from dri.resolve import Resolve
+    from dri.timeline import Timeline
+    from dri.timeline_item import TimelineItem
+
+_LAZY_ATTRS = {
+    "DriError": "dri.errors",
+    "FusionScriptError": "dri.errors",
+    "FusionScriptNotFoundError": "dri.errors",
+    "FusionScriptLoadError": "dri.errors",
+    "UnsupportedPlatformError": "dri.errors",
+    "ResolveConnectionError": "dri.errors",
+    "RenderJobError": "dri.errors",
+    "MissingMediaError": "dri.errors",
+    "TimelineExportError": "dri.errors",
+    "RenderSettingsError": "dri.errors",
+    "FUSIONSCRIPT_PATHS": "dri.loader",
+    "fusionscript_path": "dri.loader",
+    "load_dynamic_lib": "dri.loader",
+    "clear_dynamic_lib_cache": "dri.loader",
+    "KeyframeMode": "dri.enums",
+    "ExportType": "dri.enums",
+    "CloudSync": "dri.enums",
+    "SyncMode": "dri.enums",
+    "Resolve": "dri.resolve",
+    "ProjectManager": "dri.project_manager",
+    "Project": "dri.project",
+    "MediaStorage": "dri.media_storage",
+    "MediaPool": "dri.media_pool",
+    "Folder": "dri.folder",
+    "MediaPoolItem": "dri.media_pool_item",
+    "Timeline": "dri.timeline",
+    "TimelineItem": "dri.timeline_item",
+    "Gallery": "dri.gallery",
+    "GalleryStillAlbum": "dri.gallery",
+    "GalleryStill": "dri.gallery",
+    "Graph": "dri.graph",
+    "ColorGroup": "dri.color_group",
+    "FusionComp": "dri.fusion_comp",
+    "LiteralMarkerColor": "dri._types",
+    "LiteralFlagColor": "dri._types",
+    "LiteralClipColor": "dri._types",
+    "RenderSetting": "dri._types",
+    "TimelineImportOption": "dri._types",
+    "ClipInfo": "dri._types",
+    "Metadata": "dri._types",
+    "ThumbnailData": "dri._types",
+    "ImportOption": "dri._types",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+if TYPE_CHECKING:
+    from dri.folder import Folder
+    from dri.media_pool_item import MediaPoolItem
+
+
+LiteralMarkerColor = Literal[
+    "All",
+    "Blue",
+    "Cyan",
+    "Green",
+    "Yellow",
+    "Red",
+    "Pink",
+    "Purple",
+    "Fuchsia",
+    "Rose",
+    "Lavender",
+    "Sky",
+    "Mint",
+    "Lemon",
+    "Sand",
+    "Cocoa",
+    "Cream",
+]
+
+
+LiteralFlagColor = Literal[
+    "All",
+    "Blue",
+    "Cyan",
+    "Green",
+    "Yellow",
+    "Red",
+    "Pink",
+    "Purple",
+    "Fuchsia",
+    "Rose",
+    "Lavender",
+    "Sky",
+    "Mint",
+    "Lemon",
+    "Sand",
+    "Cocoa",
+    "Cream",
+]
+
+
+LiteralClipColor = Literal[
+    "Orange",
+    "Apricot",
+    "Yellow",
+    "Lime",
+    "Olive",
+    "Green",
+    "Teal",
+    "Navy",
+    "Blue",
+    "Purple",
+    "Violet",
+    "Pink",
+    "Tan",
+    "Beige",
+    "Brown",
+    "Chocolate",
+]
+
+
+class RenderSetting(TypedDict):
+    SelectAllFrames: bool
+    MarkIn: int
+    MarkOut: int
+    TargetDir: str
+    CustomName: str
+    UniqueFilenameStyle: Literal[0, 1]  # 0 - Prefix, 1 - Suffix
+    ExportVideo: bool
+    ExportAudio: bool
+    FormatWidth: int
+    FormatHeight: int
+    FrameRate: float  # Example: 23.976, 24
+    # For SD resolution: "16_9" or "4_3", other resolution: "square" or "cinemascope"
+    PixelAspectRatio: str
+    # "VideoQuality" possible values for current codec (if applicable):
+    #  - 0 (int) - will set quality to automatic
+    #  - [1 -> MAX] (int) - will set input bit rate
+    #  - ["Least", "Low", "Medium", "High", "Best"] (string) - will set input quality level
+    VideoQuality: int | str
+    AudioCodec: str  # Example: "aac"
+    AudioBitDepth: int
+    AudioSampleRate: int
+    ColorSpaceTag: str  # Example: "Same as Project", "ACES (AP0)"
+    GammaTag: str  # Example: "Same as Project", "ACEScct"
+    ExportAlpha: bool
+    EncodingProfile: str  # Example: "Main10". Can only be set for H.264 and H.265.
+    MultiPassEncode: bool  # Can only be set for H.264.
+    # 0 - Premultiplied, 1 - Straight. Can only be set for H.264 and H.265.
+    AlphaMode: Literal[0, 1]
+    NetworkOptimization: bool
+    ClipStartFrame: int
+    TimelineStartTimecode: str
+    ReplaceExistingFilesInPlace: bool
+    ExportSubtitle: bool
+    SubtitleFormat: str
+
+
+@dataclass
+class TimelineImportOption:
+    """
+    For :func:`ImportTimelineFromFile()` use.
+
+    Attributes
+    ----------
+    timelineName : str
+        Specifies the name of the timeline to be created. Not valid for DRT import.
+    sourceClipsPath : str
+        Specifies a filesystem path to search for source clips if the media is
+        inaccessible in their original path and if "importSourceClips" is True.
+    sourceClipsFolders : list[Folder]
+        List of Media Pool folder objects to search for source clips if the media is not
+        present in the current folder and if "importSourceClips" is False. Not valid for
+        DRT import.
+    interlaceProcessing : bool
+        Specifies whether to enable interlace processing on the imported timeline being
+        created. Valid only for AAF import.
+    importSourceClips : bool, optional
+        Specifies whether source clips should be imported. True by default. Not valid
+        for DRT import.
+
+    """
+
+    timelineName: str
+    sourceClipsPath: str
+    sourceClipsFolders: list["Folder"]
+    interlaceProcessing: bool
+    importSourceClips: bool = True
+
+
+@dataclass
+class ClipInfo:
+    """
+    Information about a clip for API usage as argument.
+
+    Attributes
+    ----------
+    mediaPoolItem : MediaPoolItem
+        The media pool item associated with the clip.
+    startFrame : int
+        The starting frame of the clip. Optional. If not specified, using 0.
+    endFrame : int
+        The ending frame of the clip. Optional. If no specified, using the last frame.
+    mediaType : Literal[1, 2]
+        The type of media for the clip. Optional. 1: Video only, 2: Audio only.
+    trackIndex : int
+        Indicates which track of the timeline the clip will be inserted into. Optional.
+    recordFrame: int
+        Indicates where in the timeline the clip will be inserted, in Frames. Optional.
+
+    Notes
+    -----
+    trackIndex
+
+    -   If there is only one video track in the timeline: V1, then if trackIndex is
+        set to 2, which means the clip will be inserted into the timeline's video
+        track 2, then the API will automatically add video track V2 and insert the
+        clip into V2.
+
+    -   However, the API does not work if the trackIndex is set to 3 or more when
+        only one video track V1 exists. The clip will still be inserted into V1.
+
+    Examples
+    --------
+    >>> clip_info = {
+    ...     "mediaPoolItem": MediaPoolItem,
+    ...     "startFrame": 0,
+    ...     "endFrame": 12,
+    ...     "mediaType": 1
+    ...     "trackIndex": 2,
+    ...     "recordFrame": 86400,
+    ... }
+
+    """
+
+    mediaPoolItem: "MediaPoolItem"
+    startFrame: int = 0
+    endFrame: int = 0
+    mediaType: Literal[1, 2] = 1  # 1 - Video only, 2 - Audio only
+    recordFrame: int = 0
+    trackIndex: int = 0
+
+
+# TODO This Metadata class is incomplete
+class Metadata(TypedDict):
+    """
+    For SetMetadata() and GetMetadata() use.
+
+    """
+
+    Description: str
+    Comments: str
+    Keywords: str
+    People: str
+    # ClipColor: ClipColor
+    Shot: str
+    Scene: str
+    Take: str
+    Angle: str
+    Move: str
+
+    # In order to access this field, use "Day / Night" instead of "Day_Night"
+    Day_Night: str
+
+    # In order to access this field, use "Good Take" instead of "Good_Take"
+    Good_Take: Literal["true", "false"]
+
+
+@dataclass
+class ThumbnailData:
+    width: int
+    height: int
+    format: str
+    data: str
+
+
+class ImportOption:
+    """
+    For :func:`ImportIntoTimeline` use.
+
+    Attributes
+    ----------
+    autoImportSourceClipsIntoMediaPool
+        Specifies if source clips should be imported into media pool, True by default.
+    ignoreFileExtensionsWhenMatching
+        Specifies if file extensions should be ignored when matching, False by default.
+    linkToSourceCameraFiles
+        Specifies if link to source camera files should be enabled, False by default.
+    useSizingInfo
+        Specifies if sizing information should be used, False by default.
+    importMultiChannelAudioTracksAsLinkedGroups
+        Specifies if multichannel audio tracks should be imported as linked groups,
+        False by default
+    insertAdditionalTracks
+        Specifies if additional tracks should be inserted, True by default.
+    insertWithOffset
+        specifies insert with offset value in timecode format - defaults to
+        "00:00:00:00", applicable if "insertAdditionalTracks" is False.
+    sourceClipsPath
+        specifies a filesystem path to search for source clips if the media is
+        inaccessible in their original path and if "ignoreFileExtensionsWhenMatching"
+        is True.
+    sourceClipsFolder
+        list of Media Pool folder objects to search for source clips if the media is not
+        present in current folder.
+
+    """
+
+    autoImportSourceClipsIntoMediaPool: bool = True
+    ignoreFileExtensionsWhenMatching: bool = False
+    linkToSourceCameraFiles: bool = False
+    useSizingInfo: bool = False
+    importMultiChannelAudioTracksAsLinkedGroups: bool = False
+    insertAdditionalTracks: bool = True
+    insertWithOffset: str = "00:00:00:00"
+    sourceClipsPath: str = ""
+    sourceClipsFolder: str
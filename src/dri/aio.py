@@ -0,0 +1,493 @@
+"""
+asyncio facade for the scripting API.
+
+Every scripting API call blocks until Resolve answers, and the objects returned by
+``fusionscript`` must not be used from several threads at once. :class:`AsyncResolve`
+runs every call on one dedicated worker thread and exposes the API as coroutines, so an
+event loop can drive render monitoring, ingest and network services side by side.
+
+Objects returned by a call are wrapped in the matching facade class
+(:class:`AsyncProject`, :class:`AsyncTimeline`, ...), chosen from the return annotation
+of the method in the ``dri`` stubs, and share the worker thread of the
+:class:`AsyncResolve` they came from. Use :meth:`AsyncObject.run` to make many calls in
+a single hop to the worker thread.
+
+Examples
+--------
+>>> import asyncio
+>>> from dri.aio import AsyncResolve
+...
+>>> async def main():
+...     async with await AsyncResolve.connect() as resolve:
+...         project_manager = await resolve.GetProjectManager()
+...         project = await project_manager.GetCurrentProject()
+...         await project.SetRenderSettings({"TargetDir": "/Volumes/Renders"})
+...         job_id = await project.AddRenderJob()
+...         await project.StartRendering([job_id])
+...         return await project.wait_render(job_id)
+>>> asyncio.run(main())
+{'JobStatus': 'Complete', 'CompletionPercentage': 100, 'TimeTakenToRenderInMs': 48312}
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Optional
+
+_SCALARS = (str, bytes, int, float, bool, type(None))
+
+_NAME = re.compile(r"[A-Z]\w*")
+
+_FINISHED = ("Complete", "Failed", "Cancelled")
+
+# Facade class by API class name, filled in by AsyncObject.__init_subclass__.
+_FACADES: dict[str, type[AsyncObject]] = {}
+
+
+class AsyncObject:
+    """
+    Facade of one API object whose methods are coroutines run on the worker thread.
+
+    ``await obj.Method(*args)`` calls ``Method`` of the wrapped object on the worker
+    thread. Facades passed as arguments are unwrapped, API objects in the result are
+    wrapped.
+
+    """
+
+    __slots__ = ("_executor", "_target")
+
+    # (module, class) of the stub whose return annotations pick the facade of results.
+    _stub: Optional[tuple[str, str]] = None
+    _return_types: dict[str, Optional[type[AsyncObject]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._return_types = {}
+        if cls._stub is not None:
+            _FACADES[cls._stub[1]] = cls
+
+    def __init__(self, target, executor: ThreadPoolExecutor):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_executor", executor)
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        target, executor = self._target, self._executor
+        facade = self._facade_for(name)
+
+        async def method(*args, **kwargs):
+            def call():
+                return getattr(target, name)(
+                    *(_unwrap(arg) for arg in args),
+                    **{key: _unwrap(value) for key, value in kwargs.items()},
+                )
+
+            result = await _submit(executor, call)
+            return _wrap(result, executor, facade)
+
+        method.__name__ = name
+        return method
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} attributes are read-only")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, AsyncObject):
+            other = other._target
+        return self._target == other
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._target!r})"
+
+    @classmethod
+    def _facade_for(cls, name: str) -> Optional[type[AsyncObject]]:
+        try:
+            return cls._return_types[name]
+        except KeyError:
+            pass
+        facade = None
+        if cls._stub is not None:
+            module_name, class_name = cls._stub
+            stub = getattr(importlib.import_module(module_name), class_name)
+            annotation = getattr(stub, name, None)
+            annotation = getattr(annotation, "__annotations__", {}).get("return")
+            if isinstance(annotation, str):
+                for word in _NAME.findall(annotation):
+                    if word in _FACADES:
+                        facade = _FACADES[word]
+                        break
+        cls._return_types[name] = facade
+        return facade
+
+    def unwrap(self):
+        """
+        Returns the wrapped API object. Only use it on the worker thread, e.g. inside
+        :meth:`run`.
+
+        """
+        return self._target
+
+    async def run(self, function: Callable[..., Any], *args) -> Any:
+        """
+        Runs ``function(obj, *args)`` on the worker thread with the wrapped API object,
+        to make several calls in a single hop. API objects in the result are wrapped
+        in :class:`AsyncObject`.
+
+        Examples
+        --------
+        >>> names = await timeline.run(
+        ...     lambda timeline: [
+        ...         item.GetName() for item in timeline.GetItemListInTrack("video", 1)
+        ...     ]
+        ... )
+
+        """
+        target = self._target
+        unwrapped = [_unwrap(arg) for arg in args]
+        result = await _submit(self._executor, lambda: function(target, *unwrapped))
+        return _wrap(result, self._executor, AsyncObject)
+
+
+async def _submit(executor: ThreadPoolExecutor, function: Callable[[], Any]) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(executor, function)
+
+
+def _wrap(value, executor: ThreadPoolExecutor, facade: Optional[type[AsyncObject]]):
+    if isinstance(value, _SCALARS) or isinstance(value, AsyncObject):
+        return value
+    if isinstance(value, list):
+        return [_wrap(item, executor, facade) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_wrap(item, executor, facade) for item in value)
+    if isinstance(value, dict):
+        return {key: _wrap(item, executor, facade) for key, item in value.items()}
+    return (facade or AsyncObject)(value, executor)
+
+
+def _unwrap(value):
+    if isinstance(value, AsyncObject):
+        return value._target
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+class AsyncResolve(AsyncObject):
+    """
+    Facade of :class:`~dri.resolve.Resolve` that owns the worker thread.
+
+    Parameters
+    ----------
+    resolve
+        The ``Resolve`` object to wrap. Prefer :meth:`connect`, which creates it on the
+        worker thread.
+    executor
+        Single-thread executor to run calls on. A new one is created if not given and
+        shut down by :meth:`close`.
+
+    """
+
+    __slots__ = ("_owns_executor",)
+    _stub = ("dri.resolve", "Resolve")
+
+    def __init__(self, resolve, executor: Optional[ThreadPoolExecutor] = None):
+        owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dri")
+        super().__init__(resolve, executor)
+        object.__setattr__(self, "_owns_executor", owns_executor)
+
+    @classmethod
+    async def connect(cls, path: Optional[str] = None) -> AsyncResolve:
+        """
+        Connects to DaVinci Resolve on a new worker thread, see
+        :meth:`Resolve.resolve_init <dri.resolve.Resolve.resolve_init>`.
+
+        Raises
+        ------
+        FusionScriptError
+            If fusionscript cannot be loaded.
+        ResolveConnectionError
+            If DaVinci Resolve is not running.
+
+        """
+        from dri.resolve import Resolve
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dri")
+        try:
+            resolve = await _submit(executor, lambda: Resolve.resolve_init(path))
+        except BaseException:
+            executor.shutdown(wait=False)
+            raise
+        self = cls(resolve, executor)
+        object.__setattr__(self, "_owns_executor", True)
+        return self
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._executor
+
+    async def close(self) -> None:
+        """
+        Waits for pending calls and stops the worker thread, if this object created
+        it.
+
+        """
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._executor.shutdown
+            )
+
+    async def __aenter__(self) -> AsyncResolve:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class AsyncProjectManager(AsyncObject):
+    """
+    Facade of :class:`~dri.project_manager.ProjectManager`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.project_manager", "ProjectManager")
+
+
+class AsyncProject(AsyncObject):
+    """
+    Facade of :class:`~dri.project.Project`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.project", "Project")
+
+    async def wait_render(
+        self,
+        job_id: str,
+        min_interval: float = 0.25,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        timeout: Optional[float] = None,
+        progress: Optional[Callable[[dict], Any]] = None,
+    ) -> dict:
+        """
+        Waits until a render job has completed, failed or been cancelled.
+
+        The job is polled with ``GetRenderJobStatus``. The interval grows by `backoff`
+        while the completion percentage does not change, up to `max_interval`, and is
+        capped at the remaining time Resolve estimates.
+
+        Parameters
+        ----------
+        job_id
+            Render job's ID, which must have been started with ``StartRendering``.
+        min_interval, max_interval
+            Bounds of the poll interval, in seconds.
+        backoff
+            Factor the interval grows by while the job makes no progress.
+        timeout
+            Give up after this many seconds.
+        progress
+            Called with the status dict whenever the completion percentage changes.
+
+        Returns
+        -------
+        dict
+            Final ``GetRenderJobStatus`` result.
+
+        Raises
+        ------
+        KeyError
+            If the job does not exist.
+        TimeoutError
+            If `timeout` expires first.
+
+        """
+        target = self._target
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = min_interval
+        last_percentage = None
+        while True:
+            status = await _submit(
+                self._executor, lambda: target.GetRenderJobStatus(job_id)
+            )
+            if not status:
+                raise KeyError(job_id)
+            if status.get("JobStatus") in _FINISHED:
+                return status
+            percentage = status.get("CompletionPercentage")
+            if percentage != last_percentage:
+                last_percentage = percentage
+                if progress is not None:
+                    progress(status)
+            else:
+                interval = min(interval * backoff, max_interval)
+            wait = interval
+            if "EstimatedTimeRemainingInMs" in status:
+                eta = int(status["EstimatedTimeRemainingInMs"]) / 1000
+                wait = min(wait, max(eta, min_interval))
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"Render job {job_id} did not finish in time")
+                wait = min(wait, remaining)
+            await asyncio.sleep(wait)
+
+
+class AsyncMediaStorage(AsyncObject):
+    """
+    Facade of :class:`~dri.media_storage.MediaStorage`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.media_storage", "MediaStorage")
+
+
+class AsyncMediaPool(AsyncObject):
+    """
+    Facade of :class:`~dri.media_pool.MediaPool`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.media_pool", "MediaPool")
+
+
+class AsyncFolder(AsyncObject):
+    """
+    Facade of :class:`~dri.folder.Folder`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.folder", "Folder")
+
+
+class AsyncMediaPoolItem(AsyncObject):
+    """
+    Facade of :class:`~dri.media_pool_item.MediaPoolItem`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.media_pool_item", "MediaPoolItem")
+
+
+class AsyncTimeline(AsyncObject):
+    """
+    Facade of :class:`~dri.timeline.Timeline`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.timeline", "Timeline")
+
+    async def items(self, track_type: str = "video") -> list[AsyncTimelineItem]:
+        """
+        Returns the items of every track of `track_type` in one hop to the worker
+        thread.
+
+        """
+
+        def collect(timeline):
+            found = []
+            for track_index in range(1, timeline.GetTrackCount(track_type) + 1):
+                found.extend(timeline.GetItemListInTrack(track_type, track_index) or [])
+            return found
+
+        target = self._target
+        return _wrap(
+            await _submit(self._executor, lambda: collect(target)),
+            self._executor,
+            AsyncTimelineItem,
+        )
+
+
+class AsyncTimelineItem(AsyncObject):
+    """
+    Facade of :class:`~dri.timeline_item.TimelineItem`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.timeline_item", "TimelineItem")
+
+
+class AsyncGallery(AsyncObject):
+    """
+    Facade of :class:`~dri.gallery.Gallery`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.gallery", "Gallery")
+
+
+class AsyncGalleryStillAlbum(AsyncObject):
+    """
+    Facade of :class:`~dri.gallery.GalleryStillAlbum`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.gallery", "GalleryStillAlbum")
+
+
+class AsyncGalleryStill(AsyncObject):
+    """
+    Facade of :class:`~dri.gallery.GalleryStill`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.gallery", "GalleryStill")
+
+
+class AsyncGraph(AsyncObject):
+    """
+    Facade of :class:`~dri.graph.Graph`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.graph", "Graph")
+
+
+class AsyncColorGroup(AsyncObject):
+    """
+    Facade of :class:`~dri.color_group.ColorGroup`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.color_group", "ColorGroup")
+
+
+class AsyncFusionComp(AsyncObject):
+    """
+    Facade of :class:`~dri.fusion_comp.FusionComp`.
+
+    """
+
+    __slots__ = ()
+    _stub = ("dri.fusion_comp", "FusionComp")
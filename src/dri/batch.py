@@ -0,0 +1,581 @@
+"""
+Batch jobs across the projects of one or more project databases.
+
+Loading a project is by far the most expensive step of a job that visits many of them.
+:class:`ProjectInventory` walks the project folders of each database once, with
+``GotoRootFolder``/``OpenFolder``/``GetProjectListInCurrentFolder``, and caches the
+tree in a JSON file for later runs. :class:`BatchRunner` then visits the selected
+projects grouped by database and folder, so it switches databases and folders as few
+times as possible, loads each project once and runs every task that applies to it
+before closing it. It saves a project only when a task that modifies it succeeded.
+
+Each finished project is appended to a checkpoint file, so an interrupted run resumes
+where it stopped, and its load, task, save and close times are recorded.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.batch import BatchRunner, ProjectInventory, Task
+...
+>>> resolve = Resolve.resolve_init()
+>>> project_manager = resolve.GetProjectManager()
+>>> inventory = ProjectInventory.load(project_manager, "/var/cache/dri/inventory.json")
+>>> inventory
+<ProjectInventory 412 projects in 3 databases>
+>>> runner = BatchRunner(
+...     project_manager,
+...     [
+...         Task("timelines", lambda project, ref: project.GetTimelineCount()),
+...         Task("cache", set_cache_mode, save=True),
+...     ],
+...     checkpoint="/var/cache/dri/nightly.jsonl",
+... )
+>>> report = runner.run(inventory.select(lambda ref: ref.folder[:1] == ("Features",)))
+>>> report
+<BatchReport projects=212 failed=1 resumed=0 load=1288.4s>
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import NamedTuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+    from dri.project import Project
+    from dri.project_manager import ProjectManager
+
+
+class ProjectRef(NamedTuple):
+    """
+    Location of a project: its database, folder path and name.
+
+    """
+
+    db_type: str
+    db_name: str
+    ip_address: str
+    folder: tuple[str, ...]
+    name: str
+
+    @property
+    def database(self) -> tuple[str, str, str]:
+        return self.db_type, self.db_name, self.ip_address
+
+    @property
+    def key(self) -> str:
+        """
+        Identifier of the project, unique across databases, used by checkpoints. The
+        database is written "name@address" for network databases.
+
+        """
+        database = self.db_name
+        if self.ip_address:
+            database = f"{database}@{self.ip_address}"
+        return "/".join((self.db_type, database, *self.folder, self.name))
+
+    def db_info(self) -> dict[str, str]:
+        """
+        Returns the ``SetCurrentDatabase`` dict of the project's database.
+
+        """
+        info = {"DbType": self.db_type, "DbName": self.db_name}
+        if self.ip_address:
+            info["IpAddress"] = self.ip_address
+        return info
+
+
+def _database(info: dict) -> tuple[str, str, str]:
+    return (
+        info.get("DbType", "Disk"),
+        info.get("DbName", ""),
+        info.get("IpAddress", ""),
+    )
+
+
+class ProjectInventory:
+    """
+    Projects of a set of databases, in folder order.
+
+    Building an inventory closes the current project: switching databases does.
+
+    Parameters
+    ----------
+    projects
+        The projects.
+    scanned_at
+        ``time.time()`` of the scan.
+
+    """
+
+    def __init__(self, projects: Iterable[ProjectRef], scanned_at: float = 0.0):
+        self.projects = list(projects)
+        self.scanned_at = scanned_at
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def __iter__(self) -> Iterator[ProjectRef]:
+        return iter(self.projects)
+
+    def __repr__(self) -> str:
+        databases = len({ref.database for ref in self.projects})
+        return (
+            f"<ProjectInventory {len(self.projects)} projects in {databases} databases>"
+        )
+
+    @classmethod
+    def scan(
+        cls,
+        project_manager: ProjectManager,
+        databases: Optional[Iterable[dict]] = None,
+    ) -> ProjectInventory:
+        """
+        Walks the project folders of `databases`, all of ``GetDatabaseList()`` by
+        default. Databases that cannot be selected are skipped.
+
+        """
+        if databases is None:
+            databases = project_manager.GetDatabaseList() or []
+        scanned_at = time.time()
+        projects: list[ProjectRef] = []
+        for info in databases:
+            db_type, db_name, ip_address = _database(info)
+            if not project_manager.SetCurrentDatabase(dict(info)):
+                continue
+            project_manager.GotoRootFolder()
+            path: list[str] = []
+
+            def read_folder() -> list[str]:
+                for name in project_manager.GetProjectListInCurrentFolder() or []:
+                    projects.append(
+                        ProjectRef(db_type, db_name, ip_address, tuple(path), name)
+                    )
+                subfolders = list(project_manager.GetFolderListInCurrentFolder() or [])
+                subfolders.reverse()
+                return subfolders
+
+            # Depth first, one list of subfolders left to visit per level of `path`.
+            pending = [read_folder()]
+            while pending:
+                if not pending[-1]:
+                    pending.pop()
+                    if path:
+                        project_manager.GotoParentFolder()
+                        path.pop()
+                    continue
+                name = pending[-1].pop()
+                if not project_manager.OpenFolder(name):
+                    continue
+                path.append(name)
+                pending.append(read_folder())
+        return cls(projects, scanned_at)
+
+    @classmethod
+    def load(
+        cls,
+        project_manager: ProjectManager,
+        cache_path: Union[str, os.PathLike],
+        max_age: float = 24 * 3600,
+        databases: Optional[Iterable[dict]] = None,
+    ) -> ProjectInventory:
+        """
+        Returns the inventory cached at `cache_path` if it is younger than `max_age`
+        seconds, else scans the databases and caches the result.
+
+        """
+        try:
+            inventory = cls.read(cache_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            inventory = None
+        if inventory is not None and time.time() - inventory.scanned_at <= max_age:
+            return inventory
+        inventory = cls.scan(project_manager, databases)
+        inventory.write(cache_path)
+        return inventory
+
+    @classmethod
+    def read(cls, path: Union[str, os.PathLike]) -> ProjectInventory:
+        """
+        Reads an inventory written by :meth:`write`.
+
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(
+            (
+                ProjectRef(
+                    project["db_type"],
+                    project["db_name"],
+                    project["ip_address"],
+                    tuple(project["folder"]),
+                    project["name"],
+                )
+                for project in data["projects"]
+            ),
+            float(data["scanned_at"]),
+        )
+
+    def write(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Writes the inventory as JSON, atomically.
+
+        """
+        data = {
+            "scanned_at": self.scanned_at,
+            "projects": [ref._asdict() for ref in self.projects],
+        }
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temporary, path)
+
+    def select(self, predicate: Callable[[ProjectRef], bool]) -> list[ProjectRef]:
+        """
+        Returns the projects `predicate` accepts.
+
+        """
+        return [ref for ref in self.projects if predicate(ref)]
+
+    def folders(self) -> list[tuple[str, str, tuple[str, ...]]]:
+        """
+        Returns the (database type, database name, folder path) of every folder holding
+        projects, in inventory order.
+
+        """
+        return list(
+            dict.fromkeys((ref.db_type, ref.db_name, ref.folder) for ref in self)
+        )
+
+
+class Task(NamedTuple):
+    """
+    Work to run on each project of a batch.
+
+    Attributes
+    ----------
+    name : str
+        Name of the task in reports and checkpoints.
+    run : Callable[[Project, ProjectRef], Any]
+        Called with the loaded project and its reference; its return value is kept in
+        the :class:`ProjectResult`.
+    save : bool
+        Whether the task modifies the project, which is then saved once all tasks ran
+        if at least one such task succeeded.
+    applies : Callable[[ProjectRef], bool] or None
+        Selects the projects the task runs on, all by default. Projects no task
+        applies to are not loaded.
+
+    """
+
+    name: str
+    run: Callable[[Project, ProjectRef], Any]
+    save: bool = False
+    applies: Optional[Callable[[ProjectRef], bool]] = None
+
+
+class ProjectResult(NamedTuple):
+    """
+    Outcome of one project of a batch.
+
+    Attributes
+    ----------
+    ref : ProjectRef
+        The project.
+    results : dict[str, Any]
+        Return value of each task that succeeded.
+    errors : dict[str, str]
+        Error of each task that failed. The "load", "save" and "close" keys report
+        failures to open, save or close the project.
+    load_seconds, save_seconds, close_seconds : float
+        Time spent loading, saving and closing the project.
+    task_seconds : dict[str, float]
+        Time spent in each task.
+
+    """
+
+    ref: ProjectRef
+    results: dict[str, Any]
+    errors: dict[str, str]
+    load_seconds: float
+    save_seconds: float
+    close_seconds: float
+    task_seconds: dict[str, float]
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def seconds(self) -> float:
+        return (
+            self.load_seconds
+            + self.save_seconds
+            + self.close_seconds
+            + sum(self.task_seconds.values())
+        )
+
+
+class BatchReport:
+    """
+    Outcome of :meth:`BatchRunner.run`.
+
+    Attributes
+    ----------
+    results : list[ProjectResult]
+        Projects visited by this run, in visiting order.
+    resumed : list[str]
+        Keys of the projects skipped because the checkpoint records them as done.
+    seconds : float
+        Wall time of the run.
+
+    """
+
+    __slots__ = ("results", "resumed", "seconds")
+
+    def __init__(self):
+        self.results: list[ProjectResult] = []
+        self.resumed: list[str] = []
+        self.seconds = 0.0
+
+    @property
+    def failed(self) -> list[ProjectResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def load_seconds(self) -> float:
+        return sum(result.load_seconds for result in self.results)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BatchReport projects={len(self.results)} failed={len(self.failed)} "
+            f"resumed={len(self.resumed)} load={self.load_seconds:.1f}s>"
+        )
+
+
+def _error(error: BaseException) -> str:
+    return f"{type(error).__name__}: {error}"
+
+
+class BatchRunner:
+    """
+    Runs tasks on many projects, loading each project once.
+
+    Parameters
+    ----------
+    project_manager
+        Project manager of the running Resolve.
+    tasks
+        Tasks to run on each project, in order.
+    checkpoint
+        JSON Lines file recording each finished project. Projects it records as done
+        are skipped by later runs; projects that failed are retried unless
+        `retry_failed` is False.
+    retry_failed
+        Whether to run again the projects the checkpoint records as failed.
+    clock
+        Timer used for the timings, ``time.perf_counter`` by default.
+
+    """
+
+    def __init__(
+        self,
+        project_manager: ProjectManager,
+        tasks: Iterable[Task],
+        checkpoint: Optional[Union[str, os.PathLike]] = None,
+        retry_failed: bool = True,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.project_manager = project_manager
+        self.tasks = list(tasks)
+        self.checkpoint = checkpoint
+        self.retry_failed = retry_failed
+        self._clock = clock
+        self._database: Optional[tuple[str, str, str]] = None
+        self._folder: Optional[tuple[str, ...]] = None
+
+    def done(self) -> set[str]:
+        """
+        Returns the keys of the projects the checkpoint records as done.
+
+        """
+        done: set[str] = set()
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return done
+        with open(self.checkpoint, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A line cut short by an interrupted run.
+                    continue
+                if entry.get("ok") or not self.retry_failed:
+                    done.add(entry["project"])
+                else:
+                    done.discard(entry["project"])
+        return done
+
+    def _goto(self, ref: ProjectRef) -> bool:
+        # Moves to the project's folder with as few calls as possible: up to the
+        # common ancestor of the current folder, then down.
+        manager = self.project_manager
+        if ref.database != self._database:
+            self._folder = None
+            if not manager.SetCurrentDatabase(ref.db_info()):
+                self._database = None
+                return False
+            self._database = ref.database
+        current = self._folder
+        if current is None:
+            manager.GotoRootFolder()
+            current = ()
+        common = 0
+        for left, right in zip(current, ref.folder):
+            if left != right:
+                break
+            common += 1
+        for _ in range(len(current) - common):
+            if not manager.GotoParentFolder():
+                self._folder = None
+                return False
+        self._folder = current[:common]
+        for name in ref.folder[common:]:
+            if not manager.OpenFolder(name):
+                self._folder = None
+                return False
+            self._folder += (name,)
+        return True
+
+    def _visit(self, ref: ProjectRef, tasks: list[Task]) -> ProjectResult:
+        manager = self.project_manager
+        clock = self._clock
+        results: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        task_seconds: dict[str, float] = {}
+        save_seconds = close_seconds = 0.0
+
+        started = clock()
+        project = None
+        if self._goto(ref):
+            project = manager.LoadProject(ref.name)
+        load_seconds = clock() - started
+        if project is None:
+            errors["load"] = f"Cannot load project {ref.key!r}"
+            return ProjectResult(
+                ref, results, errors, load_seconds, 0.0, 0.0, task_seconds
+            )
+
+        modified = False
+        for task in tasks:
+            started = clock()
+            try:
+                results[task.name] = task.run(project, ref)
+                modified = modified or task.save
+            except Exception as error:
+                errors[task.name] = _error(error)
+            task_seconds[task.name] = clock() - started
+
+        if modified:
+            started = clock()
+            if not manager.SaveProject():
+                errors["save"] = f"Cannot save project {ref.key!r}"
+            save_seconds = clock() - started
+        started = clock()
+        if not manager.CloseProject(project):
+            errors["close"] = f"Cannot close project {ref.key!r}"
+        close_seconds = clock() - started
+        return ProjectResult(
+            ref,
+            results,
+            errors,
+            load_seconds,
+            save_seconds,
+            close_seconds,
+            task_seconds,
+        )
+
+    def _record(self, file, result: ProjectResult) -> None:
+        entry = {
+            "project": result.ref.key,
+            "ok": result.ok,
+            "errors": result.errors,
+            "load_seconds": round(result.load_seconds, 6),
+            "save_seconds": round(result.save_seconds, 6),
+            "close_seconds": round(result.close_seconds, 6),
+            "task_seconds": {
+                name: round(seconds, 6) for name, seconds in result.task_seconds.items()
+            },
+            "finished_at": time.time(),
+        }
+        file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        file.flush()
+        os.fsync(file.fileno())
+
+    def iter_run(self, projects: Iterable[ProjectRef]) -> Iterator[ProjectResult]:
+        """
+        Visits `projects` and yields the result of each as it finishes; see
+        :meth:`run`. Projects the checkpoint records as done, and projects no task
+        applies to, are skipped silently.
+
+        """
+        done = self.done()
+        # Group by database and folder, keeping the given order within a folder.
+        order: dict[tuple, int] = {}
+        for ref in projects:
+            order.setdefault((ref.database, ref.folder, ref.name), len(order))
+        refs = sorted(
+            (ProjectRef(*database, folder, name) for database, folder, name in order),
+            key=lambda ref: (ref.database, ref.folder),
+        )
+        self._database = self._folder = None
+        file = None
+        if self.checkpoint is not None:
+            file = open(self.checkpoint, "a", encoding="utf-8")
+        try:
+            for ref in refs:
+                if ref.key in done:
+                    continue
+                tasks = [
+                    task
+                    for task in self.tasks
+                    if task.applies is None or task.applies(ref)
+                ]
+                if not tasks:
+                    continue
+                result = self._visit(ref, tasks)
+                if file is not None:
+                    self._record(file, result)
+                yield result
+        finally:
+            if file is not None:
+                file.close()
+
+    def run(self, projects: Iterable[ProjectRef]) -> BatchReport:
+        """
+        Runs the tasks on `projects`, e.g. a :class:`ProjectInventory` or a selection
+        of it.
+
+        Projects are visited grouped by database and folder. Each one is loaded, given
+        to every task that applies to it, saved if a modifying task succeeded, and
+        closed without saving otherwise. Task errors are caught and reported; they do
+        not stop the batch. The project open before the run is closed by the first
+        database switch or load.
+
+        """
+        started = time.perf_counter()
+        report = BatchReport()
+        projects = list(projects)
+        done = self.done()
+        report.resumed = [ref.key for ref in projects if ref.key in done]
+        report.results.extend(self.iter_run(projects))
+        report.seconds = time.perf_counter() - started
+        return report
@@ -0,0 +1,437 @@
+"""
+Hash-indexed catalog of the Media Pool.
+
+Finding a clip through the API means walking ``GetRootFolder()`` →
+``GetSubFolderList()`` → ``GetClipList()`` and reading a property of every clip, i.e.
+O(N) round trips per lookup. :class:`MediaPoolCatalog` walks the folder tree once,
+reading each clip's properties with one bulk ``GetClipProperty()`` call, and indexes
+the clips by file path, clip name, unique ID, reel name and start timecode, so lookups
+cost no round trip at all.
+
+:meth:`MediaPoolCatalog.refresh` keeps the catalog current in collaboration projects
+by re-reading only the folders that report ``GetIsFolderStale()``, including the
+properties of the clips already cataloged in them. Clips added by the
+script itself can be registered with :meth:`MediaPoolCatalog.add_items` instead of a
+refresh.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.catalog import MediaPoolCatalog
+...
+>>> resolve = Resolve.resolve_init()
+>>> media_pool = resolve.GetProjectManager().GetCurrentProject().GetMediaPool()
+>>> catalog = MediaPoolCatalog.load(media_pool)
+>>> catalog.find_path("/Volumes/CARD_A001/A001C003_220101_R1AB.mov").name
+'A001C003_220101_R1AB.mov'
+>>> [entry.name for entry in catalog.find_source("A001C003", "14:02:11:05")]
+['A001C003_220101_R1AB.mov']
+>>> catalog.refresh()
+CatalogChanges(added=[], removed=[], changed=[])
+
+"""
+
+from __future__ import annotations
+
+import os
+from typing import NamedTuple
+
+from dri.timecode import timecode_to_frames
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional
+
+    from dri.folder import Folder
+    from dri.media_pool import MediaPool
+    from dri.media_pool_item import MediaPoolItem
+
+
+def _normalize(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path)) if path else ""
+
+
+class ClipEntry(NamedTuple):
+    """
+    One Media Pool clip in a :class:`MediaPoolCatalog`.
+
+    """
+
+    unique_id: str
+    name: str
+    path: str
+    reel: str
+    start_tc: str
+    end_tc: str
+    fps: str
+    folder_id: str
+    item: MediaPoolItem
+
+    def source_range(self) -> Optional[tuple[int, int]]:
+        """
+        Returns the frames ``[start, end)`` covered by the clip's source timecode, or
+        None if its timecode or frame rate cannot be parsed.
+
+        """
+        try:
+            start = timecode_to_frames(self.start_tc, self.fps)
+            end = timecode_to_frames(self.end_tc, self.fps)
+        except ValueError:
+            return None
+        return start, end
+
+
+class CatalogChanges(NamedTuple):
+    """
+    Clips added to, removed from and changed in a :class:`MediaPoolCatalog` by a
+    refresh. `changed` holds the new entries of clips whose name, file path, reel or
+    timecode changed.
+
+    """
+
+    added: list[ClipEntry]
+    removed: list[ClipEntry]
+    changed: list[ClipEntry]
+
+
+class _FolderState:
+    __slots__ = ("clip_ids", "folder", "parent_id", "subfolder_ids")
+
+    def __init__(self, folder: Folder, parent_id: Optional[str]):
+        self.folder = folder
+        self.parent_id = parent_id
+        self.clip_ids: dict[str, None] = {}
+        self.subfolder_ids: list[str] = []
+
+
+class MediaPoolCatalog:
+    """
+    Indexes of the clips of a Media Pool.
+
+    Path, name, reel and timecode lookups return every matching clip in the order the
+    clips were cataloged, as none of these fields is unique in a Media Pool.
+
+    Parameters
+    ----------
+    media_pool
+        Media Pool to catalog. Use :meth:`load` to read its clips.
+
+    """
+
+    def __init__(self, media_pool: MediaPool):
+        self.media_pool = media_pool
+        self._clear()
+
+    def _clear(self) -> None:
+        self._root_id: Optional[str] = None
+        self._folders: dict[str, _FolderState] = {}
+        self._entries: dict[str, ClipEntry] = {}
+        self._by_path: dict[str, dict[str, None]] = {}
+        self._by_name: dict[str, dict[str, None]] = {}
+        self._by_reel: dict[str, dict[str, None]] = {}
+        self._by_start_tc: dict[str, dict[str, None]] = {}
+
+    @classmethod
+    def load(cls, media_pool: MediaPool) -> MediaPoolCatalog:
+        """
+        Catalogs every clip of `media_pool`.
+
+        """
+        catalog = cls(media_pool)
+        catalog.rebuild()
+        return catalog
+
+    def rebuild(self) -> None:
+        """
+        Discards the catalog and walks the whole folder tree again: three calls per
+        folder and two per clip.
+
+        """
+        self._clear()
+        root = self.media_pool.GetRootFolder()
+        self._root_id = self._scan_folder(root, None, [])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[ClipEntry]:
+        return iter(self._entries.values())
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self._entries
+
+    def __repr__(self) -> str:
+        return (
+            f"<MediaPoolCatalog {len(self._entries)} clips in "
+            f"{len(self._folders)} folders>"
+        )
+
+    def _indexes(self, entry: ClipEntry):
+        return (
+            (self._by_path, _normalize(entry.path)),
+            (self._by_name, entry.name),
+            (self._by_reel, entry.reel),
+            (self._by_start_tc, entry.start_tc),
+        )
+
+    def _add_entry(self, entry: ClipEntry) -> None:
+        self._entries[entry.unique_id] = entry
+        self._folders[entry.folder_id].clip_ids[entry.unique_id] = None
+        for index, key in self._indexes(entry):
+            index.setdefault(key, {})[entry.unique_id] = None
+
+    def _remove_entry(self, unique_id: str) -> Optional[ClipEntry]:
+        entry = self._entries.pop(unique_id, None)
+        if entry is None:
+            return None
+        state = self._folders.get(entry.folder_id)
+        if state is not None:
+            state.clip_ids.pop(unique_id, None)
+        for index, key in self._indexes(entry):
+            ids = index[key]
+            del ids[unique_id]
+            if not ids:
+                del index[key]
+        return entry
+
+    def _read_clip(self, item: MediaPoolItem, unique_id: str, folder_id: str):
+        properties = item.GetClipProperty() or {}
+        return ClipEntry(
+            unique_id,
+            properties.get("Clip Name", ""),
+            properties.get("File Path", ""),
+            properties.get("Reel Name", ""),
+            properties.get("Start TC", ""),
+            properties.get("End TC", ""),
+            str(properties.get("FPS", "")),
+            folder_id,
+            item,
+        )
+
+    def _scan_folder(
+        self,
+        folder: Folder,
+        parent_id: Optional[str],
+        added: list[ClipEntry],
+        removed: Optional[list[ClipEntry]] = None,
+        changed: Optional[list[ClipEntry]] = None,
+    ) -> str:
+        # Reads the clips of `folder` and the whole tree of its new subfolders. Known
+        # subfolders are left alone: they are rescanned when they turn stale. Known
+        # clips of the folder are re-read when `changed` is given.
+        folder_id = folder.GetUniqueId()
+        state = self._folders.get(folder_id)
+        if state is None:
+            state = self._folders[folder_id] = _FolderState(folder, parent_id)
+        state.folder = folder
+
+        seen: dict[str, None] = {}
+        for item in folder.GetClipList() or []:
+            unique_id = item.GetUniqueId()
+            seen[unique_id] = None
+            entry = self._entries.get(unique_id)
+            if entry is not None and entry.folder_id == folder_id:
+                if changed is None:
+                    continue
+                new_entry = self._read_clip(item, unique_id, folder_id)
+                if new_entry[:-1] == entry[:-1]:
+                    # Indexes hold IDs only, keep the fresh item without reindexing.
+                    self._entries[unique_id] = new_entry
+                    continue
+                self._remove_entry(unique_id)
+                self._add_entry(new_entry)
+                changed.append(new_entry)
+                continue
+            if entry is not None:
+                # Moved here from another folder.
+                self._remove_entry(unique_id)
+            entry = self._read_clip(item, unique_id, folder_id)
+            self._add_entry(entry)
+            added.append(entry)
+        for unique_id in [id_ for id_ in state.clip_ids if id_ not in seen]:
+            entry = self._remove_entry(unique_id)
+            if removed is not None and entry is not None:
+                removed.append(entry)
+
+        subfolder_ids = []
+        for subfolder in folder.GetSubFolderList() or []:
+            subfolder_id = subfolder.GetUniqueId()
+            if subfolder_id not in self._folders:
+                self._scan_folder(subfolder, folder_id, added, removed, changed)
+            subfolder_ids.append(subfolder_id)
+        for subfolder_id in state.subfolder_ids:
+            if subfolder_id not in subfolder_ids:
+                self._drop_folder(subfolder_id, removed)
+        state.subfolder_ids = subfolder_ids
+        return folder_id
+
+    def _drop_folder(
+        self, folder_id: str, removed: Optional[list[ClipEntry]] = None
+    ) -> None:
+        state = self._folders.pop(folder_id, None)
+        if state is None:
+            return
+        for unique_id in list(state.clip_ids):
+            entry = self._entries.get(unique_id)
+            # A clip moved elsewhere before its old folder went away stays.
+            if entry is not None and entry.folder_id == folder_id:
+                self._remove_entry(unique_id)
+                if removed is not None:
+                    removed.append(entry)
+        for subfolder_id in state.subfolder_ids:
+            self._drop_folder(subfolder_id, removed)
+
+    def refresh(self, pull: bool = True) -> CatalogChanges:
+        """
+        Re-reads the folders that ``GetIsFolderStale()`` reports as changed by other
+        collaborators: one call per folder, plus the cost of reading the stale ones.
+
+        Parameters
+        ----------
+        pull
+            Call ``MediaPool.RefreshFolders()`` to fetch the collaborators' changes
+            before re-reading the stale folders.
+
+        Returns
+        -------
+        CatalogChanges
+            Clips that appeared, disappeared or changed.
+
+        """
+        stale = [
+            (folder_id, state)
+            for folder_id, state in self._folders.items()
+            if state.folder.GetIsFolderStale()
+        ]
+        added: list[ClipEntry] = []
+        removed: list[ClipEntry] = []
+        changed: list[ClipEntry] = []
+        if not stale:
+            return CatalogChanges(added, removed, changed)
+        if pull:
+            self.media_pool.RefreshFolders()
+        for folder_id, state in stale:
+            # Skip folders that went away with a stale parent rescanned before them.
+            if folder_id in self._folders:
+                self._scan_folder(
+                    state.folder, state.parent_id, added, removed, changed
+                )
+        return CatalogChanges(added, removed, changed)
+
+    def rescan(self, folder: Folder) -> CatalogChanges:
+        """
+        Re-reads one folder, e.g. after the script moved clips into it.
+
+        """
+        added: list[ClipEntry] = []
+        removed: list[ClipEntry] = []
+        changed: list[ClipEntry] = []
+        state = self._folders.get(folder.GetUniqueId())
+        parent_id = state.parent_id if state is not None else None
+        self._scan_folder(folder, parent_id, added, removed, changed)
+        return CatalogChanges(added, removed, changed)
+
+    def add_items(
+        self, items: Iterable[MediaPoolItem], folder: Optional[Folder] = None
+    ) -> list[ClipEntry]:
+        """
+        Catalogs clips the script has just created, e.g. the result of
+        ``MediaPool.ImportMedia``, without walking their folder.
+
+        Parameters
+        ----------
+        items
+            New clips.
+        folder
+            Folder holding the clips. Defaults to ``MediaPool.GetCurrentFolder()``,
+            where imports land.
+
+        """
+        if folder is None:
+            folder = self.media_pool.GetCurrentFolder()
+        folder_id = folder.GetUniqueId()
+        if folder_id not in self._folders:
+            # An uncataloged folder, read it whole, including the new clips.
+            return self.rescan(folder).added
+        entries = []
+        for item in items:
+            unique_id = item.GetUniqueId()
+            self._remove_entry(unique_id)
+            entry = self._read_clip(item, unique_id, folder_id)
+            self._add_entry(entry)
+            entries.append(entry)
+        return entries
+
+    def discard_items(self, items: Iterable[MediaPoolItem]) -> list[ClipEntry]:
+        """
+        Removes clips, e.g. after ``MediaPool.DeleteClips``.
+
+        """
+        removed = []
+        for item in items:
+            entry = self._remove_entry(item.GetUniqueId())
+            if entry is not None:
+                removed.append(entry)
+        return removed
+
+    def _lookup(self, index: dict[str, dict[str, None]], key: str) -> list[ClipEntry]:
+        entries = self._entries
+        return [entries[unique_id] for unique_id in index.get(key, ())]
+
+    def get(self, unique_id: str) -> Optional[ClipEntry]:
+        """
+        Returns the clip with the given ``GetUniqueId()``, or None.
+
+        """
+        return self._entries.get(unique_id)
+
+    def find_path(self, path: str) -> Optional[ClipEntry]:
+        """
+        Returns the first clip of the given file, or None.
+
+        """
+        ids = self._by_path.get(_normalize(path))
+        if not ids:
+            return None
+        return self._entries[next(iter(ids))]
+
+    def by_path(self, path: str) -> list[ClipEntry]:
+        return self._lookup(self._by_path, _normalize(path))
+
+    def by_name(self, name: str) -> list[ClipEntry]:
+        return self._lookup(self._by_name, name)
+
+    def by_reel(self, reel: str) -> list[ClipEntry]:
+        return self._lookup(self._by_reel, reel)
+
+    def by_start_tc(self, start_tc: str) -> list[ClipEntry]:
+        return self._lookup(self._by_start_tc, start_tc)
+
+    def find_source(self, reel: str, timecode: str) -> list[ClipEntry]:
+        """
+        Returns the clips of `reel` whose source timecode range contains `timecode`,
+        the usual conform lookup for EDL events.
+
+        """
+        found = []
+        for entry in self.by_reel(reel):
+            source_range = entry.source_range()
+            if source_range is None:
+                continue
+            try:
+                frame = timecode_to_frames(timecode, entry.fps)
+            except ValueError:
+                continue
+            if source_range[0] <= frame < source_range[1]:
+                found.append(entry)
+        return found
+
+    def folder_of(self, unique_id: str) -> Optional[Folder]:
+        """
+        Returns the folder holding the clip, or None if it is not cataloged.
+
+        """
+        entry = self._entries.get(unique_id)
+        if entry is None:
+            return None
+        return self._folders[entry.folder_id].folder
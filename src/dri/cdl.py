@@ -0,0 +1,551 @@
+"""
+Batch application of ASC CDLs to timeline items.
+
+On-set grades arrive as ASC CDL files (``.cdl``, ``.ccc``, ``.cc``), as ``ASC_SOP`` and
+``ASC_SAT`` columns of an ALE, or as ``*ASC_SOP`` comments of an EDL.
+:func:`read_corrections` parses any of them in one pass into :class:`Correction`
+records. :class:`ShotIndex` indexes the video items of a timeline snapshot by name,
+reel, source timecode and record position, so each correction finds its shots with a
+few dict lookups instead of a scan of the timeline. :class:`CdlApplier` then calls
+``TimelineItem.SetCDL`` once per item whose grade changes: the ``SetCDL`` map of each
+distinct CDL is formatted once, and items already set to the same values by the
+applier are skipped.
+
+:func:`apply_cdl` implements the ASC CDL with NumPy, for previews and for checking
+what Resolve renders, and :func:`cdl_lut` bakes a CDL into a :class:`~dri.lut.Lut`.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.cdl import apply_corrections, read_corrections
+...
+>>> resolve = Resolve.resolve_init()
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> corrections = read_corrections("/onset/day04.ale")
+>>> report = apply_corrections(timeline, corrections)
+>>> report
+<CdlReport corrections=1412 matched=1398 items=2210 applied=2210 failed=0>
+>>> [correction.name for correction in report.unmatched][:2]
+['A004C012_220104_R1AB', 'A004C013_220104_R1AB']
+
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import time
+from typing import NamedTuple
+
+from dri.interchange import CDL, iter_edl
+from dri.lut import Lut
+from dri.snapshot import snapshot
+from dri.timecode import parse_fps, timecode_to_frames
+from dri.timeline_export import iter_ale, iter_cdl
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Mapping, Optional, Sequence, Union
+
+    from dri.snapshot import ItemRecord, TimelineSnapshot
+    from dri.timeline import Timeline
+    from dri.timeline_item import TimelineItem
+
+# Rec. 709 luma weights of the ASC CDL saturation operation.
+LUMA_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+# Match strengths, strongest first, see ShotIndex.match.
+MATCHES = ("record", "reel_tc", "name_tc", "name", "reel")
+
+
+class Correction(NamedTuple):
+    """
+    One CDL read from a file and what identifies its shot.
+
+    Attributes
+    ----------
+    cdl : CDL
+        The correction.
+    name : str
+        Clip name, or the ``ColorCorrection`` id of CDL files.
+    reel : str
+        Reel or tape name, "" if unknown.
+    source_in, source_out : int
+        Source timecode frames of the shot, both 0 if unknown.
+    record_in : int
+        Record timecode frame of EDL events, -1 if unknown.
+
+    """
+
+    cdl: CDL
+    name: str
+    reel: str = ""
+    source_in: int = 0
+    source_out: int = 0
+    record_in: int = -1
+
+
+def read_corrections(
+    path: Union[str, os.PathLike], fps: Optional[Union[float, str]] = None
+) -> list[Correction]:
+    """
+    Reads the corrections of an ASC CDL (``.cdl``, ``.ccc``, ``.cc``), ALE (``.ale``)
+    or EDL (``.edl``) file. ALE rows and EDL events without a CDL are skipped.
+
+    Parameters
+    ----------
+    path
+        File to read, its extension giving the format.
+    fps
+        Frame rate of the ALE or EDL timecodes. Defaults to the ALE's ``FPS`` heading,
+        or 24 for EDLs.
+
+    Raises
+    ------
+    ValueError
+        If the extension is not one of the above.
+
+    """
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension in (".cdl", ".ccc", ".cc"):
+        return [Correction(cdl, cdl.id) for cdl in iter_cdl(path)]
+    if extension == ".ale":
+        events = iter_ale(path, fps)
+    elif extension == ".edl":
+        events = iter_edl(path, fps or 24)
+    else:
+        raise ValueError(f"Cannot read CDLs from {extension or path!r} files")
+    return [
+        Correction(
+            event.cdl,
+            event.name,
+            event.reel,
+            event.source_in,
+            event.source_out,
+            event.record_in if extension == ".edl" else -1,
+        )
+        for event in events
+        if event.cdl is not None
+    ]
+
+
+def _key(name: str) -> str:
+    # Case-insensitive name without extension, so "A001C003_R1AB" finds
+    # "A001C003_R1AB.mov".
+    return os.path.splitext(name)[0].casefold() if name else ""
+
+
+class ShotIndex:
+    """
+    Video items of a timeline snapshot, indexed for matching corrections.
+
+    Building the index reads the clip properties of each distinct Media Pool item
+    once, for its reel name, start timecode and frame rate.
+
+    Parameters
+    ----------
+    snap
+        Snapshot of the timeline, taken with video tracks.
+    tracks
+        Video track indices to index, all by default.
+
+    """
+
+    def __init__(self, snap: TimelineSnapshot, tracks: Optional[Iterable[int]] = None):
+        self.snapshot = snap
+        self._by_name: dict[str, list[int]] = {}
+        self._by_reel: dict[str, list[int]] = {}
+        self._by_start: dict[int, list[int]] = {}
+        self._source: dict[int, tuple[int, int]] = {}
+        self._rows: list[int] = []
+        properties: dict[int, dict] = {}
+        wanted = set(tracks) if tracks is not None else None
+        for record in snap:
+            if record.track_type != "video":
+                continue
+            if wanted is not None and record.track_index not in wanted:
+                continue
+            self._rows.append(record.row)
+            self._by_start.setdefault(record.start, []).append(record.row)
+            self._by_name.setdefault(_key(record.name), []).append(record.row)
+            clip = record.media_pool_item
+            if clip is None:
+                continue
+            values = properties.get(id(clip))
+            if values is None:
+                values = properties[id(clip)] = clip.GetClipProperty() or {}
+            clip_name = _key(values.get("Clip Name", ""))
+            if clip_name and clip_name != _key(record.name):
+                self._by_name.setdefault(clip_name, []).append(record.row)
+            reel = values.get("Reel Name", "")
+            if reel:
+                self._by_reel.setdefault(reel.casefold(), []).append(record.row)
+            try:
+                start = timecode_to_frames(
+                    values.get("Start TC", ""), parse_fps(values.get("FPS", ""))
+                )
+            except (TypeError, ValueError):
+                continue
+            source_in = start + record.left_offset
+            self._source[record.row] = (source_in, source_in + record.duration)
+
+    @classmethod
+    def build(
+        cls, timeline: Timeline, tracks: Optional[Iterable[int]] = None
+    ) -> ShotIndex:
+        """
+        Snapshots the video tracks of `timeline`, without markers, and indexes them.
+
+        """
+        return cls(snapshot(timeline, ("video",), markers=False), tracks)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<ShotIndex {self.snapshot.name!r}: {len(self._rows)} items>"
+
+    def _overlapping(self, rows: list[int], correction: Correction) -> list[int]:
+        # Items whose source range is the correction's, else all that overlap it.
+        source = self._source
+        wanted = (correction.source_in, correction.source_out)
+        exact = [row for row in rows if source.get(row) == wanted]
+        if exact:
+            return exact
+        return [
+            row
+            for row in rows
+            if row in source
+            and source[row][0] < correction.source_out
+            and correction.source_in < source[row][1]
+        ]
+
+    def match(self, correction: Correction) -> tuple[Optional[str], list[ItemRecord]]:
+        """
+        Finds the items a correction applies to.
+
+        The strongest match wins, in the order of :data:`MATCHES`: the item starting
+        at the EDL event's record frame; items of the same reel, then the same name,
+        whose source timecode equals, or else overlaps, the correction's; items of the
+        same name; items of the same reel. Names compare without case or extension.
+
+        Returns
+        -------
+        tuple[str or None, list[ItemRecord]]
+            The kind of match, one of :data:`MATCHES` or None, and the matched items.
+
+        """
+        snap = self.snapshot
+        names = self._by_name.get(_key(correction.name), [])
+        if correction.record_in >= 0:
+            rows = self._by_start.get(correction.record_in)
+            if rows:
+                # Items of several tracks may start there: take the one of the same
+                # name, else the lowest track's.
+                named = [row for row in rows if row in names]
+                return "record", [snap.record(named[0] if named else rows[0])]
+        reels = self._by_reel.get(correction.reel.casefold(), [])
+        candidates: Sequence[tuple[str, list[int]]] = ()
+        if correction.source_out > correction.source_in:
+            candidates = (
+                ("reel_tc", self._overlapping(reels, correction)),
+                ("name_tc", self._overlapping(names, correction)),
+            )
+        for kind, rows in (*candidates, ("name", names), ("reel", reels)):
+            if rows:
+                return kind, [snap.record(row) for row in rows]
+        return None, []
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
+
+
+def cdl_map(cdl: CDL, node_index: int = 1) -> dict[str, str]:
+    """
+    Returns the ``TimelineItem.SetCDL`` map of a CDL.
+
+    """
+    return {
+        "NodeIndex": str(node_index),
+        "Slope": " ".join(map(_number, cdl.slope)),
+        "Offset": " ".join(map(_number, cdl.offset)),
+        "Power": " ".join(map(_number, cdl.power)),
+        "Saturation": _number(cdl.saturation),
+    }
+
+
+class CdlReport:
+    """
+    Outcome of :meth:`CdlApplier.apply` and :func:`apply_corrections`.
+
+    Attributes
+    ----------
+    corrections : int
+        Number of corrections given, 0 when items were given directly.
+    matched : int
+        Corrections that matched at least one item.
+    unmatched : list[Correction]
+        Corrections that matched no item.
+    items : int
+        Number of items given a CDL.
+    applied : int
+        Successful ``SetCDL`` calls.
+    unchanged : int
+        Items skipped because the applier had already set the same values.
+    writes : int
+        ``SetCDL`` calls made.
+    seconds : float
+        Time spent in ``SetCDL`` calls.
+    failed : list[tuple[TimelineItem, CDL]]
+        Items whose ``SetCDL`` call failed, e.g. because the node does not exist.
+
+    """
+
+    __slots__ = (
+        "applied",
+        "corrections",
+        "failed",
+        "items",
+        "matched",
+        "seconds",
+        "unchanged",
+        "unmatched",
+        "writes",
+    )
+
+    def __init__(self):
+        self.corrections = 0
+        self.matched = 0
+        self.unmatched: list[Correction] = []
+        self.items = 0
+        self.applied = 0
+        self.unchanged = 0
+        self.writes = 0
+        self.seconds = 0.0
+        self.failed: list[tuple[TimelineItem, CDL]] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def __repr__(self) -> str:
+        return (
+            f"<CdlReport corrections={self.corrections} matched={self.matched} "
+            f"items={self.items} applied={self.applied} failed={len(self.failed)}>"
+        )
+
+
+class CdlApplier:
+    """
+    Calls ``TimelineItem.SetCDL`` on many items, skipping items already set.
+
+    The API cannot read a CDL back, so the applier remembers what it has set, keyed by
+    item object and node: reuse the items of the same snapshot, or the same
+    :class:`ShotIndex`, across calls to benefit. Grades changed other than through the
+    applier are not seen until :meth:`invalidate`.
+
+    Parameters
+    ----------
+    clock
+        Timer used for the report, ``time.perf_counter`` by default.
+
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._applied: dict[tuple[TimelineItem, int], CDL] = {}
+        self._maps: dict[tuple[CDL, int], dict[str, str]] = {}
+
+    def invalidate(self, items: Optional[Iterable[TimelineItem]] = None) -> None:
+        """
+        Forgets what was set on `items`, or on every item.
+
+        """
+        if items is None:
+            self._applied.clear()
+            return
+        forget = set(map(id, items))
+        for key in [key for key in self._applied if id(key[0]) in forget]:
+            del self._applied[key]
+
+    def apply(
+        self,
+        grades: Union[Mapping[TimelineItem, CDL], Iterable[tuple[TimelineItem, CDL]]],
+        node_index: int = 1,
+        report: Optional[CdlReport] = None,
+    ) -> CdlReport:
+        """
+        Sets the CDL of each item on node `node_index`.
+
+        Parameters
+        ----------
+        grades
+            Items and their CDL. The ``id`` of the CDLs is ignored.
+        node_index
+            1-based index of the node to grade.
+        report
+            Report to add to, a new one by default.
+
+        """
+        report = report if report is not None else CdlReport()
+        if hasattr(grades, "items"):
+            grades = grades.items()
+        clock = self._clock
+        for item, cdl in grades:
+            cdl = cdl._replace(id="")
+            report.items += 1
+            key = (item, node_index)
+            if self._applied.get(key) == cdl:
+                report.unchanged += 1
+                continue
+            values = self._maps.get((cdl, node_index))
+            if values is None:
+                values = self._maps[(cdl, node_index)] = cdl_map(cdl, node_index)
+            started = clock()
+            ok = item.SetCDL(values)
+            report.seconds += clock() - started
+            report.writes += 1
+            if ok:
+                report.applied += 1
+                self._applied[key] = cdl
+            else:
+                report.failed.append((item, cdl))
+                self._applied.pop(key, None)
+        return report
+
+
+def apply_corrections(
+    timeline: Union[Timeline, ShotIndex],
+    corrections: Iterable[Correction],
+    node_index: int = 1,
+    applier: Optional[CdlApplier] = None,
+) -> CdlReport:
+    """
+    Matches corrections to the video items of a timeline and sets their CDLs.
+
+    An item matched by several corrections takes the one of the strongest match, see
+    :meth:`ShotIndex.match`, the last one read among equally strong matches.
+
+    Parameters
+    ----------
+    timeline
+        Timeline, or a :class:`ShotIndex` of it to reuse across calls.
+    corrections
+        Corrections, e.g. from :func:`read_corrections`.
+    node_index
+        1-based index of the node to grade.
+    applier
+        Applier to use, e.g. one kept across calls to skip unchanged items.
+
+    """
+    index = timeline if isinstance(timeline, ShotIndex) else ShotIndex.build(timeline)
+    applier = applier if applier is not None else CdlApplier()
+    report = CdlReport()
+    strength = {kind: position for position, kind in enumerate(MATCHES)}
+    chosen: dict[int, tuple[int, ItemRecord, CDL]] = {}
+    for correction in corrections:
+        report.corrections += 1
+        kind, records = index.match(correction)
+        if kind is None:
+            report.unmatched.append(correction)
+            continue
+        report.matched += 1
+        for record in records:
+            previous = chosen.get(record.row)
+            if previous is None or strength[kind] <= previous[0]:
+                chosen[record.row] = (strength[kind], record, correction.cdl)
+    grades = [(record.item, cdl) for _, record, cdl in chosen.values()]
+    return applier.apply(grades, node_index, report)
+
+
+def _numpy():
+    return importlib.import_module("numpy")
+
+
+def cdl_arrays(cdls: Union[CDL, Iterable[CDL]]):
+    """
+    Returns the slope, offset, power and saturation of CDLs as float32 arrays of
+    shapes ``(n, 3)``, ``(n, 3)``, ``(n, 3)`` and ``(n,)``.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+
+    """
+    np = _numpy()
+    cdls = [cdls] if isinstance(cdls, CDL) else list(cdls)
+    return (
+        np.array([cdl.slope for cdl in cdls], dtype=np.float32).reshape(-1, 3),
+        np.array([cdl.offset for cdl in cdls], dtype=np.float32).reshape(-1, 3),
+        np.array([cdl.power for cdl in cdls], dtype=np.float32).reshape(-1, 3),
+        np.array([cdl.saturation for cdl in cdls], dtype=np.float32),
+    )
+
+
+def apply_cdl(image, cdl: Union[CDL, Iterable[CDL]], clamp: bool = True):
+    """
+    Applies the ASC CDL to RGB values.
+
+    ``out = (in * slope + offset) ** power``, then saturation around Rec. 709 luma.
+    Negative values are clipped before the power function; with `clamp`, the ASC CDL
+    v1.2 clamp to [0, 1] applies after both steps.
+
+    Parameters
+    ----------
+    image
+        Array of shape ``(..., 3)``. Integer images are normalized by the maximum of
+        their type.
+    cdl
+        One CDL, or several to apply each to the whole image.
+    clamp
+        Whether to clamp to [0, 1]. Disable for scene-referred values.
+
+    Returns
+    -------
+    numpy.ndarray
+        float32 array of the image's shape for one CDL, of shape ``(n, *image.shape)``
+        for a sequence of n CDLs.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If the image's last axis does not hold three channels.
+
+    """
+    np = _numpy()
+    pixels = np.asarray(image)
+    if pixels.ndim < 1 or pixels.shape[-1] != 3:
+        raise ValueError(f"Expected (..., 3) pixels, got shape {pixels.shape}")
+    if pixels.dtype.kind in "ui":
+        pixels = pixels.astype(np.float32) / np.iinfo(pixels.dtype).max
+    else:
+        pixels = pixels.astype(np.float32, copy=False)
+    slope, offset, power, saturation = cdl_arrays(cdl)
+    # Broadcast the CDLs over every pixel axis of the image.
+    shape = (len(saturation),) + (1,) * (pixels.ndim - 1)
+    values = pixels * slope.reshape(shape + (3,))
+    values += offset.reshape(shape + (3,))
+    np.clip(values, 0.0, 1.0 if clamp else None, out=values)
+    values **= power.reshape(shape + (3,))
+    luma = values @ np.asarray(LUMA_WEIGHTS, dtype=np.float32)
+    luma = luma[..., None]
+    values -= luma
+    values *= saturation.reshape(shape + (1,))
+    values += luma
+    if clamp:
+        np.clip(values, 0.0, 1.0, out=values)
+    return values[0] if isinstance(cdl, CDL) else values
+
+
+def cdl_lut(cdl: CDL, size: int = 33, clamp: bool = True) -> Lut:
+    """
+    Bakes a CDL into a 3D :class:`~dri.lut.Lut`, e.g. to compare with the
+    ``TimelineItem.ExportLUT`` of a graded item or to load with ``Graph.SetLUT``.
+
+    """
+    identity = Lut.identity(size)
+    return Lut(apply_cdl(identity.table, cdl, clamp), title=cdl.id or "CDL")
@@ -0,0 +1,403 @@
+"""
+Typed records of ``MediaPoolItem.GetClipProperty()``.
+
+``GetClipProperty()`` returns about 80 keys, nearly all as strings: ``"Frames": "1205"``,
+``"Resolution": "1920x1080"``, ``"Duration": "00:00:24:05"``, while ``"FPS"`` is a
+float. :class:`ClipProperties` wraps one such dict and parses each field on first access
+into an int, :class:`~fractions.Fraction`, frame count, resolution tuple or datetime,
+caching the result in a slot. Fields that are empty or malformed parse to None.
+
+:func:`parse_clip_properties` builds records for thousands of clips at once: every
+distinct frame rate, resolution and date string is parsed once, and the timecodes of
+all clips sharing a frame rate are converted in one batch with
+:func:`~dri.timecode.timecodes_to_frames`.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.clip_properties import ClipProperties, parse_clip_properties
+...
+>>> resolve = Resolve.resolve_init()
+>>> media_pool = resolve.GetProjectManager().GetCurrentProject().GetMediaPool()
+>>> clips = media_pool.GetRootFolder().GetClipList()
+>>> records = parse_clip_properties(clip.GetClipProperty() for clip in clips)
+>>> records[0].frames, records[0].fps, records[0].resolution, records[0].duration
+(1205, Fraction(50, 1), (1920, 1080), 1205)
+>>> records[0]["Video Codec"]
+'H.264 Main L5.1'
+
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from fractions import Fraction
+
+from dri.timecode import (
+    nominal_fps,
+    parse_drop_frame,
+    timecode_to_frames,
+    timecodes_to_frames,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+    from dri.media_pool_item import MediaPoolItem
+
+# Resolve shows NTSC rates rounded, map them back to their exact value.
+_NTSC_RATES = {
+    "23.976": Fraction(24000, 1001),
+    "29.97": Fraction(30000, 1001),
+    "47.952": Fraction(48000, 1001),
+    "59.94": Fraction(60000, 1001),
+    "119.88": Fraction(120000, 1001),
+}
+
+_DATE_FORMATS = ("%a %b %d %Y %H:%M:%S", "%a %b %d %H:%M:%S %Y")
+
+
+def parse_int(value: Union[str, int, float, None]) -> Optional[int]:
+    """
+    Parses "1205", 1205 or 1205.0. Returns None for "" and malformed values.
+
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return int(number) if number.is_integer() else None
+
+
+def parse_fraction(value: Union[str, int, float, None]) -> Optional[Fraction]:
+    """
+    Parses a frame rate such as 50.0, "25" or "23.976" into an exact fraction, mapping
+    the rounded NTSC rates to their x/1001 value.
+
+    """
+    if value is None or value == "":
+        return None
+    text = str(value).split()[0] if isinstance(value, str) else repr(float(value))
+    if text.endswith(".0"):
+        text = text[:-2]
+    exact = _NTSC_RATES.get(text)
+    if exact is not None:
+        return exact
+    try:
+        rate = Fraction(text)
+    except (ValueError, ZeroDivisionError):
+        return None
+    return rate if rate > 0 else None
+
+
+def parse_resolution(value: Optional[str]) -> Optional[tuple[int, int]]:
+    """
+    Parses "1920x1080" into (1920, 1080).
+
+    """
+    if not value:
+        return None
+    width, separator, height = value.lower().partition("x")
+    if not separator:
+        return None
+    try:
+        return int(width), int(height)
+    except ValueError:
+        return None
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parses the dates of "Date Added", "Date Created" and "Date Modified", which Resolve
+    formats as either "Sat Nov 5 2022 20:16:20" or "Sat Nov 5 20:16:44 2022".
+
+    """
+    if not value:
+        return None
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def parse_bool(value: Union[str, int, bool, None]) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    return parse_drop_frame(value)
+
+
+class _Field:
+    # Lazily parsed field: reads `key` from the raw dict on first access, parses it and
+    # caches the result in the slot of the same name prefixed with "_".
+
+    __slots__ = ("key", "parser", "slot")
+
+    def __init__(self, key: str, parser: Callable[[Any], Any]):
+        self.key = key
+        self.parser = parser
+        self.slot: Optional[Any] = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.slot = owner.__dict__[f"_{name}"]
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = self.parser(instance.raw.get(self.key))
+            self.slot.__set__(instance, value)
+            return value
+
+
+class _TimecodeField(_Field):
+    # Timecode field parsed into a frame count at the clip's own frame rate.
+
+    __slots__ = ()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            value = instance._timecode_frames(instance.raw.get(self.key))
+            self.slot.__set__(instance, value)
+            return value
+
+
+def _str(value) -> str:
+    return "" if value is None else str(value)
+
+
+# Attribute name -> (property key, parser), in GetClipProperty() key order.
+FIELDS = {
+    "audio_bit_depth": ("Audio Bit Depth", parse_int),
+    "audio_channels": ("Audio Ch", parse_int),
+    "audio_codec": ("Audio Codec", _str),
+    "bit_depth": ("Bit Depth", parse_int),
+    "clip_color": ("Clip Color", _str),
+    "name": ("Clip Name", _str),
+    "date_added": ("Date Added", parse_date),
+    "date_created": ("Date Created", parse_date),
+    "date_modified": ("Date Modified", parse_date),
+    "drop_frame": ("Drop frame", parse_bool),
+    "end": ("End", parse_int),
+    "fps": ("FPS", parse_fraction),
+    "file_name": ("File Name", _str),
+    "file_path": ("File Path", _str),
+    "format": ("Format", _str),
+    "frames": ("Frames", parse_int),
+    "online": ("Online Status", lambda value: value == "Online"),
+    "par": ("PAR", _str),
+    "reel_name": ("Reel Name", _str),
+    "resolution": ("Resolution", parse_resolution),
+    "sample_rate": ("Sample Rate", parse_int),
+    "start": ("Start", parse_int),
+    "type": ("Type", _str),
+    "usage": ("Usage", parse_int),
+    "video_codec": ("Video Codec", _str),
+    "super_scale": ("Super Scale", parse_int),
+}
+
+# Attribute name -> timecode property key, parsed into frame counts.
+TIMECODE_FIELDS = {
+    "duration": "Duration",
+    "end_frame": "End TC",
+    "in_frame": "In",
+    "out_frame": "Out",
+    "start_frame": "Start TC",
+}
+
+
+class ClipProperties:
+    """
+    Parsed view of one ``GetClipProperty()`` dict.
+
+    Every name of :data:`FIELDS` and :data:`TIMECODE_FIELDS` is an attribute parsed on
+    first access. Timecode fields (`duration`, `start_frame`, `end_frame`, `in_frame`,
+    `out_frame`) are frame counts at the clip's frame rate. Raw values remain
+    available by key, e.g. ``record["Input LUT"]``.
+
+    Parameters
+    ----------
+    raw
+        Result of ``MediaPoolItem.GetClipProperty()``.
+
+    """
+
+    __slots__ = ("raw",) + tuple(f"_{name}" for name in (*FIELDS, *TIMECODE_FIELDS))
+
+    def __init__(self, raw: dict[str, Any]):
+        self.raw = raw
+
+    @classmethod
+    def read(cls, item: MediaPoolItem) -> ClipProperties:
+        """
+        Reads the properties of `item` with one ``GetClipProperty()`` call.
+
+        """
+        return cls(item.GetClipProperty() or {})
+
+    def __getitem__(self, key: str):
+        return self.raw[key]
+
+    def get(self, key: str, default=None):
+        return self.raw.get(key, default)
+
+    def __repr__(self) -> str:
+        return f"<ClipProperties {self.name!r}>"
+
+    def _timecode_frames(self, value: Optional[str]) -> Optional[int]:
+        fps = self.fps
+        if not value or fps is None:
+            return None
+        try:
+            return timecode_to_frames(value, fps, bool(self.drop_frame))
+        except ValueError:
+            return None
+
+    @property
+    def width(self) -> Optional[int]:
+        return self.resolution[0] if self.resolution else None
+
+    @property
+    def height(self) -> Optional[int]:
+        return self.resolution[1] if self.resolution else None
+
+    @property
+    def seconds(self) -> Optional[float]:
+        """
+        Real-time duration, from the frame count and exact frame rate.
+
+        """
+        if self.frames is None or not self.fps:
+            return None
+        return float(self.frames / self.fps)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns every parsed field keyed by attribute name.
+
+        """
+        return {name: getattr(self, name) for name in (*FIELDS, *TIMECODE_FIELDS)}
+
+
+def _add_fields() -> None:
+    for name, (key, parser) in FIELDS.items():
+        field: _Field = _Field(key, parser)
+        setattr(ClipProperties, name, field)
+        field.__set_name__(ClipProperties, name)
+    for name, key in TIMECODE_FIELDS.items():
+        field = _TimecodeField(key, None)
+        setattr(ClipProperties, name, field)
+        field.__set_name__(ClipProperties, name)
+
+
+_add_fields()
+
+
+def _memoized(parser: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    cache: dict = {}
+
+    def parse(value):
+        try:
+            return cache[value]
+        except KeyError:
+            result = cache[value] = parser(value)
+            return result
+        except TypeError:
+            return parser(value)
+
+    return parse
+
+
+def parse_clip_properties(
+    raws: Iterable[dict[str, Any]], fields: Optional[Iterable[str]] = None
+) -> list[ClipProperties]:
+    """
+    Builds :class:`ClipProperties` for many clips and parses their fields eagerly.
+
+    Parameters
+    ----------
+    raws
+        ``GetClipProperty()`` dicts.
+    fields
+        Attribute names to parse up front, any of :data:`FIELDS` and
+        :data:`TIMECODE_FIELDS`. Defaults to all. Other fields stay lazy.
+
+    Returns
+    -------
+    list[ClipProperties]
+        One record per dict, in input order.
+
+    Raises
+    ------
+    ValueError
+        If a field name is unknown.
+
+    """
+    records = [ClipProperties(raw) for raw in raws]
+    names = list(fields) if fields is not None else [*FIELDS, *TIMECODE_FIELDS]
+    for name in names:
+        if name not in FIELDS and name not in TIMECODE_FIELDS:
+            raise ValueError(f"Unknown clip property field: {name!r}")
+
+    wanted_timecodes = [name for name in names if name in TIMECODE_FIELDS]
+    plain = [name for name in names if name in FIELDS]
+    if wanted_timecodes:
+        # Timecodes are parsed against the frame rate and drop frame flag.
+        plain.extend(name for name in ("fps", "drop_frame") if name not in plain)
+
+    for name in plain:
+        key, parser = FIELDS[name]
+        parse = _memoized(parser)
+        slot = getattr(ClipProperties, f"_{name}")
+        for record in records:
+            slot.__set__(record, parse(record.raw.get(key)))
+
+    for name in wanted_timecodes:
+        _parse_timecodes(records, name, TIMECODE_FIELDS[name])
+    return records
+
+
+def _parse_timecodes(records: list[ClipProperties], name: str, key: str) -> None:
+    slot = getattr(ClipProperties, f"_{name}")
+    groups: dict[tuple[Fraction, bool], list[ClipProperties]] = {}
+    for record in records:
+        value = record.raw.get(key)
+        if not value or record.fps is None:
+            slot.__set__(record, None)
+            continue
+        groups.setdefault((record.fps, bool(record.drop_frame)), []).append(record)
+
+    for (fps, drop_frame), group in groups.items():
+        if drop_frame and nominal_fps(float(fps)) % 30:
+            for record in group:
+                slot.__set__(record, None)
+            continue
+        timecodes = [record.raw[key] for record in group]
+        try:
+            frames: Iterator = iter(
+                timecodes_to_frames(timecodes, float(fps), drop_frame)
+            )
+        except ValueError:
+            # A malformed timecode in the batch, fall back to one at a time.
+            for record in group:
+                slot.__set__(record, record._timecode_frames(record.raw[key]))
+            continue
+        for record, value in zip(group, frames):
+            slot.__set__(record, int(value))
@@ -0,0 +1,682 @@
+"""
+Columnar export of Media Pool metadata.
+
+``MediaPool.ExportMetadata`` writes Resolve's CSV, which has to be re-read and re-parsed
+for every analysis. :func:`export_metadata` instead streams the clip properties and
+metadata of a Media Pool into a columnar file, one row group of `row_group_size` clips
+at a time so that memory stays bounded on archives of hundreds of thousands of clips.
+Numeric properties such as "Frames" or "FPS" are stored as int64/float64 columns.
+
+Two file formats are supported:
+
+-   Parquet, written with pyarrow when it is installed and read back by
+    :class:`ParquetReader` with ``pyarrow.parquet.read_table(path, memory_map=True)``.
+-   A stdlib fallback with Arrow-style buffers: per row group and column a validity
+    bitmap and either a fixed-width value buffer or int64 offsets into UTF-8 data.
+    :class:`ColumnarReader` memory-maps it and returns numeric columns as memoryviews
+    over the mapped file, without copying.
+
+:func:`read_table` opens either and returns a reader with the same ``column``,
+``to_numpy`` and ``iter_rows`` methods for both.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.columnar import export_metadata, read_table
+...
+>>> resolve = Resolve.resolve_init()
+>>> media_pool = resolve.GetProjectManager().GetCurrentProject().GetMediaPool()
+>>> export_metadata(media_pool, "/tmp/archive.parquet")
+ExportSummary(rows=512000, row_groups=52, columns=97, format='parquet')
+>>> with read_table("/tmp/archive.parquet") as table:
+...     table.to_numpy("Frames").sum()
+1203884112
+
+"""
+
+from __future__ import annotations
+
+import importlib
+import itertools
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import NamedTuple
+
+from dri.clip_properties import parse_int
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Iterator, Optional, Union
+
+    from dri.media_pool import MediaPool
+    from dri.media_pool_item import MediaPoolItem
+
+MAGIC = b"DRICOL1\n"
+
+TYPES = ("int64", "float64", "string")
+
+# Column types of the clip properties that are not strings.
+PROPERTY_TYPES = {
+    "Audio Bit Depth": "int64",
+    "Audio Ch": "int64",
+    "Bit Depth": "int64",
+    "End": "int64",
+    "FPS": "float64",
+    "Frames": "int64",
+    "Sample Rate": "int64",
+    "Start": "int64",
+    "Super Scale": "int64",
+    "Usage": "int64",
+}
+
+# Metadata columns are prefixed, as metadata and clip properties share some names.
+METADATA_PREFIX = "Metadata:"
+
+_TYPECODES = {"int64": "q", "float64": "d"}
+_ARROW_TYPES = {"int64": "int64", "double": "float64"}
+_ALIGNMENT = 8
+
+
+def _pyarrow():
+    try:
+        return importlib.import_module("pyarrow")
+    except ImportError:
+        return None
+
+
+def _to_float(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _to_str(value) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+_CONVERTERS = {"int64": parse_int, "float64": _to_float, "string": _to_str}
+
+
+class ExportSummary(NamedTuple):
+    rows: int
+    row_groups: int
+    columns: int
+    format: str
+
+
+class ColumnarWriter:
+    """
+    Writes rows to a columnar file, one row group per :meth:`write_rows` call.
+
+    Parameters
+    ----------
+    path
+        Output file.
+    schema
+        Column types keyed by column name, each "int64", "float64" or "string". Row
+        keys missing from the schema are ignored, missing values are written as nulls.
+    file_format
+        "parquet" (requires pyarrow), "dri" for the stdlib format, or "auto" to use
+        Parquet when pyarrow is installed.
+
+    Raises
+    ------
+    ValueError
+        If a column type or the format is unknown.
+    ImportError
+        If "parquet" is requested but pyarrow is not installed.
+
+    """
+
+    def __init__(self, path: str, schema: dict[str, str], file_format: str = "auto"):
+        for name, column_type in schema.items():
+            if column_type not in TYPES:
+                raise ValueError(f"Unknown type {column_type!r} of column {name!r}")
+        pyarrow = _pyarrow()
+        if file_format == "auto":
+            file_format = "parquet" if pyarrow is not None else "dri"
+        if file_format == "parquet" and pyarrow is None:
+            raise ImportError("Writing Parquet requires pyarrow")
+        if file_format not in ("parquet", "dri"):
+            raise ValueError(f"Unknown columnar format: {file_format!r}")
+        self.path = path
+        self.schema = dict(schema)
+        self.format = file_format
+        self.rows = 0
+        self.row_groups = 0
+        self._footer_groups: list[dict] = []
+        if file_format == "parquet":
+            parquet = importlib.import_module("pyarrow.parquet")
+            types = {
+                "int64": pyarrow.int64(),
+                "float64": pyarrow.float64(),
+                "string": pyarrow.string(),
+            }
+            self._arrow_schema = pyarrow.schema(
+                [(name, types[column_type]) for name, column_type in schema.items()]
+            )
+            self._parquet = parquet.ParquetWriter(path, self._arrow_schema)
+        else:
+            self._file = open(path, "wb")
+            self._file.write(MAGIC)
+
+    def __enter__(self) -> ColumnarWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _columns(self, rows: list[dict[str, Any]]) -> dict[str, list]:
+        columns = {}
+        for name, column_type in self.schema.items():
+            values = [row.get(name) for row in rows]
+            if column_type != "string" or not all(
+                value.__class__ is str or value is None for value in values
+            ):
+                convert = _CONVERTERS[column_type]
+                values = [convert(value) for value in values]
+            columns[name] = values
+        return columns
+
+    def write_rows(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Writes `rows` as one row group.
+
+        """
+        if not rows:
+            return
+        columns = self._columns(rows)
+        if self.format == "parquet":
+            pyarrow = _pyarrow()
+            table = pyarrow.Table.from_pydict(columns, schema=self._arrow_schema)
+            self._parquet.write_table(table, row_group_size=len(rows))
+        else:
+            self._write_group(columns, len(rows))
+        self.rows += len(rows)
+        self.row_groups += 1
+
+    def _write_buffer(self, data: Union[bytes, array]) -> list[int]:
+        file = self._file
+        padding = -file.tell() % _ALIGNMENT
+        if padding:
+            file.write(b"\0" * padding)
+        offset = file.tell()
+        if isinstance(data, array):
+            data.tofile(file)
+            length = len(data) * data.itemsize
+        else:
+            file.write(data)
+            length = len(data)
+        return [offset, length]
+
+    def _write_group(self, columns: dict[str, list], rows: int) -> None:
+        chunks = []
+        for name, values in columns.items():
+            column_type = self.schema[name]
+            if None in values:
+                validity = bytearray((rows + 7) // 8)
+                for position, value in enumerate(values):
+                    if value is not None:
+                        validity[position >> 3] |= 1 << (position & 7)
+            else:
+                validity = bytearray(b"\xff" * ((rows + 7) // 8))
+            chunk = {"validity": self._write_buffer(bytes(validity))}
+            if column_type == "string":
+                strings = ["" if value is None else value for value in values]
+                joined = "".join(strings)
+                if joined.isascii():
+                    data = joined.encode("ascii")
+                    lengths = map(len, strings)
+                else:
+                    encoded = [string.encode("utf-8") for string in strings]
+                    data = b"".join(encoded)
+                    lengths = map(len, encoded)
+                offsets = array("q", [0])
+                offsets.extend(itertools.accumulate(lengths))
+                chunk["offsets"] = self._write_buffer(offsets)
+                chunk["data"] = self._write_buffer(data)
+            else:
+                filled = [0 if value is None else value for value in values]
+                chunk["data"] = self._write_buffer(
+                    array(_TYPECODES[column_type], filled)
+                )
+            chunks.append(chunk)
+        self._footer_groups.append({"rows": rows, "columns": chunks})
+
+    def close(self) -> None:
+        """
+        Writes the footer and closes the file.
+
+        """
+        if self.format == "parquet":
+            if self._parquet is not None:
+                self._parquet.close()
+                self._parquet = None
+            return
+        if self._file.closed:
+            return
+        footer = json.dumps(
+            {
+                "version": 1,
+                "byteorder": sys.byteorder,
+                "columns": [
+                    {"name": name, "type": column_type}
+                    for name, column_type in self.schema.items()
+                ],
+                "row_groups": self._footer_groups,
+            }
+        ).encode("utf-8")
+        self._file.write(footer)
+        self._file.write(struct.pack("<q", len(footer)))
+        self._file.write(MAGIC)
+        self._file.close()
+
+
+class StringColumn:
+    """
+    Strings of one row group of a :class:`ColumnarReader`, decoded on access.
+
+    """
+
+    __slots__ = ("_data", "_offsets", "_validity")
+
+    def __init__(self, offsets: memoryview, data: memoryview, validity: memoryview):
+        self._offsets = offsets
+        self._data = data
+        self._validity = validity
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position: int) -> Optional[str]:
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        if not self._validity[position >> 3] & (1 << (position & 7)):
+            return None
+        start, end = self._offsets[position], self._offsets[position + 1]
+        return str(self._data[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (self[position] for position in range(len(self)))
+
+
+class ColumnarReader:
+    """
+    Memory-mapped reader of files written by :class:`ColumnarWriter` in the "dri"
+    format.
+
+    Numeric column chunks are memoryviews over the mapped file. Release them, or drop
+    every reference to them, before :meth:`close`.
+
+    Parameters
+    ----------
+    path
+        File to read.
+
+    Raises
+    ------
+    ValueError
+        If the file is not in the "dri" format.
+
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a columnar metadata file: {path}") from None
+        view = memoryview(self._mmap)
+        size = len(view)
+        if (
+            size < 2 * len(MAGIC) + 8
+            or view[: len(MAGIC)] != MAGIC
+            or view[size - len(MAGIC) :] != MAGIC
+        ):
+            view.release()
+            self.close()
+            raise ValueError(f"Not a columnar metadata file: {path}")
+        footer_end = size - len(MAGIC) - 8
+        (footer_length,) = struct.unpack("<q", view[footer_end : footer_end + 8])
+        footer = json.loads(bytes(view[footer_end - footer_length : footer_end]))
+        view.release()
+        self._view = memoryview(self._mmap)
+        self._swap = footer["byteorder"] != sys.byteorder
+        self.schema: dict[str, str] = {
+            column["name"]: column["type"] for column in footer["columns"]
+        }
+        self._names = list(self.schema)
+        self._groups: list[dict] = footer["row_groups"]
+        self.num_rows = sum(group["rows"] for group in self._groups)
+
+    def __enter__(self) -> ColumnarReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def num_row_groups(self) -> int:
+        return len(self._groups)
+
+    def close(self) -> None:
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+            self._view = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def _buffer(self, span: list[int]) -> memoryview:
+        offset, length = span
+        return self._view[offset : offset + length]
+
+    def _numeric(self, span: list[int], column_type: str) -> Union[memoryview, array]:
+        buffer = self._buffer(span)
+        typecode = _TYPECODES[column_type]
+        if not self._swap:
+            return buffer.cast(typecode)
+        values = array(typecode, buffer)
+        values.byteswap()
+        return values
+
+    def column_chunk(self, name: str, row_group: int):
+        """
+        Returns one row group of a column.
+
+        Returns
+        -------
+        tuple
+            (values, validity): for numeric columns `values` is a memoryview of int64
+            or float64 values over the mapped file, with 0 in null rows; for string
+            columns it is a :class:`StringColumn`. `validity` is the Arrow-style
+            bitmap, bit ``i % 8`` of byte ``i // 8`` set for non-null rows.
+
+        Raises
+        ------
+        KeyError
+            If the column does not exist.
+
+        """
+        column_type = self.schema[name]
+        chunk = self._groups[row_group]["columns"][self._names.index(name)]
+        validity = self._buffer(chunk["validity"])
+        if column_type == "string":
+            offsets = self._numeric(chunk["offsets"], "int64")
+            return StringColumn(
+                offsets, self._buffer(chunk["data"]), validity
+            ), validity
+        return self._numeric(chunk["data"], column_type), validity
+
+    def column(self, name: str) -> list:
+        """
+        Returns every value of a column as a list, with None for nulls.
+
+        """
+        values: list = []
+        for row_group in range(len(self._groups)):
+            chunk, validity = self.column_chunk(name, row_group)
+            if isinstance(chunk, StringColumn):
+                values.extend(chunk)
+                continue
+            values.extend(
+                value if validity[position >> 3] & (1 << (position & 7)) else None
+                for position, value in enumerate(chunk)
+            )
+        return values
+
+    def to_numpy(self, name: str):
+        """
+        Returns a numeric column as a NumPy array, with nulls as 0 for int64 columns and
+        NaN for float64 columns.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        TypeError
+            If the column holds strings.
+
+        """
+        np = importlib.import_module("numpy")
+        column_type = self.schema[name]
+        if column_type == "string":
+            raise TypeError(f"Column {name!r} holds strings")
+        parts = []
+        for row_group in range(len(self._groups)):
+            values, validity = self.column_chunk(name, row_group)
+            part = np.frombuffer(values, dtype=np.dtype(_TYPECODES[column_type]))
+            if column_type == "float64":
+                mask = np.unpackbits(
+                    np.frombuffer(validity, dtype=np.uint8), bitorder="little"
+                )[: len(part)]
+                part = np.where(mask.astype(bool), part, np.nan)
+            parts.append(part)
+        if not parts:
+            return np.empty(0, dtype=np.dtype(_TYPECODES[column_type]))
+        return np.concatenate(parts)
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields every row as a dict.
+
+        """
+        for row_group in range(len(self._groups)):
+            chunks = [
+                (name, *self.column_chunk(name, row_group)) for name in self._names
+            ]
+            for position in range(self._groups[row_group]["rows"]):
+                byte, bit = position >> 3, 1 << (position & 7)
+                yield {
+                    name: values[position] if validity[byte] & bit else None
+                    for name, values, validity in chunks
+                }
+
+
+class ParquetReader:
+    """
+    Reader of Parquet files written by :class:`ColumnarWriter`, with the interface of
+    :class:`ColumnarReader` over a memory-mapped pyarrow table.
+
+    Attributes
+    ----------
+    table : pyarrow.Table
+        The table, for anything the shared interface does not cover.
+
+    Parameters
+    ----------
+    path
+        File to read.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed.
+
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        parquet = importlib.import_module("pyarrow.parquet")
+        self.table = parquet.read_table(path, memory_map=True)
+        self.num_row_groups = parquet.ParquetFile(path).num_row_groups
+        self.schema: dict[str, str] = {
+            field.name: _ARROW_TYPES.get(str(field.type), "string")
+            for field in self.table.schema
+        }
+        self.num_rows = self.table.num_rows
+
+    def __enter__(self) -> ParquetReader:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def close(self) -> None:
+        self.table = None
+
+    def column(self, name: str) -> list:
+        """
+        Returns every value of a column as a list, with None for nulls.
+
+        """
+        return self.table.column(name).to_pylist()
+
+    def to_numpy(self, name: str):
+        """
+        Returns a numeric column as a NumPy array, with nulls as 0 for int64 columns and
+        NaN for float64 columns.
+
+        Raises
+        ------
+        TypeError
+            If the column holds strings.
+
+        """
+        column_type = self.schema[name]
+        if column_type == "string":
+            raise TypeError(f"Column {name!r} holds strings")
+        compute = importlib.import_module("pyarrow.compute")
+        fill = 0 if column_type == "int64" else float("nan")
+        return compute.fill_null(self.table.column(name), fill).to_numpy()
+
+    def iter_rows(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields every row as a dict.
+
+        """
+        for batch in self.table.to_batches():
+            yield from batch.to_pylist()
+
+
+def read_table(path: str) -> Union[ColumnarReader, ParquetReader]:
+    """
+    Opens a file written by :func:`export_metadata`.
+
+    Returns
+    -------
+    ColumnarReader or ParquetReader
+        A :class:`ParquetReader` for Parquet files, a :class:`ColumnarReader` for
+        files in the "dri" format. Both have ``schema``, ``num_rows``, ``column``,
+        ``to_numpy``, ``iter_rows`` and ``close``; only :class:`ColumnarReader` has
+        ``column_chunk``.
+
+    Raises
+    ------
+    ImportError
+        If the file is Parquet and pyarrow is not installed.
+
+    """
+    with open(path, "rb") as file:
+        magic = file.read(4)
+    if magic == b"PAR1":
+        return ParquetReader(path)
+    return ColumnarReader(path)
+
+
+def iter_clips(media_pool: MediaPool) -> Iterator[MediaPoolItem]:
+    """
+    Yields every clip of the Media Pool, folder by folder.
+
+    """
+    pending = [media_pool.GetRootFolder()]
+    while pending:
+        folder = pending.pop()
+        yield from folder.GetClipList() or []
+        pending.extend(reversed(folder.GetSubFolderList() or []))
+
+
+def _clip_row(clip: MediaPoolItem, metadata: bool) -> dict[str, Any]:
+    row = dict(clip.GetClipProperty() or {})
+    if metadata:
+        for key, value in (clip.GetMetadata() or {}).items():
+            row[METADATA_PREFIX + key] = value
+    return row
+
+
+def export_metadata(
+    source: Union[MediaPool, Iterable[MediaPoolItem]],
+    path: str,
+    columns: Optional[dict[str, str]] = None,
+    row_group_size: int = 10_000,
+    metadata: bool = True,
+    file_format: str = "auto",
+) -> ExportSummary:
+    """
+    Streams the clip properties and metadata of many clips into a columnar file.
+
+    Each clip costs one ``GetClipProperty()`` call and, with `metadata`, one
+    ``GetMetadata()`` call. At most `row_group_size` rows are held in memory.
+
+    Parameters
+    ----------
+    source
+        Media Pool to export whole, or clips to export.
+    path
+        Output file.
+    columns
+        Column types keyed by name, see :class:`ColumnarWriter`. Metadata columns are
+        named with :data:`METADATA_PREFIX`. Defaults to the keys of the first row
+        group, typed with :data:`PROPERTY_TYPES`; keys that only appear later are not
+        exported.
+    row_group_size
+        Number of clips per row group.
+    metadata
+        Whether to export ``GetMetadata()`` as well.
+    file_format
+        "parquet", "dri" or "auto", see :class:`ColumnarWriter`.
+
+    Returns
+    -------
+    ExportSummary
+        Number of rows, row groups and columns written, and the file format.
+
+    """
+    if row_group_size < 1:
+        raise ValueError("row_group_size must be at least 1")
+    clips = iter_clips(source) if hasattr(source, "GetRootFolder") else iter(source)
+    writer: Optional[ColumnarWriter] = None
+    try:
+        while True:
+            rows = [
+                _clip_row(clip, metadata)
+                for _, clip in zip(range(row_group_size), clips)
+            ]
+            if writer is None:
+                schema = columns
+                if schema is None:
+                    keys: dict[str, None] = {}
+                    for row in rows:
+                        keys.update(dict.fromkeys(row))
+                    schema = {key: PROPERTY_TYPES.get(key, "string") for key in keys}
+                writer = ColumnarWriter(path, schema, file_format)
+            writer.write_rows(rows)
+            if len(rows) < row_group_size:
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+    return ExportSummary(
+        writer.rows, writer.row_groups, len(writer.schema), writer.format
+    )
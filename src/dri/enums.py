@@ -0,0 +1,46 @@
+from enum import Enum, IntEnum
+
+
+class KeyframeMode(IntEnum):
+    """
+    'keyframeMode' can be one of the following enums:
+        - resolve.KEYFRAME_MODE_ALL     == 0
+        - resolve.KEYFRAME_MODE_COLOR   == 1
+        - resolve.KEYFRAME_MODE_SIZING  == 2
+
+    Integer values returned by Resolve.GetKeyframeMode() will correspond to the enums
+    above.
+    """
+
+    ALL = 0
+    COLOR = 1
+    SIZING = 2
+
+
+class ExportType(Enum):
+    EXPORT_LUT_17PTCUBE = "EXPORT_LUT_17PTCUBE"
+    EXPORT_LUT_33PTCUBE = "EXPORT_LUT_33PTCUBE"
+    EXPORT_LUT_65PTCUBE = "EXPORT_LUT_65PTCUBE"
+    EXPORT_LUT_PANASONICVLUT = "EXPORT_LUT_PANASONICVLUT"
+
+
+class CloudSync(Enum):
+    CLOUD_SYNC_DEFAULT = -1
+    CLOUD_SYNC_DOWNLOAD_IN_QUEUE = 0
+    CLOUD_SYNC_DOWNLOAD_IN_PROGRESS = 1
+    CLOUD_SYNC_DOWNLOAD_SUCCESS = 2
+    CLOUD_SYNC_DOWNLOAD_FAIL = 3
+    CLOUD_SYNC_DOWNLOAD_NOT_FOUND = 4
+
+    CLOUD_SYNC_UPLOAD_IN_QUEUE = 5
+    CLOUD_SYNC_UPLOAD_IN_PROGRESS = 6
+    CLOUD_SYNC_UPLOAD_SUCCESS = 7
+    CLOUD_SYNC_UPLOAD_FAIL = 8
+    CLOUD_SYNC_UPLOAD_NOT_FOUND = 9
+    CLOUD_SYNC_SUCCESS = 10
+
+
+class SyncMode(Enum):
+    CLOUD_SYNC_NONE = "CLOUD_SYNC_NONE"
+    CLOUD_SYNC_PROXY_ONLY = "CLOUD_SYNC_PROXY_ONLY"
+    CLOUD_SYNC_PROXY_AND_ORIG = "CLOUD_SYNC_PROXY_AND_ORIG"
@@ -0,0 +1,78 @@
+class DriError(Exception):
+    """
+    Base class of the errors raised by dri.
+
+    """
+
+
+class FusionScriptError(DriError, ImportError):
+    """
+    The fusionscript library could not be located or loaded.
+
+    """
+
+
+class FusionScriptNotFoundError(FusionScriptError):
+    """
+    No fusionscript library exists at the expected path.
+
+    """
+
+
+class FusionScriptLoadError(FusionScriptError):
+    """
+    The fusionscript library exists but failed to load.
+
+    """
+
+
+class UnsupportedPlatformError(FusionScriptError):
+    """
+    There is no default fusionscript location for the current platform.
+
+    """
+
+
+class ResolveConnectionError(DriError):
+    """
+    fusionscript loaded but returned no Resolve object, usually because DaVinci Resolve
+    is not running or external scripting is disabled in its preferences.
+
+    """
+
+
+class RenderJobError(DriError):
+    """
+    A render job could not be added to the render queue of a project.
+
+    """
+
+
+class MissingMediaError(DriError):
+    """
+    A timeline file references media that does not exist, found before importing it.
+
+    """
+
+    def __init__(self, message: str, report=None):
+        super().__init__(message)
+        self.report = report
+
+
+class TimelineExportError(DriError):
+    """
+    ``Timeline.Export`` failed to write a timeline.
+
+    """
+
+
+class RenderSettingsError(DriError):
+    """
+    Render settings failed validation against the render capabilities of Resolve, or
+    were rejected by ``SetRenderSettings``.
+
+    """
+
+    def __init__(self, message: str, problems=()):
+        super().__init__(message)
+        self.problems = list(problems)
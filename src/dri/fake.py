@@ -0,0 +1,3855 @@
+"""
+In-memory implementation of the DaVinci Resolve scripting API.
+
+Every class subclasses its stub in :mod:`dri`, so code written against the
+stubs runs unchanged against this backend. State lives entirely in Python
+objects: databases, project folders, projects, Media Pool bins, clips, timelines,
+tracks, timeline items, markers, gallery stills and render jobs.
+
+Use it through :func:`scriptapp`, which mirrors ``fusionscript.scriptapp``, or by
+setting ``DRI_BACKEND=fake`` so that :func:`dri.Resolve.resolve_init` returns it.
+
+Examples
+--------
+>>> from dri import fake
+...
+>>> resolve = fake.scriptapp("Resolve")
+>>> project = resolve.GetProjectManager().GetCurrentProject()
+>>> project.populate(clip_count=100_000, timeline_count=1)
+>>> timeline = project.GetCurrentTimeline()
+>>> len(timeline.GetItemListInTrack("video", 1))
+100000
+
+"""
+
+import base64
+import bisect
+import csv
+import functools
+import itertools
+import json
+import os
+import random
+import struct
+import time
+import uuid
+import xml.etree.ElementTree as ElementTree
+import zlib
+from collections import Counter
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+from dri._types import ClipInfo
+from dri.color_group import ColorGroup
+from dri.enums import ExportType
+from dri.folder import Folder
+from dri.fusion_comp import FusionComp
+from dri.gallery import Gallery, GalleryStill, GalleryStillAlbum
+from dri.graph import Graph
+from dri.media_pool import MediaPool
+from dri.media_pool_item import MediaPoolItem
+from dri.media_storage import MediaStorage
+from dri.project import Project
+from dri.project_manager import ProjectManager
+from dri.resolve import Resolve
+from dri.timecode import frames_to_timecode, timecode_to_frames
+from dri.timeline import Timeline
+from dri.timeline_item import TimelineItem
+
+PAGES = ("media", "cut", "edit", "fusion", "color", "fairlight", "deliver")
+
+MARKER_COLORS = (
+    "Blue",
+    "Cyan",
+    "Green",
+    "Yellow",
+    "Red",
+    "Pink",
+    "Purple",
+    "Fuchsia",
+    "Rose",
+    "Lavender",
+    "Sky",
+    "Mint",
+    "Lemon",
+    "Sand",
+    "Cocoa",
+    "Cream",
+)
+
+CLIP_COLORS = (
+    "Orange",
+    "Apricot",
+    "Yellow",
+    "Lime",
+    "Olive",
+    "Green",
+    "Teal",
+    "Navy",
+    "Blue",
+    "Purple",
+    "Violet",
+    "Pink",
+    "Tan",
+    "Beige",
+    "Brown",
+    "Chocolate",
+)
+
+VIDEO_EXTENSIONS = frozenset(
+    {"mov", "mp4", "mxf", "avi", "mkv", "mts", "braw", "r3d", "ari", "arx", "crm"}
+)
+IMAGE_EXTENSIONS = frozenset(
+    {"dpx", "exr", "tif", "tiff", "jpg", "jpeg", "png", "dng", "cin", "bmp"}
+)
+AUDIO_EXTENSIONS = frozenset({"wav", "mp3", "aac", "m4a", "aif", "aiff", "flac"})
+MEDIA_EXTENSIONS = VIDEO_EXTENSIONS | IMAGE_EXTENSIONS | AUDIO_EXTENSIONS
+
+RENDER_FORMATS = {
+    "AVI": "avi",
+    "BRAW": "braw",
+    "Cineon": "cin",
+    "DCP": "dcp",
+    "DPX": "dpx",
+    "EXR": "exr",
+    "GIF": "gif",
+    "HLS": "m3u8",
+    "IMF": "imf",
+    "JPEG 2000": "j2c",
+    "MJ2": "mj2",
+    "MKV": "mkv",
+    "MP4": "mp4",
+    "MTS": "mts",
+    "MXF OP-Atom": "mxf",
+    "MXF OP1A": "mxf_op1a",
+    "Panasonic AVC": "pavc",
+    "QuickTime": "mov",
+    "TIFF": "tif",
+    "Wave": "wav",
+}
+
+RENDER_CODECS = {
+    "mov": {
+        "Apple ProRes 422": "ProRes422",
+        "Apple ProRes 422 HQ": "ProRes422HQ",
+        "Apple ProRes 422 LT": "ProRes422LT",
+        "Apple ProRes 4444": "ProRes4444",
+        "Apple ProRes 4444 XQ": "ProRes4444XQ",
+        "DNxHR HQ": "DNxHRHQ",
+        "DNxHR HQX": "DNxHRHQX",
+        "H.264": "H264",
+        "H.265": "H265",
+        "Uncompressed 10-bit 4:2:2": "v210",
+    },
+    "mp4": {"H.264": "H264", "H.265": "H265", "AV1": "AV1"},
+    "mkv": {"H.264": "H264", "H.265": "H265", "AV1": "AV1"},
+    "mxf": {"DNxHR HQX": "DNxHRHQX", "DNxHD 175x": "DNxHD175x"},
+    "mxf_op1a": {
+        "DNxHR HQX": "DNxHRHQX",
+        "Apple ProRes 422 HQ": "ProRes422HQ",
+        "XAVC Intra": "XAVCIntra",
+    },
+    "dpx": {"RGB 10-bit": "RGB10", "RGB 16-bit": "RGB16"},
+    "exr": {"RGB Half (DWAA)": "RGBHalfDWAA", "RGB Half (PIZ)": "RGBHalfPIZ"},
+    "tif": {"RGB 8-bit": "RGB8", "RGB 16-bit": "RGB16"},
+    "wav": {"Linear PCM": "LinearPCM"},
+}
+
+RENDER_RESOLUTIONS = (
+    (720, 480),
+    (720, 576),
+    (1280, 720),
+    (1920, 1080),
+    (2048, 1080),
+    (2560, 1440),
+    (3840, 2160),
+    (4096, 2160),
+)
+
+RENDER_SETTING_KEYS = frozenset(
+    {
+        "SelectAllFrames",
+        "MarkIn",
+        "MarkOut",
+        "TargetDir",
+        "CustomName",
+        "UniqueFilenameStyle",
+        "ExportVideo",
+        "ExportAudio",
+        "FormatWidth",
+        "FormatHeight",
+        "FrameRate",
+        "PixelAspectRatio",
+        "VideoQuality",
+        "AudioCodec",
+        "AudioBitDepth",
+        "AudioSampleRate",
+        "ColorSpaceTag",
+        "GammaTag",
+        "ExportAlpha",
+        "EncodingProfile",
+        "MultiPassEncode",
+        "AlphaMode",
+        "NetworkOptimization",
+        "ClipStartFrame",
+        "TimelineStartTimecode",
+        "ReplaceExistingFilesInPlace",
+        "ExportSubtitle",
+        "SubtitleFormat",
+    }
+)
+
+DEFAULT_PROJECT_SETTINGS = {
+    "colorScienceMode": "davinciYRGB",
+    "colorSpaceInput": "Rec.709 (Scene)",
+    "colorSpaceOutput": "Rec.709 Gamma 2.4",
+    "colorSpaceTimeline": "Rec.709 Gamma 2.4",
+    "nodeStackLayers": "1",
+    "perfProxyMediaMode": "0",
+    "superScale": "0",
+    "timelineDropFrameTimecode": "0",
+    "timelineFrameRate": "24",
+    "timelineInterlaceProcessing": "0",
+    "timelineOutputResolutionHeight": "1080",
+    "timelineOutputResolutionWidth": "1920",
+    "timelinePixelAspectRatio": "square",
+    "timelinePlaybackFrameRate": "24",
+    "timelineResolutionHeight": "1080",
+    "timelineResolutionWidth": "1920",
+    "timelineSaveThumbsInProject": "0",
+    "videoMonitorFormat": "HD 1080p 24",
+}
+
+DEFAULT_ITEM_PROPERTIES = {
+    "AnchorPointX": 0.0,
+    "AnchorPointY": 0.0,
+    "CompositeMode": 0,
+    "CropBottom": 0.0,
+    "CropLeft": 0.0,
+    "CropRetain": False,
+    "CropRight": 0.0,
+    "CropSoftness": 0.0,
+    "CropTop": 0.0,
+    "Distortion": 0.0,
+    "DynamicZoomEase": 0,
+    "FlipX": False,
+    "FlipY": False,
+    "MotionEstimation": 0,
+    "Opacity": 100.0,
+    "Pan": 0.0,
+    "Pitch": 0.0,
+    "ResizeFilter": 0,
+    "RetimeProcess": 0,
+    "RotationAngle": 0.0,
+    "Scaling": 0,
+    "Tilt": 0.0,
+    "Yaw": 0.0,
+    "ZoomGang": True,
+    "ZoomX": 1.0,
+    "ZoomY": 1.0,
+}
+
+METADATA_KEYS = frozenset(
+    {
+        "Description",
+        "Comments",
+        "Keywords",
+        "People",
+        "Shot",
+        "Scene",
+        "Take",
+        "Angle",
+        "Move",
+        "Day / Night",
+        "Good Take",
+        "Camera #",
+        "Camera Type",
+        "Roll Card #",
+        "Reel Number",
+        "Lens Type",
+        "Shutter",
+        "ISO",
+        "White Point (Kelvin)",
+        "Camera Notes",
+        "Production Name",
+        "Director",
+        "Editor",
+    }
+)
+
+READ_ONLY_CLIP_PROPERTIES = frozenset(
+    {
+        "Audio Bit Depth",
+        "Audio Ch",
+        "Audio Codec",
+        "Bit Depth",
+        "Date Added",
+        "Date Created",
+        "Date Modified",
+        "Duration",
+        "End",
+        "End TC",
+        "FPS",
+        "File Name",
+        "File Path",
+        "Format",
+        "Frames",
+        "Online Status",
+        "Resolution",
+        "Sample Rate",
+        "Start",
+        "Type",
+        "Usage",
+        "Video Codec",
+    }
+)
+
+STILL_FORMATS = ("dpx", "cin", "tif", "jpg", "png", "ppm", "bmp", "xpm", "drx")
+
+_DATE_FORMAT = "%a %b %d %Y %H:%M:%S"
+
+_id_prefix = str(uuid.uuid4())[:23]
+
+
+def _remote_call(func: Callable, key: str) -> Callable:
+    @functools.wraps(func)
+    def call(self, *args, **kwargs):
+        app = self._app
+        app.call_count += 1
+        app.calls[key] += 1
+        if app.call_latency:
+            time.sleep(app.call_latency)
+        return func(self, *args, **kwargs)
+
+    return call
+
+
+class _FakeObject:
+    """
+    Base class of all fake API objects.
+
+    Every public (CamelCase) method defined on a subclass is wrapped so that calling
+    it is accounted as one round trip on the owning :class:`FakeResolve`, optionally
+    delayed by :attr:`FakeResolve.call_latency` to model IPC cost.
+
+    """
+
+    _app: "FakeResolve"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__name__.startswith("Fake"):
+            return
+        api_name = cls.__name__[len("Fake") :]
+        mixins = [
+            base
+            for base in reversed(cls.__mro__)
+            if base.__module__ == __name__ and base.__name__.startswith("_")
+        ]
+        methods = {}
+        for owner in mixins + [cls]:
+            methods.update(
+                (name, attr)
+                for name, attr in vars(owner).items()
+                if name[:1].isupper() and callable(attr)
+            )
+        for name, attr in methods.items():
+            setattr(cls, name, _remote_call(attr, f"{api_name}.{name}"))
+
+
+_ids = itertools.count(1)
+
+
+def _new_id() -> str:
+    # UUID-shaped but sequential, so that IDs are unique and cheap to mint.
+    return f"{_id_prefix}-{next(_ids):012x}"
+
+
+def _synthetic_rgb(width: int, height: int, seed: int) -> bytes:
+    rng = random.Random(seed)
+    red, green, blue = rng.randrange(256), rng.randrange(256), rng.randrange(256)
+    row = bytearray(width * 3)
+    for x in range(width):
+        shade = x * 255 // max(width - 1, 1)
+        row[x * 3] = (red + shade) // 2
+        row[x * 3 + 1] = green
+        row[x * 3 + 2] = (blue + 255 - shade) // 2
+    return bytes(row) * height
+
+
+def _encode_png(width: int, height: int, rgb: bytes) -> bytes:
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+        )
+
+    stride = width * 3
+    raw = b"".join(b"\x00" + rgb[y * stride : (y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(raw, 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _encode_bmp(width: int, height: int, rgb: bytes) -> bytes:
+    stride = width * 3
+    padding = b"\x00" * (-stride % 4)
+    rows = []
+    for y in range(height - 1, -1, -1):
+        row = bytearray(rgb[y * stride : (y + 1) * stride])
+        row[0::3], row[2::3] = row[2::3], row[0::3]
+        rows.append(bytes(row) + padding)
+    pixels = b"".join(rows)
+    header = struct.pack("<2sIHHI", b"BM", 54 + len(pixels), 0, 0, 54)
+    info = struct.pack(
+        "<IiiHHIIiiII", 40, width, height, 1, 24, 0, len(pixels), 0, 0, 0, 0
+    )
+    return header + info + pixels
+
+
+def _encode_still(fmt: str, width: int, height: int, rgb: bytes) -> bytes:
+    if fmt == "ppm":
+        return b"P6\n%d %d\n255\n" % (width, height) + rgb
+    if fmt == "png":
+        return _encode_png(width, height, rgb)
+    if fmt == "bmp":
+        return _encode_bmp(width, height, rgb)
+    if fmt == "drx":
+        return b'<?xml version="1.0" encoding="UTF-8"?>\n<Still/>\n'
+    # Other formats are written as a small header followed by raw RGB8 samples.
+    return b"DRIFAKE %s %d %d\n" % (fmt.encode(), width, height) + rgb
+
+
+def _media_kind(path: str) -> Optional[str]:
+    extension = os.path.splitext(path)[1][1:].lower()
+    if extension in VIDEO_EXTENSIONS:
+        return "Video + Audio"
+    if extension in IMAGE_EXTENSIONS:
+        return "Still"
+    if extension in AUDIO_EXTENSIONS:
+        return "Audio"
+    return None
+
+
+class _Track:
+    __slots__ = ("track_type", "name", "sub_type", "enabled", "locked", "items")
+
+    def __init__(self, track_type: str, name: str, sub_type: str = ""):
+        self.track_type = track_type
+        self.name = name
+        self.sub_type = sub_type
+        self.enabled = True
+        self.locked = False
+        self.items: list[FakeTimelineItem] = []
+
+    def end(self, default: int) -> int:
+        return self.items[-1]._end if self.items else default
+
+    def insert(self, item: "FakeTimelineItem") -> None:
+        items = self.items
+        if not items or items[-1]._start <= item._start:
+            items.append(item)
+            return
+        low, high = 0, len(items)
+        while low < high:
+            middle = (low + high) // 2
+            if items[middle]._start <= item._start:
+                low = middle + 1
+            else:
+                high = middle
+        items.insert(low, item)
+
+
+class _RenderJob:
+    __slots__ = (
+        "job_id",
+        "info",
+        "frames",
+        "started_at",
+        "finishes_at",
+        "fail",
+        "cancelled",
+    )
+
+    def __init__(self, job_id: str, info: dict, frames: int):
+        self.job_id = job_id
+        self.info = info
+        self.frames = frames
+        self.started_at: Optional[float] = None
+        self.finishes_at: Optional[float] = None
+        self.fail = False
+        self.cancelled = False
+
+
+class _ProjectFolder:
+    __slots__ = ("name", "parent", "folders", "projects")
+
+    def __init__(self, name: str, parent: Optional["_ProjectFolder"] = None):
+        self.name = name
+        self.parent = parent
+        self.folders: dict[str, _ProjectFolder] = {}
+        self.projects: dict[str, FakeProject] = {}
+
+
+class FakeResolve(_FakeObject, Resolve):
+    """
+    In-memory stand-in for the ``Resolve`` app object.
+
+    Parameters
+    ----------
+    volumes
+        Folder paths reported by :meth:`FakeMediaStorage.GetMountedVolumeList`.
+        Defaults to the filesystem root.
+    call_latency
+        Seconds to sleep on every API call, to model the IPC round trip of the real
+        scripting bridge. Defaults to 0.
+    project_load_latency
+        Seconds to sleep in :meth:`FakeProjectManager.LoadProject`. Defaults to 0.
+    render_fps
+        Simulated render speed in frames per second. Defaults to 500.
+    clock
+        Monotonic clock used by the render simulation. Defaults to
+        :func:`time.monotonic`.
+    thumbnail_size
+        Width and height of :meth:`FakeTimeline.GetCurrentClipThumbnailImage`
+        images. Defaults to (320, 180).
+    still_size
+        Width and height of exported gallery stills. Defaults to (320, 180).
+
+    Attributes
+    ----------
+    call_count : int
+        Number of API calls served so far.
+    calls : Counter
+        Number of API calls served so far, keyed by "Class.Method".
+
+    """
+
+    def __init__(
+        self,
+        volumes: Optional[list[str]] = None,
+        call_latency: float = 0.0,
+        project_load_latency: float = 0.0,
+        render_fps: float = 500.0,
+        clock: Callable[[], float] = time.monotonic,
+        thumbnail_size: tuple[int, int] = (320, 180),
+        still_size: tuple[int, int] = (320, 180),
+    ):
+        self._app = self
+        self.call_count = 0
+        self.calls: Counter = Counter()
+        self.call_latency = call_latency
+        self.project_load_latency = project_load_latency
+        self.render_fps = render_fps
+        self.clock = clock
+        self.thumbnail_size = thumbnail_size
+        self.still_size = still_size
+        self._page = "edit"
+        self._keyframe_mode = 0
+        self._layout_presets: set[str] = set()
+        self._render_presets: dict[str, dict] = {}
+        self._burn_in_presets: set[str] = set()
+        self._media_storage = FakeMediaStorage(
+            self, volumes if volumes is not None else [os.path.abspath(os.sep)]
+        )
+        self._project_manager = FakeProjectManager(self)
+
+    def reset_call_stats(self) -> None:
+        """
+        Resets :attr:`call_count` and :attr:`calls` to zero.
+
+        """
+        self.call_count = 0
+        self.calls.clear()
+
+    def Fusion(self):
+        return None
+
+    def GetMediaStorage(self) -> "FakeMediaStorage":
+        return self._media_storage
+
+    def GetProjectManager(self) -> "FakeProjectManager":
+        return self._project_manager
+
+    def OpenPage(self, page_name: str) -> bool:
+        if page_name not in PAGES:
+            return False
+        self._page = page_name
+        return True
+
+    def GetCurrentPage(self) -> str:
+        return self._page
+
+    def GetProductName(self) -> str:
+        return "DaVinci Resolve Studio"
+
+    def GetVersion(self) -> list:
+        return [20, 2, 0, 49, ""]
+
+    def GetVersionString(self) -> str:
+        return "20.2.0.49"
+
+    def LoadLayoutPreset(self, preset_name: str) -> bool:
+        return preset_name in self._layout_presets
+
+    def UpdateLayoutPreset(self, preset_name: str) -> bool:
+        return preset_name in self._layout_presets
+
+    def ExportLayoutPreset(self, preset_name: str, preset_file_path: str) -> bool:
+        if preset_name not in self._layout_presets:
+            return False
+        Path(preset_file_path).write_text(json.dumps({"name": preset_name}))
+        return True
+
+    def DeleteLayoutPreset(self, preset_name: str) -> bool:
+        if preset_name not in self._layout_presets:
+            return False
+        self._layout_presets.discard(preset_name)
+        return True
+
+    def SaveLayoutPreset(self, preset_name: str) -> bool:
+        if preset_name in self._layout_presets:
+            return False
+        self._layout_presets.add(preset_name)
+        return True
+
+    def ImportLayoutPreset(self, preset_file_path: str, preset_name: str = "") -> bool:
+        if not os.path.isfile(preset_file_path):
+            return False
+        self._layout_presets.add(preset_name or Path(preset_file_path).stem)
+        return True
+
+    def Quit(self):
+        project = self._project_manager._current_project
+        if project is not None:
+            project._stop_rendering()
+
+    def ImportRenderPreset(self, preset_path: str) -> bool:
+        try:
+            preset = json.loads(Path(preset_path).read_text())
+        except (OSError, ValueError):
+            return False
+        name = preset.get("name") or Path(preset_path).stem
+        self._render_presets[name] = preset
+        project = self._project_manager._current_project
+        if project is not None:
+            project._apply_render_preset(preset)
+        return True
+
+    def ExportRenderPreset(self, preset_name: str, export_path: str) -> bool:
+        preset = self._render_presets.get(preset_name)
+        if preset is None:
+            return False
+        Path(export_path).write_text(json.dumps(preset))
+        return True
+
+    def ImportBurnInPreset(self, preset_path: str) -> bool:
+        if not os.path.isfile(preset_path):
+            return False
+        self._burn_in_presets.add(Path(preset_path).stem)
+        return True
+
+    def ExportBurnInPreset(self, preset_name: str, export_path: str) -> bool:
+        if preset_name not in self._burn_in_presets:
+            return False
+        Path(export_path).write_text(json.dumps({"name": preset_name}))
+        return True
+
+    def GetKeyframeMode(self) -> int:
+        return self._keyframe_mode
+
+    def SetKeyframeMode(self, keyframe_mode: int) -> bool:
+        if int(keyframe_mode) not in (0, 1, 2):
+            return False
+        self._keyframe_mode = int(keyframe_mode)
+        return True
+
+
+class FakeProjectManager(_FakeObject, ProjectManager):
+    """
+    Project manager over one or more in-memory databases, each holding a tree of
+    project folders.
+
+    """
+
+    def __init__(self, app: FakeResolve):
+        self._app = app
+        self._databases: dict[tuple, _ProjectFolder] = {}
+        self._database_info: dict[tuple, dict[str, str]] = {}
+        self._current_database = self._add_database(
+            {"DbType": "Disk", "DbName": "Local Database"}
+        )
+        self._current_folder = self._databases[self._current_database]
+        self._current_project: Optional[FakeProject] = None
+        self._current_project = self._create_project("Untitled Project")
+
+    def _add_database(self, db_info: dict) -> tuple:
+        key = (db_info.get("DbType", "Disk"), db_info.get("DbName", ""))
+        if key not in self._databases:
+            info = {"DbType": key[0], "DbName": key[1]}
+            if key[0] == "PostgreSQL":
+                info["IpAddress"] = db_info.get("IpAddress", "127.0.0.1")
+            self._databases[key] = _ProjectFolder("")
+            self._database_info[key] = info
+        return key
+
+    def add_database(self, db_info: dict) -> None:
+        """
+        Registers a database so that it shows up in :meth:`GetDatabaseList` and can
+        be selected with :meth:`SetCurrentDatabase`.
+
+        Parameters
+        ----------
+        db_info
+            Dict with keys "DbType", "DbName" and optional "IpAddress".
+
+        """
+        self._add_database(db_info)
+
+    def _create_project(self, name: str) -> "FakeProject":
+        project = FakeProject(self._app, name)
+        self._current_folder.projects[name] = project
+        return project
+
+    def _find_project(self, project: "FakeProject") -> Optional[_ProjectFolder]:
+        pending = list(self._databases.values())
+        while pending:
+            folder = pending.pop()
+            if folder.projects.get(project._name) is project:
+                return folder
+            pending.extend(folder.folders.values())
+        return None
+
+    def ArchiveProject(
+        self,
+        project_name: str,
+        file_path: str,
+        is_archive_src_media: bool = True,
+        is_archive_render_cache: bool = True,
+        is_archive_proxy_media: bool = False,
+    ) -> bool:
+        project = self._current_folder.projects.get(project_name)
+        if project is None:
+            return False
+        Path(file_path).write_text(json.dumps(project._summary()))
+        return True
+
+    def CreateProject(self, project_name: str) -> Optional["FakeProject"]:
+        if not project_name or project_name in self._current_folder.projects:
+            return None
+        if self._current_project is not None:
+            self._current_project._stop_rendering()
+        self._current_project = self._create_project(project_name)
+        return self._current_project
+
+    def DeleteProject(self, project_name: str) -> bool:
+        project = self._current_folder.projects.get(project_name)
+        if project is None or project is self._current_project:
+            return False
+        del self._current_folder.projects[project_name]
+        return True
+
+    def LoadProject(self, project_name: str) -> Optional["FakeProject"]:
+        project = self._current_folder.projects.get(project_name)
+        if project is None:
+            return None
+        if self._app.project_load_latency:
+            time.sleep(self._app.project_load_latency)
+        if self._current_project is not None and self._current_project is not project:
+            self._current_project._stop_rendering()
+        self._current_project = project
+        return project
+
+    def GetCurrentProject(self) -> Optional["FakeProject"]:
+        return self._current_project
+
+    def SaveProject(self) -> bool:
+        if self._current_project is None:
+            return False
+        self._current_project._saved_at = time.time()
+        return True
+
+    def CloseProject(self, project: "FakeProject") -> bool:
+        if project is None or project is not self._current_project:
+            return False
+        project._stop_rendering()
+        self._current_project = None
+        return True
+
+    def CreateFolder(self, folder_name: str) -> bool:
+        if not folder_name or folder_name in self._current_folder.folders:
+            return False
+        self._current_folder.folders[folder_name] = _ProjectFolder(
+            folder_name, self._current_folder
+        )
+        return True
+
+    def DeleteFolder(self, folder_name: str) -> bool:
+        folder = self._current_folder.folders.get(folder_name)
+        if folder is None:
+            return False
+        current = self._current_project
+        if current is not None and self._find_project(current) is not None:
+            pending = [folder]
+            while pending:
+                node = pending.pop()
+                if node.projects.get(current._name) is current:
+                    return False
+                pending.extend(node.folders.values())
+        del self._current_folder.folders[folder_name]
+        return True
+
+    def GetProjectListInCurrentFolder(self) -> list[str]:
+        return list(self._current_folder.projects)
+
+    def GetFolderListInCurrentFolder(self) -> list[str]:
+        return list(self._current_folder.folders)
+
+    def GotoRootFolder(self) -> bool:
+        self._current_folder = self._databases[self._current_database]
+        return True
+
+    def GotoParentFolder(self) -> bool:
+        if self._current_folder.parent is None:
+            return False
+        self._current_folder = self._current_folder.parent
+        return True
+
+    def GetCurrentFolder(self) -> str:
+        return self._current_folder.name
+
+    def OpenFolder(self, folder_name: str) -> bool:
+        folder = self._current_folder.folders.get(folder_name)
+        if folder is None:
+            return False
+        self._current_folder = folder
+        return True
+
+    def ImportProject(self, file_path: str, project_name: str = None) -> bool:
+        if not os.path.isfile(file_path):
+            return False
+        name = project_name or Path(file_path).stem
+        if name in self._current_folder.projects:
+            return False
+        project = FakeProject(self._app, name)
+        self._current_folder.projects[name] = project
+        try:
+            summary = json.loads(Path(file_path).read_text())
+        except ValueError:
+            summary = {}
+        for setting_name, value in summary.get("settings", {}).items():
+            project._settings[setting_name] = value
+        return True
+
+    def ExportProject(
+        self, project_name: str, file_path: str, with_stills_and_luts: bool = True
+    ) -> bool:
+        project = self._current_folder.projects.get(project_name)
+        if project is None:
+            return False
+        path = file_path if file_path.endswith(".drp") else f"{file_path}.drp"
+        Path(path).write_text(json.dumps(project._summary()))
+        return True
+
+    def RestoreProject(self, file_path: str, project_name: str = None) -> bool:
+        return self.ImportProject.__wrapped__(self, file_path, project_name)
+
+    def GetCurrentDatabase(self) -> dict[str, str]:
+        return dict(self._database_info[self._current_database])
+
+    def GetDatabaseList(self) -> list[dict[str, str]]:
+        return [dict(info) for info in self._database_info.values()]
+
+    def SetCurrentDatabase(self, db_info: dict) -> bool:
+        key = (db_info.get("DbType", "Disk"), db_info.get("DbName", ""))
+        if key not in self._databases:
+            return False
+        if self._current_project is not None:
+            self._current_project._stop_rendering()
+            self._current_project = None
+        self._current_database = key
+        self._current_folder = self._databases[key]
+        return True
+
+    def CreateCloudProject(self, cloud_settings: Optional[dict] = None):
+        return None
+
+    def ImportCloudProject(self, file_path: str, cloud_settings: dict = None) -> bool:
+        return False
+
+    def restoreCloudProject(
+        self, folder_path: str, cloud_settings: dict = None
+    ) -> bool:
+        return False
+
+
+class FakeProject(_FakeObject, Project):
+    """
+    In-memory project: settings, Media Pool, timelines, gallery, color groups and a
+    simulated render queue.
+
+    """
+
+    def __init__(self, app: FakeResolve, name: str):
+        self._app = app
+        self._name = name
+        self._unique_id = _new_id()
+        self._settings = dict(DEFAULT_PROJECT_SETTINGS)
+        self._timelines: list[FakeTimeline] = []
+        self._current_timeline: Optional[FakeTimeline] = None
+        self._media_pool = FakeMediaPool(app, self)
+        self._gallery = FakeGallery(app, self)
+        self._color_groups: list[FakeColorGroup] = []
+        self._render_settings: dict[str, Any] = {
+            "SelectAllFrames": True,
+            "TargetDir": "",
+            "CustomName": "",
+            "UniqueFilenameStyle": 0,
+            "ExportVideo": True,
+            "ExportAudio": True,
+            "FormatWidth": 1920,
+            "FormatHeight": 1080,
+            "FrameRate": 24.0,
+            "PixelAspectRatio": "square",
+            "VideoQuality": 0,
+            "AudioCodec": "aac",
+            "AudioBitDepth": 16,
+            "AudioSampleRate": 48000,
+            "ColorSpaceTag": "Same as Project",
+            "GammaTag": "Same as Project",
+            "ExportAlpha": False,
+        }
+        self._render_format = "mov"
+        self._render_codec = "H264"
+        self._render_mode = 1
+        self._render_jobs: dict[str, _RenderJob] = {}
+        self._render_job_counter = 0
+        self._render_batch: list[_RenderJob] = []
+        self._presets = [
+            {"Name": "Current Project", "Width": 1920, "Height": 1080},
+            {"Name": "System Config", "Width": 1920, "Height": 1080},
+        ]
+        self._render_presets = {
+            "H.264 Master": {"format": "mp4", "codec": "H264", "settings": {}},
+            "YouTube - 1080p": {
+                "format": "mp4",
+                "codec": "H264",
+                "settings": {"FormatWidth": 1920, "FormatHeight": 1080},
+            },
+            "ProRes 422 HQ": {"format": "mov", "codec": "ProRes422HQ", "settings": {}},
+        }
+        self._saved_at: Optional[float] = None
+
+    def _summary(self) -> dict:
+        return {
+            "name": self._name,
+            "settings": self._settings,
+            "timelines": [timeline._name for timeline in self._timelines],
+        }
+
+    def _fps(self) -> float:
+        return float(self._settings["timelineFrameRate"])
+
+    def _drop_frame(self) -> bool:
+        return self._settings["timelineDropFrameTimecode"] == "1"
+
+    def _new_timeline(self, name: str) -> Optional["FakeTimeline"]:
+        if not name or any(timeline._name == name for timeline in self._timelines):
+            return None
+        timeline = FakeTimeline(self._app, self, name)
+        self._timelines.append(timeline)
+        self._media_pool._current_folder._timelines.append(timeline)
+        if self._current_timeline is None:
+            self._current_timeline = timeline
+        return timeline
+
+    def _remove_timeline(self, timeline: "FakeTimeline") -> None:
+        self._timelines.remove(timeline)
+        pending = [self._media_pool._root]
+        while pending:
+            folder = pending.pop()
+            if timeline in folder._timelines:
+                folder._timelines.remove(timeline)
+            pending.extend(folder._subfolders)
+        if self._current_timeline is timeline:
+            self._current_timeline = self._timelines[0] if self._timelines else None
+
+    def populate(
+        self,
+        clip_count: int = 100,
+        timeline_count: int = 1,
+        bin_count: int = 1,
+        items_per_timeline: Optional[int] = None,
+        video_tracks: int = 1,
+        markers_per_item: int = 0,
+        seed: int = 0,
+    ) -> "FakeProject":
+        """
+        Fills the project with synthetic clips and timelines without touching the
+        filesystem, for load testing.
+
+        Parameters
+        ----------
+        clip_count
+            Number of clips to create, spread round-robin over the bins.
+        timeline_count
+            Number of timelines to create.
+        bin_count
+            Number of bins created under the root folder to hold the clips.
+        items_per_timeline
+            Number of video items per timeline. Defaults to ``clip_count``.
+        video_tracks
+            Number of video tracks the items are spread over.
+        markers_per_item
+            Number of markers added to every timeline item.
+        seed
+            Seed of the pseudo-random clip durations.
+
+        Returns
+        -------
+        FakeProject
+            This project.
+
+        """
+        rng = random.Random(seed)
+        media_pool = self._media_pool
+        fps = self._fps()
+        bins = [
+            media_pool._add_subfolder(media_pool._root, f"Bin {index + 1}")
+            for index in range(bin_count)
+        ]
+        clips = []
+        for index in range(clip_count):
+            reel = index // 100 + 1
+            path = f"/synthetic/A{reel:03d}/A{reel:03d}C{index % 100 + 1:03d}.mov"
+            frames = rng.randrange(24, 2400)
+            start = rng.randrange(0, 24 * 3600 * 12)
+            clips.append(
+                media_pool._add_clip(
+                    bins[index % bin_count],
+                    path,
+                    frames=frames,
+                    fps=fps,
+                    start_frame=start,
+                    reel=f"A{reel:03d}",
+                )
+            )
+        item_count = clip_count if items_per_timeline is None else items_per_timeline
+        colors = MARKER_COLORS
+        for timeline_index in range(timeline_count):
+            name = f"Timeline {len(self._timelines) + 1}"
+            timeline = self._new_timeline(name)
+            for _ in range(len(timeline._tracks["video"]), video_tracks):
+                timeline._add_track("video")
+            if not clips:
+                continue
+            for item_index in range(item_count):
+                clip = clips[(timeline_index + item_index) % len(clips)]
+                frames = clip._frames
+                source_in = rng.randrange(0, max(frames // 4, 1))
+                source_out = max(
+                    source_in, frames - 1 - rng.randrange(0, max(frames // 4, 1))
+                )
+                track = timeline._tracks["video"][item_index % video_tracks]
+                item = timeline._place(
+                    clip, track, source_in, source_out, track.end(timeline._start_frame)
+                )
+                for marker_index in range(markers_per_item):
+                    item._markers[
+                        marker_index
+                        * max(item._duration // max(markers_per_item, 1), 1)
+                    ] = {
+                        "color": colors[marker_index % len(colors)],
+                        "duration": 1,
+                        "note": "",
+                        "name": f"Marker {marker_index + 1}",
+                        "customData": "",
+                    }
+        return self
+
+    def fail_render_job(self, job_id: str) -> bool:
+        """
+        Makes the given render job fail halfway through when it is rendered.
+
+        Parameters
+        ----------
+        job_id
+            Render job's ID (string).
+
+        Returns
+        -------
+        bool
+            True if the job exists, False otherwise.
+
+        """
+        job = self._render_jobs.get(job_id)
+        if job is None:
+            return False
+        job.fail = True
+        return True
+
+    def _apply_render_preset(self, preset: dict) -> None:
+        self._render_format = preset.get("format", self._render_format)
+        self._render_codec = preset.get("codec", self._render_codec)
+        self._render_settings.update(preset.get("settings", {}))
+
+    def _job_status(self, job: _RenderJob, now: float) -> dict[str, Union[str, int]]:
+        if job.started_at is None or now < job.started_at:
+            return {"JobStatus": "Ready", "CompletionPercentage": 0}
+        duration = job.finishes_at - job.started_at
+        if job.cancelled:
+            return {"JobStatus": "Cancelled", "CompletionPercentage": 0}
+        if now < job.finishes_at:
+            fraction = (now - job.started_at) / (job.frames / self._app.render_fps)
+            return {
+                "JobStatus": "Rendering",
+                "CompletionPercentage": min(int(fraction * 100), 99),
+                "EstimatedTimeRemainingInMs": int(
+                    (job.started_at + job.frames / self._app.render_fps - now) * 1000
+                ),
+            }
+        if job.fail:
+            return {
+                "JobStatus": "Failed",
+                "CompletionPercentage": 50,
+                "Error": "Render job failed.",
+            }
+        return {
+            "JobStatus": "Complete",
+            "CompletionPercentage": 100,
+            "TimeTakenToRenderInMs": int(duration * 1000),
+        }
+
+    def _stop_rendering(self) -> None:
+        now = self._app.clock()
+        for job in self._render_batch:
+            if job.finishes_at is not None and now < job.finishes_at:
+                if job.started_at <= now:
+                    job.cancelled = True
+                else:
+                    job.started_at = job.finishes_at = None
+        self._render_batch = []
+
+    def GetMediaPool(self) -> "FakeMediaPool":
+        return self._media_pool
+
+    def GetTimelineCount(self) -> int:
+        return len(self._timelines)
+
+    def GetTimelineByIndex(self, idx: int) -> Optional["FakeTimeline"]:
+        if not 1 <= idx <= len(self._timelines):
+            return None
+        return self._timelines[idx - 1]
+
+    def GetCurrentTimeline(self) -> Optional["FakeTimeline"]:
+        return self._current_timeline
+
+    def SetCurrentTimeline(self, timeline: "FakeTimeline") -> bool:
+        if timeline not in self._timelines:
+            return False
+        self._current_timeline = timeline
+        return True
+
+    def GetGallery(self) -> "FakeGallery":
+        return self._gallery
+
+    def GetName(self) -> str:
+        return self._name
+
+    def SetName(self, project_name: str) -> bool:
+        manager = self._app._project_manager
+        folder = manager._find_project(self)
+        if not project_name or folder is None or project_name in folder.projects:
+            return False
+        del folder.projects[self._name]
+        folder.projects[project_name] = self
+        self._name = project_name
+        return True
+
+    def GetPresetList(self) -> list[dict[str, str]]:
+        return [dict(preset) for preset in self._presets]
+
+    def SetPreset(self, preset_name: str) -> bool:
+        for preset in self._presets:
+            if preset["Name"] == preset_name:
+                self._settings["timelineResolutionWidth"] = str(preset["Width"])
+                self._settings["timelineResolutionHeight"] = str(preset["Height"])
+                return True
+        return False
+
+    def AddRenderJob(self) -> Optional[str]:
+        timeline = self._current_timeline
+        if timeline is None:
+            return None
+        settings = self._render_settings
+        if (
+            not settings.get("TargetDir")
+            or timeline._end_frame() == timeline._start_frame
+        ):
+            return ""
+        if settings.get("SelectAllFrames", True) or "MarkIn" not in settings:
+            mark_in, mark_out = timeline._start_frame, timeline._end_frame() - 1
+        else:
+            mark_in, mark_out = (
+                settings["MarkIn"],
+                settings.get("MarkOut", settings["MarkIn"]),
+            )
+        self._render_job_counter += 1
+        job_id = _new_id()
+        name = settings.get("CustomName") or timeline._name
+        info = {
+            "JobId": job_id,
+            "RenderJobName": f"Job {self._render_job_counter}",
+            "TimelineName": timeline._name,
+            "TargetDir": settings["TargetDir"],
+            "OutputFilename": f"{name}.{self._render_format}",
+            "IsExportVideo": settings.get("ExportVideo", True),
+            "IsExportAudio": settings.get("ExportAudio", True),
+            "FormatWidth": settings.get("FormatWidth", 1920),
+            "FormatHeight": settings.get("FormatHeight", 1080),
+            "FrameRate": str(settings.get("FrameRate", self._fps())),
+            "PixelAspectRatio": settings.get("PixelAspectRatio", "square"),
+            "MarkIn": mark_in,
+            "MarkOut": mark_out,
+            "AudioBitDepth": settings.get("AudioBitDepth", 16),
+            "AudioSampleRate": settings.get("AudioSampleRate", 48000),
+            "ExportAlpha": settings.get("ExportAlpha", False),
+            "VideoFormat": self._render_format,
+            "VideoCodec": self._render_codec,
+            "RenderMode": "Single clip"
+            if self._render_mode == 1
+            else "Individual clips",
+        }
+        self._render_jobs[job_id] = _RenderJob(
+            job_id, info, max(mark_out - mark_in + 1, 1)
+        )
+        return job_id
+
+    def DeleteRenderJob(self, job_id: str) -> bool:
+        job = self._render_jobs.get(job_id)
+        if job is None or job in self._render_batch and self._is_rendering():
+            return False
+        del self._render_jobs[job_id]
+        return True
+
+    def DeleteAllRenderJobs(self) -> bool:
+        if self._is_rendering():
+            return False
+        self._render_jobs.clear()
+        return True
+
+    def GetRenderJobList(self) -> list[dict[str, Union[str, int, float, bool]]]:
+        return [dict(job.info) for job in self._render_jobs.values()]
+
+    def GetRenderPresetList(self) -> list[str]:
+        return list(self._render_presets) + list(self._app._render_presets)
+
+    def _is_rendering(self) -> bool:
+        now = self._app.clock()
+        return any(
+            job.finishes_at is not None and not job.cancelled and now < job.finishes_at
+            for job in self._render_batch
+        )
+
+    def StartRendering(self, *job_ids, is_interactive_mode: bool = False) -> bool:
+        if job_ids and isinstance(job_ids[-1], bool):
+            job_ids = job_ids[:-1]
+        if len(job_ids) == 1 and isinstance(job_ids[0], (list, tuple)):
+            job_ids = tuple(job_ids[0])
+        if self._is_rendering():
+            return False
+        if job_ids:
+            if any(job_id not in self._render_jobs for job_id in job_ids):
+                return False
+            jobs = [self._render_jobs[job_id] for job_id in job_ids]
+        else:
+            jobs = [
+                job
+                for job in self._render_jobs.values()
+                if job.started_at is None or job.cancelled
+            ]
+        if not jobs:
+            return False
+        start = self._app.clock()
+        for job in jobs:
+            seconds = job.frames / self._app.render_fps
+            if job.fail:
+                seconds /= 2
+            job.cancelled = False
+            job.started_at = start
+            job.finishes_at = start + seconds
+            start += seconds
+        self._render_batch = jobs
+        return True
+
+    def StopRendering(self):
+        self._stop_rendering()
+
+    def IsRenderingInProgress(self) -> bool:
+        return self._is_rendering()
+
+    def LoadRenderPreset(self, preset_name: str) -> bool:
+        preset = self._render_presets.get(preset_name) or self._app._render_presets.get(
+            preset_name
+        )
+        if preset is None:
+            return False
+        self._apply_render_preset(preset)
+        return True
+
+    def SaveAsNewRenderPreset(self, preset_name: str) -> bool:
+        if not preset_name or preset_name in self._render_presets:
+            return False
+        self._render_presets[preset_name] = {
+            "name": preset_name,
+            "format": self._render_format,
+            "codec": self._render_codec,
+            "settings": dict(self._render_settings),
+        }
+        return True
+
+    def SetRenderSettings(self, settings: dict) -> bool:
+        if not isinstance(settings, dict) or not settings:
+            return False
+        if any(key not in RENDER_SETTING_KEYS for key in settings):
+            return False
+        codec = self._render_codec
+        if "EncodingProfile" in settings and codec not in ("H264", "H265"):
+            return False
+        if "AlphaMode" in settings and codec not in ("H264", "H265"):
+            return False
+        if "MultiPassEncode" in settings and codec != "H264":
+            return False
+        self._render_settings.update(settings)
+        if "MarkIn" in settings or "MarkOut" in settings:
+            self._render_settings.setdefault("SelectAllFrames", False)
+            if "SelectAllFrames" not in settings:
+                self._render_settings["SelectAllFrames"] = False
+        return True
+
+    def GetRenderJobStatus(self, job_id: str) -> dict[str, Union[str, int]]:
+        job = self._render_jobs.get(job_id)
+        if job is None:
+            return {}
+        return self._job_status(job, self._app.clock())
+
+    def GetSetting(self, setting_name: str = ""):
+        if not setting_name:
+            return dict(self._settings)
+        return self._settings.get(setting_name, "")
+
+    def SetSetting(self, setting_name: str, setting_value: str) -> bool:
+        if setting_name not in self._settings:
+            return False
+        if setting_name == "timelineFrameRate" and self._timelines:
+            # Resolve locks the timeline frame rate once a timeline exists.
+            return False
+        self._settings[setting_name] = str(setting_value)
+        return True
+
+    def GetRenderFormats(self) -> dict[str, str]:
+        return dict(RENDER_FORMATS)
+
+    def GetRenderCodecs(self, render_format: str) -> dict[str, str]:
+        return dict(RENDER_CODECS.get(render_format.lower(), {}))
+
+    def GetCurrentRenderFormatAndCodec(self) -> dict[str, str]:
+        return {"format": self._render_format, "codec": self._render_codec}
+
+    def SetCurrentRenderFormatAndCodec(self, render_format: str, codec: str) -> bool:
+        codecs = RENDER_CODECS.get(render_format)
+        if codecs is None or codec not in codecs.values():
+            return False
+        self._render_format = render_format
+        self._render_codec = codec
+        if codec not in ("H264", "H265"):
+            for key in ("EncodingProfile", "AlphaMode", "MultiPassEncode"):
+                self._render_settings.pop(key, None)
+        return True
+
+    def GetCurrentRenderMode(self) -> int:
+        return self._render_mode
+
+    def SetCurrentRenderMode(self, render_mode: int) -> bool:
+        if render_mode not in (0, 1):
+            return False
+        self._render_mode = render_mode
+        return True
+
+    def GetRenderResolutions(
+        self, render_format: str = "", codec: str = ""
+    ) -> list[dict[str, int]]:
+        if render_format:
+            codecs = RENDER_CODECS.get(render_format.lower())
+            if codecs is None or (codec and codec not in codecs.values()):
+                return []
+            if render_format.lower() == "wav":
+                return []
+        return [
+            {"Width": width, "Height": height} for width, height in RENDER_RESOLUTIONS
+        ]
+
+    def RefreshLUTList(self) -> bool:
+        return True
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+    def InsertAudioToCurrentTrackAtPlayhead(
+        self, media_path: str, start_offset_in_samples: int, duration_in_samples: int
+    ) -> bool:
+        return self._app._page == "fairlight" and os.path.isfile(media_path)
+
+    def LoadBurnInPreset(self, preset_name: str) -> bool:
+        return preset_name in self._app._burn_in_presets
+
+    def ExportCurrentFrameAsStill(self, file_path: str) -> bool:
+        fmt = os.path.splitext(file_path)[1][1:].lower()
+        timeline = self._current_timeline
+        if fmt not in STILL_FORMATS or timeline is None:
+            return False
+        width, height = self._app.still_size
+        rgb = _synthetic_rgb(width, height, timeline._playhead)
+        Path(file_path).write_bytes(_encode_still(fmt, width, height, rgb))
+        return True
+
+    def GetColorGroupsList(self) -> list["FakeColorGroup"]:
+        return list(self._color_groups)
+
+    def AddColorGroup(self, group_name: str) -> Optional["FakeColorGroup"]:
+        if not group_name or any(
+            group._name == group_name for group in self._color_groups
+        ):
+            return None
+        group = FakeColorGroup(self._app, self, group_name)
+        self._color_groups.append(group)
+        return group
+
+    def DeleteColorGroup(self, color_group: "FakeColorGroup") -> bool:
+        if color_group not in self._color_groups:
+            return False
+        self._color_groups.remove(color_group)
+        for timeline in self._timelines:
+            for track in timeline._tracks["video"]:
+                for item in track.items:
+                    if item._color_group is color_group:
+                        item._color_group = None
+        return True
+
+
+class FakeMediaStorage(_FakeObject, MediaStorage):
+    """
+    Media storage backed by the local filesystem under the configured volumes.
+
+    """
+
+    def __init__(self, app: FakeResolve, volumes: list[str]):
+        self._app = app
+        self._volumes = list(volumes)
+        self._revealed: Optional[str] = None
+
+    def _media_pool(self) -> Optional["FakeMediaPool"]:
+        project = self._app._project_manager._current_project
+        return project._media_pool if project is not None else None
+
+    def GetMountedVolumeList(self) -> list[str]:
+        return list(self._volumes)
+
+    def GetSubFolderList(self, folder_path: str) -> list[str]:
+        try:
+            entries = sorted(os.scandir(folder_path), key=lambda entry: entry.name)
+        except OSError:
+            return []
+        return [entry.path for entry in entries if entry.is_dir()]
+
+    def GetFileList(self, folder_path: str) -> list[str]:
+        try:
+            entries = sorted(os.scandir(folder_path), key=lambda entry: entry.name)
+        except OSError:
+            return []
+        return [entry.path for entry in entries if entry.is_file()]
+
+    def RevealInStorage(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        self._revealed = path
+        return True
+
+    def AddItemListToMediaPool(self, *items) -> list["FakeMediaPoolItem"]:
+        media_pool = self._media_pool()
+        if media_pool is None or not items:
+            return []
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = tuple(items[0])
+        return media_pool._import(items)
+
+    def AddClipMattesToMediaPool(
+        self,
+        media_pool_item: "FakeMediaPoolItem",
+        paths: list[str],
+        stereo_eye: str = "",
+    ) -> bool:
+        existing = [path for path in paths if os.path.isfile(path)]
+        if not existing or not isinstance(media_pool_item, FakeMediaPoolItem):
+            return False
+        media_pool_item._mattes.extend(existing)
+        return True
+
+    def AddTimelineMattesToMediaPool(
+        self, paths: list[str]
+    ) -> list["FakeMediaPoolItem"]:
+        media_pool = self._media_pool()
+        if media_pool is None:
+            return []
+        return media_pool._import([path for path in paths if os.path.isfile(path)])
+
+
+class FakeMediaPool(_FakeObject, MediaPool):
+    """
+    Media Pool holding a tree of :class:`FakeFolder` bins.
+
+    """
+
+    def __init__(self, app: FakeResolve, project: FakeProject):
+        self._app = app
+        self._project = project
+        self._unique_id = _new_id()
+        self._root = FakeFolder(app, self, "Master", None)
+        self._current_folder = self._root
+
+    def _add_subfolder(self, folder: "FakeFolder", name: str) -> "FakeFolder":
+        subfolder = FakeFolder(self._app, self, name, folder)
+        folder._subfolders.append(subfolder)
+        return subfolder
+
+    def _add_clip(
+        self,
+        folder: "FakeFolder",
+        path: str,
+        frames: int,
+        fps: float,
+        start_frame: int = 0,
+        reel: str = "",
+        kind: str = "Video + Audio",
+    ) -> "FakeMediaPoolItem":
+        clip = FakeMediaPoolItem(
+            self._app, folder, path, frames, fps, start_frame, reel, kind
+        )
+        folder._clips.append(clip)
+        return clip
+
+    def _import(self, items) -> list["FakeMediaPoolItem"]:
+        fps = self._project._fps()
+        folder = self._current_folder
+        created = []
+        for entry in items:
+            start_index = end_index = None
+            if isinstance(entry, dict):
+                path = entry.get("media") or entry.get("FilePath", "")
+                start_index = entry.get("startFrame", entry.get("StartIndex"))
+                end_index = entry.get("endFrame", entry.get("EndIndex"))
+            else:
+                path = entry
+            if not path:
+                continue
+            if os.path.isdir(path):
+                for root, dirnames, filenames in os.walk(path):
+                    dirnames.sort()
+                    for filename in sorted(filenames):
+                        file_path = os.path.join(root, filename)
+                        kind = _media_kind(file_path)
+                        if kind is not None:
+                            created.append(
+                                self._add_clip(
+                                    folder,
+                                    file_path,
+                                    self._probe(file_path),
+                                    fps,
+                                    kind=kind,
+                                )
+                            )
+                continue
+            if "%" in path and start_index is not None and end_index is not None:
+                # Image sequence pattern such as "file_%03d.dpx".
+                first = path % start_index
+                last = path % end_index
+                consolidated = f"{first[: first.rfind(str(start_index).zfill(1))]}"
+                name = path.replace(
+                    path[path.index("%") : path.index("d", path.index("%")) + 1],
+                    f"[{first[len(consolidated) :].split('.')[0]}-"
+                    f"{last[len(consolidated) :].split('.')[0]}]",
+                )
+                created.append(
+                    self._add_clip(
+                        folder,
+                        name,
+                        end_index - start_index + 1,
+                        fps,
+                        start_frame=start_index,
+                        kind="Video",
+                    )
+                )
+                continue
+            kind = _media_kind(path)
+            if kind is None or not os.path.isfile(path):
+                continue
+            frames = self._probe(path)
+            if start_index is not None or end_index is not None:
+                first = start_index or 0
+                last = end_index if end_index is not None else frames - 1
+                frames = max(last - first + 1, 1)
+            created.append(self._add_clip(folder, path, frames, fps, kind=kind))
+        return created
+
+    @staticmethod
+    def _probe(path: str) -> int:
+        if _media_kind(path) == "Still":
+            return 1
+        # Deterministic pseudo duration derived from the path and file size.
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        return 24 + (zlib.crc32(path.encode()) ^ size) % 4800
+
+    def _timeline_items(self):
+        for timeline in self._project._timelines:
+            for tracks in timeline._tracks.values():
+                for track in tracks:
+                    yield from track.items
+
+    def GetRootFolder(self) -> "FakeFolder":
+        return self._root
+
+    def AddSubFolder(self, folder: "FakeFolder", name: str) -> Optional["FakeFolder"]:
+        if not isinstance(folder, FakeFolder) or not name:
+            return None
+        return self._add_subfolder(folder, name)
+
+    def RefreshFolders(self) -> bool:
+        pending = [self._root]
+        while pending:
+            folder = pending.pop()
+            folder._stale = False
+            pending.extend(folder._subfolders)
+        return True
+
+    def CreateEmptyTimeline(self, name: str) -> Optional["FakeTimeline"]:
+        return self._project._new_timeline(name)
+
+    def AppendToTimeline(self, *clips) -> list["FakeTimelineItem"]:
+        timeline = self._project._current_timeline
+        if timeline is None or not clips:
+            return []
+        if len(clips) == 1 and isinstance(clips[0], (list, tuple)):
+            clips = tuple(clips[0])
+        return timeline._append(clips)
+
+    def CreateTimelineFromClips(
+        self, timeline_name: str, *clips
+    ) -> Optional["FakeTimeline"]:
+        if len(clips) == 1 and isinstance(clips[0], (list, tuple)):
+            clips = tuple(clips[0])
+        timeline = self._project._new_timeline(timeline_name)
+        if timeline is None:
+            return None
+        self._project._current_timeline = timeline
+        timeline._append(clips)
+        return timeline
+
+    def ImportTimelineFromFile(
+        self, file_path: str, import_option: Optional[dict] = None
+    ) -> Optional["FakeTimeline"]:
+        if not os.path.isfile(file_path):
+            return None
+        options = import_option if isinstance(import_option, dict) else {}
+        if import_option is not None and not isinstance(import_option, dict):
+            options = vars(import_option)
+        return self._project._new_timeline(
+            options.get("timelineName") or Path(file_path).stem
+        )
+
+    def DeleteTimelines(self, timeline) -> bool:
+        timelines = timeline if isinstance(timeline, (list, tuple)) else [timeline]
+        if not timelines or any(t not in self._project._timelines for t in timelines):
+            return False
+        for item in timelines:
+            self._project._remove_timeline(item)
+        return True
+
+    def GetCurrentFolder(self) -> "FakeFolder":
+        return self._current_folder
+
+    def SetCurrentFolder(self, folder: "FakeFolder") -> bool:
+        if not isinstance(folder, FakeFolder) or folder._media_pool is not self:
+            return False
+        self._current_folder = folder
+        return True
+
+    def DeleteClips(self, *clips) -> bool:
+        if len(clips) == 1 and isinstance(clips[0], (list, tuple)):
+            clips = tuple(clips[0])
+        if not clips or any(
+            not isinstance(clip, FakeMediaPoolItem) or clip._folder is None
+            for clip in clips
+        ):
+            return False
+        for clip in clips:
+            clip._folder._clips.remove(clip)
+            clip._folder = None
+        return True
+
+    def ImportFolderFromFile(self, file_path: str, source_clips_path: str = "") -> bool:
+        if not os.path.isfile(file_path):
+            return False
+        self._add_subfolder(self._current_folder, Path(file_path).stem)
+        return True
+
+    def DeleteFolders(self, *subfolders) -> bool:
+        if len(subfolders) == 1 and isinstance(subfolders[0], (list, tuple)):
+            subfolders = tuple(subfolders[0])
+        if not subfolders or any(
+            not isinstance(folder, FakeFolder) or folder._parent is None
+            for folder in subfolders
+        ):
+            return False
+        for folder in subfolders:
+            folder._parent._subfolders.remove(folder)
+            node = self._current_folder
+            while node is not None:
+                if node is folder:
+                    self._current_folder = folder._parent
+                    break
+                node = node._parent
+        return True
+
+    def MoveClips(
+        self, clips: list["FakeMediaPoolItem"], target_folder: "FakeFolder"
+    ) -> bool:
+        if not isinstance(target_folder, FakeFolder) or not clips:
+            return False
+        for clip in clips:
+            if clip._folder is not None:
+                clip._folder._clips.remove(clip)
+            clip._folder = target_folder
+            target_folder._clips.append(clip)
+        return True
+
+    def MoveFolders(
+        self, folders: list["FakeFolder"], target_folder: "FakeFolder"
+    ) -> bool:
+        if not isinstance(target_folder, FakeFolder) or not folders:
+            return False
+        for folder in folders:
+            node = target_folder
+            while node is not None:
+                if node is folder:
+                    return False
+                node = node._parent
+        for folder in folders:
+            folder._parent._subfolders.remove(folder)
+            folder._parent = target_folder
+            target_folder._subfolders.append(folder)
+        return True
+
+    def GetClipMatteList(self, media_pool_item: "FakeMediaPoolItem") -> list[str]:
+        return list(media_pool_item._mattes)
+
+    def GetTimelineMatteList(self, folder: "FakeFolder") -> list["FakeMediaPoolItem"]:
+        return []
+
+    def DeleteClipMattes(
+        self, media_pool_item: "FakeMediaPoolItem", paths: list[str]
+    ) -> bool:
+        if any(path not in media_pool_item._mattes for path in paths):
+            return False
+        for path in paths:
+            media_pool_item._mattes.remove(path)
+        return True
+
+    def RelinkClips(self, clips: list["FakeMediaPoolItem"], folder_path: str) -> bool:
+        if not os.path.isdir(folder_path) or not clips:
+            return False
+        for clip in clips:
+            file_name = clip._properties["File Name"]
+            clip._properties["File Path"] = os.path.join(folder_path, file_name)
+            clip._properties["Online Status"] = "Online"
+        return True
+
+    def UnlinkClips(self, clips: list["FakeMediaPoolItem"]) -> bool:
+        if not clips:
+            return False
+        for clip in clips:
+            clip._properties["Online Status"] = "Offline"
+        return True
+
+    def ImportMedia(self, paths: list) -> list["FakeMediaPoolItem"]:
+        if not isinstance(paths, (list, tuple)):
+            paths = [paths]
+        return self._import(paths)
+
+    def ExportMetadata(
+        self, file_name: str, clips: list["FakeMediaPoolItem"] = []
+    ) -> bool:
+        if not clips:
+            clips = []
+            pending = [self._root]
+            while pending:
+                folder = pending.pop(0)
+                clips.extend(folder._clips)
+                pending.extend(folder._subfolders)
+        path = file_name if file_name.lower().endswith(".csv") else f"{file_name}.csv"
+        columns: dict[str, None] = {}
+        for clip in clips:
+            columns.update(dict.fromkeys(clip._properties))
+            columns.update(dict.fromkeys(clip._metadata))
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.DictWriter(file, fieldnames=list(columns))
+                writer.writeheader()
+                for clip in clips:
+                    writer.writerow({**clip._properties, **clip._metadata})
+        except OSError:
+            return False
+        return True
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+    def CreateStereoClip(
+        self,
+        left_media_pool_item: "FakeMediaPoolItem",
+        right_media_pool_item: "FakeMediaPoolItem",
+    ) -> Optional["FakeMediaPoolItem"]:
+        left, right = left_media_pool_item, right_media_pool_item
+        if left._folder is None or right._folder is None or left is right:
+            return None
+        folder = left._folder
+        stereo = self._add_clip(
+            folder,
+            left._properties["File Path"],
+            min(left._frames, right._frames),
+            left._fps,
+            left._start_frame,
+            left._properties["Reel Name"],
+            left._properties["Type"],
+        )
+        stereo._properties["S3D Sync"] = "Stereo"
+        self.DeleteClips.__wrapped__(self, [left, right])
+        return stereo
+
+
+class FakeFolder(_FakeObject, Folder):
+    """
+    Media Pool bin holding clips, timelines and subfolders.
+
+    """
+
+    def __init__(
+        self,
+        app: FakeResolve,
+        media_pool: FakeMediaPool,
+        name: str,
+        parent: Optional["FakeFolder"],
+    ):
+        self._app = app
+        self._media_pool = media_pool
+        self._name = name
+        self._parent = parent
+        self._unique_id = _new_id()
+        self._clips: list[FakeMediaPoolItem] = []
+        self._timelines: list[FakeTimeline] = []
+        self._subfolders: list[FakeFolder] = []
+        self._stale = False
+
+    def mark_stale(self) -> None:
+        """
+        Flags the folder as stale, as another collaborator would.
+
+        """
+        self._stale = True
+
+    def GetClipList(self) -> list["FakeMediaPoolItem"]:
+        return list(self._clips)
+
+    def GetName(self) -> str:
+        return self._name
+
+    def GetSubFolderList(self) -> list["FakeFolder"]:
+        return list(self._subfolders)
+
+    def GetIsFolderStale(self) -> bool:
+        return self._stale
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+    def Export(self, file_path: str) -> bool:
+        try:
+            Path(file_path).write_text(
+                json.dumps(
+                    {
+                        "name": self._name,
+                        "clips": [
+                            clip._properties["File Path"] for clip in self._clips
+                        ],
+                    }
+                )
+            )
+        except OSError:
+            return False
+        return True
+
+
+class _MarkerMixin:
+    """
+    Marker storage shared by media pool items, timelines and timeline items.
+
+    """
+
+    _markers: dict[int, dict[str, Union[str, int]]]
+
+    def _marker_range(self) -> Optional[int]:
+        return None
+
+    def _add_marker(self, frame_id, color, name, note, duration, custom_data) -> bool:
+        if not isinstance(frame_id, (int, float)) or frame_id < 0:
+            return False
+        frame_id = int(frame_id)
+        limit = self._marker_range()
+        if limit is not None and frame_id >= limit:
+            return False
+        if color not in MARKER_COLORS or frame_id in self._markers:
+            return False
+        if not isinstance(duration, int) or duration < 1:
+            return False
+        self._markers[frame_id] = {
+            "color": color,
+            "duration": duration,
+            "note": note or "",
+            "name": name,
+            "customData": custom_data or "",
+        }
+        return True
+
+    def _find_custom_data(self, custom_data: str) -> Optional[int]:
+        for frame_id, marker in self._markers.items():
+            if marker["customData"] == custom_data:
+                return frame_id
+        return None
+
+    def AddMarker(
+        self, frame_id, color, name, note="", duration=1, custom_data=""
+    ) -> bool:
+        return self._add_marker(frame_id, color, name, note, duration, custom_data)
+
+    def GetMarkers(self) -> dict[int, dict[str, Union[str, int]]]:
+        return {
+            frame_id: dict(marker) for frame_id, marker in sorted(self._markers.items())
+        }
+
+    def GetMarkerByCustomData(self, custom_data: str) -> dict:
+        frame_id = self._find_custom_data(custom_data)
+        if frame_id is None:
+            return {}
+        return {frame_id: dict(self._markers[frame_id])}
+
+    def UpdateMarkerCustomData(self, frame_id: int, custom_data: str) -> bool:
+        marker = self._markers.get(frame_id)
+        if marker is None:
+            return False
+        marker["customData"] = custom_data
+        return True
+
+    def GetMarkerCustomData(self, frame_id: int) -> str:
+        marker = self._markers.get(frame_id)
+        return marker["customData"] if marker is not None else ""
+
+    def DeleteMarkersByColor(self, color: str) -> bool:
+        if color == "All":
+            self._markers.clear()
+            return True
+        if color not in MARKER_COLORS:
+            return False
+        for frame_id in [f for f, m in self._markers.items() if m["color"] == color]:
+            del self._markers[frame_id]
+        return True
+
+    def DeleteMarkerAtFrame(self, frame_num: int) -> bool:
+        if frame_num not in self._markers:
+            return False
+        del self._markers[frame_num]
+        return True
+
+    def DeleteMarkerByCustomData(self, custom_data: str) -> bool:
+        frame_id = self._find_custom_data(custom_data)
+        if frame_id is None:
+            return False
+        del self._markers[frame_id]
+        return True
+
+
+class _FlagColorMixin:
+    """
+    Flag and clip color storage shared by media pool items and timeline items.
+
+    """
+
+    _flags: list[str]
+    _clip_color: str
+
+    def AddFlag(self, color: str) -> bool:
+        if color not in MARKER_COLORS:
+            return False
+        if color not in self._flags:
+            self._flags.append(color)
+        return True
+
+    def GetFlagList(self) -> list[str]:
+        return list(self._flags)
+
+    def ClearFlags(self, color: str) -> bool:
+        if color == "All":
+            self._flags.clear()
+            return True
+        if color not in self._flags:
+            return False
+        self._flags.remove(color)
+        return True
+
+    def GetClipColor(self) -> str:
+        return self._clip_color
+
+    def SetClipColor(self, color_name: str) -> bool:
+        if color_name not in CLIP_COLORS:
+            return False
+        self._clip_color = color_name
+        return True
+
+    def ClearClipColor(self) -> bool:
+        self._clip_color = ""
+        return True
+
+
+class FakeMediaPoolItem(_FakeObject, _MarkerMixin, _FlagColorMixin, MediaPoolItem):
+    """
+    Media Pool clip with the string-valued clip properties Resolve reports.
+
+    """
+
+    def __init__(
+        self,
+        app: FakeResolve,
+        folder: Optional[FakeFolder],
+        path: str,
+        frames: int,
+        fps: float,
+        start_frame: int = 0,
+        reel: str = "",
+        kind: str = "Video + Audio",
+    ):
+        self._app = app
+        self._folder = folder
+        self._frames = frames
+        self._fps = fps
+        self._start_frame = start_frame
+        self._unique_id = _new_id()
+        self._media_id = _new_id()
+        self._markers = {}
+        self._flags = []
+        self._clip_color = ""
+        self._metadata: dict[str, str] = {}
+        self._mattes: list[str] = []
+        self._audio_mapping = {
+            "embedded_audio_channels": 2 if kind != "Video" and kind != "Still" else 0,
+            "linked_audio": {},
+            "track_mapping": {},
+        }
+        now = time.strftime(_DATE_FORMAT)
+        file_name = os.path.basename(path)
+        has_video = kind != "Audio"
+        has_audio = kind in ("Video + Audio", "Audio")
+        end_frame = start_frame + frames - 1
+        self._properties: dict[str, Union[str, float, int]] = {
+            "Alpha mode": "None",
+            "Angle": "",
+            "Audio Bit Depth": "24" if has_audio else "",
+            "Audio Ch": "2" if has_audio else "0",
+            "Audio Codec": "Linear PCM" if has_audio else "",
+            "Audio Offset": "",
+            "Bit Depth": "10" if has_video else "",
+            "Camera #": "",
+            "Clip Color": "",
+            "Clip Name": file_name,
+            "Comments": "",
+            "Data Level": "Auto",
+            "Date Added": now,
+            "Date Created": now,
+            "Date Modified": now,
+            "Description": "",
+            "Drop frame": "0",
+            "Duration": frames_to_timecode(frames, fps),
+            "Enable Deinterlacing": "0",
+            "End": str(frames - 1),
+            "End TC": frames_to_timecode(end_frame + 1, fps),
+            "FPS": fps,
+            "Field Dominance": "Auto",
+            "File Name": file_name,
+            "File Path": path,
+            "Flags": "",
+            "Format": "QuickTime"
+            if path.lower().endswith(".mov")
+            else os.path.splitext(path)[1][1:].upper(),
+            "Frames": str(frames),
+            "Good Take": "",
+            "H-FLIP": "Off",
+            "IDT": "",
+            "In": "",
+            "Input Color Space": "Rec.709 Gamma 2.4",
+            "Input LUT": "",
+            "Input Sizing Preset": "None",
+            "Keyword": "",
+            "Noise Reduction": "",
+            "Offline Reference": "",
+            "Online Status": "Online",
+            "Out": "",
+            "PAR": "Square",
+            "Proxy": "None",
+            "Proxy Media Path": "",
+            "Reel Name": reel,
+            "Resolution": "1920x1080" if has_video else "",
+            "Roll/Card": "",
+            "S3D Sync": "",
+            "Sample Rate": "48000" if has_audio else "",
+            "Scene": "",
+            "Sharpness": "",
+            "Shot": "",
+            "Slate TC": "00:00:00:00",
+            "Start": "0",
+            "Start KeyKode": "",
+            "Start TC": frames_to_timecode(start_frame, fps),
+            "SuperScale Noise Reduction": "0.5",
+            "SuperScale Sharpness": "0.5",
+            "Synced Audio": "",
+            "Take": "",
+            "Type": kind,
+            "Usage": "0",
+            "V-FLIP": "Off",
+            "Video Codec": "Apple ProRes 422 HQ" if has_video else "",
+            "Super Scale": 1,
+        }
+
+    def _marker_range(self) -> Optional[int]:
+        return self._frames
+
+    def GetName(self) -> str:
+        return self._properties["Clip Name"]
+
+    def GetMetadata(self, metadata_type: str = None):
+        if metadata_type is None:
+            return dict(self._metadata)
+        return self._metadata.get(metadata_type, "")
+
+    def SetMetadata(self, metadata_type, metadata_value: str = None) -> bool:
+        if isinstance(metadata_type, dict):
+            updates = metadata_type
+        else:
+            updates = {metadata_type: metadata_value}
+        if not updates or any(
+            key not in METADATA_KEYS or not isinstance(value, str)
+            for key, value in updates.items()
+        ):
+            return False
+        for key, value in updates.items():
+            self._metadata[key] = value
+            if key in self._properties:
+                self._properties[key] = value
+        return True
+
+    def GetMediaId(self) -> str:
+        return self._media_id
+
+    def GetClipProperty(self, property_name: str = None):
+        if property_name is None:
+            return dict(self._properties)
+        return self._properties.get(property_name, "")
+
+    def SetClipProperty(self, property_name: str, property_value: str) -> bool:
+        if property_name not in self._properties:
+            return False
+        if property_name in READ_ONLY_CLIP_PROPERTIES:
+            return False
+        if property_name == "Start TC":
+            try:
+                start = timecode_to_frames(property_value, self._fps)
+            except ValueError:
+                return False
+            self._start_frame = start
+            self._properties["End TC"] = frames_to_timecode(
+                start + self._frames, self._fps
+            )
+        self._properties[property_name] = property_value
+        if property_name in METADATA_KEYS:
+            self._metadata[property_name] = property_value
+        return True
+
+    def LinkProxyMedia(self, proxy_media_file_path: str) -> bool:
+        if not os.path.isfile(proxy_media_file_path):
+            return False
+        self._properties["Proxy"] = "1920x1080"
+        self._properties["Proxy Media Path"] = proxy_media_file_path
+        return True
+
+    def UnlinkProxyMedia(self) -> bool:
+        if not self._properties["Proxy Media Path"]:
+            return False
+        self._properties["Proxy"] = "None"
+        self._properties["Proxy Media Path"] = ""
+        return True
+
+    def ReplaceClip(self, file_path: str) -> bool:
+        if not os.path.isfile(file_path) or _media_kind(file_path) is None:
+            return False
+        self._properties["File Path"] = file_path
+        self._properties["File Name"] = os.path.basename(file_path)
+        self._properties["Clip Name"] = os.path.basename(file_path)
+        return True
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+    def TranscribeAudio(self) -> bool:
+        return self._properties["Audio Ch"] != "0"
+
+    def ClearTranscription(self) -> bool:
+        return True
+
+    def GetAudioMapping(self) -> str:
+        return json.dumps(self._audio_mapping)
+
+
+class FakeTimeline(_FakeObject, _MarkerMixin, Timeline):
+    """
+    Timeline with video, audio and subtitle tracks holding sorted items.
+
+    """
+
+    def __init__(self, app: FakeResolve, project: FakeProject, name: str):
+        self._app = app
+        self._project = project
+        self._name = name
+        self._unique_id = _new_id()
+        self._settings = dict(project._settings)
+        self._fps = float(self._settings["timelineFrameRate"])
+        # Resolve ignores the drop frame setting at rates without drop-frame timecode.
+        self._drop_frame = (
+            self._settings["timelineDropFrameTimecode"] == "1"
+            and round(self._fps) % 30 == 0
+        )
+        self._start_frame = timecode_to_frames(
+            "01:00:00:00", self._fps, self._drop_frame
+        )
+        self._playhead = self._start_frame
+        self._markers = {}
+        self._tracks: dict[str, list[_Track]] = {
+            "video": [],
+            "audio": [],
+            "subtitle": [],
+        }
+        self._add_track("video")
+        self._add_track("audio", "stereo")
+        self._node_graph = FakeGraph(app)
+
+    def _add_track(
+        self, track_type: str, sub_type: str = "", index: Optional[int] = None
+    ) -> _Track:
+        tracks = self._tracks[track_type]
+        track = _Track(track_type, "", sub_type)
+        if index is None or not 1 <= index <= len(tracks):
+            tracks.append(track)
+        else:
+            tracks.insert(index - 1, track)
+        for position, each in enumerate(tracks, 1):
+            if not each.name or each.name.startswith(track_type.capitalize() + " "):
+                each.name = f"{track_type.capitalize()} {position}"
+        return track
+
+    def _track(self, track_type: str, track_index: int) -> Optional[_Track]:
+        tracks = self._tracks.get(track_type)
+        if tracks is None or not isinstance(track_index, int):
+            return None
+        if not 1 <= track_index <= len(tracks):
+            return None
+        return tracks[track_index - 1]
+
+    def _end_frame(self) -> int:
+        return max(
+            (
+                track.end(self._start_frame)
+                for tracks in self._tracks.values()
+                for track in tracks
+            ),
+            default=self._start_frame,
+        )
+
+    def _place(
+        self,
+        clip: FakeMediaPoolItem,
+        track: _Track,
+        source_in: int,
+        source_out: int,
+        record: int,
+    ) -> "FakeTimelineItem":
+        item = FakeTimelineItem(
+            self._app, self, track, clip, source_in, source_out, record
+        )
+        track.insert(item)
+        clip._properties["Usage"] = str(int(clip._properties["Usage"]) + 1)
+        return item
+
+    def _append(self, clips) -> list["FakeTimelineItem"]:
+        appended = []
+        for entry in clips:
+            if isinstance(entry, ClipInfo):
+                entry = vars(entry)
+            if isinstance(entry, dict):
+                clip = entry.get("mediaPoolItem")
+                media_type = entry.get("mediaType")
+                track_index = entry.get("trackIndex") or 1
+                record = entry.get("recordFrame") or None
+                source_in = entry.get("startFrame") or 0
+                source_out = entry.get("endFrame")
+            else:
+                clip, media_type, track_index, record = entry, None, 1, None
+                source_in, source_out = 0, None
+            if not isinstance(clip, FakeMediaPoolItem):
+                continue
+            if source_out is None or source_out == 0 and source_in == 0:
+                source_out = clip._frames - 1
+            if not 0 <= source_in <= source_out < clip._frames:
+                continue
+            kind = clip._properties["Type"]
+            targets = []
+            if kind != "Audio" and media_type != 2:
+                targets.append("video")
+            if kind in ("Video + Audio", "Audio") and media_type != 1:
+                targets.append("audio")
+            tracks = []
+            for track_type in targets:
+                count = len(self._tracks[track_type])
+                if track_index == count + 1:
+                    self._add_track(
+                        track_type, "stereo" if track_type == "audio" else ""
+                    )
+                index = (
+                    track_index if track_index <= len(self._tracks[track_type]) else 1
+                )
+                tracks.append(self._tracks[track_type][index - 1])
+            if not tracks:
+                continue
+            if record is None:
+                record = max(track.end(self._start_frame) for track in tracks)
+            items = [
+                self._place(clip, track, source_in, source_out, record)
+                for track in tracks
+            ]
+            for item in items:
+                item._linked = [other for other in items if other is not item]
+            appended.extend(items)
+        return appended
+
+    def _item_at(self, frame: int) -> Optional["FakeTimelineItem"]:
+        for track in reversed(self._tracks["video"]):
+            if not track.enabled:
+                continue
+            for item in track.items:
+                if item._start <= frame < item._end:
+                    return item
+        return None
+
+    def _insert_generated(self, name: str) -> "FakeTimelineItem":
+        track = (
+            self._tracks["video"][0]
+            if self._tracks["video"]
+            else self._add_track("video")
+        )
+        clip = FakeMediaPoolItem(
+            self._app, None, name, int(self._fps * 5), self._fps, kind="Video"
+        )
+        clip._properties["Clip Name"] = name
+        return self._place(clip, track, 0, clip._frames - 1, self._playhead)
+
+    def GetName(self) -> str:
+        return self._name
+
+    def SetName(self, timeline_name) -> bool:
+        if not timeline_name or any(
+            timeline._name == timeline_name for timeline in self._project._timelines
+        ):
+            return False
+        self._name = timeline_name
+        return True
+
+    def GetStartFrame(self) -> int:
+        return self._start_frame
+
+    def GetEndFrame(self) -> int:
+        return self._end_frame()
+
+    def SetStartTimecode(self, timecode: str) -> bool:
+        try:
+            start = timecode_to_frames(timecode, self._fps, self._drop_frame)
+        except ValueError:
+            return False
+        delta = start - self._start_frame
+        for tracks in self._tracks.values():
+            for track in tracks:
+                for item in track.items:
+                    item._start += delta
+                    item._end += delta
+        self._start_frame = start
+        self._playhead += delta
+        return True
+
+    def GetStartTimecode(self) -> str:
+        return frames_to_timecode(self._start_frame, self._fps, self._drop_frame)
+
+    def GetTrackCount(self, track_type: str) -> int:
+        return len(self._tracks.get(track_type, ()))
+
+    def AddTrack(self, track_type: str, sub_track_type="") -> bool:
+        if track_type not in self._tracks:
+            return False
+        index = None
+        if isinstance(sub_track_type, dict):
+            index = sub_track_type.get("index")
+            sub_track_type = sub_track_type.get("audioType", "mono")
+        if track_type == "audio":
+            sub_track_type = sub_track_type or "mono"
+        else:
+            sub_track_type = ""
+        self._add_track(track_type, sub_track_type, index)
+        return True
+
+    def DeleteTrack(self, track_type: str, track_index: int) -> bool:
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        self._tracks[track_type].remove(track)
+        return True
+
+    def GetTrackSubType(self, track_type: str, track_index: int) -> str:
+        track = self._track(track_type, track_index)
+        return track.sub_type if track is not None else ""
+
+    def SetTrackEnable(self, track_type: str, track_index: int, enabled: bool) -> bool:
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        track.enabled = bool(enabled)
+        return True
+
+    def GetIsTrackEnabled(self, track_type: str, track_index: int) -> bool:
+        track = self._track(track_type, track_index)
+        return track is not None and track.enabled
+
+    def SetTrackLock(self, track_type: str, track_index: int, locked: bool) -> bool:
+        track = self._track(track_type, track_index)
+        if track is None:
+            return False
+        track.locked = bool(locked)
+        return True
+
+    def GetIsTrackLocked(self, track_type: str, track_index: int) -> bool:
+        track = self._track(track_type, track_index)
+        return track is not None and track.locked
+
+    def DeleteClips(
+        self, clips: list["FakeTimelineItem"], ripple_delete: bool = False
+    ) -> bool:
+        if not clips or any(
+            not isinstance(item, FakeTimelineItem) or item._timeline is not self
+            for item in clips
+        ):
+            return False
+        if any(item._track.locked for item in clips):
+            return False
+        for item in clips:
+            track = item._track
+            track.items.remove(item)
+            item._timeline = None
+            if ripple_delete:
+                for later in track.items:
+                    if later._start >= item._end:
+                        later._start -= item._duration
+                        later._end -= item._duration
+            usage = int(item._clip._properties["Usage"])
+            item._clip._properties["Usage"] = str(max(usage - 1, 0))
+        return True
+
+    def SetClipsLinked(self, clips: list["FakeTimelineItem"], linked: bool) -> bool:
+        if not clips or any(not isinstance(item, FakeTimelineItem) for item in clips):
+            return False
+        for item in clips:
+            item._linked = (
+                [other for other in clips if other is not item] if linked else []
+            )
+        return True
+
+    def GetItemListInTrack(
+        self, track_type: str, track_index: int
+    ) -> Optional[list["FakeTimelineItem"]]:
+        track = self._track(track_type, track_index)
+        if track is None:
+            return None
+        return list(track.items)
+
+    def ApplyGradeFromDRX(self, path: str, grade_mode: int, *items) -> bool:
+        if not os.path.isfile(path) or grade_mode not in (0, 1, 2):
+            return False
+        return True
+
+    def GetCurrentTimecode(self) -> str:
+        return frames_to_timecode(self._playhead, self._fps, self._drop_frame)
+
+    def SetCurrentTimecode(self, timecode: str) -> bool:
+        if self._app._page not in ("cut", "edit", "color", "fairlight", "deliver"):
+            return False
+        try:
+            frame = timecode_to_frames(timecode, self._fps, self._drop_frame)
+        except ValueError:
+            return False
+        if not self._start_frame <= frame <= max(self._end_frame(), self._start_frame):
+            return False
+        self._playhead = frame
+        return True
+
+    def GetCurrentVideoItem(self) -> Optional["FakeTimelineItem"]:
+        return self._item_at(self._playhead)
+
+    def GetCurrentClipThumbnailImage(self) -> Optional[dict[str, Union[int, str]]]:
+        item = self._item_at(self._playhead)
+        if item is None:
+            return None
+        width, height = self._app.thumbnail_size
+        seed = zlib.crc32(item._clip._unique_id.encode()) ^ (
+            self._playhead - item._start
+        )
+        rgb = _synthetic_rgb(width, height, seed)
+        return {
+            "width": width,
+            "height": height,
+            "format": "RGB 8 bit",
+            "data": base64.b64encode(rgb).decode("ascii"),
+        }
+
+    def GetTrackName(self, track_type: str, track_index: int) -> str:
+        track = self._track(track_type, track_index)
+        return track.name if track is not None else ""
+
+    def SetTrackName(self, track_type: str, track_index: int, name: str = "") -> bool:
+        track = self._track(track_type, track_index)
+        if track is None or not name:
+            return False
+        track.name = name
+        return True
+
+    def DuplicateTimeline(
+        self, new_timeline_name: str = ""
+    ) -> Optional["FakeTimeline"]:
+        name = new_timeline_name or f"{self._name} copy"
+        duplicate = self._project._new_timeline(name)
+        if duplicate is None:
+            return None
+        duplicate._settings = dict(self._settings)
+        duplicate._start_frame = self._start_frame
+        duplicate._playhead = self._start_frame
+        duplicate._markers = {
+            frame: dict(marker) for frame, marker in self._markers.items()
+        }
+        duplicate._tracks = {track_type: [] for track_type in self._tracks}
+        copies: dict[int, FakeTimelineItem] = {}
+        for track_type, tracks in self._tracks.items():
+            for track in tracks:
+                new_track = _Track(track_type, track.name, track.sub_type)
+                new_track.enabled, new_track.locked = track.enabled, track.locked
+                duplicate._tracks[track_type].append(new_track)
+                for item in track.items:
+                    copy = item._copy(duplicate, new_track)
+                    copies[id(item)] = copy
+                    new_track.items.append(copy)
+        for item in copies.values():
+            item._linked = [
+                copies[id(other)] for other in item._linked if id(other) in copies
+            ]
+        return duplicate
+
+    def CreateCompoundClip(
+        self, timeline_items: list["FakeTimelineItem"], clip_info: dict = None
+    ) -> Optional["FakeTimelineItem"]:
+        if not timeline_items or any(
+            item._timeline is not self for item in timeline_items
+        ):
+            return None
+        start = min(item._start for item in timeline_items)
+        end = max(item._end for item in timeline_items)
+        track = min(
+            (
+                item._track
+                for item in timeline_items
+                if item._track.track_type == "video"
+            ),
+            key=self._tracks["video"].index,
+            default=None,
+        )
+        if track is None:
+            return None
+        name = (clip_info or {}).get("name") or "Compound Clip 1"
+        self.DeleteClips.__wrapped__(self, timeline_items)
+        clip = FakeMediaPoolItem(
+            self._app, None, name, end - start, self._fps, kind="Video"
+        )
+        clip._properties["Clip Name"] = name
+        clip._properties["Type"] = "Compound"
+        media_pool = self._project._media_pool
+        clip._folder = media_pool._current_folder
+        media_pool._current_folder._clips.append(clip)
+        return self._place(clip, track, 0, end - start - 1, start)
+
+    def CreateFusionClip(
+        self, timeline_items: list["FakeTimelineItem"]
+    ) -> Optional["FakeTimelineItem"]:
+        item = self.CreateCompoundClip.__wrapped__(
+            self, timeline_items, {"name": "Fusion Clip 1"}
+        )
+        if item is not None:
+            item._clip._properties["Type"] = "Fusion"
+            item._fusion_comps.append("Composition 1")
+        return item
+
+    def ImportIntoTimeline(
+        self, file_path: str, import_option: Optional[dict] = None
+    ) -> bool:
+        return os.path.isfile(file_path)
+
+    def Export(
+        self, file_path: str, export_type: str, export_subtype: str = ""
+    ) -> bool:
+        if export_type == Resolve.EXPORT_EDL:
+            return self._export_edl(file_path, export_subtype)
+        writers = {
+            Resolve.EXPORT_TEXT_CSV: lambda: self._export_edit_index(file_path, ","),
+            Resolve.EXPORT_TEXT_TAB: lambda: self._export_edit_index(file_path, "\t"),
+            Resolve.EXPORT_FCP_7_XML: lambda: self._export_xmeml(file_path),
+            Resolve.EXPORT_FCPXML_1_8: lambda: self._export_fcpxml(file_path, "1.8"),
+            Resolve.EXPORT_FCPXML_1_9: lambda: self._export_fcpxml(file_path, "1.9"),
+            Resolve.EXPORT_FCPXML_1_10: lambda: self._export_fcpxml(file_path, "1.10"),
+            Resolve.EXPORT_OTIO: lambda: self._export_otio(file_path),
+            Resolve.EXPORT_ALE: lambda: self._export_ale(file_path),
+            Resolve.EXPORT_CDL: lambda: self._export_cdl(file_path),
+        }
+        writer = writers.get(export_type)
+        if writer is None:
+            return False
+        try:
+            writer()
+        except OSError:
+            return False
+        return True
+
+    def _export_items(self, track_types=("video", "audio")):
+        # (track label, item, source timecode frame of the item's first frame).
+        for track_type in track_types:
+            for index, track in enumerate(self._tracks[track_type], 1):
+                for item in track.items:
+                    yield (
+                        f"{track_type[0].upper()}{index}",
+                        item,
+                        item._clip._start_frame + item._left_offset,
+                    )
+
+    def _export_edit_index(self, file_path: str, delimiter: str) -> None:
+        with open(file_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file, delimiter=delimiter)
+            writer.writerow(
+                ["#", "Reel", "Match", "V", "C", "Dur", "Source In", "Source Out"]
+                + ["Record In", "Record Out", "Name", "Comments"]
+            )
+            for number, (track, item, source_start) in enumerate(
+                self._export_items(), 1
+            ):
+                clip = item._clip
+                writer.writerow(
+                    [
+                        number,
+                        clip._properties["Reel Name"],
+                        "",
+                        track,
+                        "Cut",
+                        frames_to_timecode(item._duration, self._fps),
+                        frames_to_timecode(source_start, self._fps),
+                        frames_to_timecode(source_start + item._duration, self._fps),
+                        frames_to_timecode(item._start, self._fps, self._drop_frame),
+                        frames_to_timecode(item._end, self._fps, self._drop_frame),
+                        clip._properties["Clip Name"],
+                        "",
+                    ]
+                )
+
+    def _export_xmeml(self, file_path: str) -> None:
+        root = ElementTree.Element("xmeml", version="5")
+        sequence = ElementTree.SubElement(root, "sequence")
+        ElementTree.SubElement(sequence, "name").text = self._name
+        rate = ElementTree.SubElement(sequence, "rate")
+        ElementTree.SubElement(rate, "timebase").text = str(round(self._fps))
+        ntsc = "TRUE" if round(self._fps) != self._fps else "FALSE"
+        ElementTree.SubElement(rate, "ntsc").text = ntsc
+        timecode = ElementTree.SubElement(sequence, "timecode")
+        ElementTree.SubElement(timecode, "frame").text = str(self._start_frame)
+        ElementTree.SubElement(timecode, "displayformat").text = (
+            "DF" if self._drop_frame else "NDF"
+        )
+        media = ElementTree.SubElement(sequence, "media")
+        files: dict[int, str] = {}
+        number = 0
+        for track_type in ("video", "audio"):
+            kind = ElementTree.SubElement(media, track_type)
+            for track in self._tracks[track_type]:
+                track_element = ElementTree.SubElement(kind, "track")
+                for item in track.items:
+                    number += 1
+                    clip = item._clip
+                    element = ElementTree.SubElement(
+                        track_element, "clipitem", id=f"clipitem-{number}"
+                    )
+                    for tag, value in (
+                        ("name", clip._properties["Clip Name"]),
+                        ("start", item._start - self._start_frame),
+                        ("end", item._end - self._start_frame),
+                        ("in", item._left_offset),
+                        ("out", item._left_offset + item._duration),
+                    ):
+                        ElementTree.SubElement(element, tag).text = str(value)
+                    file_id = files.get(id(clip))
+                    if file_id is not None:
+                        ElementTree.SubElement(element, "file", id=file_id)
+                        continue
+                    file_id = files[id(clip)] = f"file-{len(files) + 1}"
+                    file_element = ElementTree.SubElement(element, "file", id=file_id)
+                    ElementTree.SubElement(
+                        file_element, "name"
+                    ).text = clip._properties["File Name"]
+                    ElementTree.SubElement(file_element, "pathurl").text = (
+                        Path(clip._properties["File Path"]).as_uri()
+                        if clip._properties["File Path"]
+                        else ""
+                    )
+                    reel = ElementTree.SubElement(
+                        ElementTree.SubElement(file_element, "timecode"), "reel"
+                    )
+                    ElementTree.SubElement(reel, "name").text = clip._properties[
+                        "Reel Name"
+                    ]
+        ElementTree.ElementTree(root).write(
+            file_path, encoding="UTF-8", xml_declaration=True
+        )
+
+    def _export_fcpxml(self, file_path: str, version: str) -> None:
+        # V1 forms the primary storyline, padded with gaps up to the timeline end.
+        # Items of the other video tracks and audio-only items are connected clips on
+        # lanes 1, 2... and -1, -2..., anchored to the storyline element under their
+        # record in. Linked audio stays part of its asset-clip, as in Resolve's export.
+        rate = round(self._fps)
+        frame = Fraction(1001, rate * 1000) if rate != self._fps else Fraction(1, rate)
+
+        def seconds(frames: int) -> str:
+            value = frames * frame
+            if value.denominator == 1:
+                return f"{value.numerator}s"
+            return f"{value.numerator}/{value.denominator}s"
+
+        root = ElementTree.Element("fcpxml", version=version)
+        resources = ElementTree.SubElement(root, "resources")
+        ElementTree.SubElement(resources, "format", id="r1", frameDuration=seconds(1))
+        assets: dict[int, str] = {}
+
+        def asset_id(clip: "FakeMediaPoolItem") -> str:
+            found = assets.get(id(clip))
+            if found is None:
+                found = assets[id(clip)] = f"r{len(assets) + 2}"
+                path = clip._properties["File Path"]
+                ElementTree.SubElement(
+                    resources,
+                    "asset",
+                    id=found,
+                    name=clip._properties["Clip Name"],
+                    src=Path(path).as_uri() if path else "",
+                    start=seconds(clip._start_frame),
+                    duration=seconds(clip._frames),
+                    hasVideo="0" if clip._properties["Type"] == "Audio" else "1",
+                    hasAudio="0" if clip._properties["Type"] == "Video" else "1",
+                    format="r1",
+                )
+            return found
+
+        def asset_clip(parent, item, offset: int, lane: int = 0):
+            clip = item._clip
+            element = ElementTree.SubElement(
+                parent,
+                "asset-clip",
+                ref=asset_id(clip),
+                name=clip._properties["Clip Name"],
+                offset=seconds(offset),
+                start=seconds(clip._start_frame + item._left_offset),
+                duration=seconds(item._duration),
+            )
+            if lane:
+                element.set("lane", str(lane))
+            return element
+
+        end = self._end_frame()
+        sequence = ElementTree.SubElement(
+            ElementTree.SubElement(
+                ElementTree.SubElement(
+                    ElementTree.SubElement(root, "library"), "event", name=self._name
+                ),
+                "project",
+                name=self._name,
+            ),
+            "sequence",
+            format="r1",
+            tcStart=seconds(self._start_frame),
+            duration=seconds(end - self._start_frame),
+        )
+        spine = ElementTree.SubElement(sequence, "spine")
+        # (record in, element, local start frame) of the storyline elements.
+        anchors: list[tuple[int, Any, int]] = []
+        position = self._start_frame
+        primary = self._tracks["video"][0].items if self._tracks["video"] else []
+        for item in [*primary, None]:
+            gap_end = end if item is None else item._start
+            if gap_end > position:
+                gap = ElementTree.SubElement(
+                    spine,
+                    "gap",
+                    name="Gap",
+                    offset=seconds(position),
+                    start=seconds(position),
+                    duration=seconds(gap_end - position),
+                )
+                anchors.append((position, gap, position))
+            if item is None:
+                break
+            element = asset_clip(spine, item, item._start)
+            anchors.append(
+                (item._start, element, item._clip._start_frame + item._left_offset)
+            )
+            position = item._end
+        starts = [anchor[0] for anchor in anchors]
+
+        connected = [
+            (index, item)
+            for index, track in enumerate(self._tracks["video"][1:], 1)
+            for item in track.items
+        ]
+        connected.extend(
+            (-index, item)
+            for index, track in enumerate(self._tracks["audio"], 1)
+            for item in track.items
+            if item._clip._properties["Type"] == "Audio"
+        )
+        for lane, item in connected:
+            record, parent, local_start = anchors[
+                max(bisect.bisect_right(starts, item._start) - 1, 0)
+            ]
+            asset_clip(parent, item, local_start + item._start - record, lane)
+        ElementTree.ElementTree(root).write(
+            file_path, encoding="UTF-8", xml_declaration=True
+        )
+
+    def _export_otio(self, file_path: str) -> None:
+        def rational(value: int) -> dict:
+            return {"OTIO_SCHEMA": "RationalTime.1", "rate": self._fps, "value": value}
+
+        def time_range(start: int, duration: int) -> dict:
+            return {
+                "OTIO_SCHEMA": "TimeRange.1",
+                "start_time": rational(start),
+                "duration": rational(duration),
+            }
+
+        tracks = []
+        for track_type in ("video", "audio"):
+            for track in self._tracks[track_type]:
+                children = []
+                position = self._start_frame
+                for item in track.items:
+                    if item._start > position:
+                        children.append(
+                            {
+                                "OTIO_SCHEMA": "Gap.1",
+                                "name": "",
+                                "source_range": time_range(0, item._start - position),
+                            }
+                        )
+                    clip = item._clip
+                    path = clip._properties["File Path"]
+                    children.append(
+                        {
+                            "OTIO_SCHEMA": "Clip.2",
+                            "name": clip._properties["Clip Name"],
+                            "source_range": time_range(
+                                item._left_offset, item._duration
+                            ),
+                            "media_references": {
+                                "DEFAULT_MEDIA": {
+                                    "OTIO_SCHEMA": "ExternalReference.1",
+                                    "target_url": Path(path).as_uri() if path else "",
+                                }
+                            },
+                            "active_media_reference_key": "DEFAULT_MEDIA",
+                        }
+                    )
+                    position = item._end
+                tracks.append(
+                    {
+                        "OTIO_SCHEMA": "Track.1",
+                        "name": track.name,
+                        "kind": track_type.capitalize(),
+                        "children": children,
+                    }
+                )
+        Path(file_path).write_text(
+            json.dumps(
+                {
+                    "OTIO_SCHEMA": "Timeline.1",
+                    "name": self._name,
+                    "global_start_time": rational(self._start_frame),
+                    "tracks": {"OTIO_SCHEMA": "Stack.1", "children": tracks},
+                },
+                indent=4,
+            )
+        )
+
+    def _export_ale(self, file_path: str) -> None:
+        lines = [
+            "Heading",
+            "FIELD_DELIM\tTABS",
+            "VIDEO_FORMAT\t1080",
+            f"FPS\t{self._fps:g}",
+            "",
+            "Column",
+            "Name\tTracks\tStart\tEnd\tTape\tSource File\tASC_SOP\tASC_SAT",
+            "",
+            "Data",
+        ]
+        for _, item, source_start in self._export_items(("video",)):
+            clip = item._clip
+            cdl = item._cdl.get(1, {})
+            sop = (
+                f"({cdl.get('Slope', '1 1 1')})({cdl.get('Offset', '0 0 0')})"
+                f"({cdl.get('Power', '1 1 1')})"
+            )
+            fields = [
+                clip._properties["Clip Name"],
+                "V",
+                frames_to_timecode(source_start, self._fps),
+                frames_to_timecode(source_start + item._duration, self._fps),
+                clip._properties["Reel Name"],
+                clip._properties["File Path"],
+                sop,
+                cdl.get("Saturation", "1"),
+            ]
+            lines.append("\t".join(str(field) for field in fields))
+        Path(file_path).write_text("\n".join(lines) + "\n")
+
+    def _export_cdl(self, file_path: str) -> None:
+        root = ElementTree.Element("ColorDecisionList", xmlns="urn:ASC:CDL:v1.01")
+        for _, item, _ in self._export_items(("video",)):
+            cdl = item._cdl.get(1, {})
+            correction = ElementTree.SubElement(
+                ElementTree.SubElement(root, "ColorDecision"),
+                "ColorCorrection",
+                id=item._clip._properties["Clip Name"],
+            )
+            sop = ElementTree.SubElement(correction, "SOPNode")
+            for key, default in (
+                ("Slope", "1 1 1"),
+                ("Offset", "0 0 0"),
+                ("Power", "1 1 1"),
+            ):
+                ElementTree.SubElement(sop, key).text = cdl.get(key, default)
+            saturation = ElementTree.SubElement(correction, "SatNode")
+            ElementTree.SubElement(saturation, "Saturation").text = cdl.get(
+                "Saturation", "1"
+            )
+        ElementTree.ElementTree(root).write(
+            file_path, encoding="UTF-8", xml_declaration=True
+        )
+
+    def _export_edl(self, file_path: str, export_subtype: str) -> bool:
+        lines = [f"TITLE: {self._name}", "FCM: NON-DROP FRAME", ""]
+        event = 0
+        for track in self._tracks["video"]:
+            for item in track.items:
+                event += 1
+                clip = item._clip
+                source_start = clip._start_frame + item._left_offset
+                reel = (clip._properties["Reel Name"] or "AX")[:8]
+                lines.append(
+                    f"{event:03d}  {reel:<8} V     C        "
+                    f"{frames_to_timecode(source_start, self._fps)} "
+                    f"{frames_to_timecode(source_start + item._duration, self._fps)} "
+                    f"{frames_to_timecode(item._start, self._fps, self._drop_frame)} "
+                    f"{frames_to_timecode(item._end, self._fps, self._drop_frame)}"
+                )
+                lines.append(f"* FROM CLIP NAME: {clip._properties['Clip Name']}")
+                if export_subtype == Resolve.EXPORT_CDL and item._cdl:
+                    cdl = item._cdl.get(1, {})
+                    lines.append(
+                        f"*ASC_SOP ({cdl.get('Slope', '1 1 1')})"
+                        f"({cdl.get('Offset', '0 0 0')})({cdl.get('Power', '1 1 1')})"
+                    )
+                    lines.append(f"*ASC_SAT {cdl.get('Saturation', '1')}")
+                lines.append("")
+        try:
+            Path(file_path).write_text("\n".join(lines))
+        except OSError:
+            return False
+        return True
+
+    def GetSetting(self, setting_name: str = ""):
+        if not setting_name:
+            return dict(self._settings)
+        return self._settings.get(setting_name, "")
+
+    def SetSetting(self, setting_name: str, setting_value: str) -> bool:
+        if setting_name not in self._settings or setting_name == "timelineFrameRate":
+            return False
+        self._settings[setting_name] = str(setting_value)
+        return True
+
+    def InsertGeneratorIntoTimeline(self, generator_name: str) -> "FakeTimelineItem":
+        return self._insert_generated(generator_name)
+
+    def InsertFusionGeneratorIntoTimeline(
+        self, generator_name: str
+    ) -> "FakeTimelineItem":
+        return self._insert_generated(generator_name)
+
+    def InsertFusionCompositionIntoTimeline(self) -> "FakeTimelineItem":
+        item = self._insert_generated("Fusion Composition")
+        item._fusion_comps.append("Composition 1")
+        return item
+
+    def InsertOFXGeneratorIntoTimeline(self, generator_name: str) -> "FakeTimelineItem":
+        return self._insert_generated(generator_name)
+
+    def InsertTitleIntoTimeline(self, title_name: str) -> "FakeTimelineItem":
+        return self._insert_generated(title_name)
+
+    def InsertFusionTitleIntoTimeline(self, title_name: str) -> "FakeTimelineItem":
+        return self._insert_generated(title_name)
+
+    def GrabStill(self) -> Optional["FakeGalleryStill"]:
+        item = self._item_at(self._playhead)
+        if item is None:
+            return None
+        return self._project._gallery._current_album._add_still(item, self._playhead)
+
+    def GrabAllStills(self, still_frame_source: int) -> list["FakeGalleryStill"]:
+        if still_frame_source not in (1, 2):
+            return []
+        album = self._project._gallery._current_album
+        stills = []
+        for track in self._tracks["video"][:1]:
+            for item in track.items:
+                frame = (
+                    item._start
+                    if still_frame_source == 1
+                    else (item._start + item._end) // 2
+                )
+                stills.append(album._add_still(item, frame))
+        return stills
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+    def CreateSubtitlesFromAudio(
+        self, auto_caption_settings: Optional[dict] = None
+    ) -> bool:
+        return bool(self._tracks["audio"]) and any(
+            track.items for track in self._tracks["audio"]
+        )
+
+    def DetectSceneCuts(self) -> bool:
+        return any(track.items for track in self._tracks["video"])
+
+    def ConvertTimelineToStereo(self) -> bool:
+        return True
+
+    def GetNodeGraph(self) -> "FakeGraph":
+        return self._node_graph
+
+    def AnalyzeDolbyVision(
+        self, timeline_items: Optional[list] = None, analysis_type=None
+    ) -> bool:
+        return True
+
+
+class FakeTimelineItem(_FakeObject, _MarkerMixin, _FlagColorMixin, TimelineItem):
+    """
+    Timeline item referencing a :class:`FakeMediaPoolItem` on one track.
+
+    """
+
+    def __init__(
+        self,
+        app: FakeResolve,
+        timeline: FakeTimeline,
+        track: _Track,
+        clip: FakeMediaPoolItem,
+        source_in: int,
+        source_out: int,
+        record: int,
+    ):
+        self._app = app
+        self._timeline: Optional[FakeTimeline] = timeline
+        self._track = track
+        self._clip = clip
+        self._duration = source_out - source_in + 1
+        self._start = record
+        self._end = record + self._duration
+        self._left_offset = source_in
+        self._right_offset = clip._frames - 1 - source_out
+        self._unique_id = _new_id()
+        self._markers = {}
+        self._flags = []
+        self._clip_color = ""
+        self._properties = dict(DEFAULT_ITEM_PROPERTIES)
+        self._linked: list[FakeTimelineItem] = []
+        self._enabled = True
+        self._fusion_comps: list[str] = []
+        self._versions = {0: ["Version 1"], 1: []}
+        self._current_version = {"versionName": "Version 1", "versionType": 0}
+        self._takes: list[dict] = []
+        self._selected_take = 0
+        self._cdl: dict[int, dict[str, str]] = {}
+        self._graphs: dict[int, FakeGraph] = {}
+        self._color_group: Optional[FakeColorGroup] = None
+
+    def _copy(self, timeline: FakeTimeline, track: _Track) -> "FakeTimelineItem":
+        copy = FakeTimelineItem(
+            self._app,
+            timeline,
+            track,
+            self._clip,
+            self._left_offset,
+            self._left_offset + self._duration - 1,
+            self._start,
+        )
+        copy._markers = {frame: dict(marker) for frame, marker in self._markers.items()}
+        copy._flags = list(self._flags)
+        copy._clip_color = self._clip_color
+        copy._properties = dict(self._properties)
+        copy._enabled = self._enabled
+        copy._cdl = {node: dict(values) for node, values in self._cdl.items()}
+        copy._linked = list(self._linked)
+        return copy
+
+    def _marker_range(self) -> Optional[int]:
+        return self._duration
+
+    def _graph(self, layer_index: int = 1) -> "FakeGraph":
+        graph = self._graphs.get(layer_index)
+        if graph is None:
+            graph = self._graphs[layer_index] = FakeGraph(self._app)
+        return graph
+
+    def GetName(self) -> str:
+        return self._clip._properties["Clip Name"]
+
+    def GetDuration(self) -> int:
+        return self._duration
+
+    def GetEnd(self) -> int:
+        return self._end
+
+    def GetFusionCompCount(self) -> int:
+        return len(self._fusion_comps)
+
+    def GetFusionCompByIndex(self, comp_index: int) -> Optional["FakeFusionComp"]:
+        if not 1 <= comp_index <= len(self._fusion_comps):
+            return None
+        return FakeFusionComp(self._app, self._fusion_comps[comp_index - 1])
+
+    def GetFusionCompNameList(self) -> list[str]:
+        return list(self._fusion_comps)
+
+    def GetFusionCompByName(self, comp_name: str) -> Optional["FakeFusionComp"]:
+        if comp_name not in self._fusion_comps:
+            return None
+        return FakeFusionComp(self._app, comp_name)
+
+    def GetLeftOffset(self) -> int:
+        return self._left_offset
+
+    def GetRightOffset(self) -> int:
+        return self._right_offset
+
+    def GetStart(self) -> int:
+        return self._start
+
+    def SetProperty(self, property_key: str, property_value) -> bool:
+        current = self._properties.get(property_key)
+        if (
+            current is None
+            or type(current) is bool
+            and not isinstance(property_value, bool)
+        ):
+            return False
+        if not isinstance(property_value, (int, float, bool)):
+            return False
+        self._properties[property_key] = property_value
+        return True
+
+    def GetProperty(self, property_key: str = None):
+        if property_key is None:
+            return dict(self._properties)
+        return self._properties.get(property_key)
+
+    def AddFlag(self, color: str) -> bool:
+        return _FlagColorMixin.AddFlag(self, color)
+
+    def AddFusionComp(self) -> "FakeFusionComp":
+        name = f"Composition {len(self._fusion_comps) + 1}"
+        self._fusion_comps.append(name)
+        return FakeFusionComp(self._app, name)
+
+    def ImportFusionComp(self, path: str) -> Optional["FakeFusionComp"]:
+        if not os.path.isfile(path):
+            return None
+        name = Path(path).stem
+        self._fusion_comps.append(name)
+        return FakeFusionComp(self._app, name)
+
+    def ExportFusionComp(self, path: str, comp_index: int) -> bool:
+        if not 1 <= comp_index <= len(self._fusion_comps):
+            return False
+        Path(path).write_text(
+            f"Composition {{ Name = {self._fusion_comps[comp_index - 1]!r} }}\n"
+        )
+        return True
+
+    def DeleteFusionCompByName(self, comp_name: str) -> bool:
+        if comp_name not in self._fusion_comps:
+            return False
+        self._fusion_comps.remove(comp_name)
+        return True
+
+    def LoadFusionCompByName(self, comp_name: str) -> Optional["FakeFusionComp"]:
+        return self.GetFusionCompByName.__wrapped__(self, comp_name)
+
+    def RenameFusionCompByName(self, old_name: str, new_name: str) -> bool:
+        if old_name not in self._fusion_comps or new_name in self._fusion_comps:
+            return False
+        self._fusion_comps[self._fusion_comps.index(old_name)] = new_name
+        return True
+
+    def AddVersion(self, version_name: str, version_type: int) -> bool:
+        names = self._versions.get(version_type)
+        if names is None or not version_name or version_name in names:
+            return False
+        names.append(version_name)
+        self._current_version = {
+            "versionName": version_name,
+            "versionType": version_type,
+        }
+        return True
+
+    def GetCurrentVersion(self) -> dict:
+        return dict(self._current_version)
+
+    def DeleteVersionByName(self, version_name: str, version_type: int) -> bool:
+        names = self._versions.get(version_type)
+        if names is None or version_name not in names:
+            return False
+        if self._current_version == {
+            "versionName": version_name,
+            "versionType": version_type,
+        }:
+            return False
+        names.remove(version_name)
+        return True
+
+    def LoadVersionByName(self, version_name: str, version_type: int) -> bool:
+        names = self._versions.get(version_type)
+        if names is None or version_name not in names:
+            return False
+        self._current_version = {
+            "versionName": version_name,
+            "versionType": version_type,
+        }
+        return True
+
+    def RenameVersionByName(
+        self, old_name: str, new_name: str, version_type: int
+    ) -> bool:
+        names = self._versions.get(version_type)
+        if names is None or old_name not in names or new_name in names:
+            return False
+        names[names.index(old_name)] = new_name
+        if self._current_version["versionName"] == old_name:
+            self._current_version["versionName"] = new_name
+        return True
+
+    def GetVersionNameList(self, version_type: int) -> list[str]:
+        return list(self._versions.get(version_type, []))
+
+    def GetMediaPoolItem(self) -> FakeMediaPoolItem:
+        return self._clip
+
+    def GetStereoConvergenceValues(self) -> dict:
+        return {}
+
+    def GetStereoLeftFloatingWindowParams(self) -> dict:
+        return {}
+
+    def GetStereoRightFloatingWindowParams(self) -> dict:
+        return {}
+
+    def ApplyArriCdlLut(self) -> bool:
+        return False
+
+    def SetCDL(self, CDL_map: dict) -> bool:
+        try:
+            node_index = int(CDL_map["NodeIndex"])
+            values = {
+                key: CDL_map[key] for key in ("Slope", "Offset", "Power", "Saturation")
+            }
+            for key in ("Slope", "Offset", "Power"):
+                if len([float(value) for value in str(values[key]).split()]) != 3:
+                    return False
+            float(values["Saturation"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        if not 1 <= node_index <= self._graph()._node_count():
+            return False
+        self._cdl[node_index] = {key: str(value) for key, value in values.items()}
+        return True
+
+    def AddTake(
+        self,
+        media_pool_item: FakeMediaPoolItem,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+    ) -> bool:
+        if not isinstance(media_pool_item, FakeMediaPoolItem):
+            return False
+        if not self._takes:
+            self._takes.append(
+                {
+                    "startFrame": self._left_offset,
+                    "endFrame": self._left_offset + self._duration - 1,
+                    "mediaPoolItem": self._clip,
+                }
+            )
+            self._selected_take = 1
+        self._takes.append(
+            {
+                "startFrame": start_frame or 0,
+                "endFrame": end_frame
+                if end_frame is not None
+                else media_pool_item._frames - 1,
+                "mediaPoolItem": media_pool_item,
+            }
+        )
+        return True
+
+    def GetSelectedTakeIndex(self) -> int:
+        return self._selected_take
+
+    def GetTakesCount(self) -> int:
+        return len(self._takes)
+
+    def GetTakeByIndex(self, idx: int) -> dict:
+        if not 1 <= idx <= len(self._takes):
+            return {}
+        return dict(self._takes[idx - 1])
+
+    def DeleteTakeByIndex(self, idx: int) -> bool:
+        if not 1 <= idx <= len(self._takes) or idx == self._selected_take:
+            return False
+        del self._takes[idx - 1]
+        if idx < self._selected_take:
+            self._selected_take -= 1
+        return True
+
+    def SelectTakeByIndex(self, idx: int) -> bool:
+        if not 1 <= idx <= len(self._takes):
+            return False
+        self._selected_take = idx
+        self._clip = self._takes[idx - 1]["mediaPoolItem"]
+        return True
+
+    def FinalizeTake(self) -> bool:
+        if not self._takes:
+            return False
+        self._takes = []
+        self._selected_take = 0
+        return True
+
+    def CopyGrades(self, target_timemline_items: list["FakeTimelineItem"]) -> bool:
+        if not target_timemline_items:
+            return False
+        for item in target_timemline_items:
+            item._cdl = {node: dict(values) for node, values in self._cdl.items()}
+        return True
+
+    def SetClipEnabled(self, enabled: bool) -> bool:
+        self._enabled = bool(enabled)
+        return True
+
+    def GetClipEnabled(self) -> bool:
+        return self._enabled
+
+    def UpdateSidecar(self) -> bool:
+        return self._clip._properties["Format"] in ("BRAW", "R3D")
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+    def LoadBurnInPreset(self, preset_name: str) -> bool:
+        return preset_name in self._app._burn_in_presets
+
+    def CreateMagicMask(self, mode: str) -> bool:
+        return mode in ("F", "B", "BI")
+
+    def RegenerateMagicMask(self) -> bool:
+        return True
+
+    def Stabilize(self) -> bool:
+        return True
+
+    def SmartReframe(self) -> bool:
+        return True
+
+    def GetNodeGraph(self, layer_index: int = 1) -> Optional["FakeGraph"]:
+        if not 1 <= layer_index <= 4:
+            return None
+        return self._graph(layer_index)
+
+    def GetColorGroup(self) -> Optional["FakeColorGroup"]:
+        return self._color_group
+
+    def AssignToColorGroup(self, color_group: "FakeColorGroup") -> bool:
+        if (
+            self._timeline is None
+            or color_group not in self._timeline._project._color_groups
+        ):
+            return False
+        self._color_group = color_group
+        return True
+
+    def RemoveFromColorGroup(self) -> bool:
+        if self._color_group is None:
+            return False
+        self._color_group = None
+        return True
+
+    def ExportLUT(self, export_type, path: str) -> bool:
+        if isinstance(export_type, ExportType):
+            export_type = export_type.value
+        sizes = {
+            Resolve.EXPORT_LUT_17PTCUBE: 17,
+            Resolve.EXPORT_LUT_33PTCUBE: 33,
+            Resolve.EXPORT_LUT_65PTCUBE: 65,
+            Resolve.EXPORT_LUT_PANASONICVLUT: 17,
+        }
+        size = sizes.get(export_type)
+        if size is None:
+            return False
+        vlut = export_type == Resolve.EXPORT_LUT_PANASONICVLUT
+        extension = ".vlt" if vlut else ".cube"
+        if not path.lower().endswith(extension):
+            path += extension
+        cdl = self._cdl.get(1, {})
+        slope = [float(v) for v in cdl.get("Slope", "1 1 1").split()]
+        offset = [float(v) for v in cdl.get("Offset", "0 0 0").split()]
+        power = [float(v) for v in cdl.get("Power", "1 1 1").split()]
+        saturation = float(cdl.get("Saturation", "1"))
+        scale = size - 1
+        if vlut:
+            header = [
+                "# panasonic vlt file version 1.0",
+                f'# source vlt file "{self.GetName.__wrapped__(self)}"',
+                f"LUT_3D_SIZE {size}",
+                "",
+            ]
+        else:
+            header = [
+                f'TITLE "{self.GetName.__wrapped__(self)}"',
+                f"LUT_3D_SIZE {size}",
+                "DOMAIN_MIN 0.0 0.0 0.0",
+                "DOMAIN_MAX 1.0 1.0 1.0",
+                "",
+            ]
+        rows = []
+        for blue in range(size):
+            for green in range(size):
+                for red in range(size):
+                    rgb = []
+                    for channel, value in enumerate(
+                        (red / scale, green / scale, blue / scale)
+                    ):
+                        value = max(value * slope[channel] + offset[channel], 0.0)
+                        rgb.append(value ** power[channel])
+                    luma = 0.2126 * rgb[0] + 0.7152 * rgb[1] + 0.0722 * rgb[2]
+                    rgb = [
+                        min(max(luma + saturation * (v - luma), 0.0), 1.0) for v in rgb
+                    ]
+                    if vlut:
+                        rows.append(" ".join(str(round(v * 4095)) for v in rgb))
+                    else:
+                        rows.append(" ".join(f"{v:.6f}" for v in rgb))
+        try:
+            Path(path).write_text("\n".join(header + rows) + "\n")
+        except OSError:
+            return False
+        return True
+
+    def GetLinkedItems(self) -> list["FakeTimelineItem"]:
+        return list(self._linked)
+
+    def GetTrackTypeAndIndex(self) -> list:
+        track = self._track
+        if self._timeline is None:
+            return []
+        return [
+            track.track_type,
+            self._timeline._tracks[track.track_type].index(track) + 1,
+        ]
+
+    def GetSourceAudioChannelMapping(self) -> str:
+        return self._clip.GetAudioMapping.__wrapped__(self._clip)
+
+
+class FakeGallery(_FakeObject, Gallery):
+    """
+    Gallery with still albums.
+
+    """
+
+    def __init__(self, app: FakeResolve, project: FakeProject):
+        self._app = app
+        self._project = project
+        self._albums = [FakeGalleryStillAlbum(app, "Stills 1", 1)]
+        self._current_album = self._albums[0]
+
+    def GetAlbumName(self, gallery_still_album: "FakeGalleryStillAlbum") -> str:
+        return gallery_still_album._name
+
+    def SetAlbumName(
+        self, gallery_still_album: "FakeGalleryStillAlbum", album_name: str
+    ) -> bool:
+        if gallery_still_album not in self._albums or not album_name:
+            return False
+        gallery_still_album._name = album_name
+        return True
+
+    def GetCurrentStillAlbum(self) -> "FakeGalleryStillAlbum":
+        return self._current_album
+
+    def SetCurrentStillAlbum(
+        self, gallery_still_album: "FakeGalleryStillAlbum"
+    ) -> bool:
+        if gallery_still_album not in self._albums:
+            return False
+        self._current_album = gallery_still_album
+        return True
+
+    def GetGalleryStillAlbums(self) -> list["FakeGalleryStillAlbum"]:
+        return list(self._albums)
+
+    def CreateGalleryStillAlbum(self) -> "FakeGalleryStillAlbum":
+        album = FakeGalleryStillAlbum(
+            self._app, f"Stills {len(self._albums) + 1}", len(self._albums) + 1
+        )
+        self._albums.append(album)
+        return album
+
+
+class FakeGalleryStill(_FakeObject, GalleryStill):
+    """
+    Still grabbed from a timeline item.
+
+    """
+
+    def __init__(self, app: FakeResolve, label: str, seed: int):
+        self._app = app
+        self._label = label
+        self._seed = seed
+
+
+class FakeGalleryStillAlbum(_FakeObject, GalleryStillAlbum):
+    """
+    Album of :class:`FakeGalleryStill` objects.
+
+    """
+
+    def __init__(self, app: FakeResolve, name: str, number: int):
+        self._app = app
+        self._name = name
+        self._number = number
+        self._stills: list[FakeGalleryStill] = []
+        self._counter = 0
+
+    def _add_still(self, item: FakeTimelineItem, frame: int) -> FakeGalleryStill:
+        self._counter += 1
+        seed = zlib.crc32(item._clip._unique_id.encode()) ^ frame
+        still = FakeGalleryStill(self._app, f"{self._number}.{self._counter}.1", seed)
+        self._stills.append(still)
+        return still
+
+    def GetStills(self) -> list[FakeGalleryStill]:
+        return list(self._stills)
+
+    def GetLabel(self, gallery_still: FakeGalleryStill) -> str:
+        if gallery_still not in self._stills:
+            return ""
+        return gallery_still._label
+
+    def SetLabel(self, gallery_still: FakeGalleryStill, label: str) -> bool:
+        if gallery_still not in self._stills:
+            return False
+        gallery_still._label = label
+        return True
+
+    def ImportStills(self, file_paths) -> bool:
+        if isinstance(file_paths, str):
+            file_paths = [file_paths]
+        imported = False
+        for path in file_paths:
+            if os.path.isfile(os.path.expanduser(path)):
+                self._counter += 1
+                self._stills.append(
+                    FakeGalleryStill(
+                        self._app,
+                        f"{self._number}.{self._counter}.1",
+                        zlib.crc32(path.encode()),
+                    )
+                )
+                imported = True
+        return imported
+
+    def ExportStills(
+        self,
+        gallery_still: list[FakeGalleryStill],
+        folder_path: str,
+        file_prefix: str,
+        format: str,
+    ) -> bool:
+        fmt = format.lower()
+        if fmt not in STILL_FORMATS or not os.path.isabs(folder_path):
+            return False
+        if not os.path.isdir(folder_path):
+            return False
+        width, height = self._app.still_size
+        exported = True
+        for still in gallery_still:
+            if still not in self._stills:
+                exported = False
+                continue
+            name = f"{file_prefix}_{still._label}" if file_prefix else still._label
+            rgb = _synthetic_rgb(width, height, still._seed)
+            try:
+                Path(folder_path, f"{name}.{fmt}").write_bytes(
+                    _encode_still(fmt, width, height, rgb)
+                )
+            except OSError:
+                exported = False
+        return exported
+
+    def DeleteStills(self, gallery_still: list[FakeGalleryStill]) -> bool:
+        if not gallery_still or any(
+            still not in self._stills for still in gallery_still
+        ):
+            return False
+        for still in gallery_still:
+            self._stills.remove(still)
+        return True
+
+
+class FakeGraph(_FakeObject, Graph):
+    """
+    Node graph with a configurable number of serial nodes.
+
+    """
+
+    def __init__(self, app: FakeResolve, node_count: int = 1):
+        self._app = app
+        self._nodes = [
+            {"label": "", "lut": "", "enabled": True, "tools": []}
+            for _ in range(node_count)
+        ]
+
+    def _node_count(self) -> int:
+        return len(self._nodes)
+
+    def _node(self, node_index: int) -> Optional[dict]:
+        if not isinstance(node_index, int) or not 1 <= node_index <= len(self._nodes):
+            return None
+        return self._nodes[node_index - 1]
+
+    def add_node(self, label: str = "") -> int:
+        """
+        Appends a serial node and returns its 1-based index.
+
+        """
+        self._nodes.append({"label": label, "lut": "", "enabled": True, "tools": []})
+        return len(self._nodes)
+
+    def GetNumNodes(self) -> int:
+        return len(self._nodes)
+
+    def SetLUT(self, node_index: int, lut_path: str) -> bool:
+        node = self._node(node_index)
+        if node is None or not lut_path:
+            return False
+        if os.path.isabs(lut_path) and not os.path.isfile(lut_path):
+            return False
+        node["lut"] = lut_path
+        if "LUT" not in node["tools"]:
+            node["tools"].append("LUT")
+        return True
+
+    def GetLUT(self, node_index: int) -> str:
+        node = self._node(node_index)
+        return node["lut"] if node is not None else ""
+
+    def GetNodeLabel(self, node_index: int) -> str:
+        node = self._node(node_index)
+        return node["label"] if node is not None else ""
+
+    def GetToolsInNode(self, node_index: int) -> list:
+        node = self._node(node_index)
+        return list(node["tools"]) if node is not None else []
+
+    def SetNodeEnabled(self, node_index: int, is_enabled: bool) -> bool:
+        node = self._node(node_index)
+        if node is None:
+            return False
+        node["enabled"] = bool(is_enabled)
+        return True
+
+
+class FakeColorGroup(_FakeObject, ColorGroup):
+    """
+    Color group with its own pre-clip and post-clip node graphs.
+
+    """
+
+    def __init__(self, app: FakeResolve, project: FakeProject, name: str):
+        self._app = app
+        self._project = project
+        self._name = name
+        self._pre_clip_graph = FakeGraph(app)
+        self._post_clip_graph = FakeGraph(app)
+
+    def GetName(self) -> str:
+        return self._name
+
+    def SetName(self, group_name: str) -> bool:
+        if not group_name or any(
+            group._name == group_name for group in self._project._color_groups
+        ):
+            return False
+        self._name = group_name
+        return True
+
+    def GetClipsInTimeline(
+        self, timeline: Optional[FakeTimeline] = None
+    ) -> list[FakeTimelineItem]:
+        timeline = timeline or self._project._current_timeline
+        if timeline is None:
+            return []
+        return [
+            item
+            for track in timeline._tracks["video"]
+            for item in track.items
+            if item._color_group is self
+        ]
+
+    def GetPreClipNodeGraph(self) -> FakeGraph:
+        return self._pre_clip_graph
+
+    def GetPostClipNodeGraph(self) -> FakeGraph:
+        return self._post_clip_graph
+
+
+class FakeFusionComp(_FakeObject, FusionComp):
+    """
+    Named Fusion composition placeholder.
+
+    """
+
+    def __init__(self, app: FakeResolve, name: str):
+        self._app = app
+        self._name = name
+
+    def GetAttrs(self) -> dict:
+        return {"COMPS_Name": self._name}
+
+
+_instance: Optional[FakeResolve] = None
+
+
+def scriptapp(app_name: str, *args, **kwargs) -> Optional[FakeResolve]:
+    """
+    Returns the process-wide :class:`FakeResolve`, mirroring
+    ``fusionscript.scriptapp("Resolve")``.
+
+    Parameters
+    ----------
+    app_name
+        Application name, "Resolve" (case-insensitive). Anything else returns None.
+
+    Returns
+    -------
+    Optional[FakeResolve]
+        The fake Resolve app object.
+
+    """
+    global _instance
+    if app_name.lower() != "resolve":
+        return None
+    if _instance is None:
+        _instance = FakeResolve()
+    return _instance
+
+
+def reset(**kwargs) -> FakeResolve:
+    """
+    Replaces the process-wide :class:`FakeResolve` with a fresh one.
+
+    Parameters
+    ----------
+    **kwargs
+        Passed to :class:`FakeResolve`.
+
+    Returns
+    -------
+    FakeResolve
+        The new fake Resolve app object.
+
+    """
+    global _instance
+    _instance = FakeResolve(**kwargs)
+    return _instance
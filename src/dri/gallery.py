@@ -0,0 +1,352 @@
+class Gallery:
+    def GetAlbumName(self, gallery_still_album: "GalleryStillAlbum") -> str:
+        """
+        Returns the name of the :class:`dri.GalleryStillAlbum` object
+        "galleryStillAlbum".
+
+        Parameters
+        ----------
+        gallery_still_album
+            :class:`dri.GalleryStillAlbum` object
+
+        Returns
+        -------
+        str
+            Album name.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> galley.GetAlbumName(current_gallery_still_ablum)
+        Stills 1
+
+        """
+        ...
+
+    def SetAlbumName(
+        self, gallery_still_album: "GalleryStillAlbum", album_name: str
+    ) -> bool:
+        """
+        Sets the name of the GalleryStillAlbum object "galleryStillAlbum" to "albumName".
+
+        Parameters
+        ----------
+        gallery_still_album
+            :class:`dri.GalleryStillAlbum` object
+        album_name
+            Album name to set.
+
+        Returns
+        -------
+        bool
+            True if successful, False otherwise.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> galley.SetAlbumName(current_gallery_still_ablum, "New Album Name")
+        True
+
+        """
+        ...
+
+    def GetCurrentStillAlbum(self) -> "GalleryStillAlbum":
+        """
+        Returns current album as a GalleryStillAlbum object.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+
+        """
+        ...
+
+    def SetCurrentStillAlbum(self, gallery_still_album: "GalleryStillAlbum") -> bool:
+        """
+        Sets current album to GalleryStillAlbum object "galleryStillAlbum".
+
+        Parameters
+        ----------
+        gallery_still_album
+            :class:`dri.GalleryStillAlbum` object
+
+        Returns
+        -------
+        bool
+            True if successful, False otherwise.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> gallery_still_ablums: list[GalleryStillAlbum] = galley.GetGalleryStillAlbums()
+        >>> galley.SetCurrentStillAlbum(gallery_still_ablums[0])
+        True
+
+        """
+        ...
+
+    def GetGalleryStillAlbums(self) -> list["GalleryStillAlbum"]:
+        """
+        Returns the gallery albums as a list of GalleryStillAlbum objects.
+
+        Returns
+        -------
+        list[GalleryStillAlbum]
+            A list of :class:`dri.GalleryStillAlbum` object.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> gallery_still_albums: list[GalleryStillAlbum] = galley.GetGalleryStillAlbums()
+
+        """
+        ...
+
+
+class GalleryStillAlbum:
+    def GetStills(self) -> list["GalleryStill"]:
+        """
+        Returns the list of GalleryStill objects in the album.
+
+        Returns
+        -------
+        list[GalleryStill]
+            A list of GalleryStill objects in the album.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> current_gallery_still_ablum.GetStills()
+        [<BlackmagicFusion.PyRemoteObject object at 0x102f72070>, <BlackmagicFusion.PyRemoteObject object at 0x102f70ff0>]
+
+        """
+        ...
+
+    def GetLabel(self, gallery_still: "GalleryStill") -> str:
+        """
+        Returns the label of the galleryStill.
+
+        Parameters
+        ----------
+        gallery_still
+            Get label from this :class:`GallerySill` object.
+
+        Returns
+        -------
+        str
+            The Label of this :class:`GalleryStill` object.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> for still in current_gallery_still_ablum.GetStills():
+        ...     current_gallery_still_ablum.GetLabel(still)
+
+        """
+        ...
+
+    def SetLabel(self, gallery_still: "GalleryStill", label: str) -> bool:
+        """
+        Sets the new 'label' to GalleryStill object 'galleryStill'.
+
+        Parameters
+        ----------
+        gallery_still
+            Target of setting new label to.
+        label
+            New label.
+
+        Returns
+        -------
+        bool
+            True if successful, false otherwise.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> for still in current_gallery_still_ablum.GetStills():
+        ...     current_gallery_still_ablum.SetLabel(still, "Label Name")
+
+        """
+        ...
+
+    def ImportStills(self, file_paths: str | list[str]) -> bool:
+        """
+        Imports GalleryStill from each filePath in [filePaths] list. True if at least
+        one still is imported successfully. False otherwise.
+
+        Parameters
+        ----------
+        file_path
+           File paths that store GalleryStills.
+
+        Returns
+        -------
+        bool
+            True if at least one still is imported successfully, false otherwise.
+
+        Notes
+        -----
+        It can also take a single file path, not limited to only accept a list of file
+        paths.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> current_gallery_still_ablum.ImportStills("~/Downloads/Still_1.1.1.drx")
+
+        """
+        ...
+
+    def ExportStills(
+        self,
+        gallery_still: list["GalleryStill"],
+        folder_path: str,
+        file_prefix: str,
+        format: str,
+    ) -> bool:
+        """
+        Exports list of GalleryStill objects '[galleryStill]' to directory 'folderPath',
+        with filename prefix 'filePrefix', using file format 'format' (supported
+        formats: dpx, cin, tif, jpg, png, ppm, bmp, xpm, drx).
+
+        Parameters
+        ----------
+        gallery_still
+            The list of `GalleryStill` objects to be exported.
+        folder_path
+            The path of the folder where the stills will be exported to.
+        file_prefix
+            The prefix that will be added to the filenames of all exported stills.
+        format
+            The format of the exported stills. Supported formats are: dpx, cin, tif,
+            jpg, png, ppm, bmp, xpm, and drx.
+
+        Returns
+        -------
+        bool
+            Return `True` if all the stills are successfully exported, `False`
+            otherwise.
+
+        Notes
+        -----
+        folder_path must be absolute path, abbreviation like `~/Downloads/` will not
+        work.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> gallery_stills_to_export = current_gallery_still_ablum.GetStills()
+        >>> current_gallery_still_ablum.ExportStills(
+        ...     gallery_stills_to_export, "/Users/thom/Downloads/", "prefix", "png"
+        ... )
+
+        """
+        ...
+
+    def DeleteStills(self, gallery_still: list["GalleryStill"]) -> bool:
+        """
+        Deletes specified list of GalleryStill objects '[galleryStill]'.
+
+        Parameters
+        ----------
+        gallery_still
+            The list of `GalleryStill` objects that are to be deleted.
+
+        Returns
+        -------
+        bool
+            Return `True` if all objects were successfully deleted, `False` otherwise.
+
+        Examples
+        --------
+        >>> from dri import GalleryStillAlbum, Resolve
+        ...
+        >>> resolve = Resolve.resolve_init()
+        >>> project_manager = resolve.GetProjectManager()
+        >>> project = project_manager.GetCurrentProject()
+        ...
+        >>> galley = project.GetGallery()
+        >>> current_gallery_still_ablum: GalleryStillAlbum = galley.GetCurrentStillAlbum()
+        >>> gallery_stills_to_export = current_gallery_still_ablum.GetStills()
+        >>> current_gallery_still_ablum.DeleteStills(gallery_stills_to_export)
+
+        """
+        ...
+
+
+class GalleryStill:
+    """
+    This class does not provide any API functions but the object type is used by
+    functions in other classes.
+    """
+
+    ...
@@ -0,0 +1,468 @@
+"""
+Parallel media ingest into the Media Pool.
+
+:class:`MediaIngest` turns a list of volumes or folders into Media Pool clips in four
+steps:
+
+1.  Walk the folders, either on the local filesystem or through
+    ``MediaStorage.GetSubFolderList``/``GetFileList``.
+2.  Filter the files by extension, then by size with ``os.stat`` calls spread over a
+    thread pool, which hides the latency of network volumes.
+3.  Drop files that are already clips in the Media Pool.
+4.  Import the rest with ``MediaStorage.AddItemListToMediaPool`` or
+    ``MediaPool.ImportMedia`` in chunks sized to take about `target_seconds` each. A
+    chunk that fails or imports only some of its files is bisected until the bad files
+    are isolated; single files are retried `retries` times before they are reported as
+    failed.
+
+API calls are made from the calling thread only, the thread pool is used for filesystem
+access.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.ingest import MediaIngest
+...
+>>> resolve = Resolve.resolve_init()
+>>> media_pool = resolve.GetProjectManager().GetCurrentProject().GetMediaPool()
+>>> ingest = MediaIngest(media_pool, resolve.GetMediaStorage(), min_size=1024)
+>>> report = ingest.run(["/Volumes/CARD_A001", "/Volumes/CARD_A002"])
+>>> len(report.imported), report.duplicates, report.failed
+(1412, 36, ['/Volumes/CARD_A002/A002C014_220101_R1AB.mov'])
+
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Iterator, Optional
+
+    from dri.folder import Folder
+    from dri.media_pool import MediaPool
+    from dri.media_pool_item import MediaPoolItem
+    from dri.media_storage import MediaStorage
+
+VIDEO_EXTENSIONS = frozenset(
+    {"ari", "arx", "avi", "braw", "crm", "mkv", "mov", "mp4", "mts", "mxf", "r3d"}
+)
+AUDIO_EXTENSIONS = frozenset({"aac", "aif", "aiff", "flac", "m4a", "mp3", "wav"})
+# Frames of image sequences are imported one clip per file, so they are opt-in.
+IMAGE_EXTENSIONS = frozenset(
+    {"bmp", "cin", "dng", "dpx", "exr", "jpeg", "jpg", "png", "tif", "tiff"}
+)
+CAMERA_EXTENSIONS = VIDEO_EXTENSIONS | AUDIO_EXTENSIONS
+
+
+def _normalize(path: str) -> str:
+    return os.path.normcase(os.path.normpath(path))
+
+
+def walk_local(roots: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the files below `roots` on the local filesystem, skipping hidden files and
+    folders, e.g. ``.DS_Store`` or ``._`` resource forks.
+
+    """
+    pending = list(roots)
+    while pending:
+        folder = pending.pop()
+        if os.path.isfile(folder):
+            yield folder
+            continue
+        try:
+            entries = sorted(os.scandir(folder), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subfolders = []
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            try:
+                if entry.is_dir():
+                    subfolders.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+        pending.extend(reversed(subfolders))
+
+
+def walk_storage(
+    media_storage: MediaStorage, roots: Optional[Iterable[str]] = None
+) -> Iterator[str]:
+    """
+    Yields the files below `roots` as listed by Media Storage, two API calls per
+    folder.
+
+    Parameters
+    ----------
+    media_storage
+        Media Storage of the running Resolve.
+    roots
+        Folders to walk. Defaults to ``GetMountedVolumeList()``.
+
+    """
+    if roots is None:
+        roots = media_storage.GetMountedVolumeList() or []
+    pending = list(roots)
+    pending.reverse()
+    while pending:
+        folder = pending.pop()
+        for path in media_storage.GetFileList(folder) or []:
+            if not os.path.basename(path).startswith("."):
+                yield path
+        subfolders = media_storage.GetSubFolderList(folder) or []
+        pending.extend(reversed(subfolders))
+
+
+def _stat_size(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def filter_paths(
+    paths: Iterable[str],
+    extensions: Optional[frozenset[str]] = CAMERA_EXTENSIONS,
+    min_size: int = 1,
+    max_size: Optional[int] = None,
+    workers: int = 8,
+) -> tuple[list[str], Counter]:
+    """
+    Keeps the paths with a wanted extension and size.
+
+    Parameters
+    ----------
+    paths
+        Candidate file paths.
+    extensions
+        Lowercase extensions without the dot. None keeps every extension.
+    min_size, max_size
+        Size bounds in bytes. Files that cannot be stat'ed are dropped.
+    workers
+        Number of threads calling ``os.stat``.
+
+    Returns
+    -------
+    tuple[list[str], Counter]
+        Kept paths in input order, and the number of dropped paths keyed by reason:
+        "extension", "missing", "too small" or "too large".
+
+    """
+    skipped: Counter = Counter()
+    candidates = []
+    for path in paths:
+        extension = os.path.splitext(path)[1][1:].lower()
+        if extensions is not None and extension not in extensions:
+            skipped["extension"] += 1
+        else:
+            candidates.append(path)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        sizes = executor.map(_stat_size, candidates, chunksize=64)
+        kept = []
+        for path, size in zip(candidates, sizes):
+            if size is None:
+                skipped["missing"] += 1
+            elif size < min_size:
+                skipped["too small"] += 1
+            elif max_size is not None and size > max_size:
+                skipped["too large"] += 1
+            else:
+                kept.append(path)
+    return kept, skipped
+
+
+def pool_file_paths(
+    media_pool: MediaPool, folder: Optional[Folder] = None
+) -> dict[str, MediaPoolItem]:
+    """
+    Returns the clips of the Media Pool keyed by normalized file path.
+
+    Costs two calls per folder and one ``GetClipProperty("File Path")`` call per clip.
+
+    Parameters
+    ----------
+    media_pool
+        Media Pool to read.
+    folder
+        Folder to start from. Defaults to the root folder.
+
+    """
+    clips: dict[str, MediaPoolItem] = {}
+    pending = [folder or media_pool.GetRootFolder()]
+    while pending:
+        current = pending.pop()
+        for clip in current.GetClipList() or []:
+            path = clip.GetClipProperty("File Path")
+            if path:
+                clips.setdefault(_normalize(path), clip)
+        pending.extend(current.GetSubFolderList() or [])
+    return clips
+
+
+class IngestReport:
+    """
+    Outcome of :meth:`MediaIngest.run` and :meth:`MediaIngest.submit`.
+
+    Attributes
+    ----------
+    scanned : int
+        Number of files found.
+    skipped : Counter
+        Files dropped by :func:`filter_paths`, keyed by reason.
+    duplicates : int
+        Files that were already in the Media Pool or listed twice.
+    imported : list[MediaPoolItem]
+        Clips created.
+    failed : list[str]
+        Files that could not be imported.
+    calls : int
+        Number of import calls made.
+    seconds : float
+        Time spent in import calls.
+
+    """
+
+    __slots__ = (
+        "calls",
+        "duplicates",
+        "failed",
+        "imported",
+        "scanned",
+        "seconds",
+        "skipped",
+    )
+
+    def __init__(self):
+        self.scanned = 0
+        self.skipped: Counter = Counter()
+        self.duplicates = 0
+        self.imported: list[MediaPoolItem] = []
+        self.failed: list[str] = []
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"IngestReport(scanned={self.scanned}, skipped={sum(self.skipped.values())}, "
+            f"duplicates={self.duplicates}, imported={len(self.imported)}, "
+            f"failed={len(self.failed)}, calls={self.calls})"
+        )
+
+
+class MediaIngest:
+    """
+    Media ingest pipeline, see the module documentation.
+
+    Parameters
+    ----------
+    media_pool
+        Media Pool to import into. Clips land in its current folder.
+    media_storage
+        If given, files are imported with ``AddItemListToMediaPool`` and
+        ``run(use_storage=True)`` can walk folders through it. Otherwise
+        ``MediaPool.ImportMedia`` is used.
+    extensions
+        Lowercase extensions to import, None for all. Defaults to
+        :data:`CAMERA_EXTENSIONS`.
+    min_size, max_size
+        Size bounds in bytes.
+    workers
+        Number of threads used for ``os.stat``.
+    chunk_size
+        Number of files in the first import call.
+    max_chunk_size
+        Upper bound of the chunk size.
+    target_seconds
+        Desired duration of one import call. The chunk size is adapted to the measured
+        time per file so that a bad file only holds up a bounded amount of work.
+    retries
+        Number of times a single file is retried after its import failed.
+    clock
+        Monotonic clock used to time import calls.
+
+    """
+
+    def __init__(
+        self,
+        media_pool: MediaPool,
+        media_storage: Optional[MediaStorage] = None,
+        extensions: Optional[frozenset[str]] = CAMERA_EXTENSIONS,
+        min_size: int = 1,
+        max_size: Optional[int] = None,
+        workers: int = 8,
+        chunk_size: int = 64,
+        max_chunk_size: int = 1024,
+        target_seconds: float = 5.0,
+        retries: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= chunk_size <= max_chunk_size:
+            raise ValueError("chunk_size must be between 1 and max_chunk_size")
+        self.media_pool = media_pool
+        self.media_storage = media_storage
+        self.extensions = extensions
+        self.min_size = min_size
+        self.max_size = max_size
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_seconds = target_seconds
+        self.retries = retries
+        self.clock = clock
+        # Moving average of the seconds one file takes to import.
+        self._seconds_per_file: Optional[float] = None
+
+    def scan(
+        self, roots: Iterable[str], use_storage: bool = False
+    ) -> tuple[list[str], IngestReport]:
+        """
+        Walks `roots` and filters the files found.
+
+        Returns
+        -------
+        tuple[list[str], IngestReport]
+            Files to import, and a report with `scanned` and `skipped` filled in.
+
+        """
+        if use_storage:
+            if self.media_storage is None:
+                raise ValueError("use_storage=True requires a MediaStorage")
+            found = list(walk_storage(self.media_storage, roots))
+        else:
+            found = list(walk_local(roots))
+        report = IngestReport()
+        report.scanned = len(found)
+        paths, report.skipped = filter_paths(
+            found, self.extensions, self.min_size, self.max_size, self.workers
+        )
+        return paths, report
+
+    def run(
+        self,
+        roots: Iterable[str],
+        use_storage: bool = False,
+        dedupe: bool = True,
+    ) -> IngestReport:
+        """
+        Walks, filters, dedupes and imports the files below `roots`.
+
+        Parameters
+        ----------
+        roots
+            Volumes, folders or files.
+        use_storage
+            Walk folders through Media Storage rather than the local filesystem, for
+            paths that only Resolve can see.
+        dedupe
+            Skip files that are already clips anywhere in the Media Pool.
+
+        """
+        paths, report = self.scan(roots, use_storage)
+        return self.submit(paths, dedupe, report)
+
+    def submit(
+        self,
+        paths: Iterable[str],
+        dedupe: bool = True,
+        report: Optional[IngestReport] = None,
+    ) -> IngestReport:
+        """
+        Imports files that are already filtered.
+
+        Parameters
+        ----------
+        paths
+            Files to import.
+        dedupe
+            Skip files that are already clips anywhere in the Media Pool.
+        report
+            Report to add to, e.g. the one returned by :meth:`scan`.
+
+        """
+        if report is None:
+            report = IngestReport()
+        known = set(pool_file_paths(self.media_pool)) if dedupe else set()
+        queue = []
+        for path in paths:
+            key = _normalize(path)
+            if key in known:
+                report.duplicates += 1
+                continue
+            known.add(key)
+            queue.append(path)
+
+        # Chunks to redo after a failure, as (paths, attempt), processed first.
+        redo: list[tuple[list[str], int]] = []
+        position = 0
+        while redo or position < len(queue):
+            if redo:
+                chunk, attempt = redo.pop()
+            else:
+                chunk = queue[position : position + self._chunk_size()]
+                position += len(chunk)
+                attempt = 0
+
+            items = self._import(chunk, report)
+            if items is not None and len(items) >= len(chunk):
+                report.imported.extend(items)
+                continue
+
+            remaining = chunk
+            if items:
+                report.imported.extend(items)
+                imported = {
+                    _normalize(item.GetClipProperty("File Path") or "")
+                    for item in items
+                }
+                remaining = [path for path in chunk if _normalize(path) not in imported]
+            # Failures are likelier in big chunks, shrink the next ones.
+            self.chunk_size = max(1, self.chunk_size // 2)
+            if len(remaining) > 1:
+                middle = len(remaining) // 2
+                redo.append((remaining[middle:], attempt))
+                redo.append((remaining[:middle], attempt))
+            elif remaining:
+                if attempt < self.retries:
+                    redo.append((remaining, attempt + 1))
+                else:
+                    report.failed.extend(remaining)
+        return report
+
+    def _chunk_size(self) -> int:
+        if self._seconds_per_file:
+            wanted = int(self.target_seconds / self._seconds_per_file)
+            # Grow at most twofold per call, so one fast chunk cannot overshoot.
+            self.chunk_size = max(1, min(wanted, self.chunk_size * 2))
+        self.chunk_size = min(self.chunk_size, self.max_chunk_size)
+        return self.chunk_size
+
+    def _import(
+        self, chunk: list[str], report: IngestReport
+    ) -> Optional[list[MediaPoolItem]]:
+        start = self.clock()
+        try:
+            if self.media_storage is not None:
+                items = self.media_storage.AddItemListToMediaPool(chunk)
+            else:
+                items = self.media_pool.ImportMedia(chunk)
+        except Exception:
+            items = None
+        elapsed = self.clock() - start
+        report.calls += 1
+        report.seconds += elapsed
+        if items and len(items) >= len(chunk):
+            per_file = elapsed / len(chunk)
+            if self._seconds_per_file is None:
+                self._seconds_per_file = per_file
+            else:
+                self._seconds_per_file = 0.7 * self._seconds_per_file + 0.3 * per_file
+        return items
@@ -0,0 +1,853 @@
+"""
+Streaming readers of edit interchange files, to check them before importing.
+
+``MediaPool.ImportTimelineFromFile`` and ``Timeline.ImportIntoTimeline`` take minutes on
+large files and return None or False without saying why, most often because the file
+points at media that is not there. :func:`preflight` reads the file first, builds its
+event list, resolves every source against the filesystem and reports what is missing;
+:func:`import_timeline` and :func:`import_into_timeline` only hand the file to Resolve
+once it passes.
+
+The readers stream: EDLs line by line, FCPXML and FCP7 XML with
+:func:`xml.etree.ElementTree.iterparse`, discarding each element once read, so a 50 MB
+FCPXML is read in bounded memory. OTIO files are JSON and are loaded whole. AAF is a
+binary format and is not read: :func:`import_timeline` and :func:`import_into_timeline`
+pass AAF, DRT and other files they cannot read straight to Resolve, with a warning.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.interchange import import_timeline, preflight
+...
+>>> report = preflight("/edit/reel1_v2.fcpxml", search_paths=["/Volumes/RAID/media"])
+>>> len(report.events), len(report.sources), report.missing
+(4873, 1129, ['/Volumes/CARD_A014/A014C003_220101_R1AB.mov'])
+>>> resolve = Resolve.resolve_init()
+>>> media_pool = resolve.GetProjectManager().GetCurrentProject().GetMediaPool()
+>>> timeline = import_timeline(media_pool, "/edit/reel1_v3.edl", fps=24)
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import re
+import time
+import warnings
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from typing import NamedTuple
+from urllib.parse import unquote, urlparse
+
+from dri.errors import MissingMediaError
+from dri.timecode import parse_fps, timecode_to_frames
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional, Union
+
+    from dri._types import ImportOption
+    from dri.media_pool import MediaPool
+    from dri.timeline import Timeline
+
+FORMATS = ("edl", "fcpxml", "xmeml", "otio")
+
+_EXTENSIONS = {
+    ".edl": "edl",
+    ".fcpxml": "fcpxml",
+    ".fcpxmld": "fcpxml",
+    ".otio": "otio",
+    ".aaf": "aaf",
+}
+
+
+class CDL(NamedTuple):
+    """
+    ASC CDL values of one color correction.
+
+    """
+
+    slope: tuple[float, float, float] = (1.0, 1.0, 1.0)
+    offset: tuple[float, float, float] = (0.0, 0.0, 0.0)
+    power: tuple[float, float, float] = (1.0, 1.0, 1.0)
+    saturation: float = 1.0
+    id: str = ""
+
+    @classmethod
+    def from_sop(
+        cls, sop: str, saturation: Union[str, float] = 1.0, id: str = ""
+    ) -> CDL:
+        """
+        Parses the ``ASC_SOP`` notation "(1 1 1)(0 0 0)(1 1 1)" of EDL comments and
+        ALE columns.
+
+        Raises
+        ------
+        ValueError
+            If `sop` does not hold three groups of three numbers.
+
+        """
+        groups = re.findall(r"\(([^)]*)\)", sop)
+        values = [tuple(float(value) for value in group.split()) for group in groups]
+        if len(values) != 3 or any(len(group) != 3 for group in values):
+            raise ValueError(f"Invalid ASC_SOP: {sop!r}")
+        return cls(*values, float(saturation), id)
+
+    def to_sop(self) -> str:
+        return "".join(
+            "(" + " ".join(f"{value:g}" for value in group) + ")"
+            for group in (self.slope, self.offset, self.power)
+        )
+
+
+class EditEvent(NamedTuple):
+    """
+    One clip of an edit.
+
+    Frames are counted at the edit's frame rate. Source frames are source timecode
+    frames for EDL and FCPXML and frames from the start of the media for FCP7 XML and
+    OTIO.
+
+    Attributes
+    ----------
+    number : int
+        1-based event number, the EDL event number when there is one.
+    track : str
+        Track, e.g. "V1" or "A2".
+    name : str
+        Clip name.
+    reel : str
+        Reel or tape name, "" if the format has none.
+    path : str
+        Source file path, "" if the file does not name one.
+    cdl : CDL or None
+        Color correction exported with the event, e.g. by EDL ``*ASC_SOP`` comments.
+
+    """
+
+    number: int
+    track: str
+    name: str
+    reel: str
+    path: str
+    source_in: int
+    source_out: int
+    record_in: int
+    record_out: int
+    cdl: Optional[CDL] = None
+
+
+def url_to_path(url: str) -> str:
+    """
+    Returns the local path of a ``file://`` URL, or `url` itself if it is a plain
+    path. Returns "" for other URL schemes.
+
+    """
+    if not url or "://" not in url:
+        return url or ""
+    parsed = urlparse(url)
+    if parsed.scheme != "file":
+        return ""
+    path = unquote(parsed.path)
+    if re.match(r"/[A-Za-z]:", path):
+        path = path[1:]
+    elif parsed.netloc and parsed.netloc != "localhost":
+        path = f"//{parsed.netloc}{path}"
+    return path
+
+
+def detect_format(path: Union[str, os.PathLike]) -> str:
+    """
+    Returns the format of an edit file, one of :data:`FORMATS` or "aaf". ".xml" files
+    are told apart by their root element.
+
+    Raises
+    ------
+    ValueError
+        If the format is not recognised.
+
+    """
+    path = os.fspath(path)
+    extension = os.path.splitext(path)[1].lower()
+    if extension in _EXTENSIONS:
+        return _EXTENSIONS[extension]
+    if extension == ".xml":
+        for _, element in ElementTree.iterparse(path, events=("start",)):
+            if element.tag in ("fcpxml", "xmeml"):
+                return element.tag
+            break
+    raise ValueError(f"Unrecognised edit file: {path}")
+
+
+_EDL_TIMECODE = r"(\d{1,2}[:;.]\d\d[:;.]\d\d[:;.,]\d\d)"
+_EDL_EVENT = re.compile(
+    r"^(\d+)\s+(\S+)\s+(\S+)\s+(C|D|W\d+|K[BO]?)\s+(?:\d+\s+)?"
+    + r"\s+".join([_EDL_TIMECODE] * 4)
+)
+_EDL_BLACK = ("BL", "BLACK")
+_EDL_COMMENTS = {
+    "FROM CLIP NAME": "name",
+    "SOURCE FILE": "path",
+}
+
+
+def _edl_track(channels: str) -> str:
+    channels = channels.upper()
+    if channels.startswith(("V", "B")):
+        return "V1"
+    number = channels.lstrip("A") or "1"
+    return f"A{number}" if number.isdigit() else "A1"
+
+
+def iter_edl(
+    path: Union[str, os.PathLike], fps: Union[float, str] = 24
+) -> Iterator[EditEvent]:
+    """
+    Yields the events of a CMX 3600 EDL, reading it line by line.
+
+    The clip name and source path come from the ``* FROM CLIP NAME:`` and
+    ``* SOURCE FILE:`` comments that follow an event, its CDL from ``*ASC_SOP`` and
+    ``*ASC_SAT`` comments. Black and other non-media reels
+    ("BL", "BLACK") are skipped.
+
+    Parameters
+    ----------
+    path
+        EDL file.
+    fps
+        Frame rate of the timecodes, which EDLs do not record.
+
+    """
+    fps = parse_fps(fps)
+    drop_frame: Optional[bool] = None
+    pending: Optional[dict] = None
+
+    with open(path, encoding="utf-8", errors="replace") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            match = _EDL_EVENT.match(line)
+            if match:
+                if pending is not None and pending["reel"].upper() not in _EDL_BLACK:
+                    yield EditEvent(**pending)
+                number, reel, channels, _, *timecodes = match.groups()
+                frames = [timecode_to_frames(tc, fps, drop_frame) for tc in timecodes]
+                pending = {
+                    "number": int(number),
+                    "track": _edl_track(channels),
+                    "name": "",
+                    "reel": reel,
+                    "path": "",
+                    "source_in": frames[0],
+                    "source_out": frames[1],
+                    "record_in": frames[2],
+                    "record_out": frames[3],
+                    "cdl": None,
+                }
+                saturation = "1"
+            elif line.upper().startswith("FCM:"):
+                drop_frame = "NON" not in line.upper()
+            elif line.upper().startswith(("*ASC_SOP", "* ASC_SOP")) and pending:
+                sop = line[line.upper().index("SOP") + 3 :]
+                with contextlib.suppress(ValueError):
+                    pending["cdl"] = CDL.from_sop(sop, saturation)
+            elif line.upper().startswith(("*ASC_SAT", "* ASC_SAT")) and pending:
+                saturation = line[line.upper().index("SAT") + 3 :].strip()
+                if pending["cdl"] is not None:
+                    with contextlib.suppress(ValueError):
+                        pending["cdl"] = pending["cdl"]._replace(
+                            saturation=float(saturation)
+                        )
+            elif line.startswith("*") and pending is not None:
+                key, separator, value = line.lstrip("* ").partition(":")
+                field = _EDL_COMMENTS.get(key.strip().upper())
+                if separator and field and not pending[field]:
+                    pending[field] = value.strip()
+    if pending is not None and pending["reel"].upper() not in _EDL_BLACK:
+        yield EditEvent(**pending)
+
+
+def _time(value: Optional[str]) -> tuple[int, int]:
+    # FCPXML time values ("0s", "10s", "1001/24000s") as (numerator, denominator).
+    # Kept as integer pairs, Fraction arithmetic dominates the parse time otherwise.
+    if not value:
+        return 0, 1
+    text = value.rstrip("s")
+    numerator, _, denominator = text.partition("/")
+    try:
+        return int(numerator), int(denominator or 1)
+    except ValueError:
+        exact = Fraction(text)
+        return exact.numerator, exact.denominator
+
+
+def _add(left: tuple[int, int], right: tuple[int, int], sign: int = 1):
+    if left[1] == right[1]:
+        return left[0] + sign * right[0], left[1]
+    return left[0] * right[1] + sign * right[0] * left[1], left[1] * right[1]
+
+
+def _to_frames(time: tuple[int, int], fps: tuple[int, int]) -> int:
+    # Rounds half up to the nearest frame.
+    numerator = time[0] * fps[0]
+    denominator = time[1] * fps[1]
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+# FCPXML elements with an offset and a start in their parent's time.
+_FCPXML_TIMED = frozenset(
+    {
+        "asset-clip",
+        "audio",
+        "audition",
+        "clip",
+        "gap",
+        "mc-clip",
+        "ref-clip",
+        "spine",
+        "sync-clip",
+        "title",
+        "transition",
+        "video",
+    }
+)
+
+
+def iter_fcpxml(path: Union[str, os.PathLike]) -> Iterator[EditEvent]:
+    """
+    Yields the media events of every sequence of an FCPXML file or ``.fcpxmld``
+    bundle: ``asset-clip`` elements and the ``video``/``audio`` elements of ``clip``.
+
+    Record frames include the sequence start timecode. Connected clips and secondary
+    storylines are placed on tracks above (V2, V3...) or below (A1, A2...) the primary
+    storyline according to their lane.
+
+    """
+    path = os.fspath(path)
+    if os.path.isdir(path):
+        path = os.path.join(path, "Info.fcpxml")
+    # Format id -> frames per second.
+    formats: dict[str, tuple[int, int]] = {}
+    # Asset id -> [name, path, has video].
+    assets: dict[str, list] = {}
+    asset: Optional[list] = None
+    fps = (24, 1)
+    # (record time of the local origin, local start, lane) of each timed ancestor.
+    stack: list[tuple[tuple[int, int], tuple[int, int], int]] = []
+    elements: list[ElementTree.Element] = []
+    number = 0
+    for event, element in ElementTree.iterparse(path, events=("start", "end")):
+        tag = element.tag
+        if event == "end":
+            if tag in _FCPXML_TIMED or tag == "sequence":
+                if stack:
+                    stack.pop()
+            elif tag == "asset":
+                asset = None
+            # Drop the element and its parent's reference to it.
+            elements.pop()
+            element.clear()
+            if elements:
+                elements[-1].remove(element)
+            continue
+
+        elements.append(element)
+        attributes = element.attrib
+        if tag == "format":
+            frame_duration = _time(attributes.get("frameDuration"))
+            if frame_duration[0]:
+                formats[attributes.get("id", "")] = frame_duration[::-1]
+        elif tag == "asset":
+            asset = assets[attributes.get("id", "")] = [
+                attributes.get("name", ""),
+                url_to_path(attributes.get("src", "")),
+                attributes.get("hasVideo", "1") != "0",
+            ]
+        elif tag == "media-rep" and asset is not None:
+            if attributes.get("kind", "original-media") == "original-media":
+                asset[1] = url_to_path(attributes.get("src", ""))
+        elif tag == "sequence":
+            fps = formats.get(attributes.get("format", ""), (24, 1))
+            stack.append(((0, 1), (0, 1), 0))
+        elif tag in _FCPXML_TIMED and stack:
+            origin, parent_start, parent_lane = stack[-1]
+            offset = attributes.get("offset")
+            record = origin
+            if offset:
+                record = _add(_add(origin, _time(offset)), parent_start, -1)
+            start = _time(attributes.get("start"))
+            lane = parent_lane + int(attributes.get("lane", 0))
+            stack.append((record, start, lane))
+            reference = assets.get(attributes.get("ref", ""))
+            if tag in ("asset-clip", "video", "audio") and reference is not None:
+                name, source_path, has_video = reference
+                duration = _time(attributes.get("duration"))
+                if tag == "audio" or not has_video or lane < 0:
+                    track = f"A{max(-lane, 1)}"
+                else:
+                    track = f"V{lane + 1}"
+                number += 1
+                yield EditEvent(
+                    number,
+                    track,
+                    attributes.get("name") or name,
+                    "",
+                    source_path,
+                    _to_frames(start, fps),
+                    _to_frames(_add(start, duration), fps),
+                    _to_frames(record, fps),
+                    _to_frames(_add(record, duration), fps),
+                )
+
+
+def _text(element: Optional[ElementTree.Element], tag: str, default: str = "") -> str:
+    if element is None:
+        return default
+    child = element.find(tag)
+    return default if child is None or child.text is None else child.text.strip()
+
+
+def iter_xmeml(path: Union[str, os.PathLike]) -> Iterator[EditEvent]:
+    """
+    Yields the ``clipitem`` elements of a Final Cut Pro 7 XML (xmeml) file.
+
+    Files are defined once and referenced by id afterwards; the path of the first
+    definition is used for every reference. Record frames include the sequence start
+    timecode when the sequence gives its ``timecode`` before its ``media``, as
+    Resolve's export does.
+
+    """
+    files: dict[str, tuple[str, str]] = {}
+    counts = {"video": 0, "audio": 0}
+    kind = "video"
+    number = 0
+    sequence_start = 0
+    parents: list[ElementTree.Element] = []
+    for event, element in ElementTree.iterparse(path, events=("start", "end")):
+        tag = element.tag
+        if event == "start":
+            parents.append(element)
+            if (
+                tag in counts
+                and len(parents) > 2
+                and parents[-2].tag == "media"
+                and parents[-3].tag == "sequence"
+            ):
+                kind = tag
+            elif tag == "track":
+                counts[kind] += 1
+            continue
+        parents.pop()
+        if tag == "timecode" and parents and parents[-1].tag == "sequence":
+            frame = _text(element, "frame")
+            sequence_start = int(frame) if frame.isdigit() else 0
+        if tag != "clipitem":
+            continue
+
+        file_element = element.find("file")
+        name = _text(element, "name")
+        source_path = reel = ""
+        if file_element is not None:
+            file_id = file_element.get("id", "")
+            pathurl = _text(file_element, "pathurl")
+            if pathurl:
+                reel = _text(file_element.find("timecode"), "reel/name")
+                files[file_id] = (url_to_path(pathurl), reel)
+            source_path, reel = files.get(file_id, ("", ""))
+            name = name or _text(file_element, "name")
+        source_in = int(_text(element, "in", "0"))
+        source_out = int(_text(element, "out", "0"))
+        record_in = int(_text(element, "start", "-1"))
+        record_out = int(_text(element, "end", "-1"))
+        # -1 marks an edge covered by a transition.
+        if record_in < 0:
+            record_in = record_out - (source_out - source_in)
+        if record_out < 0:
+            record_out = record_in + (source_out - source_in)
+        record_in += sequence_start
+        record_out += sequence_start
+        number += 1
+        yield EditEvent(
+            number,
+            f"{kind[0].upper()}{counts[kind]}",
+            name,
+            reel,
+            source_path,
+            source_in,
+            source_out,
+            record_in,
+            record_out,
+        )
+        element.clear()
+        if parents:
+            parents[-1].remove(element)
+
+
+def _otio_frames(time: Optional[dict], rate: float) -> int:
+    if not time:
+        return 0
+    return round(time.get("value", 0) * rate / (time.get("rate") or rate))
+
+
+def _otio_reference(clip: dict) -> dict:
+    references = clip.get("media_references")
+    if references:
+        key = clip.get("active_media_reference_key", "DEFAULT_MEDIA")
+        return references.get(key) or {}
+    return clip.get("media_reference") or {}
+
+
+def iter_otio(
+    path: Union[str, os.PathLike], fps: Optional[float] = None
+) -> Iterator[EditEvent]:
+    """
+    Yields the clips of an OpenTimelineIO ``.otio`` file.
+
+    Parameters
+    ----------
+    path
+        OTIO file.
+    fps
+        Frame rate to count frames at. Defaults to the rate of the timeline's global
+        start time, or 24.
+
+    """
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if not data.get("OTIO_SCHEMA", "").startswith("Timeline"):
+        raise ValueError(f"Not an OTIO timeline: {path}")
+    global_start = data.get("global_start_time") or {}
+    rate = float(fps or global_start.get("rate") or 24)
+    offset = _otio_frames(global_start, rate)
+    counts = {"V": 0, "A": 0}
+    number = 0
+    for track in (data.get("tracks") or {}).get("children", []):
+        if not track.get("OTIO_SCHEMA", "").startswith("Track"):
+            continue
+        kind = "A" if track.get("kind") == "Audio" else "V"
+        counts[kind] += 1
+        position = offset
+        for child in track.get("children", []):
+            schema = child.get("OTIO_SCHEMA", "").split(".")[0]
+            if schema == "Transition":
+                continue
+            reference = _otio_reference(child)
+            source_range = child.get("source_range") or reference.get("available_range")
+            if not source_range:
+                continue
+            source_in = _otio_frames(source_range.get("start_time"), rate)
+            duration = _otio_frames(source_range.get("duration"), rate)
+            if schema == "Clip":
+                number += 1
+                yield EditEvent(
+                    number,
+                    f"{kind}{counts[kind]}",
+                    child.get("name") or "",
+                    "",
+                    url_to_path(reference.get("target_url", "")),
+                    source_in,
+                    source_in + duration,
+                    position,
+                    position + duration,
+                )
+            position += duration
+
+
+def iter_events(
+    path: Union[str, os.PathLike],
+    fps: Optional[Union[float, str]] = None,
+    file_format: Optional[str] = None,
+) -> Iterator[EditEvent]:
+    """
+    Yields the events of an edit file of any of the :data:`FORMATS`.
+
+    Parameters
+    ----------
+    path
+        Edit file.
+    fps
+        Frame rate of an EDL (default 24) or to count OTIO frames at. FCPXML and FCP7
+        XML files carry their own.
+    file_format
+        One of :data:`FORMATS`. Detected from the file if not given.
+
+    Raises
+    ------
+    ValueError
+        If the format is not supported.
+
+    """
+    file_format = file_format or detect_format(path)
+    if file_format == "edl":
+        return iter_edl(path, fps or 24)
+    if file_format == "fcpxml":
+        return iter_fcpxml(path)
+    if file_format == "xmeml":
+        return iter_xmeml(path)
+    if file_format == "otio":
+        return iter_otio(path, float(parse_fps(fps)) if fps else None)
+    raise ValueError(f"Unsupported edit file format: {file_format}")
+
+
+class PreflightReport:
+    """
+    Outcome of :func:`preflight`.
+
+    Attributes
+    ----------
+    path : str
+        Edit file.
+    format : str
+        One of :data:`FORMATS`, or the detected format or extension of a file that was
+        not checked.
+    checked : bool
+        False if the file could not be read, e.g. AAF or DRT, and nothing was checked.
+    events : list[EditEvent]
+        Events of the file.
+    sources : dict[str, str]
+        Resolved file of every source, keyed by the path named in the file or, for
+        sources without one, by the clip name.
+    missing : list[str]
+        Source paths that do not exist and were not found under the search paths.
+    unresolved : list[str]
+        Clip names of sources without a path that were not found under the search
+        paths.
+    relinked : dict[str, str]
+        Missing source paths found under the search paths, mapped to where.
+    seconds : float
+        Time taken.
+
+    """
+
+    __slots__ = (
+        "checked",
+        "events",
+        "format",
+        "missing",
+        "path",
+        "relinked",
+        "seconds",
+        "sources",
+        "unresolved",
+    )
+
+    def __init__(self, path: str, file_format: str):
+        self.path = path
+        self.format = file_format
+        self.checked = True
+        self.events: list[EditEvent] = []
+        self.sources: dict[str, str] = {}
+        self.missing: list[str] = []
+        self.unresolved: list[str] = []
+        self.relinked: dict[str, str] = {}
+        self.seconds = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """
+        True if every source with a path exists, relinked or not.
+
+        """
+        return not self.missing
+
+    def __repr__(self) -> str:
+        if not self.checked:
+            return f"<PreflightReport {self.format} not checked>"
+        return (
+            f"<PreflightReport {self.format} {len(self.events)} events, "
+            f"{len(self.sources)} sources, {len(self.missing)} missing>"
+        )
+
+
+class _FileIndex:
+    # Basename index of the files under some folders, walked on first lookup.
+
+    def __init__(self, roots: Iterable[str]):
+        self.roots = [os.fspath(root) for root in roots]
+        self._index: Optional[dict[str, str]] = None
+
+    def find(self, name: str) -> Optional[str]:
+        if not self.roots or not name:
+            return None
+        if self._index is None:
+            self._index = {}
+            for root in self.roots:
+                for folder, _, file_names in os.walk(root):
+                    for file_name in file_names:
+                        self._index.setdefault(
+                            file_name.lower(), os.path.join(folder, file_name)
+                        )
+        return self._index.get(os.path.basename(name).lower())
+
+
+def preflight(
+    path: Union[str, os.PathLike],
+    fps: Optional[Union[float, str]] = None,
+    search_paths: Iterable[Union[str, os.PathLike]] = (),
+    workers: int = 8,
+) -> PreflightReport:
+    """
+    Reads an edit file and checks that its media exists.
+
+    Every distinct source path is checked once, with ``os.path.exists`` calls spread
+    over a thread pool to hide the latency of network volumes. Sources that are missing
+    or have no path (EDLs without ``* SOURCE FILE:`` comments) are looked up by file
+    name under `search_paths`.
+
+    Parameters
+    ----------
+    path
+        Edit file, any of :data:`FORMATS`.
+    fps
+        Frame rate of an EDL, see :func:`iter_events`.
+    search_paths
+        Folders to look for missing or unnamed sources in, e.g. the
+        ``sourceClipsPath`` of the import.
+    workers
+        Number of threads checking paths.
+
+    Returns
+    -------
+    PreflightReport
+        Events, resolved sources and missing media.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported.
+
+    """
+    started = time.perf_counter()
+    path = os.fspath(path)
+    file_format = detect_format(path)
+    report = PreflightReport(path, file_format)
+    report.events = list(iter_events(path, fps, file_format))
+
+    paths = list(dict.fromkeys(event.path for event in report.events if event.path))
+    names = list(dict.fromkeys(event.name for event in report.events if not event.path))
+    if paths:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            exists = list(executor.map(os.path.exists, paths))
+    else:
+        exists = []
+
+    index = _FileIndex(search_paths)
+    for source_path, found in zip(paths, exists):
+        if found:
+            report.sources[source_path] = source_path
+            continue
+        relinked = index.find(source_path)
+        if relinked is None:
+            report.missing.append(source_path)
+        else:
+            report.sources[source_path] = report.relinked[source_path] = relinked
+    for name in names:
+        found_path = index.find(name)
+        if found_path is None:
+            report.unresolved.append(name)
+        else:
+            report.sources[name] = found_path
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def _checked(
+    path: Union[str, os.PathLike],
+    import_options: Optional[Union[ImportOption, dict]],
+    fps: Optional[Union[float, str]],
+    search_paths: Iterable[Union[str, os.PathLike]],
+) -> PreflightReport:
+    path = os.fspath(path)
+    try:
+        file_format = detect_format(path)
+    except ValueError:
+        file_format = os.path.splitext(path)[1].lstrip(".").lower()
+    report = None
+    if file_format in FORMATS:
+        search_paths = list(search_paths)
+        options = import_options if isinstance(import_options, dict) else {}
+        if options.get("sourceClipsPath"):
+            search_paths.append(options["sourceClipsPath"])
+        try:
+            report = preflight(path, fps, search_paths)
+        except (ElementTree.ParseError, ValueError):
+            # Truncated or malformed, e.g. still being written. Resolve has the final
+            # say on whether it imports.
+            pass
+    if report is None:
+        report = PreflightReport(path, file_format)
+        report.checked = False
+        warnings.warn(
+            f"Cannot read {path} to check its media, importing it unchecked",
+            stacklevel=3,
+        )
+        return report
+    if not report.ok:
+        raise MissingMediaError(
+            f"{len(report.missing)} source file(s) of {report.path} not found, "
+            f"first: {report.missing[0]}",
+            report,
+        )
+    return report
+
+
+def import_timeline(
+    media_pool: MediaPool,
+    path: Union[str, os.PathLike],
+    import_options: Optional[Union[ImportOption, dict]] = None,
+    fps: Optional[Union[float, str]] = None,
+    search_paths: Iterable[Union[str, os.PathLike]] = (),
+) -> Optional[Timeline]:
+    """
+    Runs :func:`preflight` on `path`, then imports it with
+    ``MediaPool.ImportTimelineFromFile``.
+
+    The ``sourceClipsPath`` import option, if set, is added to `search_paths`. Files
+    :func:`preflight` cannot read, e.g. AAF, DRT, an unrecognised ".xml" or a truncated
+    file, are imported without checking and a :class:`UserWarning` is issued.
+
+    Returns
+    -------
+    Timeline or None
+        The imported timeline, or None if Resolve failed to import it.
+
+    Raises
+    ------
+    MissingMediaError
+        If source media is missing. The :class:`PreflightReport` is its `report`.
+
+    """
+    _checked(path, import_options, fps, search_paths)
+    if import_options is None:
+        return media_pool.ImportTimelineFromFile(os.fspath(path))
+    return media_pool.ImportTimelineFromFile(os.fspath(path), import_options)
+
+
+def import_into_timeline(
+    timeline: Timeline,
+    path: Union[str, os.PathLike],
+    import_options: Optional[dict] = None,
+    fps: Optional[Union[float, str]] = None,
+    search_paths: Iterable[Union[str, os.PathLike]] = (),
+) -> bool:
+    """
+    Runs :func:`preflight` on `path`, then imports it with
+    ``Timeline.ImportIntoTimeline``.
+
+    Files :func:`preflight` cannot read, e.g. AAF, are imported without checking and a
+    :class:`UserWarning` is issued.
+
+    Raises
+    ------
+    MissingMediaError
+        If source media is missing. The :class:`PreflightReport` is its `report`.
+
+    """
+    _checked(path, import_options, fps, search_paths)
+    if import_options is None:
+        return timeline.ImportIntoTimeline(os.fspath(path))
+    return timeline.ImportIntoTimeline(os.fspath(path), import_options)
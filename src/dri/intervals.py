@@ -0,0 +1,397 @@
+"""
+Interval index over timeline item ranges.
+
+:class:`IntervalTree` is a treap keyed by start frame and augmented with the maximum end
+frame of each subtree, which gives O(log n) expected inserts and removals and
+O(log n + k) stabbing and overlap queries for k results. :class:`TimelineIndex` keeps
+one tree per track type, built from ``TimelineItem.GetStart()``/``GetEnd()``, and can
+be updated in place after ``Timeline.DeleteClips`` or ``MediaPool.AppendToTimeline``.
+
+Ranges are half-open: an item covers ``start <= frame < end``, matching
+``TimelineItem.GetEnd()`` which returns the first frame after the item.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.intervals import TimelineIndex
+...
+>>> resolve = Resolve.resolve_init()
+>>> project = resolve.GetProjectManager().GetCurrentProject()
+>>> timeline = project.GetCurrentTimeline()
+>>> index = TimelineIndex.from_timeline(timeline)
+>>> [entry.track_index for entry in index.at(86400)]
+[1, 2]
+>>> items = project.GetMediaPool().AppendToTimeline(clips)
+>>> index.add_items(items)
+
+"""
+
+from __future__ import annotations
+
+import random
+from typing import NamedTuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
+
+    from dri.snapshot import TimelineSnapshot
+    from dri.timeline import Timeline
+    from dri.timeline_item import TimelineItem
+
+TRACK_TYPES = ("video", "audio", "subtitle")
+
+
+class _Node:
+    __slots__ = ("end", "left", "max_end", "priority", "right", "seq", "start", "value")
+
+    def __init__(self, start: int, end: int, seq: int, value, priority: float):
+        self.start = start
+        self.end = end
+        self.seq = seq
+        self.value = value
+        self.priority = priority
+        self.left: Optional[_Node] = None
+        self.right: Optional[_Node] = None
+        self.max_end = end
+
+    def update(self) -> None:
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+def _split(node: Optional[_Node], key: tuple[int, int]):
+    # Splits into nodes with (start, seq) < key and nodes with (start, seq) >= key.
+    if node is None:
+        return None, None
+    if (node.start, node.seq) < key:
+        node.right, right = _split(node.right, key)
+        node.update()
+        return node, right
+    left, node.left = _split(node.left, key)
+    node.update()
+    return left, node
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.update()
+        return left
+    right.left = _merge(left, right.left)
+    right.update()
+    return right
+
+
+class IntervalTree:
+    """
+    Set of half-open ``[start, end)`` intervals, each carrying a value.
+
+    Parameters
+    ----------
+    seed
+        Seed of the treap priorities, for reproducible tree shapes.
+
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        self._root: Optional[_Node] = None
+        self._size = 0
+        self._seq = 0
+        self._random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[int, int, Any]]:
+        """
+        Yields (start, end, value) ordered by start.
+
+        """
+        stack: list[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.start, node.end, node.value
+            node = node.right
+
+    def add(self, start: int, end: int, value: Any = None) -> tuple[int, int]:
+        """
+        Inserts an interval and returns its handle for :meth:`remove`.
+
+        Raises
+        ------
+        ValueError
+            If `end` is smaller than `start`.
+
+        """
+        if end < start:
+            raise ValueError(f"Interval end {end} is before its start {start}")
+        self._seq += 1
+        node = _Node(start, end, self._seq, value, self._random.random())
+        left, right = _split(self._root, (start, self._seq))
+        self._root = _merge(_merge(left, node), right)
+        self._size += 1
+        return start, self._seq
+
+    def remove(self, handle: tuple[int, int]) -> Any:
+        """
+        Removes the interval returned by :meth:`add` and returns its value.
+
+        Raises
+        ------
+        KeyError
+            If the interval is not in the tree.
+
+        """
+        start, seq = handle
+        left, rest = _split(self._root, (start, seq))
+        node, right = _split(rest, (start, seq + 1))
+        if node is None:
+            self._root = _merge(left, right)
+            raise KeyError(handle)
+        self._root = _merge(left, right)
+        self._size -= 1
+        return node.value
+
+    def stab(self, point: int) -> list[Any]:
+        """
+        Returns the values of the intervals containing `point`, ordered by start.
+
+        """
+        return self.overlap(point, point + 1)
+
+    def overlap(self, start: int, end: int) -> list[Any]:
+        """
+        Returns the values of the intervals overlapping ``[start, end)``, ordered by
+        start.
+
+        """
+        found: list[Any] = []
+        stack: list[tuple[_Node, bool]] = []
+        if self._root is not None:
+            stack.append((self._root, False))
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                if node.start < end and node.end > start:
+                    found.append(node.value)
+                continue
+            if node.max_end <= start:
+                continue
+            # Right subtree starts at or after node.start, skip it past the query end.
+            if node.right is not None and node.start < end:
+                stack.append((node.right, False))
+            stack.append((node, True))
+            if node.left is not None:
+                stack.append((node.left, False))
+        return found
+
+
+class IndexEntry(NamedTuple):
+    """
+    One timeline item in a :class:`TimelineIndex`.
+
+    """
+
+    start: int
+    end: int
+    track_type: str
+    track_index: int
+    item: Any
+
+
+def _identity(item):
+    return item
+
+
+class TimelineIndex:
+    """
+    Interval index of timeline items, one :class:`IntervalTree` per track type.
+
+    Parameters
+    ----------
+    key
+        Function mapping a timeline item to the hashable key used by :meth:`discard`.
+        Defaults to the item itself; pass e.g. ``lambda item: item.GetUniqueId()`` when
+        the items passed to :meth:`discard` are not the objects that were indexed.
+
+    Notes
+    -----
+    A ripple delete moves every later item on the track, so rebuild the index with
+    :meth:`from_timeline` after ``DeleteClips(items, True)`` rather than calling
+    :meth:`discard`.
+
+    """
+
+    def __init__(self, key: Callable[[Any], Hashable] = _identity):
+        self._key = key
+        self._trees = {track_type: IntervalTree() for track_type in TRACK_TYPES}
+        self._handles: dict[Hashable, tuple[str, tuple[int, int]]] = {}
+
+    @classmethod
+    def from_timeline(
+        cls,
+        timeline: Timeline,
+        track_types: Iterable[str] = TRACK_TYPES,
+        key: Callable[[Any], Hashable] = _identity,
+    ) -> TimelineIndex:
+        """
+        Builds an index from every item of the given track types.
+
+        """
+        index = cls(key)
+        for track_type in track_types:
+            for track_index in range(1, timeline.GetTrackCount(track_type) + 1):
+                for item in timeline.GetItemListInTrack(track_type, track_index) or []:
+                    index.add(item, track_type, track_index)
+        return index
+
+    @classmethod
+    def from_snapshot(
+        cls,
+        snap: TimelineSnapshot,
+        key: Callable[[Any], Hashable] = _identity,
+    ) -> TimelineIndex:
+        """
+        Builds an index from a :class:`~dri.snapshot.TimelineSnapshot` without calling
+        Resolve.
+
+        """
+        index = cls(key)
+        for record in snap:
+            index.add(
+                record.item,
+                record.track_type,
+                record.track_index,
+                record.start,
+                record.end,
+            )
+        return index
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, item) -> bool:
+        return self._key(item) in self._handles
+
+    def add(
+        self,
+        item: TimelineItem,
+        track_type: str,
+        track_index: int,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> IndexEntry:
+        """
+        Indexes one timeline item, calling ``GetStart``/``GetEnd`` unless `start` and
+        `end` are given.
+
+        Raises
+        ------
+        ValueError
+            If `track_type` is not "video", "audio" or "subtitle", or the item is
+            already indexed.
+
+        """
+        tree = self._trees.get(track_type)
+        if tree is None:
+            raise ValueError(f"Unknown track type: {track_type!r}")
+        key = self._key(item)
+        if key in self._handles:
+            raise ValueError(f"Item already indexed: {item!r}")
+        if start is None:
+            start = item.GetStart()
+        if end is None:
+            end = item.GetEnd()
+        entry = IndexEntry(start, end, track_type, track_index, item)
+        self._handles[key] = (track_type, tree.add(start, end, entry))
+        return entry
+
+    def add_items(self, items: Iterable[TimelineItem]) -> list[IndexEntry]:
+        """
+        Indexes items whose track is not known, e.g. those returned by
+        ``MediaPool.AppendToTimeline``, using ``TimelineItem.GetTrackTypeAndIndex``.
+
+        """
+        entries = []
+        for item in items:
+            track_type, track_index = item.GetTrackTypeAndIndex()
+            entries.append(self.add(item, track_type, track_index))
+        return entries
+
+    def discard(self, item) -> Optional[IndexEntry]:
+        """
+        Removes an item, e.g. after ``Timeline.DeleteClips``. Returns its entry, or
+        None if it was not indexed.
+
+        """
+        found = self._handles.pop(self._key(item), None)
+        if found is None:
+            return None
+        track_type, handle = found
+        return self._trees[track_type].remove(handle)
+
+    def discard_items(self, items: Iterable) -> None:
+        for item in items:
+            self.discard(item)
+
+    def at(
+        self,
+        frame: int,
+        track_type: str = "video",
+        track_index: Optional[int] = None,
+    ) -> list[IndexEntry]:
+        """
+        Returns the items under `frame`, ordered by track index.
+
+        Parameters
+        ----------
+        frame
+            Timeline frame.
+        track_type
+            "video", "audio" or "subtitle".
+        track_index
+            Restrict the result to one track.
+
+        """
+        entries = self._trees[track_type].stab(frame)
+        if track_index is not None:
+            return [entry for entry in entries if entry.track_index == track_index]
+        entries.sort(key=lambda entry: entry.track_index)
+        return entries
+
+    def overlapping(
+        self,
+        start: int,
+        end: int,
+        track_type: str = "video",
+        track_index: Optional[int] = None,
+    ) -> list[IndexEntry]:
+        """
+        Returns the items overlapping ``[start, end)``, ordered by start frame.
+
+        """
+        entries = self._trees[track_type].overlap(start, end)
+        if track_index is not None:
+            return [entry for entry in entries if entry.track_index == track_index]
+        return entries
+
+    def entries(self, track_type: str = "video") -> Iterator[IndexEntry]:
+        """
+        Yields the entries of a track type, ordered by start frame.
+
+        """
+        for _, _, entry in self._trees[track_type]:
+            yield entry
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import builtins
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+
+from dri.errors import (
+    FusionScriptLoadError,
+    FusionScriptNotFoundError,
+    UnsupportedPlatformError,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from types import ModuleType
+    from typing import Optional
+
+
+FUSIONSCRIPT_PATHS = {
+    "win32": "C:\\Program Files\\Blackmagic Design\\DaVinci Resolve\\fusionscript.dll",
+    "darwin": "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/Libraries/Fusion/fusionscript.so",
+    "linux": "/opt/resolve/libs/Fusion/fusionscript.so",
+}
+
+_loaded_libs: dict[str, ModuleType] = {}
+_load_lock = threading.Lock()
+
+
+def fusionscript_path() -> str:
+    """
+    Returns the path fusionscript is loaded from: ``RESOLVE_SCRIPT_LIB`` if set,
+    otherwise the default install location for the current platform.
+
+    Raises
+    ------
+    UnsupportedPlatformError
+        If ``RESOLVE_SCRIPT_LIB`` is unset and the platform is not Windows, macOS or
+        Linux.
+
+    """
+    path = os.environ.get("RESOLVE_SCRIPT_LIB")
+    if path:
+        return path
+    try:
+        return FUSIONSCRIPT_PATHS[sys.platform]
+    except KeyError:
+        raise UnsupportedPlatformError(
+            f"Unsupported platform: {sys.platform!r}. "
+            "Set RESOLVE_SCRIPT_LIB to the path of fusionscript."
+        ) from None
+
+
+def _imported_scripting_module() -> Optional[ModuleType]:
+    # Inside Resolve's console `bmd` is injected into the namespace; external scripts
+    # may already have imported DaVinciResolveScript or fusionscript themselves.
+    for name in ("fusionscript", "DaVinciResolveScript"):
+        module = sys.modules.get(name)
+        if getattr(module, "scriptapp", None) is not None:
+            return module
+    for namespace in (sys.modules.get("__main__"), builtins):
+        module = getattr(namespace, "bmd", None)
+        if getattr(module, "scriptapp", None) is not None:
+            return module
+    return None
+
+
+def load_dynamic_lib(path: Optional[str] = None) -> ModuleType:
+    """
+    Loads the fusionscript library once per process and returns the cached module on
+    subsequent calls.
+
+    If `path` is not given, an already imported ``fusionscript``,
+    ``DaVinciResolveScript`` or ``bmd`` module is reused when available, otherwise the
+    library is loaded from :func:`fusionscript_path`. Setting ``DRI_BACKEND=fake``
+    returns the in-memory :mod:`dri.fake` backend instead.
+
+    Parameters
+    ----------
+    path
+        Explicit path of the fusionscript library.
+
+    Returns
+    -------
+    ModuleType
+        Module exposing ``scriptapp``.
+
+    Raises
+    ------
+    FusionScriptNotFoundError
+        If no file exists at the path.
+    FusionScriptLoadError
+        If the library fails to load.
+    UnsupportedPlatformError
+        If no path is given and the platform has no default location.
+
+    """
+    if path is None:
+        if os.environ.get("DRI_BACKEND", "").lower() == "fake":
+            # In-memory backend for running scripts without DaVinci Resolve.
+            return importlib.import_module("dri.fake")
+        module = _imported_scripting_module()
+        if module is not None:
+            return module
+        path = fusionscript_path()
+
+    module = _loaded_libs.get(path)
+    if module is not None:
+        return module
+
+    with _load_lock:
+        module = _loaded_libs.get(path)
+        if module is not None:
+            return module
+
+        if not os.path.isfile(path):
+            raise FusionScriptNotFoundError(f"fusionscript not found at {path}")
+        spec = importlib.util.spec_from_file_location("fusionscript", path)
+        if spec is None or spec.loader is None:
+            raise FusionScriptLoadError(f"Cannot create a module spec for {path}")
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+        except Exception as e:
+            raise FusionScriptLoadError(f"Failed to load {path}: {e}") from e
+
+        sys.modules.setdefault("fusionscript", module)
+        _loaded_libs[path] = module
+
+    return module
+
+
+def clear_dynamic_lib_cache() -> None:
+    """
+    Forgets the loaded fusionscript modules, so that the next
+    :func:`load_dynamic_lib` call loads the library again.
+
+    """
+    with _load_lock:
+        for module in _loaded_libs.values():
+            if sys.modules.get("fusionscript") is module:
+                del sys.modules["fusionscript"]
+        _loaded_libs.clear()
@@ -0,0 +1,544 @@
+"""
+LUT parsing, application and composition.
+
+``TimelineItem.ExportLUT`` writes 17, 33 or 65-point ``.cube`` files, or Panasonic
+``.vlt`` files, and ``Graph.SetLUT`` applies LUT files to nodes. :func:`read_lut` parses
+both formats into a :class:`Lut` holding a contiguous float32 table, and
+:meth:`Lut.apply` applies it to an image with NumPy, using tetrahedral or trilinear
+interpolation over chunks of pixels: a 65-point LUT applies to a 4K frame in about a
+second on one core, and chunks can be spread over threads. :func:`compose` bakes a chain
+of LUTs into one, which :meth:`Lut.write_cube` writes for ``Graph.SetLUT``.
+
+:func:`load_lut` caches parsed LUTs by path, modification time and size, so previews
+that reload the same LUT do not parse it again.
+
+NumPy is required by everything but :func:`export_lut`'s ``ExportLUT`` call.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.lut import compose, export_lut, load_lut
+...
+>>> resolve = Resolve.resolve_init()
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> item = timeline.GetItemListInTrack("video", 1)[0]
+>>> grade = export_lut(item, Resolve.EXPORT_LUT_65PTCUBE)
+>>> grade
+<Lut 3D 65 'A001C003_220101_R1AB.mov'>
+>>> preview = grade.apply(frame)  # (2160, 3840, 3) uint8 in, uint8 out
+>>> show_lut = compose([grade, load_lut("/luts/show_rec709.cube")])
+>>> show_lut.write_cube("/luts/baked/A001C003.cube")
+>>> item.GetNodeGraph().SetLUT(1, "/luts/baked/A001C003.cube")
+True
+
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import re
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from dri.resolve import Resolve
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Optional, Union
+
+    from dri.timeline_item import TimelineItem
+
+INTERPOLATIONS = ("tetrahedral", "trilinear")
+
+# Number of parsed LUTs kept by load_lut.
+CACHE_SIZE = 16
+
+# Pixels interpolated per step of Lut.apply: large enough to amortize NumPy call
+# overhead, small enough for the temporaries to stay in cache.
+_CHUNK = 1 << 16
+
+# First data line of a LUT file: keyword lines start with a letter, comments with "#".
+_DATA_START = re.compile(r"^[ \t]*[-+.\d]", re.MULTILINE)
+
+_cache: OrderedDict[str, tuple[tuple[int, int], Lut]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _numpy():
+    return importlib.import_module("numpy")
+
+
+class Lut:
+    """
+    A 1D or 3D LUT.
+
+    Attributes
+    ----------
+    table
+        Read-only, C-contiguous float32 array. ``(size, size, size, 3)`` for a 3D LUT,
+        indexed ``[blue, green, red]`` as in the file, red varying fastest; ``(size,
+        3)`` for a 1D LUT.
+    domain_min, domain_max : tuple[float, float, float]
+        Input values mapped to the first and last table entries.
+    title : str
+        ``TITLE`` of the file.
+    path : str
+        File the LUT was read from, "" if built in memory.
+
+    """
+
+    __slots__ = ("_planar", "domain_max", "domain_min", "path", "table", "title")
+
+    def __init__(
+        self,
+        table,
+        domain_min: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        domain_max: tuple[float, float, float] = (1.0, 1.0, 1.0),
+        title: str = "",
+        path: str = "",
+    ):
+        np = _numpy()
+        table = np.ascontiguousarray(table, dtype=np.float32)
+        size = table.shape[0]
+        if table.shape not in ((size, 3), (size, size, size, 3)) or size < 2:
+            raise ValueError(f"Invalid LUT table shape {table.shape}")
+        table.flags.writeable = False
+        self.table = table
+        self.domain_min = tuple(float(value) for value in domain_min)
+        self.domain_max = tuple(float(value) for value in domain_max)
+        self.title = title
+        self.path = path
+        self._planar = None
+
+    def __repr__(self) -> str:
+        name = self.title or os.path.basename(self.path)
+        return f"<Lut {self.dimensions}D {self.size} {name!r}>"
+
+    @property
+    def size(self) -> int:
+        return self.table.shape[0]
+
+    @property
+    def dimensions(self) -> int:
+        return 1 if self.table.ndim == 2 else 3
+
+    @classmethod
+    def identity(cls, size: int = 33, dimensions: int = 3) -> Lut:
+        """
+        Returns a LUT that maps every input to itself.
+
+        """
+        np = _numpy()
+        ramp = np.linspace(0.0, 1.0, size, dtype=np.float32)
+        if dimensions == 1:
+            return cls(np.repeat(ramp[:, None], 3, axis=1), title="identity")
+        blue, green, red = np.meshgrid(ramp, ramp, ramp, indexing="ij")
+        return cls(np.stack([red, green, blue], axis=-1), title="identity")
+
+    def apply(
+        self, image, interpolation: str = "tetrahedral", out=None, workers: int = 1
+    ):
+        """
+        Applies the LUT to an image.
+
+        Parameters
+        ----------
+        image
+            Array of shape ``(..., channels)`` with at least three channels, RGB first.
+            Integer images are normalized by the maximum of their type; extra channels
+            such as alpha are copied unchanged.
+        interpolation
+            "tetrahedral", as Resolve does, or "trilinear". Ignored by 1D LUTs.
+        out
+            Optional C-contiguous output array of the image's shape.
+        workers
+            Number of threads processing chunks of pixels. NumPy releases the GIL
+            during the lookups, so threads scale with cores.
+
+        Returns
+        -------
+        numpy.ndarray
+            The result, with the image's shape and type. Integer results are rounded and
+            clipped to their type.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+        ValueError
+            If the image has fewer than three channels, `interpolation` is unknown or
+            `out` does not fit.
+
+        """
+        np = _numpy()
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Unknown interpolation {interpolation!r}")
+        image = np.asarray(image)
+        if image.ndim < 1 or image.shape[-1] < 3:
+            raise ValueError(f"Expected (..., 3) pixels, got shape {image.shape}")
+        if out is None:
+            out = np.empty_like(image)
+        elif out.shape != image.shape or not out.flags.c_contiguous:
+            raise ValueError("`out` must be C-contiguous and shaped like the image")
+        pixels = image.reshape(-1, image.shape[-1])
+        result = out.reshape(-1, out.shape[-1])
+        integer = image.dtype.kind in "ui"
+        maximum = float(np.iinfo(image.dtype).max) if integer else 1.0
+
+        low = np.asarray(self.domain_min, dtype=np.float32)
+        high = np.asarray(self.domain_max, dtype=np.float32)
+        scale = (self.size - 1) / (high - low)
+        if integer:
+            # Fold the normalization into the scale and offset of the lookup.
+            low = low * maximum
+            scale = scale / maximum
+        if self.dimensions == 1:
+            interpolate = self._interpolate_1d
+        elif interpolation == "tetrahedral":
+            interpolate = self._interpolate_tetrahedral
+        else:
+            interpolate = self._interpolate_trilinear
+
+        planes = self._planes()
+
+        def process(start: int) -> None:
+            chunk = pixels[start : start + _CHUNK]
+            # One contiguous row per channel keeps every operation below on
+            # contiguous float32 arrays.
+            position = np.array(chunk[:, :3].T, dtype=np.float32, order="C")
+            position -= low[:, None]
+            position *= scale[:, None]
+            np.clip(position, 0, self.size - 1, out=position)
+            values = interpolate(np, planes, position)
+            if integer:
+                values *= maximum
+                values += 0.5
+                np.clip(values, 0, maximum, out=values)
+            target = result[start : start + _CHUNK]
+            target[:, :3] = values.T
+            if chunk.shape[1] > 3:
+                target[:, 3:] = chunk[:, 3:]
+
+        starts = range(0, len(pixels), _CHUNK)
+        if workers > 1 and len(starts) > 1:
+            with ThreadPoolExecutor(workers) as executor:
+                list(executor.map(process, starts))
+        else:
+            for start in starts:
+                process(start)
+        return out
+
+    def _planes(self):
+        # The table as one contiguous row of samples per output channel, so lookups
+        # gather from 1D arrays.
+        if self._planar is None:
+            self._planar = _numpy().ascontiguousarray(self.table.reshape(-1, 3).T)
+        return self._planar
+
+    def _interpolate_1d(self, np, planes, position):
+        ramp = np.arange(self.size, dtype=np.float32)
+        values = np.empty_like(position)
+        for channel, plane in enumerate(planes):
+            values[channel] = np.interp(position[channel], ramp, plane)
+        return values
+
+    def _corners(self, np, position):
+        # Index of the lower corner of each pixel's cell in the flattened table, and
+        # the pixel's fractional position in the cell.
+        size = self.size
+        base = position.astype(np.intp)
+        np.minimum(base, size - 2, out=base)
+        fraction = position - base.astype(np.float32)
+        index = base[2] * (size * size)
+        index += base[1] * size
+        index += base[0]
+        return index, fraction
+
+    def _interpolate_tetrahedral(self, np, planes, position):
+        size = self.size
+        area = size * size
+        index, fraction = self._corners(np, position)
+        red, green, blue = fraction
+        # The cell splits into six tetrahedra along its diagonal; each pixel walks from
+        # the lower corner along its largest, middle and smallest fraction to the upper
+        # corner. Ties break red, green, blue for the largest fraction and blue, green,
+        # red for the smallest, so the two never name the same axis.
+        red_green = red >= green
+        green_blue = green >= blue
+        red_blue = red >= blue
+        high = np.maximum(np.maximum(red, green), blue)
+        low = np.minimum(np.minimum(red, green), blue)
+        middle = red + green + blue
+        middle -= high
+        middle -= low
+        last = index + (1 + size + area)
+        first = index + np.where(
+            red_green, np.where(red_blue, 1, area), np.where(green_blue, size, area)
+        )
+        second = last - np.where(
+            green_blue & red_blue, area, np.where(red_green, size, 1)
+        )
+        weights = (1 - high, high - middle, middle - low, low)
+
+        values = np.empty_like(fraction)
+        for channel, plane in enumerate(planes):
+            value = plane.take(index)
+            value *= weights[0]
+            for corner, weight in zip((first, second, last), weights[1:]):
+                value += plane.take(corner) * weight
+            values[channel] = value
+        return values
+
+    def _interpolate_trilinear(self, np, planes, position):
+        size = self.size
+        area = size * size
+        index, fraction = self._corners(np, position)
+        red, green, blue = fraction
+        corners = [
+            index + offset
+            for offset in (0, 1, size, size + 1, area, area + 1, area + size)
+        ]
+        corners.append(index + (area + size + 1))
+
+        values = np.empty_like(fraction)
+        for channel, plane in enumerate(planes):
+            c000, c100, c010, c110, c001, c101, c011, c111 = (
+                plane.take(corner) for corner in corners
+            )
+            bottom = c000 + (c100 - c000) * red
+            top = c010 + (c110 - c010) * red
+            near = bottom + (top - bottom) * green
+            bottom = c001 + (c101 - c001) * red
+            top = c011 + (c111 - c011) * red
+            far = bottom + (top - bottom) * green
+            values[channel] = near + (far - near) * blue
+        return values
+
+    def then(self, other: Lut, size: Optional[int] = None) -> Lut:
+        """
+        Returns the LUT applying this one, then `other`. See :func:`compose`.
+
+        """
+        return compose([self, other], size)
+
+    def write_cube(self, path: Union[str, os.PathLike], decimals: int = 6) -> None:
+        """
+        Writes the LUT as a ``.cube`` file.
+
+        """
+        np = _numpy()
+        keyword = "LUT_1D_SIZE" if self.dimensions == 1 else "LUT_3D_SIZE"
+        lines = []
+        if self.title:
+            lines.append(f'TITLE "{self.title}"')
+        lines.append(f"{keyword} {self.size}")
+        if self.domain_min != (0.0, 0.0, 0.0) or self.domain_max != (1.0, 1.0, 1.0):
+            lines.append("DOMAIN_MIN " + " ".join(map(repr, self.domain_min)))
+            lines.append("DOMAIN_MAX " + " ".join(map(repr, self.domain_max)))
+        with open(path, "w", encoding="utf-8", newline="\n") as file:
+            file.write("\n".join(lines) + "\n")
+            np.savetxt(file, self.table.reshape(-1, 3), fmt=f"%.{decimals}f")
+
+
+def _triple(values: list[str], line: str) -> tuple[float, float, float]:
+    if len(values) != 3:
+        raise ValueError(f"Expected three values: {line!r}")
+    return float(values[0]), float(values[1]), float(values[2])
+
+
+def _parse(text: str, path: str, vlt: bool, bit_depth: Optional[int]) -> Lut:
+    np = _numpy()
+    match = _DATA_START.search(text)
+    header = text[: match.start()] if match else text
+    data = text[match.start() :] if match else ""
+    title = ""
+    size_1d = size_3d = 0
+    domain_min = (0.0, 0.0, 0.0)
+    domain_max = (1.0, 1.0, 1.0)
+    for line in header.splitlines():
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        keyword = fields[0].upper()
+        if keyword == "TITLE":
+            title = line.split(None, 1)[1].strip().strip('"') if len(fields) > 1 else ""
+        elif keyword == "LUT_1D_SIZE":
+            size_1d = int(fields[1])
+        elif keyword == "LUT_3D_SIZE":
+            size_3d = int(fields[1])
+        elif keyword == "DOMAIN_MIN":
+            domain_min = _triple(fields[1:], line)
+        elif keyword == "DOMAIN_MAX":
+            domain_max = _triple(fields[1:], line)
+        elif keyword in ("LUT_1D_INPUT_RANGE", "LUT_3D_INPUT_RANGE"):
+            low, high = float(fields[1]), float(fields[2])
+            domain_min, domain_max = (low,) * 3, (high,) * 3
+    if size_1d and size_3d:
+        raise ValueError(
+            f"Cube files with a 1D shaper and a 3D LUT are unsupported: {path}"
+        )
+    size = size_3d or size_1d
+    if not size:
+        raise ValueError(f"No LUT_1D_SIZE or LUT_3D_SIZE in {path}")
+    if "#" in data:
+        data = "\n".join(line.partition("#")[0] for line in data.splitlines())
+    with warnings.catch_warnings():
+        # fromstring warns, then stops, at the first malformed value; the count check
+        # below reports it.
+        warnings.simplefilter("ignore", DeprecationWarning)
+        values = np.fromstring(data, dtype=np.float32, sep=" ")
+    count = size**3 * 3 if size_3d else size * 3
+    if values.size != count:
+        raise ValueError(f"Expected {count} values in {path}, found {values.size}")
+    if vlt:
+        if bit_depth is None:
+            # Panasonic VLT tables hold 10 or 12-bit code values.
+            bit_depth = 12 if values.max() > 1023 else 10
+        values /= (1 << bit_depth) - 1
+    shape = (size, size, size, 3) if size_3d else (size, 3)
+    return Lut(values.reshape(shape), domain_min, domain_max, title, path)
+
+
+def read_lut(path: Union[str, os.PathLike], bit_depth: Optional[int] = None) -> Lut:
+    """
+    Parses a ``.cube`` file, 1D or 3D, or a Panasonic ``.vlt`` file.
+
+    Parameters
+    ----------
+    path
+        LUT file. Files ending in ``.vlt`` are read as Panasonic VLT.
+    bit_depth
+        Bit depth of VLT code values, 10 or 12. Inferred from the values by default.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+    ValueError
+        If the file is malformed.
+
+    """
+    path = os.fspath(path)
+    with open(path, encoding="utf-8", errors="replace") as file:
+        text = file.read()
+    return _parse(text, path, path.lower().endswith(".vlt"), bit_depth)
+
+
+def load_lut(path: Union[str, os.PathLike]) -> Lut:
+    """
+    Returns :func:`read_lut` of `path`, parsed again only when the file's modification
+    time or size changed. The :data:`CACHE_SIZE` most recently used LUTs are kept.
+
+    """
+    path = os.path.abspath(os.fspath(path))
+    status = os.stat(path)
+    stamp = (status.st_mtime_ns, status.st_size)
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is not None and entry[0] == stamp:
+            _cache.move_to_end(path)
+            return entry[1]
+    lut = read_lut(path)
+    with _cache_lock:
+        _cache[path] = (stamp, lut)
+        _cache.move_to_end(path)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return lut
+
+
+def clear_cache() -> None:
+    """
+    Empties the :func:`load_lut` cache.
+
+    """
+    with _cache_lock:
+        _cache.clear()
+
+
+def compose(
+    luts: Iterable[Union[Lut, str, os.PathLike]],
+    size: Optional[int] = None,
+    interpolation: str = "tetrahedral",
+) -> Lut:
+    """
+    Bakes a chain of LUTs, applied first to last, into one.
+
+    The chain is sampled on a grid over the first LUT's domain. Chains of 1D LUTs
+    give a 1D LUT, any 3D LUT in the chain gives a 3D one.
+
+    Parameters
+    ----------
+    luts
+        LUTs, or paths loaded with :func:`load_lut`.
+    size
+        Size of the result. Defaults to the largest size of the chain's LUTs of the
+        result's dimensions.
+    interpolation
+        Interpolation of the 3D LUTs of the chain.
+
+    Raises
+    ------
+    ValueError
+        If the chain is empty.
+
+    """
+    np = _numpy()
+    chain = [lut if isinstance(lut, Lut) else load_lut(lut) for lut in luts]
+    if not chain:
+        raise ValueError("Cannot compose an empty chain of LUTs")
+    dimensions = max(lut.dimensions for lut in chain)
+    if size is None:
+        size = max(lut.size for lut in chain if lut.dimensions == dimensions)
+    first = chain[0]
+    identity = Lut.identity(size, dimensions).table
+    low = np.asarray(first.domain_min, dtype=np.float32)
+    high = np.asarray(first.domain_max, dtype=np.float32)
+    grid = identity * (high - low) + low
+    for lut in chain:
+        grid = lut.apply(grid, interpolation)
+    title = " > ".join(
+        filter(None, (lut.title or os.path.basename(lut.path) for lut in chain))
+    )
+    return Lut(grid, first.domain_min, first.domain_max, title)
+
+
+def export_lut(
+    item: TimelineItem,
+    export_type: str = Resolve.EXPORT_LUT_33PTCUBE,
+    directory: Optional[Union[str, os.PathLike]] = None,
+) -> Optional[Lut]:
+    """
+    Exports the grade of a timeline item with ``TimelineItem.ExportLUT`` to a
+    temporary file and parses it.
+
+    Parameters
+    ----------
+    item
+        Timeline item.
+    export_type
+        One of the ``Resolve.EXPORT_LUT_*`` types.
+    directory
+        Folder of the temporary file, which Resolve must be able to write to. Defaults
+        to the system temporary folder.
+
+    Returns
+    -------
+    Lut or None
+        The LUT, None if ``ExportLUT`` failed.
+
+    """
+    extension = ".vlt" if export_type == Resolve.EXPORT_LUT_PANASONICVLUT else ".cube"
+    with tempfile.TemporaryDirectory(prefix="dri-lut-", dir=directory) as folder:
+        path = os.path.join(folder, f"grade{extension}")
+        if not item.ExportLUT(export_type, path):
+            return None
+        lut = read_lut(path)
+    lut.path = ""
+    if not lut.title:
+        lut.title = item.GetName() or ""
+    return lut
@@ -0,0 +1,428 @@
+"""
+Indexed marker store with batched sync.
+
+``GetMarkers()`` returns a ``dict[int, dict]`` that scripts search linearly, and
+``GetMarkerByCustomData`` costs a round trip per lookup. :class:`MarkerStore` loads the
+markers of a Timeline, TimelineItem or MediaPoolItem with a single ``GetMarkers`` call
+and indexes them by frame (a sorted ``array('q')``), color, name and customData. To
+write markers back, :meth:`MarkerStore.diff` compares the store with the desired
+markers and :meth:`MarkerStore.apply` issues ``AddMarker``, ``DeleteMarkerAtFrame`` and
+``UpdateMarkerCustomData`` calls for the changed frames only.
+
+Frames are frame ids as used by the owner's marker API: relative to
+``Timeline.GetStartFrame()`` for timelines and to the item or clip start otherwise.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.markers import Marker, MarkerStore
+...
+>>> resolve = Resolve.resolve_init()
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> store = MarkerStore.load(timeline)
+>>> store.by_custom_data("note-1234")
+Marker(frame=207, color='Blue', name='Fix flicker', note='', duration=1, custom_data='note-1234')
+>>> desired = [Marker(frame, "Red", "Review", note) for frame, note in tracker_notes]
+>>> result = store.sync(desired)
+>>> result.calls, result.failed
+(42, [])
+
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import NamedTuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional, Union
+
+    from dri.media_pool_item import MediaPoolItem
+    from dri.timeline import Timeline
+    from dri.timeline_item import TimelineItem
+
+
+class Marker(NamedTuple):
+    """
+    One marker, as returned by ``GetMarkers()``.
+
+    """
+
+    frame: int
+    color: str
+    name: str
+    note: str = ""
+    duration: int = 1
+    custom_data: str = ""
+
+    @classmethod
+    def from_info(cls, frame: int, info: dict) -> Marker:
+        """
+        Builds a marker from one entry of ``GetMarkers()``.
+
+        """
+        return cls(
+            int(frame),
+            info.get("color", ""),
+            info.get("name", ""),
+            info.get("note", ""),
+            int(info.get("duration", 1)),
+            info.get("customData", ""),
+        )
+
+
+class MarkerDiff(NamedTuple):
+    """
+    Changes that turn the markers of a :class:`MarkerStore` into the desired ones.
+
+    Attributes
+    ----------
+    add : list[Marker]
+        Markers at frames that have no marker yet.
+    delete : list[int]
+        Frames whose marker is removed.
+    replace : list[Marker]
+        Markers whose color, name, note or duration change. Each costs a delete and an
+        add, as the API cannot edit a marker in place.
+    custom_data : list[Marker]
+        Markers whose customData alone changes, written with
+        ``UpdateMarkerCustomData``.
+
+    """
+
+    add: list[Marker]
+    delete: list[int]
+    replace: list[Marker]
+    custom_data: list[Marker]
+
+    def __bool__(self) -> bool:
+        return bool(self.add or self.delete or self.replace or self.custom_data)
+
+    @property
+    def calls(self) -> int:
+        """
+        Number of API calls :meth:`MarkerStore.apply` makes for this diff.
+
+        """
+        return (
+            len(self.add)
+            + len(self.delete)
+            + 2 * len(self.replace)
+            + len(self.custom_data)
+        )
+
+
+class SyncResult(NamedTuple):
+    """
+    Outcome of :meth:`MarkerStore.apply`.
+
+    Attributes
+    ----------
+    calls : int
+        Number of API calls made.
+    failed : list[tuple[str, int]]
+        (method name, frame) of every call that returned False.
+
+    """
+
+    calls: int
+    failed: list[tuple[str, int]]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+class MarkerStore:
+    """
+    Markers of one Timeline, TimelineItem or MediaPoolItem, indexed by frame, color,
+    name and customData.
+
+    The store is a cache: changes made to the owner other than through :meth:`apply`
+    are not seen until :meth:`reload`.
+
+    Parameters
+    ----------
+    owner
+        Object whose markers are stored.
+    markers
+        Initial markers. Use :meth:`load` to read them from `owner`.
+
+    """
+
+    def __init__(
+        self,
+        owner: Union[Timeline, TimelineItem, MediaPoolItem],
+        markers: Iterable[Marker] = (),
+    ):
+        self.owner = owner
+        self._reset(markers)
+
+    @classmethod
+    def load(cls, owner: Union[Timeline, TimelineItem, MediaPoolItem]) -> MarkerStore:
+        """
+        Reads every marker of `owner` with one ``GetMarkers`` call.
+
+        """
+        store = cls(owner)
+        store.reload()
+        return store
+
+    def reload(self) -> None:
+        """
+        Discards the indexes and reads the markers of the owner again.
+
+        """
+        markers = self.owner.GetMarkers() or {}
+        self._reset(Marker.from_info(frame, info) for frame, info in markers.items())
+
+    def _reset(self, markers: Iterable[Marker]) -> None:
+        self._markers: dict[int, Marker] = {}
+        self._by_color: dict[str, set[int]] = {}
+        self._by_name: dict[str, set[int]] = {}
+        self._by_custom_data: dict[str, set[int]] = {}
+        for marker in markers:
+            self._index(marker)
+        self._sort()
+
+    def _sort(self) -> None:
+        self._frames = array("q", sorted(self._markers))
+        self._longest = max(
+            (marker.duration for marker in self._markers.values()), default=1
+        )
+
+    def _index(self, marker: Marker) -> None:
+        self._markers[marker.frame] = marker
+        self._by_color.setdefault(marker.color, set()).add(marker.frame)
+        self._by_name.setdefault(marker.name, set()).add(marker.frame)
+        self._by_custom_data.setdefault(marker.custom_data, set()).add(marker.frame)
+
+    def _unindex(self, frame: int) -> None:
+        marker = self._markers.pop(frame)
+        for index, key in (
+            (self._by_color, marker.color),
+            (self._by_name, marker.name),
+            (self._by_custom_data, marker.custom_data),
+        ):
+            frames = index[key]
+            frames.discard(frame)
+            if not frames:
+                del index[key]
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __iter__(self) -> Iterator[Marker]:
+        """
+        Yields the markers ordered by frame.
+
+        """
+        markers = self._markers
+        return (markers[frame] for frame in self._frames)
+
+    def __contains__(self, frame: int) -> bool:
+        return frame in self._markers
+
+    def __repr__(self) -> str:
+        return f"<MarkerStore {len(self)} markers of {self.owner!r}>"
+
+    @property
+    def frames(self) -> memoryview:
+        """
+        Frames of all markers, sorted, as a read-only memoryview.
+
+        """
+        return memoryview(self._frames).toreadonly()
+
+    def get(self, frame: int) -> Optional[Marker]:
+        """
+        Returns the marker at `frame`, or None.
+
+        """
+        return self._markers.get(frame)
+
+    def at(self, frame: int) -> list[Marker]:
+        """
+        Returns the markers whose duration covers `frame`, ordered by frame.
+
+        """
+        return [
+            marker
+            for marker in self.between(frame - self._longest + 1, frame + 1)
+            if frame < marker.frame + marker.duration
+        ]
+
+    def between(self, start: int, end: int) -> list[Marker]:
+        """
+        Returns the markers placed at frames ``start <= frame < end``, ordered by frame.
+
+        """
+        frames = self._frames
+        first = bisect_left(frames, start)
+        last = bisect_left(frames, end, first)
+        markers = self._markers
+        return [markers[frames[position]] for position in range(first, last)]
+
+    def next_after(self, frame: int) -> Optional[Marker]:
+        """
+        Returns the first marker after `frame`, or None.
+
+        """
+        position = bisect_left(self._frames, frame + 1)
+        if position == len(self._frames):
+            return None
+        return self._markers[self._frames[position]]
+
+    def by_color(self, color: str) -> list[Marker]:
+        """
+        Returns the markers of a color, ordered by frame.
+
+        """
+        return self._lookup(self._by_color, color)
+
+    def by_name(self, name: str) -> list[Marker]:
+        """
+        Returns the markers called `name`, ordered by frame.
+
+        """
+        return self._lookup(self._by_name, name)
+
+    def by_custom_data(self, custom_data: str) -> Optional[Marker]:
+        """
+        Returns the first marker with the given customData, like
+        ``GetMarkerByCustomData`` but without a round trip, or None.
+
+        """
+        frames = self._by_custom_data.get(custom_data)
+        if not frames:
+            return None
+        return self._markers[min(frames)]
+
+    def all_by_custom_data(self, custom_data: str) -> list[Marker]:
+        """
+        Returns every marker with the given customData, ordered by frame.
+
+        """
+        return self._lookup(self._by_custom_data, custom_data)
+
+    def _lookup(self, index: dict[str, set[int]], key: str) -> list[Marker]:
+        markers = self._markers
+        return [markers[frame] for frame in sorted(index.get(key, ()))]
+
+    def colors(self) -> dict[str, int]:
+        """
+        Returns the number of markers of each color.
+
+        """
+        return {color: len(frames) for color, frames in self._by_color.items()}
+
+    def diff(
+        self, markers: Iterable[Marker], delete_missing: bool = True
+    ) -> MarkerDiff:
+        """
+        Compares the store with the desired markers.
+
+        Parameters
+        ----------
+        markers
+            Desired markers.
+        delete_missing
+            Whether markers of the store that are not in `markers` are deleted. If
+            False, only frames present in `markers` are touched.
+
+        Returns
+        -------
+        MarkerDiff
+            Changes to apply with :meth:`apply`.
+
+        Raises
+        ------
+        ValueError
+            If two of the desired markers share a frame.
+
+        """
+        desired: dict[int, Marker] = {}
+        for marker in markers:
+            if marker.frame in desired:
+                raise ValueError(f"Duplicate marker at frame {marker.frame}")
+            desired[marker.frame] = marker
+
+        add, replace, custom_data = [], [], []
+        for frame, marker in desired.items():
+            current = self._markers.get(frame)
+            if current is None:
+                add.append(marker)
+            elif current == marker:
+                continue
+            elif current._replace(custom_data=marker.custom_data) == marker:
+                custom_data.append(marker)
+            else:
+                replace.append(marker)
+        delete = []
+        if delete_missing:
+            delete = [frame for frame in self._frames if frame not in desired]
+        add.sort()
+        replace.sort()
+        custom_data.sort()
+        return MarkerDiff(add, delete, replace, custom_data)
+
+    def apply(self, diff: MarkerDiff) -> SyncResult:
+        """
+        Writes a diff to the owner and updates the indexes to match.
+
+        Deletions run before additions so that a frame freed by one can be reused by
+        the other. A failed call leaves the store as Resolve reports it, e.g. a replaced
+        marker whose ``AddMarker`` fails is gone from both.
+
+        Returns
+        -------
+        SyncResult
+            Number of calls made and the calls that failed.
+
+        """
+        owner = self.owner
+        failed: list[tuple[str, int]] = []
+        calls = 0
+        for frame in diff.delete + [marker.frame for marker in diff.replace]:
+            calls += 1
+            if owner.DeleteMarkerAtFrame(frame):
+                self._unindex(frame)
+            else:
+                failed.append(("DeleteMarkerAtFrame", frame))
+        for marker in diff.add + diff.replace:
+            if marker.frame in self._markers:
+                # Its DeleteMarkerAtFrame failed above.
+                continue
+            calls += 1
+            # AddMarker only accepts positional arguments.
+            if owner.AddMarker(
+                marker.frame,
+                marker.color,
+                marker.name,
+                marker.note,
+                marker.duration,
+                marker.custom_data,
+            ):
+                self._index(marker)
+            else:
+                failed.append(("AddMarker", marker.frame))
+        for marker in diff.custom_data:
+            calls += 1
+            if owner.UpdateMarkerCustomData(marker.frame, marker.custom_data):
+                self._unindex(marker.frame)
+                self._index(marker)
+            else:
+                failed.append(("UpdateMarkerCustomData", marker.frame))
+        self._sort()
+        return SyncResult(calls, failed)
+
+    def sync(
+        self, markers: Iterable[Marker], delete_missing: bool = True
+    ) -> SyncResult:
+        """
+        Shortcut for ``apply(diff(markers, delete_missing))``.
+
+        """
+        return self.apply(self.diff(markers, delete_missing))
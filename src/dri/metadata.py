@@ -0,0 +1,321 @@
+"""
+Bulk Media Pool metadata writer.
+
+Syncing Scene/Shot/Take/Description from a shot-tracking system with one
+``SetMetadata(key, value)`` call per key and clip costs thousands of round trips, most
+of which rewrite the value already there. :class:`MetadataWriter` keeps the
+``GetMetadata()`` and ``GetClipProperty()`` dicts of the clips it has seen, compares
+them with the desired values and writes only the keys that differ: one
+``SetMetadata(key, value)`` for a single key, one ``SetMetadata(metadata)`` call for
+several. Clip properties have no dict form and are written with one
+``SetClipProperty`` call per changed key.
+
+Clips can be given as :class:`~dri.media_pool_item.MediaPoolItem` or as
+:class:`~dri.catalog.ClipEntry`, whose unique id saves a ``GetUniqueId()`` call.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.catalog import MediaPoolCatalog
+>>> from dri.metadata import MetadataWriter
+...
+>>> resolve = Resolve.resolve_init()
+>>> media_pool = resolve.GetProjectManager().GetCurrentProject().GetMediaPool()
+>>> catalog = MediaPoolCatalog.load(media_pool)
+>>> writer = MetadataWriter()
+>>> report = writer.write(
+...     {catalog.by_name(row["clip"])[0]: row["metadata"] for row in tracker_rows}
+... )
+>>> report.changed, report.unchanged, report.writes, report.failed
+(37, 1375, 41, [])
+
+"""
+
+from __future__ import annotations
+
+import time
+
+from dri.catalog import ClipEntry
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Iterable, Mapping, Optional, Union
+
+    from dri._types import Metadata
+    from dri.media_pool_item import MediaPoolItem
+
+    Clip = Union[MediaPoolItem, ClipEntry]
+
+
+class WriteReport:
+    """
+    Outcome of :meth:`MetadataWriter.write`.
+
+    Attributes
+    ----------
+    clips : int
+        Number of clips given.
+    changed : int
+        Clips with at least one key that differed.
+    unchanged : int
+        Clips whose values all matched already.
+    keys : int
+        Number of keys that differed.
+    reads : int
+        ``GetMetadata()``/``GetClipProperty()`` calls made to fill the cache.
+    writes : int
+        ``SetMetadata``/``SetClipProperty`` calls made.
+    read_seconds : float
+        Time spent in read calls.
+    write_seconds : float
+        Time spent in write calls.
+    failed : list[tuple[Clip, str]]
+        (clip, key) of every key that could not be written.
+
+    """
+
+    __slots__ = (
+        "changed",
+        "clips",
+        "failed",
+        "keys",
+        "read_seconds",
+        "reads",
+        "unchanged",
+        "write_seconds",
+        "writes",
+    )
+
+    def __init__(self):
+        self.clips = 0
+        self.changed = 0
+        self.unchanged = 0
+        self.keys = 0
+        self.reads = 0
+        self.writes = 0
+        self.read_seconds = 0.0
+        self.write_seconds = 0.0
+        self.failed: list[tuple[Clip, str]] = []
+
+    @property
+    def calls(self) -> int:
+        return self.reads + self.writes
+
+    @property
+    def seconds(self) -> float:
+        return self.read_seconds + self.write_seconds
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def __repr__(self) -> str:
+        return (
+            f"<WriteReport clips={self.clips} changed={self.changed} "
+            f"writes={self.writes} failed={len(self.failed)}>"
+        )
+
+
+def _item(clip: Clip) -> MediaPoolItem:
+    return clip.item if isinstance(clip, ClipEntry) else clip
+
+
+def _unique_id(clip: Clip) -> str:
+    return clip.unique_id if isinstance(clip, ClipEntry) else clip.GetUniqueId()
+
+
+class MetadataWriter:
+    """
+    Writes metadata and clip properties to many clips, skipping unchanged values.
+
+    The writer caches what it reads and what it writes, keyed by the clips' unique id.
+    Changes made to the clips other than through the writer are not seen until
+    :meth:`invalidate`.
+
+    Parameters
+    ----------
+    clock
+        Timer used for the report, ``time.perf_counter`` by default.
+
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self._metadata: dict[str, dict[str, str]] = {}
+        self._properties: dict[str, dict[str, str]] = {}
+
+    def invalidate(self, clips: Optional[Iterable[Clip]] = None) -> None:
+        """
+        Drops the cached values of `clips`, or of every clip.
+
+        """
+        if clips is None:
+            self._metadata.clear()
+            self._properties.clear()
+            return
+        for clip in clips:
+            unique_id = _unique_id(clip)
+            self._metadata.pop(unique_id, None)
+            self._properties.pop(unique_id, None)
+
+    def metadata(self, clip: Clip) -> dict[str, str]:
+        """
+        Returns the cached ``GetMetadata()`` of `clip`, reading it on first use.
+
+        """
+        return self._cached(self._metadata, clip, _unique_id(clip), "GetMetadata")
+
+    def properties(self, clip: Clip) -> dict[str, str]:
+        """
+        Returns the cached ``GetClipProperty()`` of `clip`, reading it on first use.
+
+        """
+        return self._cached(self._properties, clip, _unique_id(clip), "GetClipProperty")
+
+    def _cached(
+        self,
+        cache: dict[str, dict[str, str]],
+        clip: Clip,
+        unique_id: str,
+        method: str,
+        report: Optional[WriteReport] = None,
+    ) -> dict[str, str]:
+        values = cache.get(unique_id)
+        if values is None:
+            start = self.clock()
+            values = cache[unique_id] = dict(getattr(_item(clip), method)() or {})
+            if report is not None:
+                report.reads += 1
+                report.read_seconds += self.clock() - start
+        return values
+
+    def diff(
+        self,
+        metadata: Optional[Mapping[Clip, Union[Metadata, Mapping[str, str]]]] = None,
+        properties: Optional[Mapping[Clip, Mapping[str, str]]] = None,
+    ) -> list[tuple[Clip, dict[str, str], dict[str, str]]]:
+        """
+        Compares the desired values with the cache, reading uncached clips.
+
+        A metadata key that is absent from ``GetMetadata()`` counts as empty, so
+        writing "" to an unset key is not a change.
+
+        Returns
+        -------
+        list[tuple[Clip, dict[str, str], dict[str, str]]]
+            (clip, changed metadata, changed clip properties) of every clip with a
+            change.
+
+        """
+        changes, _ = self._diff(metadata or {}, properties or {}, WriteReport())
+        return changes
+
+    def _diff(
+        self,
+        metadata: Mapping[Clip, Mapping[str, str]],
+        properties: Mapping[Clip, Mapping[str, str]],
+        report: WriteReport,
+    ) -> tuple[list[tuple[Clip, dict[str, str], dict[str, str]]], dict[Clip, str]]:
+        clips = list(metadata)
+        clips.extend(clip for clip in properties if clip not in metadata)
+        report.clips = len(clips)
+        unique_ids: dict[Clip, str] = {}
+        changes = []
+        for clip in clips:
+            unique_id = unique_ids[clip] = _unique_id(clip)
+            changed_metadata: dict[str, str] = {}
+            desired = metadata.get(clip)
+            if desired:
+                current = self._cached(
+                    self._metadata, clip, unique_id, "GetMetadata", report
+                )
+                changed_metadata = {
+                    key: value
+                    for key, value in desired.items()
+                    if current.get(key, "") != value
+                }
+            changed_properties: dict[str, str] = {}
+            desired = properties.get(clip)
+            if desired:
+                current = self._cached(
+                    self._properties, clip, unique_id, "GetClipProperty", report
+                )
+                changed_properties = {
+                    key: value
+                    for key, value in desired.items()
+                    if str(current.get(key, "")) != value
+                }
+            if changed_metadata or changed_properties:
+                changes.append((clip, changed_metadata, changed_properties))
+                report.keys += len(changed_metadata) + len(changed_properties)
+        report.changed = len(changes)
+        report.unchanged = report.clips - report.changed
+        return changes, unique_ids
+
+    def write(
+        self,
+        metadata: Optional[Mapping[Clip, Union[Metadata, Mapping[str, str]]]] = None,
+        properties: Optional[Mapping[Clip, Mapping[str, str]]] = None,
+    ) -> WriteReport:
+        """
+        Writes the values that differ from the clips' current ones.
+
+        If a ``SetMetadata(metadata)`` call with several keys fails, its keys are
+        written one at a time so that the valid ones still land and the failing ones
+        are reported individually.
+
+        Parameters
+        ----------
+        metadata
+            Desired metadata per clip, e.g. ``{clip: {"Scene": "12", "Take": "3"}}``.
+        properties
+            Desired clip properties per clip, e.g. ``{clip: {"Reel Name": "A001"}}``.
+
+        Returns
+        -------
+        WriteReport
+            Counts, calls and timings of the write.
+
+        """
+        report = WriteReport()
+        changes, unique_ids = self._diff(metadata or {}, properties or {}, report)
+        for clip, changed_metadata, changed_properties in changes:
+            item = _item(clip)
+            unique_id = unique_ids[clip]
+            if changed_metadata:
+                written = self._set_metadata(item, changed_metadata, report)
+                cached = self._metadata[unique_id]
+                for key, value in changed_metadata.items():
+                    if key in written:
+                        cached[key] = value
+                    else:
+                        report.failed.append((clip, key))
+            if changed_properties:
+                cached = self._properties[unique_id]
+                for key, value in changed_properties.items():
+                    if self._call(report, item.SetClipProperty, key, value):
+                        cached[key] = value
+                    else:
+                        report.failed.append((clip, key))
+        return report
+
+    def _set_metadata(
+        self, item: MediaPoolItem, changed: dict[str, str], report: WriteReport
+    ) -> set[str]:
+        # Returns the keys written.
+        if len(changed) > 1:
+            if self._call(report, item.SetMetadata, changed):
+                return set(changed)
+        return {
+            key
+            for key, value in changed.items()
+            if self._call(report, item.SetMetadata, key, value)
+        }
+
+    def _call(self, report: WriteReport, method: Callable[..., bool], *args) -> bool:
+        start = self.clock()
+        try:
+            return bool(method(*args))
+        finally:
+            report.writes += 1
+            report.write_seconds += self.clock() - start
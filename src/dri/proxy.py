@@ -0,0 +1,364 @@
+"""
+Opt-in proxy layer that coalesces scripting API round trips.
+
+Every method call on an object returned by the scripting API is an IPC round trip into
+Resolve. :func:`wrap` returns a :class:`RemoteProxy` that forwards calls and, inside a
+read transaction, memoizes read-only getters, serves keyed getters such as
+``GetProperty("Pan")`` from a single bulk ``GetProperty()`` call and lets callers
+prefetch getters for many objects up front. Any other call is treated as a mutation and
+clears the cache, so reads never see stale values written through the proxy.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.proxy import wrap
+...
+>>> resolve = wrap(Resolve.resolve_init())
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> with resolve.read_transaction() as stats:
+...     items = timeline.GetItemListInTrack("video", 1)
+...     for item in items:
+...         print(item.GetName(), item.GetProperty("ZoomX"), item.GetProperty("Pan"))
+>>> stats.saved
+3000
+
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Iterator, Optional
+
+# Getters whose result can change without the script doing anything, e.g. because the
+# user moves the playhead or a render progresses. They are never memoized.
+VOLATILE_GETTERS = frozenset(
+    {
+        "GetCurrentClipThumbnailImage",
+        "GetCurrentPage",
+        "GetCurrentTimecode",
+        "GetCurrentVideoItem",
+        "GetIsFolderStale",
+        "GetRenderJobStatus",
+        "IsRenderingInProgress",
+    }
+)
+
+# Getters taking one key that return every key as a dict when called without it.
+BULK_GETTERS = frozenset(
+    {"GetClipProperty", "GetMetadata", "GetProperty", "GetSetting"}
+)
+
+_SCALARS = (str, bytes, int, float, bool, type(None))
+
+
+def is_read_only(method_name: str) -> bool:
+    """
+    Returns True if calls to `method_name` can be memoized within a read transaction.
+
+    """
+    return method_name.startswith(("Get", "Is")) and method_name not in VOLATILE_GETTERS
+
+
+class CallStats:
+    """
+    Call accounting of a :class:`ProxySession`.
+
+    Attributes
+    ----------
+    calls : int
+        Number of method calls made through proxies.
+    round_trips : int
+        Number of calls actually forwarded to Resolve.
+    by_method : Counter
+        Round trips keyed by method name.
+
+    """
+
+    __slots__ = ("by_method", "calls", "round_trips")
+
+    def __init__(self):
+        self.calls = 0
+        self.round_trips = 0
+        self.by_method: Counter = Counter()
+
+    @property
+    def saved(self) -> int:
+        """
+        Number of round trips avoided.
+
+        """
+        return self.calls - self.round_trips
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.round_trips = 0
+        self.by_method.clear()
+
+    def __repr__(self) -> str:
+        return (
+            f"CallStats(calls={self.calls}, round_trips={self.round_trips}, "
+            f"saved={self.saved})"
+        )
+
+
+class ProxySession:
+    """
+    Shared state of all proxies created from one :func:`wrap` call: call statistics,
+    the read transaction cache and the proxy of every wrapped object.
+
+    """
+
+    def __init__(self):
+        self.stats = CallStats()
+        self._depth = 0
+        self._cache: dict[tuple, Any] = {}
+        self._proxies: dict[int, RemoteProxy] = {}
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._depth > 0
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[CallStats]:
+        """
+        Memoizes read-only getters until the outermost transaction exits.
+
+        Yields
+        ------
+        CallStats
+            The session's statistics.
+
+        """
+        self._depth += 1
+        try:
+            yield self.stats
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                self.invalidate()
+                self._proxies.clear()
+
+    def invalidate(self) -> None:
+        """
+        Drops every memoized result.
+
+        """
+        self._cache.clear()
+
+    def _pin(self, target) -> int:
+        # Cache keys hold id(target). Keeping a proxy of the target until the
+        # transaction ends stops that id from being reused by a new object, which
+        # would then be served the old object's results.
+        key = id(target)
+        if key not in self._proxies:
+            self._proxies[key] = RemoteProxy(target, self)
+        return key
+
+    def wrap(self, value):
+        """
+        Wraps API objects in `value`, recursing into lists, tuples and dict values.
+
+        """
+        if isinstance(value, _SCALARS) or isinstance(value, RemoteProxy):
+            return value
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        if isinstance(value, tuple):
+            return tuple(self.wrap(item) for item in value)
+        if isinstance(value, dict):
+            return {key: self.wrap(item) for key, item in value.items()}
+        if not self._depth:
+            return RemoteProxy(value, self)
+        proxy = self._proxies.get(id(value))
+        if proxy is None:
+            proxy = self._proxies[id(value)] = RemoteProxy(value, self)
+        return proxy
+
+    def prefetch(self, objects: Iterable[RemoteProxy], *method_names: str) -> None:
+        """
+        Calls the given argument-less getters on every object so that later calls in the
+        same read transaction are served from the cache.
+
+        Parameters
+        ----------
+        objects
+            Proxies to prefetch, e.g. the items of ``GetItemListInTrack``.
+        *method_names
+            Names of read-only getters, e.g. "GetName", "GetStart", "GetProperty".
+
+        Raises
+        ------
+        RuntimeError
+            If called outside of a read transaction.
+        ValueError
+            If one of the methods is not a read-only getter.
+
+        """
+        if not self._depth:
+            raise RuntimeError("prefetch() must be called inside read_transaction()")
+        for name in method_names:
+            if not is_read_only(name):
+                raise ValueError(f"{name} is not a read-only getter")
+        for proxy in objects:
+            target = proxy._target
+            target_id = self._pin(target)
+            for name in method_names:
+                key = (target_id, name, ())
+                if key not in self._cache:
+                    self._cache[key] = self.wrap(self._invoke(target, name, (), {}))
+
+    def call(self, target, name: str, args: tuple, kwargs: dict):
+        self.stats.calls += 1
+        if not is_read_only(name):
+            self.invalidate()
+            return self.wrap(self._invoke(target, name, args, kwargs))
+        if not self._depth or kwargs:
+            return self.wrap(self._invoke(target, name, args, kwargs))
+
+        target_id = self._pin(target)
+        key = (target_id, name, args)
+        try:
+            hit = key in self._cache
+        except TypeError:
+            # Unhashable arguments, e.g. a dict of options.
+            return self.wrap(self._invoke(target, name, args, kwargs))
+        if hit:
+            return _copy(self._cache[key])
+
+        if name in BULK_GETTERS and len(args) == 1 and isinstance(args[0], str):
+            bulk_key = (target_id, name, ())
+            bulk = self._cache.get(bulk_key)
+            if bulk is None:
+                bulk = self._cache[bulk_key] = self.wrap(
+                    self._invoke(target, name, (), {})
+                )
+            if isinstance(bulk, dict) and args[0] in bulk:
+                self._cache[key] = bulk[args[0]]
+                return _copy(bulk[args[0]])
+
+        value = self._cache[key] = self.wrap(self._invoke(target, name, args, kwargs))
+        return _copy(value)
+
+    def _invoke(self, target, name: str, args: tuple, kwargs: dict):
+        self.stats.round_trips += 1
+        self.stats.by_method[name] += 1
+        return getattr(target, name)(
+            *(_unwrap(arg) for arg in args),
+            **{key: _unwrap(value) for key, value in kwargs.items()},
+        )
+
+
+class RemoteProxy:
+    """
+    Stand-in for an API object that routes method calls through a
+    :class:`ProxySession`.
+
+    Proxies are accepted anywhere the API expects an object, e.g.
+    ``project.SetCurrentTimeline(timeline)``, and are unwrapped before the call is
+    forwarded.
+
+    """
+
+    __slots__ = ("_session", "_target")
+
+    def __init__(self, target, session: ProxySession):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_session", session)
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        session, target = self._session, self._target
+
+        def method(*args, **kwargs):
+            return session.call(target, name, args, kwargs)
+
+        method.__name__ = name
+        return method
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self._target, name, value)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RemoteProxy):
+            other = other._target
+        return self._target == other
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        return f"RemoteProxy({self._target!r})"
+
+    @property
+    def stats(self) -> CallStats:
+        return self._session.stats
+
+    def read_transaction(self):
+        """
+        Shortcut for ``ProxySession.read_transaction()`` of this proxy's session.
+
+        """
+        return self._session.read_transaction()
+
+    def prefetch(self, objects: Iterable[RemoteProxy], *method_names: str) -> None:
+        """
+        Shortcut for ``ProxySession.prefetch()`` of this proxy's session.
+
+        """
+        self._session.prefetch(objects, *method_names)
+
+    def unwrap(self):
+        """
+        Returns the wrapped API object.
+
+        """
+        return self._target
+
+
+def wrap(obj, session: Optional[ProxySession] = None) -> RemoteProxy:
+    """
+    Wraps an API object, typically the one returned by ``Resolve.resolve_init()``, so
+    that it and every object obtained through it go through a :class:`ProxySession`.
+
+    Parameters
+    ----------
+    obj
+        API object to wrap.
+    session
+        Session to attach the proxy to. A new session is created if not given.
+
+    Returns
+    -------
+    RemoteProxy
+        Proxy of `obj`.
+
+    """
+    return (session or ProxySession()).wrap(obj)
+
+
+def _unwrap(value):
+    if isinstance(value, RemoteProxy):
+        return value._target
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_unwrap(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in value.items()}
+    return value
+
+
+def _copy(value):
+    # Cached containers are shared between calls, hand out shallow copies so that
+    # callers mutating a result do not corrupt the cache.
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
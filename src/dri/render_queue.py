@@ -0,0 +1,505 @@
+"""
+Priority render queue with adaptive polling.
+
+:class:`RenderScheduler` takes :class:`RenderJobSpec` objects (timeline, render preset,
+format and codec and :class:`~dri._types.RenderSetting` overrides), adds them to the
+project's render queue with ``SetRenderSettings``/``AddRenderJob`` and starts them one
+at a time, highest priority first, so that jobs submitted while a render is running
+still go ahead of lower-priority ones.
+
+Running jobs are monitored with one ``GetRenderJobStatus`` call per poll. The poll
+interval starts at `min_interval` when a job starts and grows by `backoff`, up to
+`max_interval`, on every poll that sees no progress. It is kept, not reset, when the
+progress changes, so long renders are not polled many times per percent. The only thing
+that shortens a wait is the job's ETA: a poll never waits past the estimated end of the
+running job, so the next job starts right after the previous one finishes without
+polling in a tight loop. Callbacks registered with :meth:`RenderScheduler.on` receive a
+:class:`RenderEvent` when a job starts, progresses, gets a new ETA, completes, fails or
+is cancelled.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.render_queue import RenderJobSpec, RenderScheduler
+...
+>>> resolve = Resolve.resolve_init()
+>>> project = resolve.GetProjectManager().GetCurrentProject()
+>>> scheduler = RenderScheduler(project)
+>>> scheduler.on("progress", lambda event: print(event.job.name, event.job.progress))
+>>> scheduler.on("failed", lambda event: print(event.job.name, event.job.error))
+>>> for index in range(1, project.GetTimelineCount() + 1):
+...     timeline = project.GetTimelineByIndex(index)
+...     scheduler.submit(
+...         RenderJobSpec(
+...             timeline,
+...             preset="H.264 Master",
+...             settings={"TargetDir": "/Volumes/Renders"},
+...             priority=1 if timeline.GetName().startswith("REEL") else 0,
+...         )
+...     )
+>>> jobs = scheduler.run()
+
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from dri.errors import RenderJobError
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Optional, Union
+
+    from dri._types import RenderSetting
+    from dri.project import Project
+    from dri.timeline import Timeline
+
+EVENTS = ("queued", "started", "progress", "eta", "completed", "failed", "cancelled")
+
+_FINISHED = ("Complete", "Failed", "Cancelled")
+
+
+@dataclass
+class RenderJobSpec:
+    """
+    Description of one render job for :meth:`RenderScheduler.submit`.
+
+    Attributes
+    ----------
+    timeline
+        Timeline to render. The current timeline if None.
+    settings
+        Render settings applied after the preset, see
+        :class:`~dri._types.RenderSetting`.
+    preset
+        Render preset loaded before the settings, e.g. "H.264 Master".
+    render_format
+        Render format, e.g. "mov". Must be given together with `codec`.
+    codec
+        Render codec, e.g. "ProRes422HQ".
+    priority
+        Jobs with a higher priority start first. Jobs of equal priority start in
+        submission order.
+    name
+        Label used in events. Defaults to the timeline name.
+
+    """
+
+    timeline: Optional[Timeline] = None
+    settings: Union[RenderSetting, dict] = field(default_factory=dict)
+    preset: Optional[str] = None
+    render_format: Optional[str] = None
+    codec: Optional[str] = None
+    priority: int = 0
+    name: Optional[str] = None
+
+
+class ScheduledJob:
+    """
+    A job submitted to a :class:`RenderScheduler`.
+
+    Attributes
+    ----------
+    spec : RenderJobSpec
+        Submitted spec.
+    job_id : str
+        Render job ID returned by ``AddRenderJob``.
+    name : str
+        Job label.
+    state : str
+        "pending", "rendering", "completed", "failed" or "cancelled".
+    progress : int
+        Completion percentage.
+    eta : float or None
+        Estimated seconds until the job finishes, while it renders.
+    frames : int
+        Number of frames to render, 0 if Resolve did not report the mark in and out.
+    error : str
+        Error reported by Resolve for a failed job.
+    started_at, finished_at, polled_at : float or None
+        Scheduler clock readings.
+
+    """
+
+    __slots__ = (
+        "error",
+        "eta",
+        "finished_at",
+        "frames",
+        "job_id",
+        "name",
+        "polled_at",
+        "progress",
+        "spec",
+        "started_at",
+        "state",
+    )
+
+    def __init__(self, spec: RenderJobSpec, job_id: str, name: str, frames: int):
+        self.spec = spec
+        self.job_id = job_id
+        self.name = name
+        self.frames = frames
+        self.state = "pending"
+        self.progress = 0
+        self.eta: Optional[float] = None
+        self.error = ""
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.polled_at: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"<ScheduledJob {self.name!r} {self.state} {self.progress}%>"
+
+    @property
+    def done(self) -> bool:
+        return self.state in ("completed", "failed", "cancelled")
+
+
+class RenderEvent(NamedTuple):
+    """
+    Notification passed to :meth:`RenderScheduler.on` callbacks.
+
+    """
+
+    kind: str
+    job: ScheduledJob
+    time: float
+
+
+class RenderScheduler:
+    """
+    Submits render jobs to a project and renders them in priority order.
+
+    Parameters
+    ----------
+    project
+        Project whose render queue is used.
+    min_interval
+        Shortest time between two polls, in seconds.
+    max_interval
+        Longest time between two polls, in seconds.
+    backoff
+        Factor the poll interval grows by while a job's progress does not change.
+    clock
+        Monotonic clock. Defaults to :func:`time.monotonic`.
+    sleep
+        Function used by :meth:`run` to wait between polls. Defaults to
+        :func:`time.sleep`.
+
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        min_interval: float = 0.25,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(
+                "Poll intervals must satisfy 0 < min_interval <= max_interval"
+            )
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        self.project = project
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.clock = clock
+        self.sleep = sleep
+        self.jobs: list[ScheduledJob] = []
+        self._pending: list[tuple[int, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._running: Optional[ScheduledJob] = None
+        self._interval = min_interval
+        self._listeners: dict[str, list[Callable[[RenderEvent], None]]] = {
+            kind: [] for kind in EVENTS
+        }
+        # Seconds per frame of the jobs completed so far, for the queue ETA.
+        self._rendered_frames = 0
+        self._render_seconds = 0.0
+
+    def on(self, kind: str, callback: Callable[[RenderEvent], None]) -> None:
+        """
+        Registers a callback for one kind of event.
+
+        Parameters
+        ----------
+        kind
+            One of "queued", "started", "progress", "eta", "completed", "failed" and
+            "cancelled".
+        callback
+            Called with a :class:`RenderEvent`.
+
+        Raises
+        ------
+        ValueError
+            If `kind` is unknown.
+
+        """
+        listeners = self._listeners.get(kind)
+        if listeners is None:
+            raise ValueError(f"Unknown render event: {kind!r}")
+        listeners.append(callback)
+
+    def _emit(self, kind: str, job: ScheduledJob) -> None:
+        if self._listeners[kind]:
+            event = RenderEvent(kind, job, self.clock())
+            for callback in self._listeners[kind]:
+                callback(event)
+
+    def submit(self, spec: RenderJobSpec) -> ScheduledJob:
+        """
+        Adds a job to the project's render queue. It starts once every job of higher
+        priority, and every earlier job of the same priority, has finished.
+
+        The project's current timeline is restored afterwards, the render settings are
+        left as set for this job.
+
+        Raises
+        ------
+        RenderJobError
+            If the timeline, preset, format, codec or settings are rejected, or
+            ``AddRenderJob`` fails, e.g. because no target directory is set.
+
+        """
+        project = self.project
+        previous = project.GetCurrentTimeline()
+        timeline = spec.timeline or previous
+        if timeline is None:
+            raise RenderJobError("The project has no timeline to render")
+        name = spec.name or timeline.GetName()
+        try:
+            if spec.timeline is not None and not project.SetCurrentTimeline(timeline):
+                raise RenderJobError(f"Cannot switch to timeline {name!r}")
+            if spec.preset and not project.LoadRenderPreset(spec.preset):
+                raise RenderJobError(f"Cannot load render preset {spec.preset!r}")
+            if spec.render_format or spec.codec:
+                if not project.SetCurrentRenderFormatAndCodec(
+                    spec.render_format, spec.codec
+                ):
+                    raise RenderJobError(
+                        f"Unsupported format and codec: {spec.render_format!r}, "
+                        f"{spec.codec!r}"
+                    )
+            if spec.settings and not project.SetRenderSettings(dict(spec.settings)):
+                raise RenderJobError(f"Render settings rejected for {name!r}")
+            job_id = project.AddRenderJob()
+            if not job_id:
+                raise RenderJobError(f"Cannot add render job for {name!r}")
+        finally:
+            if previous is not None and spec.timeline is not None:
+                project.SetCurrentTimeline(previous)
+
+        frames = 0
+        for info in project.GetRenderJobList() or []:
+            if info.get("JobId") == job_id:
+                frames = int(info.get("MarkOut", 0)) - int(info.get("MarkIn", 0)) + 1
+                break
+        job = ScheduledJob(spec, job_id, name, max(frames, 0))
+        self.jobs.append(job)
+        heapq.heappush(self._pending, (-spec.priority, next(self._sequence), job))
+        self._emit("queued", job)
+        return job
+
+    def cancel(self, job: ScheduledJob) -> bool:
+        """
+        Cancels a pending job, removing it from the render queue, or stops the job
+        that is rendering.
+
+        Returns
+        -------
+        bool
+            False if the job had already finished.
+
+        """
+        if job.done:
+            return False
+        if job is self._running:
+            self.project.StopRendering()
+            self._running = None
+        else:
+            self._pending = [entry for entry in self._pending if entry[2] is not job]
+            heapq.heapify(self._pending)
+            self.project.DeleteRenderJob(job.job_id)
+        job.state = "cancelled"
+        job.eta = None
+        job.finished_at = self.clock()
+        self._emit("cancelled", job)
+        return True
+
+    @property
+    def pending(self) -> list[ScheduledJob]:
+        """
+        Jobs waiting to start, in start order.
+
+        """
+        return [entry[2] for entry in sorted(self._pending)]
+
+    @property
+    def running(self) -> Optional[ScheduledJob]:
+        return self._running
+
+    @property
+    def idle(self) -> bool:
+        """
+        True once every submitted job has finished.
+
+        """
+        return self._running is None and not self._pending
+
+    def queue_eta(self) -> Optional[float]:
+        """
+        Estimated seconds until every submitted job has finished, based on the render
+        speed of the jobs completed so far. None until a job has completed or reported
+        an ETA.
+
+        """
+        if self.idle:
+            return 0.0
+        seconds_per_frame = None
+        if self._rendered_frames:
+            seconds_per_frame = self._render_seconds / self._rendered_frames
+        total = 0.0
+        running = self._running
+        if running is not None:
+            if running.eta is None:
+                return None
+            total += running.eta
+        for _, _, job in self._pending:
+            if seconds_per_frame is None or not job.frames:
+                return None
+            total += job.frames * seconds_per_frame
+        return total
+
+    def poll(self) -> float:
+        """
+        Checks the running job, emits events and starts the next job when the renderer
+        is free.
+
+        Returns
+        -------
+        float
+            Seconds to wait before the next poll.
+
+        """
+        job = self._running
+        if job is not None:
+            self._update(job)
+            if not job.done:
+                return self._next_interval(job)
+            self._running = None
+
+        if not self._pending:
+            return self.min_interval
+        if self.project.IsRenderingInProgress():
+            # Someone else is using the render queue, check back later.
+            self._interval = min(self._interval * self.backoff, self.max_interval)
+            return self._interval
+        _, _, job = heapq.heappop(self._pending)
+        if not self.project.StartRendering([job.job_id]):
+            job.state = "failed"
+            job.error = "StartRendering failed"
+            job.finished_at = self.clock()
+            self._emit("failed", job)
+            return 0.0
+        job.state = "rendering"
+        job.started_at = self.clock()
+        self._running = job
+        self._interval = self.min_interval
+        self._emit("started", job)
+        return self.min_interval
+
+    def _update(self, job: ScheduledJob) -> None:
+        status = self.project.GetRenderJobStatus(job.job_id) or {}
+        now = self.clock()
+        polled_at, job.polled_at = job.polled_at, now
+        state = status.get("JobStatus", "")
+        progress = int(status.get("CompletionPercentage", job.progress))
+
+        if state in _FINISHED:
+            job.finished_at = now
+            job.eta = None
+            if state == "Complete":
+                job.state = "completed"
+                job.progress = 100
+                if job.frames and job.started_at is not None:
+                    self._rendered_frames += job.frames
+                    self._render_seconds += now - job.started_at
+                self._emit("completed", job)
+            elif state == "Failed":
+                job.state = "failed"
+                job.progress = progress
+                job.error = str(status.get("Error", "Render job failed"))
+                self._emit("failed", job)
+            else:
+                job.state = "cancelled"
+                self._emit("cancelled", job)
+            return
+
+        if progress != job.progress:
+            # Keep the interval that just caught a change; resetting it to
+            # min_interval would poll many times per percent on long renders.
+            job.progress = progress
+            self._emit("progress", job)
+        else:
+            self._interval = min(self._interval * self.backoff, self.max_interval)
+
+        eta = None
+        if "EstimatedTimeRemainingInMs" in status:
+            eta = int(status["EstimatedTimeRemainingInMs"]) / 1000
+        elif progress > 0 and job.started_at is not None:
+            elapsed = now - job.started_at
+            eta = elapsed * (100 - progress) / progress
+        if eta is None:
+            return
+        previous = job.eta
+        job.eta = eta
+        # The ETA counts down between polls, only report a moved finish time.
+        if previous is None or abs(eta - (previous - (now - polled_at))) >= 1:
+            self._emit("eta", job)
+
+    def _next_interval(self, job: ScheduledJob) -> float:
+        interval = self._interval
+        if job.eta is not None:
+            # Wake up when the job should be done instead of overshooting by a whole
+            # backed-off interval.
+            interval = min(interval, max(job.eta, self.min_interval))
+        return interval
+
+    def run(self, timeout: Optional[float] = None) -> list[ScheduledJob]:
+        """
+        Polls until every submitted job has finished.
+
+        Parameters
+        ----------
+        timeout
+            Give up after this many seconds, leaving the remaining jobs queued.
+
+        Returns
+        -------
+        list[ScheduledJob]
+            Every submitted job, in submission order.
+
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        while not self.idle:
+            wait = self.poll()
+            if self.idle:
+                break
+            if deadline is not None:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    break
+                wait = min(wait, remaining)
+            if wait > 0:
+                self.sleep(wait)
+        return list(self.jobs)
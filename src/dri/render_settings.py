@@ -0,0 +1,594 @@
+"""
+Validation of render settings against the render capabilities of Resolve.
+
+``SetRenderSettings`` returns False for the whole dict when one key is wrong, e.g. an
+``EncodingProfile`` for a codec other than H.264 and H.265, ``MultiPassEncode`` for a
+codec other than H.264, or a resolution the codec cannot render, and some mistakes,
+like a string frame rate, only show up when the render fails. :func:`compile_settings`
+checks a :class:`~dri._types.RenderSetting` before anything is sent: key names are
+matched case-insensitively, values are converted to the types Resolve expects, and
+the format, codec and resolution are checked against the tables of
+``GetRenderFormats``, ``GetRenderCodecs`` and ``GetRenderResolutions``. Every problem
+is reported at once, not just the first.
+
+:class:`RenderCapabilities` holds those tables. They are fetched on first use for each
+format and codec and persisted to a JSON file per Resolve product and version, so later
+runs against the same Resolve make no capability calls at all.
+
+:func:`apply_settings` compiles several settings dicts into one and sends them with a
+single ``SetRenderSettings`` call, after switching the format and codec only if they
+differ from the current ones.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.render_settings import RenderCapabilities, apply_settings, compile_settings
+...
+>>> resolve = Resolve.resolve_init()
+>>> project = resolve.GetProjectManager().GetCurrentProject()
+>>> capabilities = RenderCapabilities.load(resolve, project, "/var/cache/dri")
+>>> compile_settings(
+...     capabilities,
+...     {"formatwidth": "3840", "FormatHeight": 2160, "MultiPassEncode": True},
+...     render_format="QuickTime",
+...     codec="Apple ProRes 422 HQ",
+... ).problems
+["MultiPassEncode: only for codecs H264, not 'ProRes422HQ'"]
+>>> apply_settings(
+...     project,
+...     capabilities,
+...     {"TargetDir": "/Volumes/Renders", "FrameRate": "23.976"},
+...     {"FormatWidth": 3840, "FormatHeight": 2160, "EncodingProfile": "Main10"},
+...     render_format="mp4",
+...     codec="H.265",
+... )
+CompiledSettings(render_format='mp4', codec='H265', settings={...}, problems=[])
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import NamedTuple
+
+from dri.errors import RenderSettingsError
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Mapping, Optional, Union
+
+    from dri._types import RenderSetting
+    from dri.project import Project
+    from dri.resolve import Resolve
+
+_BOOL_KEYS = (
+    "SelectAllFrames",
+    "ExportVideo",
+    "ExportAudio",
+    "ExportAlpha",
+    "MultiPassEncode",
+    "NetworkOptimization",
+    "ReplaceExistingFilesInPlace",
+    "ExportSubtitle",
+)
+_INT_KEYS = (
+    "MarkIn",
+    "MarkOut",
+    "FormatWidth",
+    "FormatHeight",
+    "AudioBitDepth",
+    "AudioSampleRate",
+    "ClipStartFrame",
+)
+_STR_KEYS = (
+    "TargetDir",
+    "CustomName",
+    "PixelAspectRatio",
+    "AudioCodec",
+    "ColorSpaceTag",
+    "GammaTag",
+    "EncodingProfile",
+    "TimelineStartTimecode",
+    "SubtitleFormat",
+)
+_CHOICE_KEYS = {"UniqueFilenameStyle": (0, 1), "AlphaMode": (0, 1)}
+
+#: Keys accepted by ``SetRenderSettings``.
+KEYS = frozenset(
+    _BOOL_KEYS
+    + _INT_KEYS
+    + _STR_KEYS
+    + tuple(_CHOICE_KEYS)
+    + ("FrameRate", "VideoQuality")
+)
+
+#: Keys only accepted for some codecs, and the codecs, without hardware encoder
+#: suffixes such as "_NVIDIA".
+CODEC_KEYS = {
+    "EncodingProfile": ("H264", "H265"),
+    "AlphaMode": ("H264", "H265"),
+    "MultiPassEncode": ("H264",),
+}
+
+QUALITY_LEVELS = ("Least", "Low", "Medium", "High", "Best")
+
+_KEYS_BY_FOLDED = {key.casefold(): key for key in KEYS}
+_QUALITY_BY_FOLDED = {level.casefold(): level for level in QUALITY_LEVELS}
+_SD_ASPECTS = ("16_9", "4_3")
+_HD_ASPECTS = ("square", "cinemascope")
+
+
+class RenderCapabilities:
+    """
+    Render formats, codecs and resolutions of one Resolve version.
+
+    Tables are fetched from `project` on first use and kept; :meth:`save` writes them
+    to `path` if anything was fetched since they were read.
+
+    Attributes
+    ----------
+    version : str
+        Product name and version string the tables belong to.
+    formats : dict[str, str]
+        Format names and their extensions, as returned by ``GetRenderFormats``.
+    path : str or None
+        File the tables are persisted to.
+
+    """
+
+    __slots__ = (
+        "_codecs",
+        "_dirty",
+        "_project",
+        "_resolutions",
+        "formats",
+        "path",
+        "version",
+    )
+
+    def __init__(
+        self,
+        version: str,
+        project: Optional[Project] = None,
+        formats: Optional[Mapping[str, str]] = None,
+        codecs: Optional[Mapping[str, Mapping[str, str]]] = None,
+        resolutions: Optional[Mapping[str, list]] = None,
+        path: Optional[Union[str, os.PathLike]] = None,
+    ):
+        self.version = version
+        self.path = os.fspath(path) if path is not None else None
+        self._project = project
+        self._dirty = False
+        if formats is None:
+            formats = self._fetch().GetRenderFormats() or {}
+            self._dirty = True
+        self.formats = dict(formats)
+        self._codecs = {ext: dict(table) for ext, table in (codecs or {}).items()}
+        self._resolutions = {
+            key: tuple((int(width), int(height)) for width, height in sizes)
+            for key, sizes in (resolutions or {}).items()
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<RenderCapabilities {self.version!r} formats={len(self.formats)} "
+            f"codecs={sum(len(table) for table in self._codecs.values())}>"
+        )
+
+    @classmethod
+    def load(
+        cls,
+        resolve: Resolve,
+        project: Project,
+        directory: Union[str, os.PathLike],
+    ) -> RenderCapabilities:
+        """
+        Returns the capabilities cached in `directory` for the running Resolve, or
+        empty ones filled from `project` as they are used.
+
+        """
+        version = f"{resolve.GetProductName()} {resolve.GetVersionString()}"
+        slug = re.sub(r"[^\w.-]+", "_", version).strip("_")
+        path = os.path.join(os.fspath(directory), f"render-capabilities-{slug}.json")
+        try:
+            capabilities = cls.read(path, project)
+        except (OSError, ValueError, KeyError, TypeError):
+            capabilities = None
+        if capabilities is None or capabilities.version != version:
+            capabilities = cls(version, project, path=path)
+        return capabilities
+
+    @classmethod
+    def read(
+        cls, path: Union[str, os.PathLike], project: Optional[Project] = None
+    ) -> RenderCapabilities:
+        """
+        Reads capabilities written by :meth:`write`. Tables missing from the file are
+        fetched from `project`.
+
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(
+            data["version"],
+            project,
+            data["formats"],
+            data["codecs"],
+            data["resolutions"],
+            path,
+        )
+
+    def write(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Writes the tables fetched so far as JSON, atomically.
+
+        """
+        data = {
+            "version": self.version,
+            "formats": self.formats,
+            "codecs": self._codecs,
+            "resolutions": {
+                key: [list(size) for size in sizes]
+                for key, sizes in self._resolutions.items()
+            },
+        }
+        directory = os.path.dirname(os.fspath(path))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, indent=1)
+        os.replace(temporary, path)
+        self._dirty = False
+
+    def save(self) -> bool:
+        """
+        Writes the tables to :attr:`path` if anything was fetched since they were
+        read.
+
+        Returns
+        -------
+        bool
+            True if the file was written.
+
+        """
+        if not self._dirty or self.path is None:
+            return False
+        self.write(self.path)
+        return True
+
+    def _fetch(self) -> Project:
+        if self._project is None:
+            raise RenderSettingsError(
+                f"Render capabilities of {self.version!r} are not cached and no "
+                "project was given to fetch them"
+            )
+        return self._project
+
+    def extension(self, render_format: str) -> Optional[str]:
+        """
+        Returns the extension of a format given by name, e.g. "QuickTime", or by
+        extension, e.g. "MOV", or None if Resolve has no such format.
+
+        """
+        folded = render_format.casefold()
+        for name, extension in self.formats.items():
+            if folded in (name.casefold(), extension.casefold()):
+                return extension
+        return None
+
+    def codecs(self, extension: str) -> dict[str, str]:
+        """
+        Returns the codec descriptions and names of a format, as returned by
+        ``GetRenderCodecs``.
+
+        """
+        table = self._codecs.get(extension)
+        if table is None:
+            table = dict(self._fetch().GetRenderCodecs(extension) or {})
+            self._codecs[extension] = table
+            self._dirty = True
+        return table
+
+    def codec(self, extension: str, codec: str) -> Optional[str]:
+        """
+        Returns the name of a codec of a format given by name, e.g. "H265", or by
+        description, e.g. "H.265", or None if the format has no such codec.
+
+        """
+        table = self.codecs(extension)
+        if codec in table.values():
+            return codec
+        if codec in table:
+            return table[codec]
+        folded = codec.casefold()
+        for description, name in table.items():
+            if folded in (description.casefold(), name.casefold()):
+                return name
+        return None
+
+    def resolutions(self, extension: str, codec: str) -> tuple[tuple[int, int], ...]:
+        """
+        Returns the (width, height) resolutions of a format and codec, as returned by
+        ``GetRenderResolutions``. Empty for formats without video.
+
+        """
+        key = f"{extension}/{codec}"
+        sizes = self._resolutions.get(key)
+        if sizes is None:
+            sizes = tuple(
+                (int(size["Width"]), int(size["Height"]))
+                for size in self._fetch().GetRenderResolutions(extension, codec) or []
+            )
+            self._resolutions[key] = sizes
+            self._dirty = True
+        return sizes
+
+
+class CompiledSettings(NamedTuple):
+    """
+    Result of :func:`compile_settings`.
+
+    Attributes
+    ----------
+    render_format : str or None
+        Extension of the format, e.g. "mov", None if none was given or it is unknown.
+    codec : str or None
+        Codec name, e.g. "ProRes422HQ", None if none was given or it is unknown.
+    settings : dict
+        Settings with canonical keys and converted values, ready for
+        ``SetRenderSettings``. Invalid entries are left out.
+    problems : list[str]
+        One message per invalid key, value or combination.
+
+    """
+
+    render_format: Optional[str]
+    codec: Optional[str]
+    settings: dict[str, Any]
+    problems: list[str]
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.casefold() in ("true", "false"):
+        return value.casefold() == "true"
+    raise ValueError
+
+
+def _to_int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError
+        return int(value)
+    return int(value)
+
+
+def _to_video_quality(value: Any) -> Union[int, str]:
+    if isinstance(value, str) and value.casefold() in _QUALITY_BY_FOLDED:
+        return _QUALITY_BY_FOLDED[value.casefold()]
+    quality = _to_int(value)
+    if quality < 0:
+        raise ValueError
+    return quality
+
+
+def _convert(key: str, value: Any) -> Any:
+    # Raises ValueError or TypeError for values Resolve would not take for `key`.
+    if key in _BOOL_KEYS:
+        return _to_bool(value)
+    if key in _INT_KEYS:
+        return _to_int(value)
+    if key in _STR_KEYS:
+        if not isinstance(value, str):
+            raise TypeError
+        return value
+    if key in _CHOICE_KEYS:
+        choice = _to_int(value)
+        if choice not in _CHOICE_KEYS[key]:
+            raise ValueError
+        return choice
+    if key == "FrameRate":
+        if isinstance(value, bool):
+            raise ValueError
+        rate = float(value)
+        if not rate > 0:
+            raise ValueError
+        return int(rate) if rate.is_integer() else rate
+    return _to_video_quality(value)
+
+
+def _codec_family(codec: str) -> str:
+    return codec.upper().split("_", 1)[0]
+
+
+def compile_settings(
+    capabilities: RenderCapabilities,
+    *settings: Union[RenderSetting, Mapping[str, Any]],
+    render_format: Optional[str] = None,
+    codec: Optional[str] = None,
+) -> CompiledSettings:
+    """
+    Merges settings dicts, later ones winning, and validates the result.
+
+    Parameters
+    ----------
+    capabilities
+        Render capabilities of the Resolve the settings are for.
+    settings
+        Settings, see :class:`~dri._types.RenderSetting`. Keys are matched
+        case-insensitively.
+    render_format
+        Format the settings are for, by name or extension. Codec-dependent keys and
+        resolutions are only checked when both the format and the codec are given.
+    codec
+        Codec the settings are for, by name or description.
+
+    Returns
+    -------
+    CompiledSettings
+        The normalized settings and the problems found.
+
+    """
+    problems = []
+    merged: dict[str, Any] = {}
+    for mapping in settings:
+        for raw_key, value in mapping.items():
+            key = _KEYS_BY_FOLDED.get(str(raw_key).casefold())
+            if key is None:
+                problems.append(f"{raw_key}: unknown render setting")
+                continue
+            try:
+                merged[key] = _convert(key, value)
+            except (TypeError, ValueError):
+                merged.pop(key, None)
+                problems.append(f"{key}: invalid value {value!r}")
+
+    extension = None
+    if render_format is not None:
+        extension = capabilities.extension(render_format)
+        if extension is None:
+            problems.append(f"Unknown render format {render_format!r}")
+    codec_name = None
+    if codec is not None and extension is not None:
+        codec_name = capabilities.codec(extension, codec)
+        if codec_name is None:
+            problems.append(f"Format {extension!r} has no codec {codec!r}")
+
+    if codec_name is not None:
+        family = _codec_family(codec_name)
+        for key, families in CODEC_KEYS.items():
+            if key in merged and family not in families:
+                del merged[key]
+                problems.append(
+                    f"{key}: only for codecs {', '.join(families)}, not {codec_name!r}"
+                )
+
+    width = merged.get("FormatWidth")
+    height = merged.get("FormatHeight")
+    if (width is None) != (height is None):
+        problems.append("FormatWidth and FormatHeight must be set together")
+    elif width is not None and codec_name is not None:
+        sizes = capabilities.resolutions(extension, codec_name)
+        if not sizes:
+            problems.append(f"{extension}/{codec_name} does not render video")
+        elif (width, height) not in sizes:
+            problems.append(
+                f"Resolution {width}x{height} is not available for "
+                f"{extension}/{codec_name}"
+            )
+    aspect = merged.get("PixelAspectRatio")
+    if aspect is not None and height is not None:
+        allowed = _SD_ASPECTS if height <= 576 else _HD_ASPECTS
+        if aspect not in allowed:
+            problems.append(
+                f"PixelAspectRatio: {aspect!r} is not one of {', '.join(allowed)} "
+                f"at a height of {height}"
+            )
+
+    mark_in = merged.get("MarkIn")
+    mark_out = merged.get("MarkOut")
+    if mark_in is not None and mark_out is not None and mark_in > mark_out:
+        problems.append(f"MarkIn {mark_in} is after MarkOut {mark_out}")
+    if merged.get("SelectAllFrames") and (mark_in is not None or mark_out is not None):
+        problems.append("SelectAllFrames cannot be combined with MarkIn or MarkOut")
+    if merged.get("ExportVideo") is False and merged.get("ExportAudio") is False:
+        problems.append("ExportVideo and ExportAudio are both disabled")
+
+    return CompiledSettings(extension, codec_name, merged, problems)
+
+
+def apply_settings(
+    project: Project,
+    capabilities: RenderCapabilities,
+    *settings: Union[RenderSetting, Mapping[str, Any]],
+    render_format: Optional[str] = None,
+    codec: Optional[str] = None,
+) -> CompiledSettings:
+    """
+    Compiles settings dicts with :func:`compile_settings` and sends them to a project
+    with one ``SetRenderSettings`` call.
+
+    The format and codec default to the project's current ones. A format given without
+    a codec keeps the current codec if the format has it, otherwise it is a problem.
+    They are switched with ``SetCurrentRenderFormatAndCodec`` only if they differ.
+    Capabilities fetched on the way are saved.
+
+    Parameters
+    ----------
+    project
+        Project to set the render settings of.
+    capabilities
+        Render capabilities of the running Resolve.
+    settings
+        Settings, later ones winning, see :class:`~dri._types.RenderSetting`.
+    render_format
+        Format to render to, by name or extension.
+    codec
+        Codec to render with, by name or description.
+
+    Returns
+    -------
+    CompiledSettings
+        The settings that were sent.
+
+    Raises
+    ------
+    RenderSettingsError
+        If the settings do not validate, with the problems in its ``problems``
+        attribute, or if Resolve rejects the format, codec or settings.
+
+    """
+    current = project.GetCurrentRenderFormatAndCodec() or {}
+    if render_format is None:
+        render_format = current.get("format") or None
+        if codec is None:
+            codec = current.get("codec") or None
+    elif codec is None:
+        extension = capabilities.extension(render_format)
+        current_codec = current.get("codec")
+        if (
+            extension is not None
+            and current_codec
+            and capabilities.codec(extension, current_codec) is not None
+        ):
+            codec = current_codec
+    compiled = compile_settings(
+        capabilities, *settings, render_format=render_format, codec=codec
+    )
+    capabilities.save()
+    if compiled.render_format is not None and codec is None:
+        compiled.problems.append(
+            f"No codec given for format {compiled.render_format!r}, which has no "
+            f"codec {current.get('codec')!r}"
+        )
+    if not compiled.ok:
+        raise RenderSettingsError(
+            f"Invalid render settings: {'; '.join(compiled.problems)}",
+            compiled.problems,
+        )
+    if compiled.codec is not None and (
+        compiled.render_format != current.get("format")
+        or compiled.codec != current.get("codec")
+    ):
+        if not project.SetCurrentRenderFormatAndCodec(
+            compiled.render_format, compiled.codec
+        ):
+            raise RenderSettingsError(
+                f"Unsupported format and codec: {compiled.render_format!r}, "
+                f"{compiled.codec!r}"
+            )
+    if compiled.settings and not project.SetRenderSettings(compiled.settings):
+        raise RenderSettingsError("Render settings rejected by Resolve")
+    return compiled
@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+from dri.enums import SyncMode
+from dri.errors import ResolveConnectionError
+from dri.loader import load_dynamic_lib
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+    from dri.enums import KeyframeMode
+    from dri.media_storage import MediaStorage
+    from dri.project_manager import ProjectManager
+
+
+class Resolve:
+    # fmt: off
+    EXPORT_AAF: str                  = "AAF"
+    EXPORT_DRT: str                  = "DRT"
+    EXPORT_EDL: str                  = "EDL"
+    EXPORT_FCP_7_XML: str            = "FCP_7_XML"
+    EXPORT_FCPXML_1_8: str           = "FCPXML_1_8"
+    EXPORT_FCPXML_1_9: str           = "FCPXML_1_9"
+    EXPORT_FCPXML_1_10: str          = "FCPXML_1_10"
+    EXPORT_HDR_10_PROFILE_A: str     = "HDR_10_PROFILE_A"
+    EXPORT_HDR_10_PROFILE_B: str     = "HDR_10_PROFILE_B"
+    EXPORT_TEXT_CSV: str             = "TEXT_CSV"
+    EXPORT_TEXT_TAB: str             = "TEXT_TAB"
+    EXPORT_DOLBY_VISION_VER_2_9: str = "DOLBY_VISION_VER_2_9"
+    EXPORT_DOLBY_VISION_VER_4_0: str = "DOLBY_VISION_VER_4_0"
+    EXPORT_DOLBY_VISION_VER_5_1: str = "DOLBY_VISION_VER_5_1"
+    EXPORT_OTIO: str                 = "OTIO"
+    EXPORT_ALE: str                  = "ALE"
+    EXPORT_CDL: str                  = "CDL"
+
+    EXPORT_NONE: str                 = "NONE"
+    EXPORT_AAF_NEW: str              = "AAF_NEW"
+    EXPORT_AAF_EXISTING: str         = "AAF_EXISTING"
+    EXPORT_CDL: str                  = "CDL"
+    EXPORT_SDL: str                  = "SDL"
+    EXPORT_MISSING_CLIPS: str        = "MISSING_CLIPS"
+
+    KEYFRAME_MODE_ALL: int           = 1
+    KEYFRAME_MODE_COLOR: int         = 2
+    KEYFRAME_MODE_SIZING: int        = 3
+
+    EXPORT_LUT_17PTCUBE: str         = "EXPORT_LUT_17PTCUBE"
+    EXPORT_LUT_33PTCUBE: str         = "EXPORT_LUT_33PTCUBE"
+    EXPORT_LUT_65PTCUBE: str         = "EXPORT_LUT_65PTCUBE"
+    EXPORT_LUT_PANASONICVLUT: str    = "EXPORT_LUT_PANASONICVLUT"
+
+    CLOUD_SYNC_DEFAULT: int               = -1
+    CLOUD_SYNC_DOWNLOAD_IN_QUEUE: int     = 0
+    CLOUD_SYNC_DOWNLOAD_IN_PROGRESS: int  = 1
+    CLOUD_SYNC_DOWNLOAD_SUCCESS: int      = 2
+    CLOUD_SYNC_DOWNLOAD_FAIL: int         = 3
+    CLOUD_SYNC_DOWNLOAD_NOT_FOUND: int    = 4
+    CLOUD_SYNC_UPLOAD_IN_QUEUE: int       = 5
+    CLOUD_SYNC_UPLOAD_IN_PROGRESS: int    = 6
+    CLOUD_SYNC_UPLOAD_SUCCESS: int        = 7
+    CLOUD_SYNC_UPLOAD_FAIL: int           = 8
+    CLOUD_SYNC_UPLOAD_NOT_FOUND: int      = 9
+    CLOUD_SYNC_SUCCESS: int               = 10
+
+    CLOUD_SYNC_NONE: str                  = "CLOUD_SYNC_NONE"
+    CLOUD_SYNC_PROXY_ONLY: str            = "CLOUD_SYNC_PROXY_ONLY"
+    CLOUD_SYNC_PROXY_AND_ORIG: str        = "CLOUD_SYNC_PROXY_AND_ORIG"
+
+    CLOUD_SETTING_PROJECT_NAME: str       = ""
+    CLOUD_SETTING_PROJECT_MEDIA_PATH: str = ""
+    CLOUD_SETTING_IS_COLLAB: bool         = False
+    CLOUD_SETTING_SYNC_MODE: SyncMode     = SyncMode.CLOUD_SYNC_PROXY_ONLY
+    CLOUD_SETTING_IS_CAMERA_ACCESS: bool  = False
+    # fmt: on
+
+    @staticmethod
+    def resolve_init(path: Optional[str] = None) -> "Resolve":
+        """
+        Connects to the running DaVinci Resolve.
+
+        fusionscript is loaded by :func:`load_dynamic_lib`, so only the first call in a
+        process pays for loading the library.
+
+        Parameters
+        ----------
+        path
+            Explicit path of the fusionscript library.
+
+        Returns
+        -------
+        Resolve
+            Resolve app object.
+
+        Raises
+        ------
+        FusionScriptError
+            If fusionscript cannot be located or loaded.
+        ResolveConnectionError
+            If DaVinci Resolve is not reachable.
+
+        """
+        resolve = load_dynamic_lib(path).scriptapp("Resolve")
+        if resolve is None:
+            raise ResolveConnectionError(
+                "Could not connect to DaVinci Resolve. Make sure it is running and "
+                'that "External scripting using" is set to "Local" in its preferences.'
+            )
+        return resolve
+
+    def Fusion(self):
+        """
+        Returns the Fusion object. Starting point for Fusion scripts.
+
+        """
+        ...
+
+    def GetMediaStorage(self) -> "MediaStorage":
+        """
+        Returns the media storage object to query and act on media locations.
+
+        Returns
+        -------
+        MediaStorage
+            The media storage object to query and act on media locations.
+
+        """
+        ...
+
+    def GetProjectManager(self) -> "ProjectManager":
+        """
+        Returns the project manager object for currently open database.
+
+        Returns
+        -------
+        ProjectManager
+            The project manager object for currently open database.
+
+        """
+        ...
+
+    def OpenPage(self, page_name: str) -> bool:
+        """
+        Switches to indicated page in DaVinci Resolve. Input can be one of ("media",
+        "cut", "edit", "fusion", "color", "fairlight", "deliver").
+
+        Parameters
+        ----------
+        page_name
+            The resolve page to switch to. Can be one of the "media", "cut", "edit",
+            "fusion", "color", "fairlight", "deliver".
+
+        Returns
+        -------
+        bool
+            True if successful, False otherwise.
+
+        """
+        ...
+
+    def GetCurrentPage(self) -> str:
+        """
+        Returns the page currently displayed in the main window. Returned value can
+        be one of ("media", "cut", "edit", "fusion", "color", "fairlight", "deliver",
+        None).
+
+        Returns
+        -------
+        str
+            The page currently displayed in the main window.
+
+        """
+        ...
+
+    def GetProductName(self) -> str:
+        """
+        Returns product name.
+
+        Returns
+        -------
+        str
+            The product name. Such as "DaVinci Resolve Studio".
+
+        """
+        ...
+
+    def GetVersion(self) -> list[int | str]:
+        """
+        Returns list of product version fields in [major, minor, patch, build,
+        suffix] format.
+
+        Returns
+        -------
+        list[str]
+            List of product version fields in [major, minor, patch, build,
+            suffix] format. Such As [18, 5, 0, 16, 'b'].
+
+        """
+        ...
+
+    def GetVersionString(self) -> str:
+        """
+        Returns product version in "major.minor.patch.build.suffix" format.
+
+        Returns
+        -------
+        str
+            Product version in "major.minor.patch.build.suffix" format.
+
+        """
+        ...
+
+    def LoadLayoutPreset(self, preset_name: str) -> bool:
+        """
+        Loads UI layout from saved preset named "presetName".
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset to load.
+
+        Returns
+        -------
+        bool
+            True if load successful, False otherwise.
+
+        """
+        ...
+
+    def UpdateLayoutPreset(self, preset_name: str) -> bool:
+        """
+        Overwrites preset named "presetName" with current UI layout.
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset to update.
+
+        Returns
+        -------
+        bool
+            True if update successful, False otherwise.
+
+        """
+        ...
+
+    def ExportLayoutPreset(self, preset_name: str, preset_file_path: str) -> bool:
+        """
+        Exports preset named "presetName" to path "presetFilePath".
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset to export.
+        preset_file_path
+            The path to the preset file to export. For example:
+            "/Users/thom/Desktop/my_preset". You should specify the name of the
+            preset that you want to export in the preset_file_path argument.
+
+        Returns
+        -------
+        bool
+            True if export successful, False otherwise. If the file exists, it will
+            also return True.
+
+        """
+        ...
+
+    def DeleteLayoutPreset(self, preset_name: str) -> bool:
+        """
+        Deletes preset named "presetName".
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset to delete.
+
+        Returns
+        -------
+        bool
+            True if delete successful, False otherwise.
+
+        """
+        ...
+
+    def SaveLayoutPreset(self, preset_name: str) -> bool:
+        """
+        Saves current UI layout as a preset named 'presetName'.
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset that will be saved.
+
+        Returns
+        -------
+        bool
+            True if save successful, False otherwise.
+
+        """
+        ...
+
+    def ImportLayoutPreset(self, preset_file_path: str, preset_name: str) -> bool:
+        """
+        Imports preset from path 'presetFilePath'. The optional argument 'presetName'
+        specifies how the preset shall be named. If not specified, the preset is
+        named based on the filename.
+
+        Parameters
+        ----------
+        preset_file_path
+            The path to the preset file to import.
+        preset_name
+            The name of the preset to import. If not specified, the preset is named
+            based on the filename.
+
+        Returns
+        -------
+        bool
+            True if import successful, False otherwise.
+
+        """
+        ...
+
+    def Quit(self):
+        """
+        Quits the Resolve App.
+
+        """
+        ...
+
+    def ImportRenderPreset(self, preset_path: str) -> bool:
+        """
+        Import a preset from presetPath (string) and set it as current preset for
+        rendering.
+
+        Parameters
+        ----------
+        preset_path
+            The path to the preset file to import.
+
+        Returns
+        -------
+        bool
+            True if import successful, False otherwise.
+
+        """
+        ...
+
+    def ExportRenderPreset(self, preset_name: str, export_path: str) -> bool:
+        """
+        Export a preset to a given path (string) if presetName(string) exists.
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset to import.
+        export_path
+            The export destination path.
+
+        Returns
+        -------
+        bool
+            True if import successful, False otherwise.
+
+        """
+        ...
+
+    def ImportBurnInPreset(self, preset_path: str) -> bool:
+        """
+        Import a data burn in preset from a given presetPath (string).
+
+        Parameters
+        ----------
+        preset_path
+            The path to the preset file to import.
+
+        Returns
+        -------
+        bool
+            True if import successful, False otherwise.
+
+        """
+        ...
+
+    def ExportBurnInPreset(self, preset_name: str, export_path: str) -> bool:
+        """
+        Export a data burn in preset to a given path (string) if presetName (string)
+        exists.
+
+        Parameters
+        ----------
+        preset_name
+            The name of the preset to import.
+        export_path
+            The export destination path.
+
+        Returns
+        -------
+        bool
+            True if import successful, False otherwise.
+
+        """
+        ...
+
+    def GetKeyframeMode(self) -> KeyframeMode:
+        """
+        Returns the currently set keyframe mode (int). Refer to section 'Keyframe Mode
+        information' below for details.
+
+        Notes
+        -----
+        It's located on Color page > Keyframes panel which next to Scopes.
+
+        Returns
+        -------
+        KeyframeMode
+            Three integers: 0, 1 or 2 correspond to All, Color and Sizing.
+
+        """
+        ...
+
+    def SetKeyframeMode(self, keyframe_mode: KeyframeMode) -> bool:
+        """
+        Returns True when 'keyframeMode'(enum) is successfully set.
+
+        Parameters
+        ----------
+        keyframe_mode
+            Three integers: 0, 1 and 2 correspond to All, Color and Sizing.
+
+        Returns
+        -------
+            True if successful, False otherwise.
+
+        """
+        ...
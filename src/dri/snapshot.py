@@ -0,0 +1,407 @@
+"""
+Columnar, immutable snapshot of a whole Timeline.
+
+:func:`snapshot` walks a timeline once, one track at a time, and stores every timeline
+item in parallel columns: frames in ``array('q')``, track indices in ``array('H')`` and
+names, colors and notes as interned strings. Later queries are local lookups that do not
+touch Resolve.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.snapshot import snapshot
+...
+>>> resolve = Resolve.resolve_init()
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> snap = snapshot(timeline)
+>>> row = snap.item_at("video", 1, 86400)
+>>> snap.record(row).name
+'A001C003_220101_R1AB.mov'
+
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from bisect import bisect_right
+from typing import NamedTuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, Optional
+
+    from dri.media_pool_item import MediaPoolItem
+    from dri.timeline import Timeline
+    from dri.timeline_item import TimelineItem
+
+TRACK_TYPES = ("video", "audio", "subtitle")
+
+
+class ItemRecord(NamedTuple):
+    """
+    One row of a :class:`TimelineSnapshot`.
+
+    """
+
+    row: int
+    track_type: str
+    track_index: int
+    name: str
+    start: int
+    end: int
+    left_offset: int
+    right_offset: int
+    media_pool_item: Optional[MediaPoolItem]
+    item: TimelineItem
+
+    @property
+    def duration(self) -> int:
+        return self.end - self.start
+
+
+class MarkerRecord(NamedTuple):
+    """
+    One marker of a :class:`TimelineSnapshot`. `row` is -1 for timeline markers.
+
+    """
+
+    row: int
+    frame: int
+    color: str
+    duration: int
+    name: str
+    note: str
+    custom_data: str
+
+
+class _Columns:
+    __slots__ = (
+        "end",
+        "items",
+        "left_offset",
+        "media_pool_items",
+        "names",
+        "right_offset",
+        "start",
+        "track_index",
+        "track_type",
+    )
+
+    def __init__(self):
+        self.track_type = array("B")
+        self.track_index = array("H")
+        self.start = array("q")
+        self.end = array("q")
+        self.left_offset = array("q")
+        self.right_offset = array("q")
+        self.names: list[str] = []
+        self.media_pool_items: list = []
+        self.items: list = []
+
+
+class _MarkerColumns:
+    __slots__ = ("colors", "custom_data", "duration", "frame", "names", "notes", "row")
+
+    def __init__(self):
+        self.row = array("q")
+        self.frame = array("q")
+        self.duration = array("q")
+        self.colors: list[str] = []
+        self.names: list[str] = []
+        self.notes: list[str] = []
+        self.custom_data: list[str] = []
+
+    def extend(self, row: int, markers: dict) -> None:
+        intern = sys.intern
+        for frame, marker in sorted(markers.items()):
+            self.row.append(row)
+            self.frame.append(int(frame))
+            self.duration.append(int(marker.get("duration", 1)))
+            self.colors.append(intern(marker.get("color", "")))
+            self.names.append(intern(marker.get("name", "")))
+            self.notes.append(marker.get("note", ""))
+            self.custom_data.append(marker.get("customData", ""))
+
+
+class TimelineSnapshot:
+    """
+    Immutable columnar model of a timeline at the time :func:`snapshot` was called.
+
+    Items are stored track by track, each track sorted by start frame, so the rows of a
+    track are a contiguous range (see :meth:`track_rows`). Numeric columns are exposed as
+    read-only memoryviews over the underlying arrays.
+
+    Attributes
+    ----------
+    name : str
+        Timeline name.
+    start_frame : int
+        Timeline start frame.
+    end_frame : int
+        Timeline end frame.
+    frame_rate : float
+        Timeline frame rate.
+    track_names : dict[tuple[str, int], str]
+        Track name keyed by (track type, 1-based track index).
+
+    """
+
+    __slots__ = (
+        "_columns",
+        "_markers",
+        "_name_index",
+        "_track_ranges",
+        "end_frame",
+        "frame_rate",
+        "name",
+        "start_frame",
+        "track_names",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        start_frame: int,
+        end_frame: int,
+        frame_rate: float,
+        track_names: dict[tuple[str, int], str],
+        columns: _Columns,
+        markers: _MarkerColumns,
+        track_ranges: dict[tuple[str, int], tuple[int, int]],
+    ):
+        self.name = name
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.frame_rate = frame_rate
+        self.track_names = track_names
+        self._columns = columns
+        self._markers = markers
+        self._track_ranges = track_ranges
+        self._name_index: Optional[dict[str, list[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._columns.start)
+
+    def __iter__(self) -> Iterator[ItemRecord]:
+        return (self.record(row) for row in range(len(self)))
+
+    def __repr__(self) -> str:
+        return (
+            f"<TimelineSnapshot {self.name!r}: {len(self)} items, "
+            f"{len(self._markers.frame)} markers>"
+        )
+
+    @property
+    def starts(self) -> memoryview:
+        return memoryview(self._columns.start).toreadonly()
+
+    @property
+    def ends(self) -> memoryview:
+        return memoryview(self._columns.end).toreadonly()
+
+    @property
+    def left_offsets(self) -> memoryview:
+        return memoryview(self._columns.left_offset).toreadonly()
+
+    @property
+    def right_offsets(self) -> memoryview:
+        return memoryview(self._columns.right_offset).toreadonly()
+
+    @property
+    def track_indices(self) -> memoryview:
+        return memoryview(self._columns.track_index).toreadonly()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(self._columns.names)
+
+    @property
+    def tracks(self) -> list[tuple[str, int]]:
+        """
+        (track type, 1-based track index) of every track, in timeline order.
+
+        """
+        return list(self.track_names)
+
+    def track_type(self, row: int) -> str:
+        return TRACK_TYPES[self._columns.track_type[row]]
+
+    def record(self, row: int) -> ItemRecord:
+        """
+        Returns all columns of `row`.
+
+        """
+        columns = self._columns
+        return ItemRecord(
+            row,
+            TRACK_TYPES[columns.track_type[row]],
+            columns.track_index[row],
+            columns.names[row],
+            columns.start[row],
+            columns.end[row],
+            columns.left_offset[row],
+            columns.right_offset[row],
+            columns.media_pool_items[row],
+            columns.items[row],
+        )
+
+    def track_rows(self, track_type: str, track_index: int) -> range:
+        """
+        Returns the rows of a track, ordered by start frame. Empty if the track does not
+        exist.
+
+        """
+        first, last = self._track_ranges.get((track_type, track_index), (0, 0))
+        return range(first, last)
+
+    def item_at(self, track_type: str, track_index: int, frame: int) -> Optional[int]:
+        """
+        Returns the row of the item covering `frame` on a track, or None.
+
+        """
+        rows = self.track_rows(track_type, track_index)
+        position = bisect_right(self._columns.start, frame, rows.start, rows.stop) - 1
+        if position >= rows.start and frame < self._columns.end[position]:
+            return position
+        return None
+
+    def rows_named(self, name: str) -> list[int]:
+        """
+        Returns the rows of every item called `name`.
+
+        """
+        if self._name_index is None:
+            index: dict[str, list[int]] = {}
+            for row, item_name in enumerate(self._columns.names):
+                index.setdefault(item_name, []).append(row)
+            self._name_index = index
+        return list(self._name_index.get(name, ()))
+
+    def markers(self, row: Optional[int] = None) -> list[MarkerRecord]:
+        """
+        Returns the markers of the item at `row`, or the timeline markers if `row` is
+        None. Frames of item markers are relative to the item start, as in
+        ``TimelineItem.GetMarkers``.
+
+        """
+        columns = self._markers
+        key = -1 if row is None else row
+        first = bisect_right(columns.row, key - 1)
+        last = bisect_right(columns.row, key, first)
+        return [
+            MarkerRecord(
+                key,
+                columns.frame[position],
+                columns.colors[position],
+                columns.duration[position],
+                columns.names[position],
+                columns.notes[position],
+                columns.custom_data[position],
+            )
+            for position in range(first, last)
+        ]
+
+    def nbytes(self) -> int:
+        """
+        Returns the approximate memory held by the columns, excluding the referenced
+        API objects and the interned strings.
+
+        """
+        total = 0
+        for columns in (self._columns, self._markers):
+            for slot in columns.__slots__:
+                value = getattr(columns, slot)
+                if isinstance(value, array):
+                    total += value.buffer_info()[1] * value.itemsize
+                else:
+                    total += sys.getsizeof(value)
+        return total
+
+
+def snapshot(
+    timeline: Timeline,
+    track_types: tuple[str, ...] = TRACK_TYPES,
+    markers: bool = True,
+) -> TimelineSnapshot:
+    """
+    Walks `timeline` once and returns a :class:`TimelineSnapshot` of it.
+
+    Parameters
+    ----------
+    timeline
+        Timeline to capture.
+    track_types
+        Track types to capture, any of "video", "audio" and "subtitle".
+    markers
+        Whether to capture timeline and item markers. Capturing markers costs one
+        ``GetMarkers`` call per item.
+
+    Returns
+    -------
+    TimelineSnapshot
+        Snapshot of the timeline.
+
+    """
+    intern = sys.intern
+    columns = _Columns()
+    marker_columns = _MarkerColumns()
+    track_names: dict[tuple[str, int], str] = {}
+    track_ranges: dict[tuple[str, int], tuple[int, int]] = {}
+
+    if markers:
+        marker_columns.extend(-1, timeline.GetMarkers() or {})
+
+    for type_code, track_type in enumerate(TRACK_TYPES):
+        if track_type not in track_types:
+            continue
+        for track_index in range(1, timeline.GetTrackCount(track_type) + 1):
+            track_names[(track_type, track_index)] = intern(
+                timeline.GetTrackName(track_type, track_index) or ""
+            )
+            rows = []
+            for item in timeline.GetItemListInTrack(track_type, track_index) or []:
+                rows.append(
+                    (
+                        item.GetStart(),
+                        item.GetEnd(),
+                        item.GetLeftOffset(),
+                        item.GetRightOffset(),
+                        item.GetName(),
+                        item.GetMediaPoolItem(),
+                        item,
+                    )
+                )
+            # Resolve returns items in timeline order, sort anyway since lookups bisect.
+            rows.sort(key=lambda values: values[0])
+            first = len(columns.start)
+            for start, end, left, right, name, media_pool_item, item in rows:
+                row = len(columns.start)
+                columns.track_type.append(type_code)
+                columns.track_index.append(track_index)
+                columns.start.append(start)
+                columns.end.append(end)
+                columns.left_offset.append(left)
+                columns.right_offset.append(right)
+                columns.names.append(intern(name or ""))
+                columns.media_pool_items.append(media_pool_item)
+                columns.items.append(item)
+                if markers:
+                    marker_columns.extend(row, item.GetMarkers() or {})
+            track_ranges[(track_type, track_index)] = (first, len(columns.start))
+
+    try:
+        frame_rate = float(timeline.GetSetting("timelineFrameRate"))
+    except (TypeError, ValueError):
+        frame_rate = 0.0
+
+    return TimelineSnapshot(
+        intern(timeline.GetName()),
+        timeline.GetStartFrame(),
+        timeline.GetEndFrame(),
+        frame_rate,
+        track_names,
+        columns,
+        marker_columns,
+        track_ranges,
+    )
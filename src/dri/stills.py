@@ -0,0 +1,494 @@
+"""
+Gallery still export with parallel post-processing.
+
+``GalleryStillAlbum.ExportStills`` writes files and nothing else; converting, resizing
+and checksumming them afterwards in a loop leaves the CPU idle while Resolve exports and
+Resolve idle while the loop runs. :class:`StillExporter` exports the stills of an album
+in chunks, each into its own scratch folder, and hands every file to a process pool as
+soon as its chunk is written, so the next chunk is exported while the previous one is
+processed. Each output is mapped back to its :class:`~dri.gallery.GalleryStill` and
+label.
+
+Workers run :func:`process_still`: an optional conversion (binary PPM and PNG are
+handled with the standard library; other formats need Pillow), an optional thumbnail
+and a SHA-256 checksum. Exporting as "ppm", the default, keeps Resolve's share of the
+work to writing raw pixels.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.stills import StillExporter
+...
+>>> resolve = Resolve.resolve_init()
+>>> gallery = resolve.GetProjectManager().GetCurrentProject().GetGallery()
+>>> exporter = StillExporter(
+...     gallery.GetCurrentStillAlbum(), "/deliveries/stills", convert_to="png",
+...     thumbnail_size=(256, 144),
+... )
+>>> for result in exporter.iter_results():
+...     upload(result.path, result.thumbnail, result.sha256, result.label)
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import os
+import re
+import shutil
+import struct
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from typing import NamedTuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+    from typing import Iterable, Iterator, Optional, Union
+
+    from dri.gallery import GalleryStill, GalleryStillAlbum
+
+FORMATS = ("dpx", "cin", "tif", "jpg", "png", "ppm", "bmp", "xpm", "drx")
+
+_PPM_HEADER = re.compile(rb"P6\s+(?:#[^\n]*\n\s*)*(\d+)\s+(\d+)\s+(\d+)\s")
+
+
+def _pil():
+    try:
+        return importlib.import_module("PIL.Image")
+    except ImportError:
+        return None
+
+
+class ExportedStill(NamedTuple):
+    """
+    One still exported by :class:`StillExporter`.
+
+    Attributes
+    ----------
+    still : GalleryStill
+        The still.
+    label : str
+        Its ``GetLabel`` label.
+    path : str
+        Final file in the output folder, "" if processing failed.
+    thumbnail : str
+        Thumbnail file, "" if none was requested or processing failed.
+    sha256 : str
+        Hex digest of `path`.
+    error : str
+        Why processing failed, "" on success.
+
+    """
+
+    still: GalleryStill
+    label: str
+    path: str
+    thumbnail: str = ""
+    sha256: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+def sha256_file(path: Union[str, os.PathLike], block_size: int = 1 << 20) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in blocks.
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_ppm(path: Union[str, os.PathLike]) -> tuple[int, int, bytes]:
+    """
+    Reads a binary 8-bit PPM (P6) file into (width, height, RGB8 bytes).
+
+    Raises
+    ------
+    ValueError
+        If the file is not an 8-bit P6 PPM.
+
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    match = _PPM_HEADER.match(data)
+    if match is None or int(match.group(3)) != 255:
+        raise ValueError(f"Not an 8-bit binary PPM: {path}")
+    width, height = int(match.group(1)), int(match.group(2))
+    pixels = data[match.end() : match.end() + width * height * 3]
+    if len(pixels) != width * height * 3:
+        raise ValueError(f"Truncated PPM: {path}")
+    return width, height, pixels
+
+
+def write_png(
+    path: Union[str, os.PathLike], width: int, height: int, rgb: bytes, level: int = 6
+) -> None:
+    """
+    Writes RGB8 pixels as a PNG file with the standard library.
+
+    """
+
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(payload))
+            + kind
+            + payload
+            + struct.pack(">I", zlib.crc32(kind + payload))
+        )
+
+    stride = width * 3
+    view = memoryview(rgb)
+    # Filter type 0 (none) before every scanline.
+    scanlines = b"".join(
+        b"\x00" + view[row : row + stride] for row in range(0, height * stride, stride)
+    )
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        )
+        file.write(chunk(b"IDAT", zlib.compress(scanlines, level)))
+        file.write(chunk(b"IEND", b""))
+
+
+def resize_nearest(
+    rgb: bytes, width: int, height: int, new_width: int, new_height: int
+) -> bytes:
+    """
+    Resizes RGB8 pixels with nearest-neighbour sampling.
+
+    """
+    columns = [min(width - 1, x * width // new_width) for x in range(new_width)]
+    view = memoryview(rgb)
+    rows = []
+    for y in range(new_height):
+        source = min(height - 1, y * height // new_height) * width * 3
+        row = view[source : source + width * 3]
+        rows.append(b"".join(row[x * 3 : x * 3 + 3] for x in columns))
+    return b"".join(rows)
+
+
+def _fit(width: int, height: int, size: tuple[int, int]) -> tuple[int, int]:
+    scale = min(size[0] / width, size[1] / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def process_still(
+    source: str,
+    destination: str,
+    convert_to: Optional[str] = None,
+    thumbnail: str = "",
+    thumbnail_size: tuple[int, int] = (256, 256),
+) -> tuple[str, str, str]:
+    """
+    Moves or converts one exported still, then writes its thumbnail and checksum.
+
+    Runs in a worker process. PPM sources and PNG outputs are handled with the standard
+    library, anything else with Pillow.
+
+    Parameters
+    ----------
+    source
+        File written by ``ExportStills``, removed once processed.
+    destination
+        Output file, its extension giving the output format when `convert_to` is set.
+    convert_to
+        Output format, e.g. "png" or "jpg". None keeps the exported file as is.
+    thumbnail
+        Thumbnail file to write, always a PNG. "" for none.
+    thumbnail_size
+        Bounding box of the thumbnail; the aspect ratio is kept.
+
+    Returns
+    -------
+    tuple[str, str, str]
+        (destination, thumbnail, SHA-256 of destination).
+
+    Raises
+    ------
+    ImportError
+        If Pillow is needed and not installed.
+
+    """
+    source_format = os.path.splitext(source)[1][1:].lower()
+    pixels: Optional[tuple[int, int, bytes]] = None
+
+    def decoded() -> tuple[int, int, bytes]:
+        nonlocal pixels
+        if pixels is None:
+            if source_format == "ppm":
+                pixels = read_ppm(source)
+            else:
+                image = _require_pil().open(source).convert("RGB")
+                pixels = (image.width, image.height, image.tobytes())
+        return pixels
+
+    if convert_to is None or convert_to.lower() == source_format:
+        if thumbnail:
+            decoded()
+        shutil.move(source, destination)
+    else:
+        width, height, rgb = decoded()
+        if convert_to.lower() == "png":
+            write_png(destination, width, height, rgb)
+        elif convert_to.lower() == "ppm":
+            with open(destination, "wb") as file:
+                file.write(b"P6\n%d %d\n255\n" % (width, height) + rgb)
+        else:
+            _require_pil().frombytes("RGB", (width, height), rgb).save(destination)
+        os.remove(source)
+
+    if thumbnail:
+        width, height, rgb = decoded()
+        new_width, new_height = _fit(width, height, thumbnail_size)
+        write_png(
+            thumbnail,
+            new_width,
+            new_height,
+            resize_nearest(rgb, width, height, new_width, new_height),
+        )
+    return destination, thumbnail, sha256_file(destination)
+
+
+def _require_pil():
+    image = _pil()
+    if image is None:
+        raise ImportError("Pillow is required to read or write this image format")
+    return image
+
+
+def _safe_name(label: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", label).strip("._") or "still"
+
+
+def match_exports(
+    folder: Union[str, os.PathLike], labels: list[str], prefix: str = ""
+) -> dict[int, str]:
+    """
+    Maps the files ``ExportStills`` wrote to `folder` back to the stills, by finding
+    each still's label in the file names.
+
+    Parameters
+    ----------
+    folder
+        Folder holding the export of one chunk only.
+    labels
+        Labels of the exported stills, in export order.
+    prefix
+        File prefix given to ``ExportStills``.
+
+    Returns
+    -------
+    dict[int, str]
+        Index in `labels` -> exported file. ``.drx`` grade files are ignored.
+
+    """
+    files = sorted(
+        name
+        for name in os.listdir(folder)
+        if not name.lower().endswith(".drx")
+        and os.path.isfile(os.path.join(folder, name))
+    )
+    stems = {os.path.splitext(name)[0]: name for name in files}
+    matched: dict[int, str] = {}
+    taken: set[str] = set()
+    # Exact names first, then any name ending with the label, longest labels first
+    # so that "11.1.1" is not claimed by "1.1.1".
+    for index, label in enumerate(labels):
+        name = stems.get(f"{prefix}_{label}" if prefix else label)
+        if label and name is not None and name not in taken:
+            matched[index] = os.path.join(folder, name)
+            taken.add(name)
+    for index in sorted(range(len(labels)), key=lambda i: -len(labels[i])):
+        label = labels[index]
+        if index in matched or not label:
+            continue
+        for stem, name in stems.items():
+            if name not in taken and stem.endswith(label):
+                matched[index] = os.path.join(folder, name)
+                taken.add(name)
+                break
+    # A single still and a single file need no label.
+    if not matched and len(labels) == 1 and len(files) == 1:
+        matched[0] = os.path.join(folder, files[0])
+    return matched
+
+
+class StillExporter:
+    """
+    Exports gallery stills in chunks and post-processes them on a process pool.
+
+    Parameters
+    ----------
+    album
+        Album to export from.
+    output_folder
+        Folder receiving the final files, created if needed. Files are named after the
+        still labels.
+    export_format
+        Format passed to ``ExportStills``, one of :data:`FORMATS`.
+    convert_to
+        Format of the final files, None to keep the exported ones.
+    thumbnail_size
+        Bounding box of PNG thumbnails written next to the final files as
+        ``<name>.thumb.png``. None for no thumbnails.
+    chunk_size
+        Stills per ``ExportStills`` call.
+    prefix
+        File prefix passed to ``ExportStills``.
+    scratch_folder
+        Parent of the temporary export folders, which Resolve must be able to write
+        to. Defaults to the system temporary folder.
+    executor
+        Executor running :func:`process_still`. Defaults to a
+        ``ProcessPoolExecutor`` with `workers` processes, shut down after each run.
+    workers
+        Number of processes of the default executor.
+
+    """
+
+    def __init__(
+        self,
+        album: GalleryStillAlbum,
+        output_folder: Union[str, os.PathLike],
+        export_format: str = "ppm",
+        convert_to: Optional[str] = "png",
+        thumbnail_size: Optional[tuple[int, int]] = None,
+        chunk_size: int = 16,
+        prefix: str = "",
+        scratch_folder: Optional[Union[str, os.PathLike]] = None,
+        executor: Optional[Executor] = None,
+        workers: Optional[int] = None,
+    ):
+        if export_format.lower() not in FORMATS:
+            raise ValueError(f"Unsupported still format: {export_format!r}")
+        self.album = album
+        self.output_folder = os.path.abspath(os.fspath(output_folder))
+        self.export_format = export_format.lower()
+        self.convert_to = convert_to.lower() if convert_to else None
+        self.thumbnail_size = thumbnail_size
+        self.chunk_size = max(1, chunk_size)
+        self.prefix = prefix
+        self.scratch_folder = scratch_folder
+        self.executor = executor
+        self.workers = workers
+
+    def _destination(self, label: str, used: set[str]) -> tuple[str, str]:
+        name = _safe_name(label)
+        candidate, number = name, 1
+        while candidate in used:
+            number += 1
+            candidate = f"{name}_{number}"
+        used.add(candidate)
+        extension = self.convert_to or self.export_format
+        destination = os.path.join(self.output_folder, f"{candidate}.{extension}")
+        thumbnail = ""
+        if self.thumbnail_size is not None:
+            thumbnail = os.path.join(self.output_folder, f"{candidate}.thumb.png")
+        return destination, thumbnail
+
+    def iter_results(
+        self, stills: Optional[Iterable[GalleryStill]] = None
+    ) -> Iterator[ExportedStill]:
+        """
+        Exports `stills`, all stills of the album by default, and yields each result as
+        its processing completes, in completion order.
+
+        Stills that Resolve did not export, or whose file could not be matched to them,
+        are yielded with an error.
+
+        """
+        album = self.album
+        stills = list(stills) if stills is not None else album.GetStills() or []
+        labels = [album.GetLabel(still) or "" for still in stills]
+        os.makedirs(self.output_folder, exist_ok=True)
+        used: set[str] = set()
+        pending: dict[Future, tuple[GalleryStill, str]] = {}
+        failures: list[ExportedStill] = []
+        # The executor must be done with the scratch files before the folder goes,
+        # so it is stopped inside the with block.
+        with tempfile.TemporaryDirectory(
+            prefix="dri-stills-", dir=self.scratch_folder
+        ) as scratch:
+            executor = self.executor
+            owned = executor is None
+            if owned:
+                executor = ProcessPoolExecutor(self.workers)
+            try:
+                for first in range(0, len(stills), self.chunk_size):
+                    chunk = stills[first : first + self.chunk_size]
+                    chunk_labels = labels[first : first + self.chunk_size]
+                    folder = os.path.join(scratch, f"{first:08d}")
+                    os.mkdir(folder)
+                    album.ExportStills(chunk, folder, self.prefix, self.export_format)
+                    files = match_exports(folder, chunk_labels, self.prefix)
+                    for index, (still, label) in enumerate(zip(chunk, chunk_labels)):
+                        source = files.get(index)
+                        if source is None:
+                            failures.append(
+                                ExportedStill(still, label, "", error="not exported")
+                            )
+                            continue
+                        destination, thumbnail = self._destination(label, used)
+                        future = executor.submit(
+                            process_still,
+                            source,
+                            destination,
+                            self.convert_to,
+                            thumbnail,
+                            self.thumbnail_size or (0, 0),
+                        )
+                        pending[future] = (still, label)
+                    # Yield what finished while this chunk was exported.
+                    yield from failures
+                    failures.clear()
+                    for future in [future for future in pending if future.done()]:
+                        yield self._result(future, *pending.pop(future))
+                for future in as_completed(list(pending)):
+                    yield self._result(future, *pending.pop(future))
+            finally:
+                if owned:
+                    executor.shutdown(cancel_futures=True)
+                else:
+                    # Leave a shared executor running, only drop this export's work.
+                    for future in pending:
+                        future.cancel()
+                    wait(pending)
+
+    @staticmethod
+    def _result(future: Future, still: GalleryStill, label: str) -> ExportedStill:
+        try:
+            path, thumbnail, digest = future.result()
+        except Exception as error:
+            return ExportedStill(
+                still, label, "", error=f"{type(error).__name__}: {error}"
+            )
+        return ExportedStill(still, label, path, thumbnail, digest)
+
+    def run(
+        self, stills: Optional[Iterable[GalleryStill]] = None
+    ) -> list[ExportedStill]:
+        """
+        Exports and processes `stills`, all stills of the album by default, and returns
+        the results in still order.
+
+        """
+        if stills is None:
+            stills = self.album.GetStills() or []
+        stills = list(stills)
+        results = list(self.iter_results(stills))
+        # Every result carries one of `stills`, so each has a position.
+        order = {id(still): index for index, still in enumerate(stills)}
+        return sorted(results, key=lambda result: order[id(result.still)])
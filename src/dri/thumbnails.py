@@ -0,0 +1,399 @@
+"""
+Thumbnail decoding and memory-mapped contact sheets.
+
+``Timeline.GetCurrentClipThumbnailImage()`` returns RGB8 pixels as a base64 string.
+:func:`decode_thumbnail` decodes them with a single ``binascii.a2b_base64`` call and
+returns a ``(height, width, 3)`` memoryview over the decoded bytes;
+:func:`thumbnail_array` wraps the same bytes in a NumPy array without copying.
+
+:func:`harvest_thumbnails` steps the playhead across a timeline with
+``SetCurrentTimecode`` and decodes the thumbnail at each frame. :func:`write_contact_sheet`
+places them in a :class:`ContactSheet`, a grid stored as a binary PPM image that is
+written through ``mmap``, so each thumbnail is copied once, straight into the file.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.thumbnails import ContactSheet, write_contact_sheet
+...
+>>> resolve = Resolve.resolve_init()
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> frames = write_contact_sheet(timeline, "/tmp/reel1.ppm", resolve=resolve)
+>>> len(frames)
+412
+>>> with ContactSheet.open("/tmp/reel1.ppm") as sheet:
+...     sheet.tile(0).shape
+(180, 320, 3)
+
+"""
+
+from __future__ import annotations
+
+import binascii
+import importlib
+import math
+import mmap
+import os
+import re
+from typing import NamedTuple
+
+from dri.timecode import frames_to_timecodes, parse_drop_frame, parse_fps
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator, Optional, Union
+
+    from dri._types import ThumbnailData
+    from dri.resolve import Resolve
+    from dri.timeline import Timeline
+
+_HEADER = re.compile(
+    rb"P6\n# dri-contact-sheet tile=(\d+)x(\d+) columns=(\d+) count=(\d+)\n"
+    rb"(\d+) (\d+)\n255\n"
+)
+
+
+def _field(thumbnail: Union[ThumbnailData, dict], key: str):
+    if isinstance(thumbnail, dict):
+        return thumbnail[key]
+    return getattr(thumbnail, key)
+
+
+def decode_thumbnail(thumbnail: Union[ThumbnailData, dict]) -> memoryview:
+    """
+    Decodes the result of ``GetCurrentClipThumbnailImage()``.
+
+    Returns
+    -------
+    memoryview
+        Read-only ``(height, width, 3)`` view of the RGB8 pixels.
+
+    Raises
+    ------
+    ValueError
+        If the data is not valid base64 or does not hold width * height RGB8 pixels.
+
+    """
+    width = int(_field(thumbnail, "width"))
+    height = int(_field(thumbnail, "height"))
+    try:
+        # a2b_base64 accepts the ASCII str as is, without an encode() copy.
+        raw = binascii.a2b_base64(_field(thumbnail, "data"))
+    except binascii.Error as error:
+        raise ValueError(f"Invalid thumbnail data: {error}") from None
+    if len(raw) != width * height * 3:
+        raise ValueError(
+            f"Thumbnail data holds {len(raw)} bytes, expected {width}x{height} RGB8"
+        )
+    return memoryview(raw).cast("B", (height, width, 3))
+
+
+def thumbnail_array(thumbnail: Union[ThumbnailData, dict, memoryview]):
+    """
+    Returns the pixels of a thumbnail as a read-only ``(height, width, 3)`` uint8
+    NumPy array sharing the decoded bytes.
+
+    Raises
+    ------
+    ImportError
+        If NumPy is not installed.
+
+    """
+    np = importlib.import_module("numpy")
+    pixels = (
+        thumbnail if isinstance(thumbnail, memoryview) else decode_thumbnail(thumbnail)
+    )
+    return np.frombuffer(pixels, dtype=np.uint8).reshape(pixels.shape)
+
+
+class Thumbnail(NamedTuple):
+    """
+    Thumbnail of a timeline frame.
+
+    """
+
+    frame: int
+    pixels: memoryview
+
+    @property
+    def width(self) -> int:
+        return self.pixels.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.pixels.shape[0]
+
+    def to_numpy(self):
+        """
+        See :func:`thumbnail_array`.
+
+        """
+        return thumbnail_array(self.pixels)
+
+
+def timeline_frames(timeline: Timeline, count: Optional[int] = None) -> list[int]:
+    """
+    Returns frames to sample: `count` frames evenly spread over the timeline, or the
+    middle frame of every item on video track 1.
+
+    """
+    if count is not None:
+        start, end = timeline.GetStartFrame(), timeline.GetEndFrame()
+        if count <= 0 or end <= start:
+            return []
+        step = (end - start) / count
+        return [start + int(step * index + step / 2) for index in range(count)]
+    return [
+        (item.GetStart() + item.GetEnd()) // 2
+        for item in timeline.GetItemListInTrack("video", 1) or []
+    ]
+
+
+def harvest_thumbnails(
+    timeline: Timeline,
+    frames: Optional[Iterable[int]] = None,
+    count: Optional[int] = None,
+    resolve: Optional[Resolve] = None,
+) -> Iterator[Thumbnail]:
+    """
+    Moves the playhead to each frame and yields its decoded thumbnail.
+
+    Frames without a video item, or whose timecode Resolve rejects, are skipped. The
+    playhead, and the page if `resolve` is given, are restored when the iteration ends.
+
+    Parameters
+    ----------
+    timeline
+        Timeline to sample. It must be the current timeline.
+    frames
+        Timeline frames to sample. Defaults to :func:`timeline_frames`.
+    count
+        Number of evenly spread frames to sample when `frames` is not given.
+    resolve
+        If given, the Color page, where thumbnails are available, is opened first.
+
+    """
+    frames = list(frames) if frames is not None else timeline_frames(timeline, count)
+    fps = parse_fps(timeline.GetSetting("timelineFrameRate") or 24)
+    drop_frame = parse_drop_frame(
+        timeline.GetSetting("timelineDropFrameTimecode") or "0"
+    )
+    timecodes = frames_to_timecodes(frames, fps, drop_frame)
+    page = resolve.GetCurrentPage() if resolve is not None else None
+    playhead = timeline.GetCurrentTimecode()
+    if resolve is not None and page != "color":
+        resolve.OpenPage("color")
+    try:
+        for frame, timecode in zip(frames, timecodes):
+            if not timeline.SetCurrentTimecode(str(timecode)):
+                continue
+            thumbnail = timeline.GetCurrentClipThumbnailImage()
+            if thumbnail:
+                yield Thumbnail(frame, decode_thumbnail(thumbnail))
+    finally:
+        if playhead:
+            timeline.SetCurrentTimecode(playhead)
+        if resolve is not None and page and page != "color":
+            resolve.OpenPage(page)
+
+
+class ContactSheet:
+    """
+    Grid of equally sized thumbnails in a memory-mapped binary PPM file.
+
+    The file is a regular P6 image that any viewer opens; a comment line in its
+    header records the tile size, column count and number of tiles. Thumbnails larger
+    than a tile are cropped, smaller ones leave the rest of their tile black.
+
+    Parameters
+    ----------
+    path
+        File to create, overwritten if it exists.
+    count
+        Number of tiles.
+    tile_width, tile_height
+        Size of a tile in pixels.
+    columns
+        Number of tiles per row.
+
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        count: int,
+        tile_width: int,
+        tile_height: int,
+        columns: int = 10,
+    ):
+        columns = max(1, min(columns, count))
+        rows = math.ceil(count / columns)
+        header = (
+            f"P6\n# dri-contact-sheet tile={tile_width}x{tile_height} "
+            f"columns={columns} count={count}\n"
+            f"{columns * tile_width} {rows * tile_height}\n255\n"
+        ).encode("ascii")
+        with open(path, "wb") as file:
+            file.write(header)
+            file.truncate(len(header) + rows * tile_height * columns * tile_width * 3)
+        self._open(path, len(header), count, tile_width, tile_height, columns, rows)
+
+    def _open(self, path, offset, count, tile_width, tile_height, columns, rows):
+        self.path = os.fspath(path)
+        self.count = count
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.columns = columns
+        self.rows = rows
+        self.width = columns * tile_width
+        self.height = rows * tile_height
+        self._offset = offset
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> ContactSheet:
+        """
+        Maps an existing contact sheet.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a contact sheet written by this class.
+
+        """
+        with open(path, "rb") as file:
+            match = _HEADER.match(file.read(256))
+        if match is None:
+            raise ValueError(f"Not a contact sheet: {path}")
+        tile_width, tile_height, columns, count, width, height = map(
+            int, match.groups()
+        )
+        sheet = cls.__new__(cls)
+        sheet._open(
+            path,
+            match.end(),
+            count,
+            tile_width,
+            tile_height,
+            columns,
+            height // tile_height,
+        )
+        return sheet
+
+    def __enter__(self) -> ContactSheet:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"<ContactSheet {self.path!r}: {self.count} tiles of "
+            f"{self.tile_width}x{self.tile_height}>"
+        )
+
+    def _tile_origin(self, index: int) -> int:
+        if not 0 <= index < self.count:
+            raise IndexError(f"Tile {index} out of range 0..{self.count - 1}")
+        row, column = divmod(index, self.columns)
+        return (row * self.tile_height * self.width + column * self.tile_width) * 3
+
+    def put(self, index: int, pixels: memoryview) -> None:
+        """
+        Copies a ``(height, width, 3)`` thumbnail into tile `index`, row by row.
+
+        """
+        height, width = pixels.shape[0], pixels.shape[1]
+        source = pixels.cast("B")
+        row_bytes = min(width, self.tile_width) * 3
+        stride = self.width * 3
+        position = self._offset + self._tile_origin(index)
+        mapped = self._map
+        for y in range(min(height, self.tile_height)):
+            start = y * width * 3
+            mapped[position : position + row_bytes] = source[start : start + row_bytes]
+            position += stride
+
+    def tile(self, index: int):
+        """
+        Returns tile `index` as a ``(tile_height, tile_width, 3)`` NumPy view of the
+        file.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        """
+        row, column = divmod(index, self.columns)
+        self._tile_origin(index)
+        y, x = row * self.tile_height, column * self.tile_width
+        return self.to_numpy()[y : y + self.tile_height, x : x + self.tile_width]
+
+    def to_numpy(self):
+        """
+        Returns the whole sheet as a ``(height, width, 3)`` uint8 NumPy view of the
+        file. Writes to it go to the file.
+
+        Raises
+        ------
+        ImportError
+            If NumPy is not installed.
+
+        """
+        np = importlib.import_module("numpy")
+        return np.frombuffer(
+            self._map, np.uint8, self.height * self.width * 3, self._offset
+        ).reshape(self.height, self.width, 3)
+
+    def flush(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        """
+        Flushes and unmaps the file. NumPy views returned earlier must be released
+        first.
+
+        """
+        if self._map.closed:
+            return
+        self._map.flush()
+        self._map.close()
+        self._file.close()
+
+
+def write_contact_sheet(
+    timeline: Timeline,
+    path: Union[str, os.PathLike],
+    frames: Optional[Iterable[int]] = None,
+    count: Optional[int] = None,
+    columns: int = 10,
+    resolve: Optional[Resolve] = None,
+) -> list[int]:
+    """
+    Harvests thumbnails with :func:`harvest_thumbnails` into a :class:`ContactSheet`
+    at `path`, tiles sized after the first thumbnail.
+
+    Returns
+    -------
+    list[int]
+        Frame of each tile, in tile order. Frames that yielded no thumbnail are left
+        out, the sheet keeps room for them at its end.
+
+    """
+    frames = list(frames) if frames is not None else timeline_frames(timeline, count)
+    placed: list[int] = []
+    sheet: Optional[ContactSheet] = None
+    try:
+        for thumbnail in harvest_thumbnails(timeline, frames, resolve=resolve):
+            if sheet is None:
+                sheet = ContactSheet(
+                    path, len(frames), thumbnail.width, thumbnail.height, columns
+                )
+            sheet.put(len(placed), thumbnail.pixels)
+            placed.append(thumbnail.frame)
+    finally:
+        if sheet is not None:
+            sheet.close()
+    return placed
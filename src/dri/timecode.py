@@ -0,0 +1,382 @@
+"""
+SMPTE timecode and frame arithmetic.
+
+Scalar functions convert one value at a time in pure Python. The batched functions
+:func:`frames_to_timecodes` and :func:`timecodes_to_frames` convert whole arrays with
+NumPy, treating timecodes as fixed-width ``HH:MM:SS:FF`` byte strings so that no Python
+code runs per element. NumPy is optional: without it the batched functions fall back to
+the scalar path and return lists.
+
+Drop-frame timecode is supported for every rate whose nominal rate is a multiple of 30
+(29.97, 59.94, 119.88): frame numbers 0 and 1 (0-3 at 59.94, 0-7 at 119.88) are skipped
+at the start of every minute except every tenth minute. Drop-frame timecodes use ``;``
+before the frame field.
+
+Examples
+--------
+>>> from dri.timecode import (
+...     frames_to_timecode,
+...     timecode_to_frames,
+...     timecodes_to_frames,
+... )
+...
+>>> timecode_to_frames("01:00:00:00", 24)
+86400
+>>> frames_to_timecode(107892, 29.97, drop_frame=True)
+'01:00:00;00'
+>>> timecodes_to_frames(["00:00:01:00", "00:10:00;00"], 29.97)
+array([   30, 17982])
+
+"""
+
+from __future__ import annotations
+
+import importlib
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterable, Optional, Union
+
+_SEPARATORS = ":;.,"
+
+
+def _numpy():
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def parse_fps(fps: Union[float, int, str]) -> float:
+    """
+    Returns a frame rate as a float, accepting the strings Resolve uses, e.g. the
+    "FPS" clip property or the "timelineFrameRate" setting ("23.976", "29.97 DF").
+
+    Raises
+    ------
+    ValueError
+        If `fps` is not a positive number.
+
+    """
+    if isinstance(fps, str):
+        fps = fps.split()[0] if fps.strip() else ""
+    try:
+        value = float(fps)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid frame rate: {fps!r}") from None
+    if value <= 0:
+        raise ValueError(f"Invalid frame rate: {fps!r}")
+    return value
+
+
+def parse_drop_frame(value: Union[bool, int, str]) -> bool:
+    """
+    Returns True for the truthy values of the "Drop frame" clip property and the
+    "timelineDropFrameTimecode" setting ("1", 1, True, "true").
+
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "df")
+    return bool(value)
+
+
+def nominal_fps(fps: Union[float, int, str]) -> int:
+    """
+    Returns the integer frame count per timecode second, e.g. 24 for 23.976 and 30 for
+    29.97.
+
+    """
+    return int(round(parse_fps(fps)))
+
+
+def dropped_frames(fps: Union[float, int, str]) -> int:
+    """
+    Returns the number of frame numbers skipped per minute in drop-frame timecode.
+
+    Raises
+    ------
+    ValueError
+        If the rate has no drop-frame timecode.
+
+    """
+    nominal = nominal_fps(fps)
+    if nominal % 30:
+        raise ValueError(f"Drop-frame timecode is not defined for {fps} fps")
+    return nominal // 15
+
+
+def frames_to_timecode(
+    frames: int, fps: Union[float, int, str], drop_frame: bool = False
+) -> str:
+    """
+    Converts a frame count to a timecode string.
+
+    Parameters
+    ----------
+    frames
+        Frame number, counted from 00:00:00:00.
+    fps
+        Frame rate.
+    drop_frame
+        Whether to produce drop-frame timecode.
+
+    Returns
+    -------
+    str
+        Timecode, e.g. "01:00:00:00" or "01:00:00;00" for drop frame.
+
+    Raises
+    ------
+    ValueError
+        If `frames` is negative or the rate has no drop-frame timecode.
+
+    """
+    if frames < 0:
+        raise ValueError(f"Frame number must not be negative: {frames}")
+    nominal = nominal_fps(fps)
+    separator = ":"
+    if drop_frame:
+        dropped = dropped_frames(fps)
+        per_10_minutes = nominal * 600 - dropped * 9
+        per_minute = nominal * 60 - dropped
+        tens, rest = divmod(frames, per_10_minutes)
+        frames += dropped * 9 * tens
+        if rest > dropped:
+            frames += dropped * ((rest - dropped) // per_minute)
+        separator = ";"
+    seconds, frame = divmod(frames, nominal)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return f"{hour:02d}:{minute:02d}:{second:02d}{separator}{frame:02d}"
+
+
+def split_timecode(timecode: str) -> tuple[int, int, int, int, bool]:
+    """
+    Splits a timecode into (hours, minutes, seconds, frames, is_drop_frame).
+
+    `is_drop_frame` is True when the frame field is separated by ";".
+
+    Raises
+    ------
+    ValueError
+        If `timecode` is not of the form HH:MM:SS:FF.
+
+    """
+    text = timecode.strip()
+    fields = []
+    start = 0
+    separator = ""
+    for position, char in enumerate(text):
+        if char in _SEPARATORS:
+            fields.append(text[start:position])
+            separator = char
+            start = position + 1
+    fields.append(text[start:])
+    if len(fields) != 4 or not all(field.isdigit() for field in fields):
+        raise ValueError(f"Invalid timecode: {timecode!r}")
+    hours, minutes, seconds, frames = (int(field) for field in fields)
+    return hours, minutes, seconds, frames, separator == ";"
+
+
+def timecode_to_frames(
+    timecode: str,
+    fps: Union[float, int, str],
+    drop_frame: Optional[bool] = None,
+) -> int:
+    """
+    Converts a timecode string to a frame count.
+
+    Parameters
+    ----------
+    timecode
+        Timecode, e.g. "01:00:00:00". Fields may be separated by ":", ";", "." or ",".
+    fps
+        Frame rate.
+    drop_frame
+        Whether `timecode` is drop frame. If None, a ";" before the frame field means
+        drop frame.
+
+    Returns
+    -------
+    int
+        Frame number, counted from 00:00:00:00.
+
+    Raises
+    ------
+    ValueError
+        If `timecode` is malformed, has out-of-range fields, or names a frame that
+        drop-frame timecode skips.
+
+    """
+    hours, minutes, seconds, frames, is_drop_frame = split_timecode(timecode)
+    if drop_frame is None:
+        drop_frame = is_drop_frame
+    nominal = nominal_fps(fps)
+    if minutes >= 60 or seconds >= 60 or frames >= nominal:
+        raise ValueError(f"Timecode out of range for {fps} fps: {timecode!r}")
+    total_minutes = hours * 60 + minutes
+    total = (total_minutes * 60 + seconds) * nominal + frames
+    if drop_frame:
+        dropped = dropped_frames(fps)
+        if seconds == 0 and frames < dropped and minutes % 10:
+            raise ValueError(f"Timecode does not exist in drop frame: {timecode!r}")
+        total -= dropped * (total_minutes - total_minutes // 10)
+    return total
+
+
+def frames_to_seconds(frames: int, fps: Union[float, int, str]) -> float:
+    """
+    Returns the real-time duration of `frames` at `fps`, e.g. 23.976 fps runs 0.1%
+    slower than its timecode.
+
+    """
+    return frames / parse_fps(fps)
+
+
+def frames_to_timecodes(
+    frames: Iterable[int], fps: Union[float, int, str], drop_frame: bool = False
+):
+    """
+    Batched :func:`frames_to_timecode`.
+
+    Parameters
+    ----------
+    frames
+        Sequence or integer array of frame numbers.
+    fps
+        Frame rate.
+    drop_frame
+        Whether to produce drop-frame timecode.
+
+    Returns
+    -------
+    numpy.ndarray or list[str]
+        Array of ``<U11`` timecodes (wider above 100 fps, whose frame field has three
+        digits), or a list if NumPy is not installed.
+
+    Raises
+    ------
+    ValueError
+        If a frame number is negative or 100 hours or more.
+
+    """
+    np = _numpy()
+    if np is None:
+        return [frames_to_timecode(frame, fps, drop_frame) for frame in frames]
+
+    nominal = nominal_fps(fps)
+    if nominal > 100:
+        # Three-digit frame fields do not fit the fixed-width layout below.
+        return np.array(
+            [frames_to_timecode(int(frame), fps, drop_frame) for frame in frames]
+        )
+    values = np.asarray(frames, dtype=np.int64)
+    if values.size and values.min() < 0:
+        raise ValueError("Frame numbers must not be negative")
+    if drop_frame:
+        dropped = dropped_frames(fps)
+        per_10_minutes = nominal * 600 - dropped * 9
+        per_minute = nominal * 60 - dropped
+        tens, rest = np.divmod(values, per_10_minutes)
+        values = values + dropped * 9 * tens
+        values += np.where(
+            rest > dropped, dropped * ((rest - dropped) // per_minute), 0
+        )
+    seconds, frame = np.divmod(values, nominal)
+    minutes, second = np.divmod(seconds, 60)
+    hour, minute = np.divmod(minutes, 60)
+    if values.size and hour.max() > 99:
+        raise ValueError("Timecodes of 100 hours or more are not supported")
+
+    # Assemble "HH:MM:SS:FF" as an (n, 11) byte matrix and view it as strings.
+    out = np.empty(values.shape + (11,), dtype=np.uint8)
+    for column, field in ((0, hour), (3, minute), (6, second), (9, frame)):
+        out[..., column] = field // 10 + 48
+        out[..., column + 1] = field % 10 + 48
+    out[..., 2] = out[..., 5] = ord(":")
+    out[..., 8] = ord(";" if drop_frame else ":")
+    return out.view("S11")[..., 0].astype("U11")
+
+
+def timecodes_to_frames(
+    timecodes: Iterable[str],
+    fps: Union[float, int, str],
+    drop_frame: Optional[bool] = None,
+):
+    """
+    Batched :func:`timecode_to_frames`.
+
+    Parameters
+    ----------
+    timecodes
+        Sequence or string array of 11-character timecodes ("HH:MM:SS:FF"), with a
+        three-digit frame field above 100 fps.
+    fps
+        Frame rate.
+    drop_frame
+        Whether the timecodes are drop frame. If None, decided per timecode by a ";"
+        before the frame field.
+
+    Returns
+    -------
+    numpy.ndarray or list[int]
+        Array of int64 frame numbers, or a list if NumPy is not installed.
+
+    Raises
+    ------
+    ValueError
+        If a timecode is malformed or out of range. The message names the first
+        offending index.
+
+    """
+    np = _numpy()
+    if np is None:
+        return [timecode_to_frames(timecode, fps, drop_frame) for timecode in timecodes]
+
+    nominal = nominal_fps(fps)
+    if nominal > 100:
+        return np.array(
+            [
+                timecode_to_frames(str(timecode), fps, drop_frame)
+                for timecode in timecodes
+            ],
+            dtype=np.int64,
+        )
+    # One byte wider than a timecode, so that longer strings show up as non-NUL there.
+    raw = np.asarray(timecodes).astype("S12")
+    chars = raw.view(np.uint8).reshape(raw.shape + (12,))
+    digits = chars[..., [0, 1, 3, 4, 6, 7, 9, 10]].astype(np.int64) - 48
+    separators = chars[..., [2, 5, 8]]
+    separator_ok = np.zeros(separators.shape, dtype=bool)
+    for char in _SEPARATORS.encode():
+        separator_ok |= separators == char
+    valid = (
+        (chars[..., 11] == 0)
+        & ((digits >= 0) & (digits <= 9)).all(axis=-1)
+        & separator_ok.all(axis=-1)
+    )
+    hours = digits[..., 0] * 10 + digits[..., 1]
+    minutes = digits[..., 2] * 10 + digits[..., 3]
+    seconds = digits[..., 4] * 10 + digits[..., 5]
+    frames = digits[..., 6] * 10 + digits[..., 7]
+    valid &= (minutes < 60) & (seconds < 60) & (frames < nominal)
+
+    total_minutes = hours * 60 + minutes
+    total = (total_minutes * 60 + seconds) * nominal + frames
+    if drop_frame is None:
+        is_drop = separators[..., 2] == ord(";")
+    else:
+        is_drop = np.full(total.shape, bool(drop_frame))
+    if is_drop.any():
+        dropped = dropped_frames(fps)
+        skipped = (seconds == 0) & (frames < dropped) & (minutes % 10 != 0)
+        valid &= ~(is_drop & skipped)
+        total -= np.where(is_drop, dropped * (total_minutes - total_minutes // 10), 0)
+
+    if not valid.all():
+        bad = np.argwhere(~valid)[0]
+        index = tuple(int(i) for i in bad) if len(bad) > 1 else int(bad[0])
+        raise ValueError(
+            f"Invalid timecode at index {index}: {raw[tuple(bad)].decode(errors='replace')!r}"
+        )
+    return total
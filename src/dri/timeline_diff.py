@@ -0,0 +1,386 @@
+"""
+Edit-decision diff between two timelines.
+
+:func:`diff_snapshots` compares two :class:`~dri.snapshot.TimelineSnapshot` item by item
+and reports what an editor would call the change list: clips inserted, removed, trimmed
+(source in or out changed) and moved (same source range at another record position or
+track), plus items whose markers or properties changed in place.
+
+Items are matched in three passes, each a hash join or a sorted sweep rather than a
+pairwise comparison, so two 5,000-event timelines diff in well under a second once
+snapshotted:
+
+1.  Same source clip, source range, track and record in: unchanged.
+2.  Same source clip and source range, in record order: moved.
+3.  Same source clip and track type with overlapping source ranges, swept in source
+    order: trimmed.
+
+What remains is removed from the old timeline or inserted into the new one.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.timeline_diff import diff_timelines
+...
+>>> resolve = Resolve.resolve_init()
+>>> project = resolve.GetProjectManager().GetCurrentProject()
+>>> old = project.GetTimelineByIndex(1)
+>>> new = project.GetMediaPool().ImportTimelineFromFile("/edit/reel1_v2.edl")
+>>> delta = diff_timelines(old, new)
+>>> delta.counts()
+Counter({'moved': 212, 'trimmed': 18, 'inserted': 4, 'removed': 3})
+>>> change = delta.trimmed[0]
+>>> change.old.name, change.fields
+('A001C003_220101_R1AB.mov', ('source_out', 'record_out'))
+
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import NamedTuple
+
+from dri.snapshot import TRACK_TYPES, snapshot
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
+
+    from dri.snapshot import ItemRecord, TimelineSnapshot
+    from dri.timeline import Timeline
+
+KINDS = ("inserted", "removed", "trimmed", "moved", "modified")
+
+
+class Change(NamedTuple):
+    """
+    One entry of a :class:`TimelineDiff`.
+
+    Attributes
+    ----------
+    kind : str
+        One of :data:`KINDS`.
+    old : ItemRecord or None
+        Item in the old timeline, None if inserted.
+    new : ItemRecord or None
+        Item in the new timeline, None if removed.
+    fields : tuple[str, ...]
+        What differs between `old` and `new`: "source_in", "source_out", "record_in",
+        "record_out", "track", "markers" and the names of changed properties.
+
+    """
+
+    kind: str
+    old: Optional[ItemRecord]
+    new: Optional[ItemRecord]
+    fields: tuple[str, ...] = ()
+
+
+class TimelineDiff:
+    """
+    Changes between two timelines, ordered by record in: in the new timeline, or in
+    the old one for removed items.
+
+    """
+
+    __slots__ = ("changes", "new", "old")
+
+    def __init__(
+        self, old: TimelineSnapshot, new: TimelineSnapshot, changes: list[Change]
+    ):
+        self.old = old
+        self.new = new
+        self.changes = changes
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[Change]:
+        return iter(self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{kind}={count}" for kind, count in self.counts().items())
+        return f"<TimelineDiff {self.old.name!r} -> {self.new.name!r}: {counts}>"
+
+    def _of_kind(self, kind: str) -> list[Change]:
+        return [change for change in self.changes if change.kind == kind]
+
+    @property
+    def inserted(self) -> list[Change]:
+        return self._of_kind("inserted")
+
+    @property
+    def removed(self) -> list[Change]:
+        return self._of_kind("removed")
+
+    @property
+    def trimmed(self) -> list[Change]:
+        return self._of_kind("trimmed")
+
+    @property
+    def moved(self) -> list[Change]:
+        return self._of_kind("moved")
+
+    @property
+    def modified(self) -> list[Change]:
+        return self._of_kind("modified")
+
+    def counts(self) -> Counter:
+        """
+        Number of changes per kind.
+
+        """
+        return Counter(change.kind for change in self.changes)
+
+
+class _Event(NamedTuple):
+    # One snapshot row reduced to what the matching passes compare.
+    source: Hashable
+    source_in: int
+    source_out: int
+    track_type: str
+    track_index: int
+    start: int
+    end: int
+    row: int
+
+
+def _events(
+    snap: TimelineSnapshot, source_key: Callable[[ItemRecord], Hashable]
+) -> list[_Event]:
+    events = []
+    for record in snap:
+        source_in = record.left_offset
+        events.append(
+            _Event(
+                source_key(record),
+                source_in,
+                source_in + record.duration,
+                record.track_type,
+                record.track_index,
+                record.start,
+                record.end,
+                record.row,
+            )
+        )
+    return events
+
+
+def _source_name(record: ItemRecord) -> Hashable:
+    return record.name
+
+
+def _edit_fields(old: _Event, new: _Event) -> list[str]:
+    fields = []
+    if old.source_in != new.source_in:
+        fields.append("source_in")
+    if old.source_out != new.source_out:
+        fields.append("source_out")
+    if old.start != new.start:
+        fields.append("record_in")
+    if old.end != new.end:
+        fields.append("record_out")
+    if (old.track_type, old.track_index) != (new.track_type, new.track_index):
+        fields.append("track")
+    return fields
+
+
+def _match(
+    old_events: list[_Event],
+    new_events: list[_Event],
+    key: Callable[[_Event], Hashable],
+) -> list[tuple[_Event, _Event]]:
+    # Hash join on `key`; events sharing a key are paired in record order. Matched
+    # events are removed from both lists.
+    buckets: dict[Hashable, list[_Event]] = {}
+    for event in sorted(old_events, key=lambda event: event.start, reverse=True):
+        buckets.setdefault(key(event), []).append(event)
+    pairs = []
+    unmatched = []
+    for event in sorted(new_events, key=lambda event: event.start):
+        bucket = buckets.get(key(event))
+        if bucket:
+            pairs.append((bucket.pop(), event))
+        else:
+            unmatched.append(event)
+    old_events[:] = [event for bucket in buckets.values() for event in bucket]
+    new_events[:] = unmatched
+    return pairs
+
+
+def _sweep(
+    old_events: list[_Event], new_events: list[_Event]
+) -> list[tuple[_Event, _Event]]:
+    # Pairs events of the same source and track type whose source ranges overlap,
+    # walking both sides in source order. Matched events are removed from both lists.
+    groups: dict[Hashable, tuple[list[_Event], list[_Event]]] = {}
+    for event in old_events:
+        groups.setdefault((event.source, event.track_type), ([], []))[0].append(event)
+    for event in new_events:
+        groups.setdefault((event.source, event.track_type), ([], []))[1].append(event)
+
+    pairs = []
+    old_left: list[_Event] = []
+    new_left: list[_Event] = []
+    for olds, news in groups.values():
+        if not olds or not news:
+            old_left.extend(olds)
+            new_left.extend(news)
+            continue
+        olds.sort(key=lambda event: (event.source_in, event.start))
+        news.sort(key=lambda event: (event.source_in, event.start))
+        i = j = 0
+        while i < len(olds) and j < len(news):
+            old, new = olds[i], news[j]
+            if old.source_out <= new.source_in:
+                old_left.append(old)
+                i += 1
+            elif new.source_out <= old.source_in:
+                new_left.append(new)
+                j += 1
+            else:
+                pairs.append((old, new))
+                i += 1
+                j += 1
+        old_left.extend(olds[i:])
+        new_left.extend(news[j:])
+    old_events[:] = old_left
+    new_events[:] = new_left
+    return pairs
+
+
+def _marker_tuples(snap: TimelineSnapshot, row: int) -> list[tuple]:
+    return [marker[1:] for marker in snap.markers(row)]
+
+
+def diff_snapshots(
+    old: TimelineSnapshot,
+    new: TimelineSnapshot,
+    source_key: Callable[[ItemRecord], Hashable] = _source_name,
+    markers: bool = True,
+    properties: Iterable[str] = (),
+) -> TimelineDiff:
+    """
+    Compares two timeline snapshots.
+
+    Parameters
+    ----------
+    old, new
+        Snapshots of the timelines to compare.
+    source_key
+        Function mapping an item record to its source clip identity. Defaults to the
+        item name, which survives EDL and XML round trips; pass e.g.
+        ``lambda record: record.media_pool_item.GetMediaId()`` to tell apart different
+        clips with the same name.
+    markers
+        Whether to report matched items whose markers differ. The snapshots must have
+        been taken with markers.
+    properties
+        ``TimelineItem.GetProperty()`` keys to compare on matched items, e.g.
+        ``("ZoomX", "Pan", "CompositeMode")``. Costs one ``GetProperty()`` call per
+        matched item on each side.
+
+    Returns
+    -------
+    TimelineDiff
+        The changes.
+
+    """
+    properties = tuple(properties)
+    old_events = _events(old, source_key)
+    new_events = _events(new, source_key)
+
+    unchanged = _match(
+        old_events,
+        new_events,
+        lambda event: (
+            event.source,
+            event.source_in,
+            event.source_out,
+            event.track_type,
+            event.track_index,
+            event.start,
+        ),
+    )
+    moved = _match(
+        old_events,
+        new_events,
+        lambda event: (event.source, event.source_in, event.source_out),
+    )
+    trimmed = _sweep(old_events, new_events)
+
+    changes: list[tuple[tuple[int, int], Change]] = []
+
+    def record_change(kind: str, old_event: _Event, new_event: _Event) -> None:
+        fields = _edit_fields(old_event, new_event)
+        if markers and _marker_tuples(old, old_event.row) != _marker_tuples(
+            new, new_event.row
+        ):
+            fields.append("markers")
+        old_record = old.record(old_event.row)
+        new_record = new.record(new_event.row)
+        if properties:
+            fields.extend(_property_changes(old_record, new_record, properties))
+        if fields:
+            changes.append(
+                (
+                    (new_event.start, TRACK_TYPES.index(new_event.track_type)),
+                    Change(kind, old_record, new_record, tuple(fields)),
+                )
+            )
+
+    for old_event, new_event in unchanged:
+        record_change("modified", old_event, new_event)
+    for old_event, new_event in moved:
+        record_change("moved", old_event, new_event)
+    for old_event, new_event in trimmed:
+        record_change("trimmed", old_event, new_event)
+    for event in new_events:
+        changes.append(
+            (
+                (event.start, TRACK_TYPES.index(event.track_type)),
+                Change("inserted", None, new.record(event.row)),
+            )
+        )
+    for event in old_events:
+        changes.append(
+            (
+                (event.start, TRACK_TYPES.index(event.track_type)),
+                Change("removed", old.record(event.row), None),
+            )
+        )
+
+    changes.sort(key=lambda pair: pair[0])
+    return TimelineDiff(old, new, [change for _, change in changes])
+
+
+def _property_changes(
+    old: ItemRecord, new: ItemRecord, keys: tuple[str, ...]
+) -> list[str]:
+    old_values: dict[str, Any] = old.item.GetProperty() or {}
+    new_values: dict[str, Any] = new.item.GetProperty() or {}
+    return [key for key in keys if old_values.get(key) != new_values.get(key)]
+
+
+def diff_timelines(
+    old: Timeline,
+    new: Timeline,
+    source_key: Callable[[ItemRecord], Hashable] = _source_name,
+    markers: bool = True,
+    properties: Iterable[str] = (),
+    track_types: tuple[str, ...] = TRACK_TYPES,
+) -> TimelineDiff:
+    """
+    Snapshots two timelines and compares them, see :func:`diff_snapshots`.
+
+    """
+    return diff_snapshots(
+        snapshot(old, track_types, markers),
+        snapshot(new, track_types, markers),
+        source_key,
+        markers,
+        properties,
+    )
@@ -0,0 +1,333 @@
+"""
+Whole-timeline reads through ``Timeline.Export``.
+
+Reading a timeline item by item costs a ``GetItemListInTrack`` call per track and
+several calls per item. ``Timeline.Export`` writes the whole timeline in one call;
+:func:`read_timeline` exports to a temporary file and parses it back into
+:class:`~dri.interchange.EditEvent` records. The readers of the EDL, FCPXML, FCP7 XML
+and OTIO exports live in :mod:`dri.interchange`, this module adds the edit index
+(``EXPORT_TEXT_CSV``/``EXPORT_TEXT_TAB``), Avid Log Exchange (``EXPORT_ALE``) and ASC
+CDL XML (``EXPORT_CDL``) readers.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.timeline_export import read_timeline
+...
+>>> resolve = Resolve.resolve_init()
+>>> timeline = resolve.GetProjectManager().GetCurrentProject().GetCurrentTimeline()
+>>> events = read_timeline(timeline)
+>>> len(events), events[0].track, events[0].name, events[0].record_in
+(5120, 'V1', 'A001C003_220101_R1AB.mov', 86400)
+>>> graded = read_timeline(timeline, Resolve.EXPORT_EDL, Resolve.EXPORT_CDL)
+>>> graded[0].cdl
+CDL(slope=(1.02, 1.0, 0.97), offset=(0.0, 0.0, 0.01), power=(1.0, 1.0, 1.0), saturation=0.9, id='')
+
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import tempfile
+import xml.etree.ElementTree as ElementTree
+
+from dri.errors import TimelineExportError
+from dri.interchange import (
+    CDL,
+    EditEvent,
+    iter_edl,
+    iter_fcpxml,
+    iter_otio,
+    iter_xmeml,
+)
+from dri.resolve import Resolve
+from dri.timecode import parse_fps, timecode_to_frames
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Iterator, Optional, Union
+
+    from dri.timeline import Timeline
+
+# Export type -> file extension, for the types this module can read back.
+EXTENSIONS = {
+    Resolve.EXPORT_EDL: ".edl",
+    Resolve.EXPORT_TEXT_CSV: ".csv",
+    Resolve.EXPORT_TEXT_TAB: ".txt",
+    Resolve.EXPORT_FCP_7_XML: ".xml",
+    Resolve.EXPORT_FCPXML_1_8: ".fcpxml",
+    Resolve.EXPORT_FCPXML_1_9: ".fcpxml",
+    Resolve.EXPORT_FCPXML_1_10: ".fcpxml",
+    Resolve.EXPORT_OTIO: ".otio",
+    Resolve.EXPORT_ALE: ".ale",
+    Resolve.EXPORT_CDL: ".cdl",
+}
+
+# Export types whose files do not record the frame rate.
+_NEEDS_FPS = frozenset(
+    {
+        Resolve.EXPORT_EDL,
+        Resolve.EXPORT_TEXT_CSV,
+        Resolve.EXPORT_TEXT_TAB,
+        Resolve.EXPORT_ALE,
+    }
+)
+
+# Edit index column -> accepted header names.
+_INDEX_COLUMNS = {
+    "number": ("#", "Event"),
+    "reel": ("Reel", "Tape"),
+    "track": ("V", "Track"),
+    "source_in": ("Source In",),
+    "source_out": ("Source Out",),
+    "record_in": ("Record In",),
+    "record_out": ("Record Out",),
+    "name": ("Name", "EDL Clip Name", "Clip Name"),
+    "path": ("File Path", "Source File", "Source File Path"),
+}
+
+
+def _column(row: dict[str, str], names: tuple[str, ...]) -> str:
+    for name in names:
+        value = row.get(name)
+        if value:
+            return value.strip()
+    return ""
+
+
+def _frames(timecode: str, fps: float) -> int:
+    return timecode_to_frames(timecode, fps) if timecode else 0
+
+
+def iter_edit_index(
+    path: Union[str, os.PathLike], fps: Union[float, str] = 24, delimiter: str = ","
+) -> Iterator[EditEvent]:
+    """
+    Yields the rows of an edit index exported as ``EXPORT_TEXT_CSV`` (`delimiter` ",")
+    or ``EXPORT_TEXT_TAB`` (`delimiter` "\\t").
+
+    Parameters
+    ----------
+    path
+        Exported file.
+    fps
+        Frame rate of the timecodes.
+    delimiter
+        Field delimiter.
+
+    """
+    fps = parse_fps(fps)
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as file:
+        for position, row in enumerate(csv.DictReader(file, delimiter=delimiter), 1):
+            values = {
+                field: _column(row, names) for field, names in _INDEX_COLUMNS.items()
+            }
+            track = values["track"].upper() or "V1"
+            if track in ("V", "A"):
+                track += "1"
+            yield EditEvent(
+                int(values["number"]) if values["number"].isdigit() else position,
+                track,
+                values["name"],
+                values["reel"],
+                values["path"],
+                _frames(values["source_in"], fps),
+                _frames(values["source_out"], fps),
+                _frames(values["record_in"], fps),
+                _frames(values["record_out"], fps),
+            )
+
+
+def iter_ale(
+    path: Union[str, os.PathLike], fps: Optional[Union[float, str]] = None
+) -> Iterator[EditEvent]:
+    """
+    Yields the clips of an Avid Log Exchange file.
+
+    ALE rows describe source clips and carry no record position, so the record
+    frames of the events are 0. The ``ASC_SOP`` and ``ASC_SAT`` columns, when present,
+    become the event's CDL.
+
+    Parameters
+    ----------
+    path
+        ALE file.
+    fps
+        Frame rate of the timecodes. Defaults to the ``FPS`` heading of the file, or 24.
+
+    """
+    heading: dict[str, str] = {}
+    columns: list[str] = []
+    section = ""
+    number = 0
+    rate = parse_fps(fps) if fps else None
+    with open(path, encoding="utf-8", errors="replace") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line.strip() in ("Heading", "Column", "Data"):
+                section = line.strip()
+                continue
+            if not line.strip():
+                continue
+            fields = line.split("\t")
+            if section == "Heading" and len(fields) >= 2:
+                heading[fields[0].strip().upper()] = fields[1].strip()
+            elif section == "Column":
+                columns = [field.strip() for field in fields]
+            elif section == "Data" and columns:
+                if rate is None:
+                    rate = parse_fps(heading.get("FPS") or 24)
+                row = dict(zip(columns, (field.strip() for field in fields)))
+                cdl = None
+                if row.get("ASC_SOP"):
+                    try:
+                        cdl = CDL.from_sop(row["ASC_SOP"], row.get("ASC_SAT") or 1)
+                    except ValueError:
+                        pass
+                number += 1
+                tracks = row.get("Tracks", "V").upper()
+                yield EditEvent(
+                    number,
+                    "V1" if "V" in tracks else "A1",
+                    row.get("Name", ""),
+                    row.get("Tape", "") or row.get("Reel", ""),
+                    row.get("Source File Path", "") or row.get("Source File", ""),
+                    _frames(row.get("Start", ""), rate),
+                    _frames(row.get("End", ""), rate),
+                    0,
+                    0,
+                    cdl,
+                )
+
+
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _triple(text: Optional[str], default: tuple[float, float, float]):
+    if not text:
+        return default
+    values = tuple(float(value) for value in text.split())
+    if len(values) != 3:
+        raise ValueError(f"Expected three values, got {text!r}")
+    return values
+
+
+def iter_cdl(path: Union[str, os.PathLike]) -> Iterator[CDL]:
+    """
+    Yields the ``ColorCorrection`` elements of an ASC CDL XML file (``.cdl``,
+    ``.ccc`` or ``.cc``), with or without the ASC namespace.
+
+    """
+    for _, element in ElementTree.iterparse(path, events=("end",)):
+        if _local(element.tag) != "ColorCorrection":
+            continue
+        values: dict[str, Optional[str]] = {}
+        for child in element.iter():
+            values[_local(child.tag)] = child.text
+        yield CDL(
+            _triple(values.get("Slope"), (1.0, 1.0, 1.0)),
+            _triple(values.get("Offset"), (0.0, 0.0, 0.0)),
+            _triple(values.get("Power"), (1.0, 1.0, 1.0)),
+            float(values.get("Saturation") or 1),
+            element.get("id", ""),
+        )
+        element.clear()
+
+
+def read_export(
+    path: Union[str, os.PathLike],
+    export_type: str,
+    fps: Optional[Union[float, str]] = None,
+) -> list[EditEvent]:
+    """
+    Parses a file written by ``Timeline.Export`` with the given export type.
+
+    CDL files hold no timing, their events carry the correction and its id as name.
+
+    Raises
+    ------
+    ValueError
+        If the export type cannot be read back, e.g. AAF or DRT.
+
+    """
+    if export_type == Resolve.EXPORT_EDL:
+        return list(iter_edl(path, fps or 24))
+    if export_type == Resolve.EXPORT_TEXT_CSV:
+        return list(iter_edit_index(path, fps or 24, ","))
+    if export_type == Resolve.EXPORT_TEXT_TAB:
+        return list(iter_edit_index(path, fps or 24, "\t"))
+    if export_type == Resolve.EXPORT_FCP_7_XML:
+        return list(iter_xmeml(path))
+    if export_type in (
+        Resolve.EXPORT_FCPXML_1_8,
+        Resolve.EXPORT_FCPXML_1_9,
+        Resolve.EXPORT_FCPXML_1_10,
+    ):
+        return list(iter_fcpxml(path))
+    if export_type == Resolve.EXPORT_OTIO:
+        return list(iter_otio(path, parse_fps(fps) if fps else None))
+    if export_type == Resolve.EXPORT_ALE:
+        return list(iter_ale(path, fps))
+    if export_type == Resolve.EXPORT_CDL:
+        return [
+            EditEvent(number, "V1", cdl.id, "", "", 0, 0, 0, 0, cdl)
+            for number, cdl in enumerate(iter_cdl(path), 1)
+        ]
+    raise ValueError(f"Cannot read back export type {export_type!r}")
+
+
+def read_timeline(
+    timeline: Timeline,
+    export_type: str = Resolve.EXPORT_FCP_7_XML,
+    export_subtype: str = Resolve.EXPORT_NONE,
+    fps: Optional[Union[float, str]] = None,
+    directory: Optional[Union[str, os.PathLike]] = None,
+) -> list[EditEvent]:
+    """
+    Exports `timeline` to a temporary file and parses it back.
+
+    The default FCP7 XML export holds every video and audio track, source paths and
+    frame-exact positions. EDL, CSV/TAB and ALE exports do not record the frame rate,
+    which is then read from the ``timelineFrameRate`` setting unless `fps` is given.
+
+    Parameters
+    ----------
+    timeline
+        Timeline to read.
+    export_type
+        One of the ``Resolve.EXPORT_*`` types of :data:`EXTENSIONS`.
+    export_subtype
+        Export subtype, e.g. ``Resolve.EXPORT_CDL`` to include CDLs in an EDL.
+    fps
+        Frame rate of the timecodes.
+    directory
+        Folder of the temporary file, which Resolve must be able to write to. Defaults
+        to the system temporary folder.
+
+    Returns
+    -------
+    list[EditEvent]
+        Events of the timeline.
+
+    Raises
+    ------
+    TimelineExportError
+        If ``Timeline.Export`` fails.
+    ValueError
+        If the export type cannot be read back.
+
+    """
+    extension = EXTENSIONS.get(export_type)
+    if extension is None:
+        raise ValueError(f"Cannot read back export type {export_type!r}")
+    if fps is None and export_type in _NEEDS_FPS:
+        fps = timeline.GetSetting("timelineFrameRate") or None
+    with tempfile.TemporaryDirectory(prefix="dri-export-", dir=directory) as folder:
+        path = os.path.join(folder, f"timeline{extension}")
+        if not timeline.Export(path, export_type, export_subtype):
+            raise TimelineExportError(
+                f"Timeline.Export failed for {export_type!r} to {path}"
+            )
+        return read_export(path, export_type, fps)
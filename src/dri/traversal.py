@@ -0,0 +1,348 @@
+"""
+Lazy traversal of a project's timelines and Media Pool.
+
+Audits usually nest loops over ``GetTimelineByIndex``, ``GetTrackCount``,
+``GetItemListInTrack`` and ``GetClipList`` and collect everything before looking at any
+of it. :func:`walk_project` is a generator over the same tree:
+
+.. code-block:: text
+
+    Project ─┬─ timeline ── track ── item
+             └─ folder ─┬─ folder ...
+                        └─ clip
+
+Nodes are produced depth first, as they are fetched, so the first results arrive after
+a handful of calls whatever the size of the project. Memory stays bounded by the
+current path: one timeline's track at a time, and one subfolder list per level of the
+folder tree. A `prune` predicate drops a node together with everything below it before
+any call is made for its children, and `kinds` stops the descent at the deepest kind
+asked for, e.g. ``kinds=("timeline",)`` never lists a track. Names are fetched on first
+use of :attr:`Node.name`.
+
+:func:`write_jsonl` streams nodes to a JSON Lines file, flushing as it goes, so an
+audit can be followed while it runs.
+
+Examples
+--------
+>>> from dri import Resolve
+>>> from dri.traversal import walk_project, write_jsonl
+...
+>>> resolve = Resolve.resolve_init()
+>>> project = resolve.GetProjectManager().GetCurrentProject()
+>>> offline = (
+...     node
+...     for node in walk_project(
+...         project,
+...         kinds=("item",),
+...         prune=lambda node: node.kind == "track" and node.track_type != "video",
+...     )
+...     if node.obj.GetMediaPoolItem() is None
+... )
+>>> next(offline).path
+('Reel 1', 'V2', 'Title 1')
+>>> with open("/tmp/clips.jsonl", "w") as file:
+...     write_jsonl(walk_project(project, kinds=("clip",)), file)
+2204
+
+"""
+
+from __future__ import annotations
+
+import json
+
+from dri.snapshot import TRACK_TYPES
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional
+
+    from dri.media_pool import MediaPool
+    from dri.project import Project
+
+KINDS = ("timeline", "track", "item", "folder", "clip")
+
+# Each kind and the kinds found below it.
+_SUBTREE = {
+    "timeline": frozenset({"timeline", "track", "item"}),
+    "track": frozenset({"track", "item"}),
+    "item": frozenset({"item"}),
+    "folder": frozenset({"folder", "clip"}),
+    "clip": frozenset({"clip"}),
+}
+
+
+class Node:
+    """
+    One timeline, track, timeline item, folder or clip of a walk.
+
+    Attributes
+    ----------
+    kind : str
+        One of :data:`KINDS`.
+    obj
+        The ``Timeline``, ``TimelineItem``, ``Folder`` or ``MediaPoolItem``. For tracks,
+        which have no API object, the timeline.
+    index : int
+        1-based position among the parent's children of the same kind, the track index
+        for tracks.
+    parent : Node or None
+        Parent node, None for timelines and the root folder.
+    track_type : str
+        "video", "audio" or "subtitle" for tracks and items, "" otherwise.
+
+    """
+
+    __slots__ = ("_name", "index", "kind", "obj", "parent", "track_type")
+
+    def __init__(
+        self,
+        kind: str,
+        obj: Any,
+        index: int,
+        parent: Optional[Node] = None,
+        track_type: str = "",
+    ):
+        self.kind = kind
+        self.obj = obj
+        self.index = index
+        self.parent = parent
+        self.track_type = track_type
+        self._name: Optional[str] = None
+
+    def __repr__(self) -> str:
+        return f"<Node {self.kind} {'/'.join(self.path)!r}>"
+
+    @property
+    def name(self) -> str:
+        """
+        ``GetName()`` of the object, ``GetTrackName()`` for tracks. Fetched once.
+
+        """
+        if self._name is None:
+            if self.kind == "track":
+                name = self.obj.GetTrackName(self.track_type, self.index)
+            else:
+                name = self.obj.GetName()
+            self._name = name or ""
+        return self._name
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        """
+        Names from the timeline or root folder down to this node.
+
+        """
+        names = []
+        node: Optional[Node] = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return tuple(reversed(names))
+
+    @property
+    def depth(self) -> int:
+        depth = 0
+        node = self.parent
+        while node is not None:
+            depth += 1
+            node = node.parent
+        return depth
+
+
+def _wanted(kind: str, kinds: frozenset[str]) -> bool:
+    # Whether `kind` or any kind below it is asked for.
+    return not kinds.isdisjoint(_SUBTREE[kind])
+
+
+def walk_timelines(
+    project: Project,
+    prune: Optional[Callable[[Node], bool]] = None,
+    kinds: Iterable[str] = ("timeline", "track", "item"),
+    track_types: Iterable[str] = TRACK_TYPES,
+) -> Iterator[Node]:
+    """
+    Yields the timelines of a project, each followed by its tracks, each followed by
+    its items in timeline order.
+
+    Parameters
+    ----------
+    project
+        Project to walk.
+    prune
+        Called with every node before it is yielded; when it returns True the node and
+        everything below it are skipped.
+    kinds
+        Kinds of nodes to yield, among "timeline", "track" and "item".
+    track_types
+        Track types to walk.
+
+    """
+    kinds = frozenset(kinds)
+    track_types = tuple(track_types)
+    tracks_wanted = _wanted("track", kinds)
+    for timeline_index in range(1, (project.GetTimelineCount() or 0) + 1):
+        timeline = project.GetTimelineByIndex(timeline_index)
+        if timeline is None:
+            continue
+        timeline_node = Node("timeline", timeline, timeline_index)
+        if prune is not None and prune(timeline_node):
+            continue
+        if "timeline" in kinds:
+            yield timeline_node
+        if not tracks_wanted:
+            continue
+        for track_type in track_types:
+            for track_index in range(1, (timeline.GetTrackCount(track_type) or 0) + 1):
+                track_node = Node(
+                    "track", timeline, track_index, timeline_node, track_type
+                )
+                if prune is not None and prune(track_node):
+                    continue
+                if "track" in kinds:
+                    yield track_node
+                if "item" not in kinds:
+                    continue
+                items = timeline.GetItemListInTrack(track_type, track_index) or []
+                for item_index, item in enumerate(items, 1):
+                    item_node = Node("item", item, item_index, track_node, track_type)
+                    if prune is None or not prune(item_node):
+                        yield item_node
+
+
+def walk_media_pool(
+    media_pool: MediaPool,
+    prune: Optional[Callable[[Node], bool]] = None,
+    kinds: Iterable[str] = ("folder", "clip"),
+) -> Iterator[Node]:
+    """
+    Yields the folders of a Media Pool depth first, from the root folder, each
+    followed by its clips and then its subfolders.
+
+    Parameters
+    ----------
+    media_pool
+        Media Pool to walk.
+    prune
+        Called with every node before it is yielded; when it returns True the node and
+        everything below it are skipped.
+    kinds
+        Kinds of nodes to yield, among "folder" and "clip".
+
+    """
+    kinds = frozenset(kinds)
+    if not _wanted("folder", kinds):
+        return
+    root = media_pool.GetRootFolder()
+    if root is None:
+        return
+    # Stack of subfolder iterators, one per level below the current folder.
+    pending: list[Iterator[Node]] = [iter([Node("folder", root, 1)])]
+    while pending:
+        folder_node = next(pending[-1], None)
+        if folder_node is None:
+            pending.pop()
+            continue
+        if prune is not None and prune(folder_node):
+            continue
+        if "folder" in kinds:
+            yield folder_node
+        folder = folder_node.obj
+        if "clip" in kinds:
+            for clip_index, clip in enumerate(folder.GetClipList() or [], 1):
+                clip_node = Node("clip", clip, clip_index, folder_node)
+                if prune is None or not prune(clip_node):
+                    yield clip_node
+        subfolders = folder.GetSubFolderList() or []
+        if subfolders:
+            pending.append(
+                iter(
+                    [
+                        Node("folder", subfolder, index, folder_node)
+                        for index, subfolder in enumerate(subfolders, 1)
+                    ]
+                )
+            )
+
+
+def walk_project(
+    project: Project,
+    prune: Optional[Callable[[Node], bool]] = None,
+    kinds: Iterable[str] = KINDS,
+    track_types: Iterable[str] = TRACK_TYPES,
+) -> Iterator[Node]:
+    """
+    Yields the timelines of a project with their tracks and items, see
+    :func:`walk_timelines`, then its Media Pool folders and clips, see
+    :func:`walk_media_pool`.
+
+    Parameters
+    ----------
+    project
+        Project to walk.
+    prune
+        Called with every node before it is yielded; when it returns True the node and
+        everything below it are skipped.
+    kinds
+        Kinds of nodes to yield, any of :data:`KINDS`. Parts of the tree holding none
+        of them are not walked.
+    track_types
+        Track types to walk.
+
+    Raises
+    ------
+    ValueError
+        If `kinds` holds an unknown kind.
+
+    """
+    kinds = frozenset(kinds)
+    unknown = kinds.difference(KINDS)
+    if unknown:
+        raise ValueError(f"Unknown node kinds: {sorted(unknown)}")
+    if _wanted("timeline", kinds):
+        yield from walk_timelines(project, prune, kinds, track_types)
+    if _wanted("folder", kinds):
+        media_pool = project.GetMediaPool()
+        if media_pool is not None:
+            yield from walk_media_pool(media_pool, prune, kinds)
+
+
+def _default_record(node: Node) -> dict[str, Any]:
+    return {"kind": node.kind, "path": list(node.path)}
+
+
+def write_jsonl(
+    nodes: Iterable[Node],
+    file: IO[str],
+    record: Callable[[Node], Mapping[str, Any]] = _default_record,
+    flush_every: int = 100,
+) -> int:
+    """
+    Writes one JSON object per node to a text file as the nodes arrive.
+
+    Parameters
+    ----------
+    nodes
+        Nodes, e.g. a :func:`walk_project` generator.
+    file
+        Open text file.
+    record
+        Returns the JSON-serializable mapping written for a node. Defaults to its kind
+        and path.
+    flush_every
+        Number of lines between flushes of `file`.
+
+    Returns
+    -------
+    int
+        Number of lines written.
+
+    """
+    count = 0
+    dumps = json.dumps
+    for node in nodes:
+        file.write(dumps(record(node), ensure_ascii=False, default=str) + "\n")
+        count += 1
+        if count % flush_every == 0:
+            file.flush()
+    file.flush()
+    return count
@@ -0,0 +1,13 @@
+import pytest
+
+from dri import fake
+
+
+@pytest.fixture
+def resolve():
+    return fake.reset()
+
+
+@pytest.fixture
+def project(resolve):
+    return resolve.GetProjectManager().GetCurrentProject()
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+from dri import fake
+from dri.aio import AsyncProject, AsyncResolve, AsyncTimeline, AsyncTimelineItem
+
+
+def test_facades_run_on_worker_thread(resolve, project):
+    project.populate(clip_count=4, timeline_count=1)
+
+    async def main():
+        async with AsyncResolve(resolve) as async_resolve:
+            project_manager = await async_resolve.GetProjectManager()
+            async_project = await project_manager.GetCurrentProject()
+            timeline = await async_project.GetTimelineByIndex(1)
+            items = await timeline.items()
+            names = [await item.GetName() for item in items]
+            thread = await timeline.run(lambda _: threading.current_thread().name)
+            same = await async_project.SetCurrentTimeline(timeline)
+            return async_project, timeline, items, names, thread, same
+
+    async_project, timeline, items, names, thread, same = asyncio.run(main())
+    assert isinstance(async_project, AsyncProject)
+    assert isinstance(timeline, AsyncTimeline)
+    assert all(isinstance(item, AsyncTimelineItem) for item in items)
+    expected = project.GetTimelineByIndex(1).GetItemListInTrack("video", 1)
+    assert items == expected
+    assert names == [item.GetName() for item in expected]
+    assert thread.startswith("dri")
+    # Facades passed as arguments reach the API unwrapped.
+    assert same is True
+
+
+def test_wait_render():
+    resolve = fake.reset(render_fps=100_000.0)
+    project = resolve.GetProjectManager().GetCurrentProject()
+    project.populate(clip_count=2, timeline_count=1)
+    project.SetCurrentTimeline(project.GetTimelineByIndex(1))
+    project.SetRenderSettings({"TargetDir": "/renders"})
+    job_id = project.AddRenderJob()
+    project.StartRendering([job_id])
+    seen = []
+
+    async def main():
+        async with AsyncResolve(None) as async_resolve:
+            async_project = AsyncProject(project, async_resolve.executor)
+            return await async_project.wait_render(
+                job_id, min_interval=0.001, progress=seen.append
+            )
+
+    status = asyncio.run(main())
+    assert status["JobStatus"] == "Complete"
+    assert all(0 <= update["CompletionPercentage"] < 100 for update in seen)
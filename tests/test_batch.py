@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from dri.batch import BatchRunner, ProjectInventory, ProjectRef, Task
+
+SHARED = {"DbType": "PostgreSQL", "DbName": "shared", "IpAddress": "10.0.0.2"}
+
+
+def _create(project_manager, db_info, tree):
+    project_manager.SetCurrentDatabase(db_info)
+    project_manager.GotoRootFolder()
+
+    def create(node):
+        for name, child in node.items():
+            if child is None:
+                project_manager.CreateProject(name)
+                continue
+            project_manager.CreateFolder(name)
+            project_manager.OpenFolder(name)
+            create(child)
+            project_manager.GotoParentFolder()
+
+    create(tree)
+
+
+@pytest.fixture
+def project_manager(resolve):
+    project_manager = resolve.GetProjectManager()
+    project_manager.add_database(SHARED)
+    _create(
+        project_manager,
+        {"DbType": "Disk", "DbName": "Local Database"},
+        {"p1": None, "F": {"p2": None, "G": {"p3": None}}},
+    )
+    _create(project_manager, SHARED, {"s1": None, "S": {"s2": None}})
+    return project_manager
+
+
+def test_inventory_cache(resolve, project_manager, tmp_path):
+    path = tmp_path / "inventory.json"
+    inventory = ProjectInventory.load(project_manager, path)
+    names = sorted(ref.name for ref in inventory)
+    assert names == ["Untitled Project", "p1", "p2", "p3", "s1", "s2"]
+    calls = resolve.call_count
+    cached = ProjectInventory.load(project_manager, path)
+    assert cached.projects == inventory.projects
+    assert resolve.call_count == calls
+
+
+def test_checkpoint_resume(project_manager, tmp_path):
+    inventory = ProjectInventory.scan(project_manager)
+    checkpoint = tmp_path / "checkpoint.jsonl"
+
+    def name(project, ref):
+        if ref.name == "p3":
+            raise RuntimeError("broken")
+        return project.GetName()
+
+    tasks = [Task("name", name)]
+    report = BatchRunner(project_manager, tasks, checkpoint=checkpoint).run(inventory)
+    assert [result.ref.name for result in report.failed] == ["p3"]
+    assert {result.ref.name: result.results.get("name") for result in report.results}[
+        "s2"
+    ] == "s2"
+    assert len(checkpoint.read_text().splitlines()) == len(inventory.projects)
+
+    retried = BatchRunner(project_manager, tasks, checkpoint=checkpoint).run(inventory)
+    assert [result.ref.name for result in retried.results] == ["p3"]
+    assert len(retried.resumed) == len(inventory.projects) - 1
+
+    skipped = BatchRunner(
+        project_manager, tasks, checkpoint=checkpoint, retry_failed=False
+    ).run(inventory)
+    assert not skipped.results
+    for line in checkpoint.read_text().splitlines():
+        assert "project" in json.loads(line)
+
+
+def test_keys_include_the_database_address():
+    first = ProjectRef("PostgreSQL", "shared", "10.0.0.1", ("A",), "p")
+    second = first._replace(ip_address="10.0.0.2")
+    assert first.key != second.key
+    assert ProjectRef("Disk", "Local Database", "", (), "p").key == (
+        "Disk/Local Database/p"
+    )
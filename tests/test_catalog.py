@@ -0,0 +1,60 @@
+import pytest
+
+from dri.catalog import MediaPoolCatalog
+
+
+@pytest.fixture
+def media_pool(project):
+    project.populate(clip_count=60, timeline_count=0, bin_count=3)
+    return project.GetMediaPool()
+
+
+@pytest.fixture
+def folder(media_pool):
+    return media_pool.GetRootFolder().GetSubFolderList()[0]
+
+
+def test_lookups_make_no_calls(resolve, media_pool):
+    catalog = MediaPoolCatalog.load(media_pool)
+    assert len(catalog) == 60
+    entry = next(iter(catalog))
+    calls = resolve.call_count
+    assert catalog.find_path(entry.path).unique_id == entry.unique_id
+    assert entry in catalog.by_reel(entry.reel)
+    assert entry in catalog.find_source(entry.reel, entry.start_tc)
+    assert resolve.call_count == calls
+
+
+def test_refresh_without_stale_folders(media_pool):
+    catalog = MediaPoolCatalog.load(media_pool)
+    assert catalog.refresh() == ([], [], [])
+
+
+def test_refresh_added_and_removed(media_pool, folder):
+    catalog = MediaPoolCatalog.load(media_pool)
+    clip = folder.GetClipList()[0]
+    media_pool.DeleteClips([clip])
+    media_pool.AddSubFolder(folder, "New")
+    folder.mark_stale()
+    changes = catalog.refresh()
+    assert [entry.unique_id for entry in changes.removed] == [clip.GetUniqueId()]
+    assert clip.GetUniqueId() not in catalog
+    assert len(catalog) == 59
+
+
+def test_refresh_rereads_changed_clips(media_pool, folder):
+    catalog = MediaPoolCatalog.load(media_pool)
+    clip = folder.GetClipList()[0]
+    old_reel = clip.GetClipProperty("Reel Name")
+    assert clip.SetClipProperty("Reel Name", "NEWREEL")
+    folder.mark_stale()
+    changes = catalog.refresh()
+    assert [entry.unique_id for entry in changes.changed] == [clip.GetUniqueId()]
+    assert [entry.unique_id for entry in catalog.by_reel("NEWREEL")] == [
+        clip.GetUniqueId()
+    ]
+    assert clip.GetUniqueId() not in {
+        entry.unique_id for entry in catalog.by_reel(old_reel)
+    }
+    assert not changes.added
+    assert not changes.removed
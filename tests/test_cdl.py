@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from dri.cdl import CdlApplier, ShotIndex, apply_corrections, cdl_map, read_corrections
+from dri.interchange import CDL
+from dri.resolve import Resolve
+
+
+def _random_cdl(rng: random.Random) -> CDL:
+    def triple(low, high):
+        return tuple(round(rng.uniform(low, high), 4) for _ in range(3))
+
+    return CDL(
+        triple(0.8, 1.2), triple(-0.05, 0.05), triple(0.8, 1.2), round(rng.random(), 4)
+    )
+
+
+@pytest.fixture
+def graded(project):
+    project.populate(clip_count=40, timeline_count=1, video_tracks=2)
+    timeline = project.GetTimelineByIndex(1)
+    items = [
+        item for track in (1, 2) for item in timeline.GetItemListInTrack("video", track)
+    ]
+    rng = random.Random(0)
+    for item in items:
+        item.SetCDL(cdl_map(_random_cdl(rng)))
+    return timeline, items
+
+
+def _exported(timeline, path, export_type, subtype=Resolve.EXPORT_NONE):
+    assert timeline.Export(str(path), export_type, subtype)
+    return read_corrections(path, 24)
+
+
+@pytest.mark.parametrize(
+    ("extension", "export_type", "subtype"),
+    [
+        ("ale", Resolve.EXPORT_ALE, Resolve.EXPORT_NONE),
+        ("cdl", Resolve.EXPORT_CDL, Resolve.EXPORT_NONE),
+        ("edl", Resolve.EXPORT_EDL, Resolve.EXPORT_CDL),
+    ],
+)
+def test_round_trip(graded, tmp_path, extension, export_type, subtype):
+    timeline, items = graded
+    path = tmp_path / f"grades.{extension}"
+    corrections = _exported(timeline, path, export_type, subtype)
+    assert corrections
+    for item in items:
+        item.SetCDL(cdl_map(CDL()))
+
+    report = apply_corrections(timeline, corrections)
+    assert report.ok
+    assert not report.unmatched
+
+    again = _exported(timeline, tmp_path / f"again.{extension}", export_type, subtype)
+    assert [correction.cdl[:4] for correction in again] == [
+        correction.cdl[:4] for correction in corrections
+    ]
+
+
+def test_applier_skips_unchanged(graded, resolve, tmp_path):
+    timeline, items = graded
+    corrections = _exported(timeline, tmp_path / "grades.ale", Resolve.EXPORT_ALE)
+    index = ShotIndex.build(timeline)
+    applier = CdlApplier()
+    first = apply_corrections(index, corrections, applier=applier)
+    calls = resolve.call_count
+    second = apply_corrections(index, corrections, applier=applier)
+    assert first.writes == len(items)
+    assert second.writes == 0
+    assert second.unchanged == len(items)
+    assert resolve.call_count == calls
+
+
+def test_apply_cdl_math():
+    np = pytest.importorskip("numpy")
+    from dri.cdl import LUMA_WEIGHTS, apply_cdl, cdl_lut
+
+    cdl = CDL((1.1, 0.9, 1.0), (0.01, 0.0, -0.02), (1.2, 1.0, 0.9), 0.8)
+    pixel = np.array([0.2, 0.5, 0.7])
+    graded = np.clip(pixel * cdl.slope + cdl.offset, 0, 1) ** cdl.power
+    luma = graded @ np.array(LUMA_WEIGHTS)
+    expected = np.clip(luma + (graded - luma) * cdl.saturation, 0, 1)
+    np.testing.assert_allclose(apply_cdl(pixel, cdl), expected, atol=1e-6)
+    np.testing.assert_allclose(apply_cdl(np.zeros(3), CDL()), np.zeros(3))
+    assert apply_cdl(pixel, [cdl, CDL()]).shape == (2, 3)
+    np.testing.assert_allclose(cdl_lut(cdl, 17).apply(pixel), expected, atol=2e-3)
+
+
+def test_cdl_lut_matches_exported_lut(graded):
+    pytest.importorskip("numpy")
+    from dri.cdl import cdl_lut
+    from dri.lut import export_lut
+
+    _, items = graded
+    # Within [0, 1] before the power: the fake does not apply the ASC clamp there.
+    cdl = CDL((0.9, 0.95, 1.0), (0.01, 0.0, -0.02), (1.2, 1.0, 0.9), 0.8)
+    items[0].SetCDL(cdl_map(cdl))
+    exported = export_lut(items[0], Resolve.EXPORT_LUT_17PTCUBE)
+    assert abs(exported.table - cdl_lut(cdl, 17).table).max() < 1e-4
@@ -0,0 +1,63 @@
+from datetime import datetime
+from fractions import Fraction
+
+import pytest
+
+from dri.clip_properties import (
+    FIELDS,
+    TIMECODE_FIELDS,
+    ClipProperties,
+    parse_clip_properties,
+)
+
+RAW = {
+    "Clip Name": "A001C001.mov",
+    "FPS": 23.976,
+    "Frames": "1205",
+    "Resolution": "3840x2160",
+    "Duration": "00:00:50:05",
+    "Start TC": "01:00:00:00",
+    "Drop frame": "0",
+    "Date Added": "Sat Nov 5 2022 20:16:20",
+    "Date Created": "Sat Nov 5 20:16:44 2022",
+    "Audio Ch": "",
+    "Bit Depth": "ten",
+    "Online Status": "Online",
+}
+
+
+def test_lazy_fields():
+    record = ClipProperties(RAW)
+    assert record.fps == Fraction(24000, 1001)
+    assert record.frames == 1205
+    assert (record.width, record.height) == (3840, 2160)
+    assert record.duration == 1205
+    assert record.start_frame == 86400
+    assert record.date_added == datetime(2022, 11, 5, 20, 16, 20)
+    assert record.date_created == datetime(2022, 11, 5, 20, 16, 44)
+    assert record.audio_channels is None
+    assert record.bit_depth is None
+    assert record.online is True
+    assert record.seconds == pytest.approx(1205 * 1001 / 24000)
+    assert record["Clip Name"] == "A001C001.mov"
+
+
+def test_batch_matches_lazy(project):
+    project.populate(clip_count=20, timeline_count=0)
+    root = project.GetMediaPool().GetRootFolder()
+    clips = root.GetSubFolderList()[0].GetClipList()
+    raws = [clip.GetClipProperty() for clip in clips]
+    raws.append(dict(RAW, **{"Duration": "bad"}))
+    records = parse_clip_properties(raws)
+    for raw, record in zip(raws, records):
+        assert record.as_dict() == ClipProperties(raw).as_dict()
+    assert records[-1].duration is None
+    assert records[0].name == clips[0].GetName()
+
+    subset = parse_clip_properties(raws, fields=["duration"])
+    assert [record.duration for record in subset] == [
+        record.duration for record in records
+    ]
+    with pytest.raises(ValueError):
+        parse_clip_properties(raws, fields=["nope"])
+    assert len(records[0].as_dict()) == len(FIELDS) + len(TIMECODE_FIELDS)
@@ -0,0 +1,34 @@
+import pytest
+
+from dri.columnar import export_metadata, read_table
+
+
+@pytest.mark.parametrize("file_format", ["dri", "parquet"])
+def test_read_table_interface(project, tmp_path, file_format):
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow")
+    project.populate(clip_count=30, timeline_count=0)
+    media_pool = project.GetMediaPool()
+    path = str(tmp_path / f"clips.{file_format}")
+    summary = export_metadata(media_pool, path, file_format=file_format)
+    assert (summary.rows, summary.format) == (30, file_format)
+
+    clips = [
+        clip
+        for folder in [media_pool.GetRootFolder()]
+        + media_pool.GetRootFolder().GetSubFolderList()
+        for clip in folder.GetClipList()
+    ]
+    frames = sorted(int(clip.GetClipProperty("Frames")) for clip in clips)
+    with read_table(path) as table:
+        assert table.num_rows == len(table) == 30
+        assert table.schema["Frames"] == "int64"
+        assert table.schema["FPS"] == "float64"
+        assert sorted(table.column("Frames")) == frames
+        rows = list(table.iter_rows())
+        assert sorted(row["Frames"] for row in rows) == frames
+        with pytest.raises(TypeError):
+            table.to_numpy("Clip Name")
+        np = pytest.importorskip("numpy")
+        assert table.to_numpy("Frames").sum() == sum(frames)
+        assert table.to_numpy("FPS").dtype == np.float64
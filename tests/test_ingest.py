@@ -0,0 +1,59 @@
+from dri.ingest import MediaIngest
+
+
+def make_card(root):
+    files = {
+        "A001C001.mov": 10,
+        "A001C002.mov": 10,
+        "A001C003.mov": 0,
+        "notes.txt": 10,
+        ".A001C001.mov": 10,
+        "audio/A001.wav": 10,
+    }
+    for name, size in files.items():
+        path = root / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"\0" * size)
+    return root
+
+
+def test_run_filters_and_dedupes(project, tmp_path):
+    card = make_card(tmp_path / "CARD")
+    media_pool = project.GetMediaPool()
+    ingest = MediaIngest(media_pool, workers=2)
+
+    report = ingest.run([str(card)])
+    assert report.scanned == 5
+    assert report.skipped == {"extension": 1, "too small": 1}
+    names = sorted(clip.GetName() for clip in report.imported)
+    assert names == ["A001.wav", "A001C001.mov", "A001C002.mov"]
+    assert report.calls == 1 and not report.failed
+
+    again = ingest.run([str(card)])
+    assert again.duplicates == 3
+    assert again.imported == [] and again.calls == 0
+
+
+def test_bad_file_is_isolated(project, tmp_path, monkeypatch):
+    paths = []
+    for index in range(8):
+        path = tmp_path / f"clip{index}.mov"
+        path.write_bytes(b"\0")
+        paths.append(str(path))
+    bad = paths[5]
+    media_pool = project.GetMediaPool()
+    import_media = media_pool.ImportMedia
+    calls = []
+
+    def flaky_import(chunk):
+        calls.append(list(chunk))
+        return import_media([path for path in chunk if path != bad])
+
+    monkeypatch.setattr(media_pool, "ImportMedia", flaky_import)
+    report = MediaIngest(media_pool, chunk_size=8, retries=1).submit(paths)
+    assert report.failed == [bad]
+    assert len(report.imported) == 7
+    # The good files are imported once, the bad one is retried once.
+    assert calls[0] == paths
+    assert all(chunk == [bad] for chunk in calls[1:])
+    assert len(calls) == 2
@@ -0,0 +1,158 @@
+import json
+
+import pytest
+
+from dri import MissingMediaError
+from dri.interchange import (
+    CDL,
+    import_timeline,
+    iter_events,
+    preflight,
+)
+from dri.resolve import Resolve
+
+EDL = """TITLE: t
+FCM: NON-DROP FRAME
+
+001  A001C003 V     C        14:02:11:05 14:02:12:05 01:00:00:00 01:00:01:00
+* FROM CLIP NAME: A001C003_220101_R1AB.mov
+*ASC_SOP (1.1 1.0 0.9)(0.01 0.0 -0.01)(1.0 1.0 1.0)
+*ASC_SAT 0.8
+"""
+
+XMEML = """<?xml version="1.0"?>
+<xmeml version="4"><sequence><name>s</name><rate><timebase>24</timebase></rate>
+<media><video><track>
+<clipitem id="c1"><name>A</name><start>0</start><end>48</end><in>10</in><out>58</out>
+<file id="f1"><name>A.mov</name><pathurl>file://localhost/media/A%20B.mov</pathurl>
+<timecode><reel><name>R1</name></reel></timecode></file></clipitem>
+<clipitem id="c2"><name>A</name><start>48</start><end>72</end><in>100</in><out>124</out>
+<file id="f1"/></clipitem>
+</track></video></media></sequence></xmeml>
+"""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [EDL, EDL.replace("*ASC_SOP", "*asc_sop").replace("*ASC_SAT", "* asc_sat")],
+    ids=["upper", "lower"],
+)
+def test_edl(tmp_path, text):
+    path = tmp_path / "a.edl"
+    path.write_text(text)
+    (event,) = iter_events(path, 24)
+    assert event.name == "A001C003_220101_R1AB.mov"
+    assert event.reel == "A001C003"
+    assert (event.record_in, event.record_out) == (86400, 86424)
+    assert event.source_out - event.source_in == 24
+    assert event.cdl == CDL((1.1, 1.0, 0.9), (0.01, 0.0, -0.01), (1.0, 1.0, 1.0), 0.8)
+
+
+def test_xmeml(tmp_path):
+    path = tmp_path / "a.xml"
+    path.write_text(XMEML)
+    events = list(iter_events(path))
+    assert [(event.source_in, event.source_out) for event in events] == [
+        (10, 58),
+        (100, 124),
+    ]
+    # The second clip item refers back to the file of the first.
+    assert {event.path for event in events} == {"/media/A B.mov"}
+    assert {event.reel for event in events} == {"R1"}
+
+
+def test_otio(tmp_path):
+    rational = {"OTIO_SCHEMA": "RationalTime.1", "rate": 24}
+    timeline = {
+        "OTIO_SCHEMA": "Timeline.1",
+        "name": "t",
+        "global_start_time": dict(rational, value=86400),
+        "tracks": {
+            "OTIO_SCHEMA": "Stack.1",
+            "children": [
+                {
+                    "OTIO_SCHEMA": "Track.1",
+                    "kind": "Video",
+                    "children": [
+                        {
+                            "OTIO_SCHEMA": "Gap.1",
+                            "source_range": {
+                                "start_time": dict(rational, value=0),
+                                "duration": dict(rational, value=10),
+                            },
+                        },
+                        {
+                            "OTIO_SCHEMA": "Clip.2",
+                            "name": "A",
+                            "source_range": {
+                                "start_time": dict(rational, value=5),
+                                "duration": dict(rational, value=20),
+                            },
+                            "media_references": {
+                                "DEFAULT_MEDIA": {
+                                    "OTIO_SCHEMA": "ExternalReference.1",
+                                    "target_url": "file:///media/zz.mov",
+                                }
+                            },
+                            "active_media_reference_key": "DEFAULT_MEDIA",
+                        },
+                    ],
+                }
+            ],
+        },
+    }
+    path = tmp_path / "a.otio"
+    path.write_text(json.dumps(timeline))
+    (event,) = iter_events(path)
+    assert event.path == "/media/zz.mov"
+    assert (event.source_in, event.source_out) == (5, 25)
+    assert (event.record_in, event.record_out) == (86410, 86430)
+
+
+def test_exported_edl_round_trip(project, tmp_path):
+    project.populate(clip_count=20, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    path = str(tmp_path / "a.edl")
+    assert timeline.Export(path, Resolve.EXPORT_EDL, Resolve.EXPORT_NONE)
+    items = timeline.GetItemListInTrack("video", 1)
+    events = [event for event in iter_events(path, 24) if event.track == "V1"]
+    assert [event.name for event in events] == [item.GetName() for item in items]
+    assert [event.record_in for event in events] == [item.GetStart() for item in items]
+
+
+def test_missing_media(project, tmp_path):
+    path = tmp_path / "a.xml"
+    path.write_text(XMEML)
+    report = preflight(path)
+    assert report.missing == ["/media/A B.mov"]
+    with pytest.raises(MissingMediaError) as error:
+        import_timeline(project.GetMediaPool(), path)
+    assert error.value.report.missing == ["/media/A B.mov"]
+
+
+@pytest.mark.parametrize("name", ["a.aaf", "a.drt", "other.xml"])
+def test_unreadable_files_are_imported_unchecked(project, tmp_path, name):
+    path = tmp_path / name
+    path.write_text("<other/>")
+    media_pool = project.GetMediaPool()
+    calls = []
+    media_pool.ImportTimelineFromFile = lambda *args: calls.append(args)
+    with pytest.warns(UserWarning, match="unchecked"):
+        import_timeline(media_pool, path)
+    assert calls == [(str(path),)]
+
+
+@pytest.mark.parametrize(
+    "name, text",
+    [("a.xml", XMEML[:200]), ("a.otio", '{"OTIO_SCHEMA": "Timeline.1", "tracks": ')],
+    ids=["xmeml", "otio"],
+)
+def test_truncated_files_are_imported_unchecked(project, tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    media_pool = project.GetMediaPool()
+    calls = []
+    media_pool.ImportTimelineFromFile = lambda *args: calls.append(args)
+    with pytest.warns(UserWarning, match="unchecked"):
+        import_timeline(media_pool, path)
+    assert calls == [(str(path),)]
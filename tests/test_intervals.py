@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from dri.intervals import IntervalTree, TimelineIndex
+from dri.snapshot import snapshot
+
+
+def test_tree_matches_brute_force():
+    rng = random.Random(3)
+    tree = IntervalTree(seed=1)
+    live = {}
+    for value in range(300):
+        start = rng.randrange(1000)
+        end = start + rng.randrange(50)
+        live[tree.add(start, end, value)] = (start, end, value)
+        if value % 4 == 0:
+            handle = rng.choice(list(live))
+            assert tree.remove(handle) == live.pop(handle)[2]
+    assert len(tree) == len(live)
+    for start, end in [(0, 1), (100, 300), (500, 501), (990, 2000), (7, 7)]:
+        expected = [v for s, e, v in live.values() if s < end and e > start]
+        assert sorted(tree.overlap(start, end)) == sorted(expected)
+    starts = [start for start, _, _ in tree]
+    assert starts == sorted(s for s, _, _ in live.values())
+
+
+def test_tree_errors():
+    tree = IntervalTree()
+    handle = tree.add(0, 10, "a")
+    with pytest.raises(ValueError):
+        tree.add(5, 4)
+    tree.remove(handle)
+    with pytest.raises(KeyError):
+        tree.remove(handle)
+    assert tree.stab(5) == []
+
+
+def test_timeline_index(resolve, project):
+    project.populate(clip_count=10, timeline_count=1, video_tracks=2)
+    timeline = project.GetTimelineByIndex(1)
+    index = TimelineIndex.from_timeline(timeline, track_types=("video",))
+    items = timeline.GetItemListInTrack("video", 1)
+    first = items[0]
+    start, end = first.GetStart(), first.GetEnd()
+
+    calls = resolve.call_count
+    assert [entry.item for entry in index.at(start, track_index=1)] == [first]
+    assert index.at(end - 1, track_index=1)[0].item is first
+    assert all(entry.item is not first for entry in index.at(end, track_index=1))
+    assert resolve.call_count == calls
+
+    from_snap = TimelineIndex.from_snapshot(snapshot(timeline, track_types=("video",)))
+    assert list(from_snap.entries()) == list(index.entries())
+
+    assert index.discard(first).item is first
+    assert first not in index
+    assert index.discard(first) is None
+    assert len(index) == len(from_snap) - 1
+    with pytest.raises(ValueError):
+        index.add(first, "effects", 1)
@@ -0,0 +1,80 @@
+import pytest
+
+from dri.lut import Lut, compose, load_lut, read_lut
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def pixels():
+    values = np.random.default_rng(0).random((500, 3)).astype(np.float32)
+    values[:3] = [[0, 0, 0], [1, 1, 1], [0.5, 0.25, 0.75]]
+    return values
+
+
+@pytest.fixture
+def gamma():
+    # Separable, so the exact result is known at every point.
+    ramp = np.linspace(0.0, 1.0, 17, dtype=np.float32)
+    blue, green, red = np.meshgrid(ramp, ramp, ramp, indexing="ij")
+    return Lut(np.stack([red, green, blue], axis=-1) ** 2)
+
+
+@pytest.mark.parametrize("interpolation", ["tetrahedral", "trilinear"])
+def test_identity(pixels, interpolation):
+    lut = Lut.identity(17)
+    np.testing.assert_allclose(lut.apply(pixels, interpolation), pixels, atol=1e-6)
+
+
+def test_lattice_points_are_exact(gamma):
+    lattice = np.linspace(0.0, 1.0, 17, dtype=np.float32)
+    points = np.stack([lattice, lattice[::-1], lattice], axis=-1)
+    for interpolation in ("tetrahedral", "trilinear"):
+        np.testing.assert_allclose(
+            gamma.apply(points, interpolation), points**2, atol=1e-6
+        )
+
+
+def test_integer_image(gamma):
+    image = np.array([[[0, 255, 128]]], dtype=np.uint8)
+    out = gamma.apply(image)
+    assert out.dtype == np.uint8
+    np.testing.assert_array_equal(out[0, 0, :2], [0, 255])
+
+
+def test_cube_round_trip(tmp_path, gamma, pixels):
+    path = tmp_path / "gamma.cube"
+    gamma.write_cube(path)
+    lut = read_lut(path)
+    assert (lut.size, lut.dimensions) == (17, 3)
+    np.testing.assert_allclose(lut.table, gamma.table, atol=1e-6)
+    assert load_lut(path) is load_lut(path)
+
+
+def test_1d_cube_round_trip(tmp_path):
+    lut = Lut(np.repeat(np.linspace(0, 1, 5, dtype=np.float32)[:, None] ** 2, 3, 1))
+    path = tmp_path / "square.cube"
+    lut.write_cube(path)
+    assert read_lut(path).dimensions == 1
+    np.testing.assert_allclose(read_lut(path).table, lut.table, atol=1e-6)
+
+
+def test_compose(gamma, pixels):
+    composed = compose([gamma, Lut.identity(33)])
+    np.testing.assert_allclose(composed.apply(pixels), gamma.apply(pixels), atol=2e-3)
+    twice = gamma.then(gamma)
+    np.testing.assert_allclose(
+        twice.apply(pixels), gamma.apply(gamma.apply(pixels)), atol=2e-2
+    )
+
+
+def test_workers_match(gamma):
+    image = np.random.default_rng(1).random((300, 300, 3)).astype(np.float32)
+    np.testing.assert_array_equal(gamma.apply(image), gamma.apply(image, workers=4))
+
+
+def test_invalid_cube(tmp_path):
+    path = tmp_path / "bad.cube"
+    path.write_text("LUT_3D_SIZE 2\n0 0 0\n")
+    with pytest.raises(ValueError):
+        read_lut(path)
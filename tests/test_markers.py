@@ -0,0 +1,50 @@
+from dri.markers import Marker, MarkerStore
+
+
+def test_lookups(resolve, project):
+    project.populate(clip_count=1, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    timeline.AddMarker(10, "Blue", "a", "", 5, "note-1")
+    timeline.AddMarker(30, "Red", "b", "", 1, "note-2")
+    timeline.AddMarker(50, "Blue", "c", "", 1, "note-1")
+    store = MarkerStore.load(timeline)
+
+    calls = resolve.call_count
+    assert store.get(10) == Marker(10, "Blue", "a", "", 5, "note-1")
+    assert [marker.frame for marker in store.at(14)] == [10]
+    assert store.at(15) == []
+    assert [marker.frame for marker in store.between(10, 50)] == [10, 30]
+    assert store.next_after(30).frame == 50
+    assert store.next_after(50) is None
+    assert [marker.name for marker in store.by_color("Blue")] == ["a", "c"]
+    assert store.by_custom_data("note-1").frame == 10
+    assert len(store.all_by_custom_data("note-1")) == 2
+    assert store.colors() == {"Blue": 2, "Red": 1}
+    assert resolve.call_count == calls
+
+
+def test_sync_touches_changed_frames_only(resolve, project):
+    project.populate(clip_count=1, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    for frame in range(0, 100, 10):
+        timeline.AddMarker(frame, "Blue", f"m{frame}", "", 1, "")
+    store = MarkerStore.load(timeline)
+    desired = [store.get(frame) for frame in range(0, 70, 10)]
+    desired[1] = desired[1]._replace(color="Red")
+    desired[2] = desired[2]._replace(custom_data="done")
+    desired.append(Marker(105, "Green", "new"))
+
+    diff = store.diff(desired)
+    assert [marker.frame for marker in diff.add] == [105]
+    assert diff.delete == [70, 80, 90]
+    assert [marker.frame for marker in diff.replace] == [10]
+    assert [marker.frame for marker in diff.custom_data] == [20]
+
+    calls = resolve.call_count
+    result = store.sync(desired)
+    assert result.ok
+    assert result.calls == diff.calls == 7
+    assert resolve.call_count - calls == 7
+    assert MarkerStore.load(timeline).diff(desired).calls == 0
+    assert store.get(10).color == "Red"
+    assert store.by_custom_data("done").frame == 20
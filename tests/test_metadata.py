@@ -0,0 +1,38 @@
+from dri.catalog import MediaPoolCatalog
+from dri.metadata import MetadataWriter
+
+
+def test_write_skips_unchanged(resolve, project):
+    project.populate(clip_count=3, timeline_count=0)
+    catalog = MediaPoolCatalog.load(project.GetMediaPool())
+    first, second, third = catalog
+    writer = MetadataWriter()
+
+    report = writer.write({first: {"Scene": "12", "Take": "3"}, second: {"Scene": "4"}})
+    assert report.ok
+    assert (report.changed, report.unchanged, report.keys) == (2, 0, 3)
+    assert (report.reads, report.writes) == (2, 2)
+    assert first.item.GetMetadata("Scene") == "12"
+
+    calls = resolve.call_count
+    report = writer.write(
+        {first: {"Scene": "12", "Take": "3"}, second: {"Scene": "5"}, third: {}},
+        properties={third: {"Reel Name": "B002"}},
+    )
+    assert (report.changed, report.unchanged) == (2, 1)
+    # Only the third clip's properties are read, the rest comes from the cache.
+    assert (report.reads, report.writes) == (1, 2)
+    assert resolve.call_count - calls == report.calls
+    assert second.item.GetMetadata("Scene") == "5"
+    assert third.item.GetClipProperty("Reel Name") == "B002"
+    assert writer.diff({second: {"Scene": "5"}}) == []
+
+
+def test_failed_keys_are_written_one_at_a_time(project):
+    project.populate(clip_count=1, timeline_count=0)
+    clip = next(iter(MediaPoolCatalog.load(project.GetMediaPool()))).item
+    report = MetadataWriter().write({clip: {"Scene": "1", "No Such Key": "x"}})
+    assert report.failed == [(clip, "No Such Key")]
+    # One failed batch call, then one call per key.
+    assert report.writes == 3
+    assert clip.GetMetadata("Scene") == "1"
@@ -0,0 +1,42 @@
+import gc
+
+from dri.proxy import ProxySession, RemoteProxy, wrap
+
+
+class _Named:
+    def __init__(self, name):
+        self.name = name
+
+    def GetName(self):
+        return self.name
+
+
+def test_read_transaction_memoizes(resolve):
+    proxy = wrap(resolve)
+    with proxy.read_transaction() as stats:
+        project = proxy.GetProjectManager().GetCurrentProject()
+        assert project.GetName() == project.GetName()
+    assert stats.saved == 1
+
+
+def test_mutation_invalidates(resolve):
+    proxy = wrap(resolve)
+    with proxy.read_transaction():
+        project = proxy.GetProjectManager().GetCurrentProject()
+        project.GetName()
+        assert project.SetName("Renamed")
+        assert project.GetName() == "Renamed"
+
+
+def test_dropped_target_id_is_not_reused():
+    session = ProxySession()
+    with session.read_transaction():
+        proxy = RemoteProxy(_Named("old"), session)
+        assert proxy.GetName() == "old"
+        target_id = id(proxy._target)
+        del proxy
+        gc.collect()
+        # The cached target is still alive, so no new object can take its id.
+        objects = [_Named("new") for _ in range(1000)]
+        assert all(id(obj) != target_id for obj in objects)
+        assert {session.call(obj, "GetName", (), {}) for obj in objects} == {"new"}
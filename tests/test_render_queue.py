@@ -0,0 +1,75 @@
+import pytest
+
+from dri import fake
+from dri.errors import RenderJobError
+from dri.render_queue import RenderJobSpec, RenderScheduler
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def project(clock):
+    resolve = fake.reset(render_fps=24.0, clock=clock)
+    project = resolve.GetProjectManager().GetCurrentProject()
+    project.populate(clip_count=6, timeline_count=3)
+    project.SetRenderSettings({"TargetDir": "/renders"})
+    return project
+
+
+def test_priority_order(project, clock):
+    scheduler = RenderScheduler(project, clock=clock, sleep=clock.sleep)
+    started = []
+    scheduler.on("started", lambda event: started.append(event.job.name))
+    timelines = [project.GetTimelineByIndex(index) for index in (1, 2, 3)]
+    for priority, timeline in zip((0, 2, 1), timelines):
+        scheduler.submit(RenderJobSpec(timeline, priority=priority))
+    assert project.GetCurrentTimeline() == timelines[0]
+
+    jobs = scheduler.run()
+    assert [job.state for job in jobs] == ["completed"] * 3
+    assert started == [timelines[i].GetName() for i in (1, 2, 0)]
+    assert scheduler.idle and scheduler.queue_eta() == 0.0
+    # The ETA keeps the scheduler from overshooting a finished job by a whole
+    # backed-off interval.
+    assert max(clock.sleeps) <= scheduler.max_interval
+    assert clock.now < sum(job.finished_at - job.started_at for job in jobs) + 3
+
+
+def test_failed_and_cancelled(project, clock):
+    scheduler = RenderScheduler(project, clock=clock, sleep=clock.sleep)
+    failed = scheduler.submit(RenderJobSpec(project.GetTimelineByIndex(1)))
+    cancelled = scheduler.submit(RenderJobSpec(project.GetTimelineByIndex(2)))
+    project.fail_render_job(failed.job_id)
+    assert scheduler.cancel(cancelled)
+    assert not scheduler.cancel(cancelled)
+
+    scheduler.run()
+    assert failed.state == "failed" and failed.error
+    assert cancelled.state == "cancelled"
+    assert cancelled.job_id not in [
+        info["JobId"] for info in project.GetRenderJobList()
+    ]
+
+
+def test_submit_errors(project, clock):
+    scheduler = RenderScheduler(project, clock=clock, sleep=clock.sleep)
+    with pytest.raises(RenderJobError):
+        scheduler.submit(RenderJobSpec(preset="No such preset"))
+    with pytest.raises(ValueError):
+        RenderScheduler(project, min_interval=2, max_interval=1)
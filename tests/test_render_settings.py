@@ -0,0 +1,92 @@
+import pytest
+
+from dri import RenderSettingsError
+from dri.render_settings import RenderCapabilities, apply_settings, compile_settings
+
+
+@pytest.fixture
+def capabilities(resolve, project, tmp_path):
+    return RenderCapabilities.load(resolve, project, tmp_path)
+
+
+def test_normalizes_and_reports_every_problem(capabilities):
+    compiled = compile_settings(
+        capabilities,
+        {"formatwidth": "3840", "FormatHeight": 2160.0, "FrameRate": "23.976"},
+        {"VideoQuality": "best", "MultiPassEncode": True, "Bogus": 1},
+        render_format="QuickTime",
+        codec="Apple ProRes 422 HQ",
+    )
+    assert (compiled.render_format, compiled.codec) == ("mov", "ProRes422HQ")
+    assert compiled.settings == {
+        "FormatWidth": 3840,
+        "FormatHeight": 2160,
+        "FrameRate": 23.976,
+        "VideoQuality": "Best",
+    }
+    assert len(compiled.problems) == 2
+
+
+def test_unavailable_resolution(capabilities):
+    compiled = compile_settings(
+        capabilities,
+        {"FormatWidth": 1000, "FormatHeight": 1000},
+        render_format="mp4",
+        codec="H264",
+    )
+    assert not compiled.ok
+
+
+def test_one_settings_call(resolve, project, capabilities):
+    apply_settings(project, capabilities, {"TargetDir": "/tmp"}, render_format="mp4")
+    calls = resolve.call_count
+    compiled = apply_settings(
+        project,
+        capabilities,
+        {"TargetDir": "/renders", "FrameRate": "24"},
+        {"FormatWidth": 3840, "FormatHeight": 2160, "EncodingProfile": "Main10"},
+        render_format="mp4",
+        codec="H.265",
+    )
+    # Current format and codec, one resolution table, the switch, the settings.
+    assert resolve.call_count - calls == 4
+    assert compiled.codec == "H265"
+    assert project.GetCurrentRenderFormatAndCodec() == {
+        "format": "mp4",
+        "codec": "H265",
+    }
+
+
+def test_format_without_codec_keeps_the_current_codec(project, capabilities):
+    assert project.SetCurrentRenderFormatAndCodec("mov", "H264")
+    compiled = apply_settings(
+        project, capabilities, {"MultiPassEncode": True}, render_format="mp4"
+    )
+    assert compiled.codec == "H264"
+    assert project.GetCurrentRenderFormatAndCodec() == {
+        "format": "mp4",
+        "codec": "H264",
+    }
+
+
+def test_format_without_codec_refuses_an_unknown_codec(project, capabilities):
+    assert project.SetCurrentRenderFormatAndCodec("mov", "ProRes422HQ")
+    with pytest.raises(RenderSettingsError):
+        apply_settings(
+            project, capabilities, {"TargetDir": "/tmp"}, render_format="mp4"
+        )
+    assert project.GetCurrentRenderFormatAndCodec()["format"] == "mov"
+
+
+def test_capabilities_are_persisted(resolve, project, capabilities):
+    compile_settings(
+        capabilities,
+        {"FormatWidth": 1920, "FormatHeight": 1080},
+        render_format="mp4",
+        codec="H264",
+    )
+    assert capabilities.save()
+    calls = resolve.call_count
+    cached = RenderCapabilities.load(resolve, None, capabilities.path.rsplit("/", 1)[0])
+    assert cached.resolutions("mp4", "H264") == capabilities.resolutions("mp4", "H264")
+    assert resolve.call_count - calls == 2  # GetProductName, GetVersionString
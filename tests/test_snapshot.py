@@ -0,0 +1,47 @@
+from dri.snapshot import snapshot
+
+
+def test_snapshot_matches_timeline(resolve, project):
+    project.populate(
+        clip_count=10, timeline_count=1, video_tracks=2, markers_per_item=2
+    )
+    timeline = project.GetTimelineByIndex(1)
+    expected = {
+        track: [
+            (item, item.GetName(), item.GetStart(), item.GetEnd())
+            for item in timeline.GetItemListInTrack("video", track)
+        ]
+        for track in (1, 2)
+    }
+    snap = snapshot(timeline, track_types=("video",))
+    assert len(snap) == len(expected[1]) + len(expected[2])
+
+    calls = resolve.call_count
+    for track, items in expected.items():
+        rows = snap.track_rows("video", track)
+        assert len(rows) == len(items)
+        for row, (item, name, start, end) in zip(rows, items):
+            record = snap.record(row)
+            assert (record.item, record.name, record.start, record.end) == (
+                item,
+                name,
+                start,
+                end,
+            )
+            assert snap.item_at("video", track, start) == row
+            assert snap.item_at("video", track, end - 1) == row
+            assert len(snap.markers(row)) == 2
+    assert snap.item_at("video", 1, snap.record(0).start - 1) is None
+    assert snap.track_rows("video", 9) == range(0, 0)
+    # Queries are served from the columns.
+    assert resolve.call_count == calls
+
+
+def test_rows_named(project):
+    project.populate(clip_count=5, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    snap = snapshot(timeline, track_types=("video",), markers=False)
+    first = snap.record(0)
+    assert 0 in snap.rows_named(first.name)
+    assert snap.rows_named("no such clip") == []
+    assert snap.markers(0) == []
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from dri.stills import StillExporter, read_ppm
+
+
+def test_run_returns_album_stills_in_order(resolve, project, tmp_path):
+    project.populate(clip_count=12, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    project.SetCurrentTimeline(timeline)
+    resolve.OpenPage("color")
+    timeline.GrabAllStills(1)
+    album = project.GetGallery().GetCurrentStillAlbum()
+    stills = album.GetStills()
+    with ThreadPoolExecutor(4) as executor:
+        results = StillExporter(
+            album, tmp_path / "out", chunk_size=3, executor=executor
+        ).run()
+    assert [result.label for result in results] == [
+        album.GetLabel(still) for still in stills
+    ]
+    assert all(result.ok for result in results)
+    assert all(len(result.sha256) == 64 for result in results)
+
+
+def test_run_keeps_given_order(resolve, project, tmp_path):
+    project.populate(clip_count=6, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    project.SetCurrentTimeline(timeline)
+    resolve.OpenPage("color")
+    stills = timeline.GrabAllStills(1)[::-1]
+    album = project.GetGallery().GetCurrentStillAlbum()
+    with ThreadPoolExecutor(2) as executor:
+        results = StillExporter(
+            album, tmp_path / "out", convert_to=None, executor=executor
+        ).run(stills)
+    assert [result.still for result in results] == stills
+    width, height = read_ppm(results[0].path)[:2]
+    assert width > 0 and height > 0
+
+
+def test_early_stop_keeps_shared_executor(resolve, project, tmp_path):
+    project.populate(clip_count=8, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    project.SetCurrentTimeline(timeline)
+    resolve.OpenPage("color")
+    timeline.GrabAllStills(1)
+    album = project.GetGallery().GetCurrentStillAlbum()
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    with ThreadPoolExecutor(1) as executor:
+        exporter = StillExporter(
+            album, tmp_path / "out", scratch_folder=scratch, executor=executor
+        )
+        results = exporter.iter_results()
+        assert next(results).ok
+        results.close()
+        assert list(scratch.iterdir()) == []
+        assert executor.submit(len, "abc").result() == 3
@@ -0,0 +1,80 @@
+import pytest
+
+from dri import fake
+from dri.thumbnails import (
+    ContactSheet,
+    decode_thumbnail,
+    harvest_thumbnails,
+    timeline_frames,
+    write_contact_sheet,
+)
+
+
+@pytest.fixture
+def resolve():
+    return fake.reset(thumbnail_size=(8, 4))
+
+
+@pytest.fixture
+def timeline(project):
+    project.populate(clip_count=5, timeline_count=1)
+    timeline = project.GetTimelineByIndex(1)
+    project.SetCurrentTimeline(timeline)
+    return timeline
+
+
+def test_harvest_restores_playhead_and_page(resolve, timeline):
+    resolve.OpenPage("edit")
+    timeline.SetCurrentTimecode("01:00:00:10")
+    frames = timeline_frames(timeline)
+    thumbnails = harvest_thumbnails(
+        timeline, frames + [timeline.GetEndFrame() + 10], resolve=resolve
+    )
+    first = next(thumbnails)
+    assert resolve.GetCurrentPage() == "color"
+    assert first.frame == frames[0]
+    assert (first.height, first.width) == (4, 8)
+    # Frames past the end have no thumbnail and are skipped.
+    assert [thumbnail.frame for thumbnail in thumbnails] == frames[1:]
+    assert resolve.GetCurrentPage() == "edit"
+    assert timeline.GetCurrentTimecode() == "01:00:00:10"
+
+    # Stopping early restores them as well.
+    thumbnails = harvest_thumbnails(timeline, frames, resolve=resolve)
+    next(thumbnails)
+    thumbnails.close()
+    assert resolve.GetCurrentPage() == "edit"
+    assert timeline.GetCurrentTimecode() == "01:00:00:10"
+
+
+def test_decode_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        decode_thumbnail({"width": 2, "height": 2, "data": "AAAA"})
+    with pytest.raises(ValueError):
+        decode_thumbnail({"width": 1, "height": 1, "data": "!"})
+    pixels = decode_thumbnail({"width": 1, "height": 1, "data": "AQID"})
+    assert pixels.tolist() == [[[1, 2, 3]]]
+
+
+def test_contact_sheet(timeline, tmp_path):
+    path = tmp_path / "sheet.ppm"
+    placed = write_contact_sheet(timeline, path, count=5, columns=2)
+    assert placed == timeline_frames(timeline, 5)
+    with ContactSheet.open(path) as sheet:
+        assert (sheet.width, sheet.height) == (16, 12)
+        assert (sheet.columns, sheet.count) == (2, 5)
+    other = tmp_path / "other.ppm"
+    other.write_bytes(b"P6\n1 1\n255\n000")
+    with pytest.raises(ValueError):
+        ContactSheet.open(other)
+
+
+def test_contact_sheet_tiles(timeline, tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "sheet.ppm"
+    frames = timeline_frames(timeline)
+    write_contact_sheet(timeline, path, frames, columns=2)
+    expected = list(harvest_thumbnails(timeline, frames))
+    with ContactSheet.open(path) as sheet:
+        for index, thumbnail in enumerate(expected):
+            assert sheet.tile(index).tobytes() == thumbnail.pixels.tobytes()
@@ -0,0 +1,46 @@
+import pytest
+
+from dri.timecode import (
+    frames_to_timecode,
+    frames_to_timecodes,
+    parse_fps,
+    timecode_to_frames,
+    timecodes_to_frames,
+)
+
+
+@pytest.mark.parametrize(
+    ("frames", "fps", "timecode"),
+    [
+        (86400, 24, "01:00:00:00"),
+        (107892, 29.97, "01:00:00;00"),
+        (1800, 29.97, "00:01:00;02"),
+        (17982, 29.97, "00:10:00;00"),
+        (215784, 59.94, "01:00:00;00"),
+    ],
+)
+def test_drop_frame(frames, fps, timecode):
+    drop_frame = ";" in timecode
+    assert frames_to_timecode(frames, fps, drop_frame=drop_frame) == timecode
+    assert timecode_to_frames(timecode, fps) == frames
+
+
+@pytest.mark.parametrize("fps", [23.976, 25, 29.97, 59.94])
+def test_round_trip(fps):
+    drop_frame = round(parse_fps(fps)) % 30 == 0 and parse_fps(fps) % 1 != 0
+    for frames in range(0, 200_000, 997):
+        timecode = frames_to_timecode(frames, fps, drop_frame=drop_frame)
+        assert timecode_to_frames(timecode, fps) == frames
+
+
+def test_parse_fps():
+    assert parse_fps("29.97 DF") == pytest.approx(29.97)
+    with pytest.raises(ValueError):
+        parse_fps("0")
+
+
+def test_batched_matches_scalar():
+    frames = list(range(0, 100_000, 1234))
+    timecodes = [frames_to_timecode(frame, 29.97, drop_frame=True) for frame in frames]
+    assert list(frames_to_timecodes(frames, 29.97, drop_frame=True)) == timecodes
+    assert [int(frame) for frame in timecodes_to_frames(timecodes, 29.97)] == frames
@@ -0,0 +1,70 @@
+from collections import Counter
+
+from dri.timeline_diff import diff_timelines
+
+
+def build(project, name, edits):
+    media_pool = project.GetMediaPool()
+    timeline = media_pool.CreateEmptyTimeline(name)
+    project.SetCurrentTimeline(timeline)
+    start = timeline.GetStartFrame()
+    media_pool.AppendToTimeline(
+        [
+            {
+                "mediaPoolItem": clip,
+                "mediaType": 1,
+                "startFrame": source_in,
+                "endFrame": source_out,
+                "recordFrame": start + record,
+            }
+            for clip, source_in, source_out, record in edits
+        ]
+    )
+    return timeline
+
+
+def bin_clips(project):
+    return project.GetMediaPool().GetRootFolder().GetSubFolderList()[0].GetClipList()
+
+
+def test_trimmed_moved_inserted_removed(project):
+    project.populate(clip_count=5, timeline_count=0, seed=1)
+    a, b, c, d, e = bin_clips(project)
+    old = build(
+        project, "v1", [(a, 0, 19, 0), (b, 0, 19, 20), (c, 0, 19, 40), (d, 0, 19, 60)]
+    )
+    new = build(
+        project, "v2", [(a, 0, 19, 0), (b, 0, 14, 20), (e, 0, 9, 40), (c, 0, 19, 50)]
+    )
+
+    delta = diff_timelines(old, new, track_types=("video",))
+    assert delta.counts() == Counter(trimmed=1, moved=1, inserted=1, removed=1)
+    trimmed = delta.trimmed[0]
+    assert trimmed.old.name == trimmed.new.name == b.GetName()
+    assert trimmed.fields == ("source_out", "record_out")
+    moved = delta.moved[0]
+    assert moved.new.name == c.GetName()
+    assert moved.fields == ("record_in", "record_out")
+    assert delta.inserted[0].new.name == e.GetName()
+    assert delta.removed[0].old.name == d.GetName()
+    # Ordered by record in.
+    assert [change.kind for change in delta] == [
+        "trimmed",
+        "inserted",
+        "moved",
+        "removed",
+    ]
+    assert not diff_timelines(old, old)
+
+
+def test_marker_change_is_modified(project):
+    project.populate(clip_count=2, timeline_count=0)
+    a, b = bin_clips(project)
+    old = build(project, "v1", [(a, 0, 9, 0), (b, 0, 9, 10)])
+    new = build(project, "v2", [(a, 0, 9, 0), (b, 0, 9, 10)])
+    new.GetItemListInTrack("video", 1)[1].AddMarker(2, "Red", "fix", "", 1, "")
+
+    delta = diff_timelines(old, new, track_types=("video",))
+    assert [(change.kind, change.fields) for change in delta] == [
+        ("modified", ("markers",))
+    ]
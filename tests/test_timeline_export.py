@@ -0,0 +1,61 @@
+import pytest
+
+from dri.errors import TimelineExportError
+from dri.resolve import Resolve
+from dri.timeline_export import EXTENSIONS, read_timeline
+
+TIMED = [
+    Resolve.EXPORT_EDL,
+    Resolve.EXPORT_TEXT_CSV,
+    Resolve.EXPORT_TEXT_TAB,
+    Resolve.EXPORT_FCP_7_XML,
+    Resolve.EXPORT_FCPXML_1_8,
+    Resolve.EXPORT_FCPXML_1_9,
+    Resolve.EXPORT_FCPXML_1_10,
+    Resolve.EXPORT_OTIO,
+]
+
+
+@pytest.fixture
+def timeline(project):
+    project.populate(clip_count=12, timeline_count=1, video_tracks=2)
+    return project.GetTimelineByIndex(1)
+
+
+@pytest.mark.parametrize("export_type", TIMED)
+def test_round_trip(timeline, export_type):
+    expected = sorted(
+        (f"V{track}", item.GetName(), item.GetStart(), item.GetEnd())
+        for track in (1, 2)
+        for item in timeline.GetItemListInTrack("video", track)
+    )
+    events = read_timeline(timeline, export_type)
+    found = sorted(
+        (event.track, event.name, event.record_in, event.record_out)
+        for event in events
+        if event.track.startswith("V")
+    )
+    if export_type == Resolve.EXPORT_EDL:
+        # The fake's EDL is a single-track cut list, read without the track number.
+        expected = sorted(("V1",) + row[1:] for row in expected)
+    assert found == expected
+    for event in events:
+        assert event.source_out - event.source_in == event.record_out - event.record_in
+
+
+def test_untimed_exports(timeline):
+    names = [item.GetName() for item in timeline.GetItemListInTrack("video", 1)]
+    ale = read_timeline(timeline, Resolve.EXPORT_ALE)
+    assert [event.name for event in ale][: len(names)] == names
+    cdl = read_timeline(timeline, Resolve.EXPORT_CDL)
+    assert [event.name for event in cdl][: len(names)] == names
+    assert all(event.cdl is not None for event in cdl)
+
+
+def test_errors(timeline, monkeypatch):
+    assert set(TIMED) < set(EXTENSIONS)
+    with pytest.raises(ValueError):
+        read_timeline(timeline, Resolve.EXPORT_AAF)
+    monkeypatch.setattr(timeline, "Export", lambda *args: False)
+    with pytest.raises(TimelineExportError):
+        read_timeline(timeline)
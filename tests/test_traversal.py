@@ -0,0 +1,71 @@
+import io
+import json
+
+import pytest
+
+from dri.traversal import walk_project, write_jsonl
+
+
+@pytest.fixture
+def populated(project):
+    return project.populate(
+        clip_count=12,
+        timeline_count=3,
+        bin_count=2,
+        items_per_timeline=6,
+        video_tracks=2,
+    )
+
+
+def calls_of(resolve, nodes):
+    calls = resolve.call_count
+    found = list(nodes)
+    return found, resolve.call_count - calls
+
+
+def test_kinds_stop_the_descent(resolve, populated):
+    nodes, calls = calls_of(resolve, walk_project(populated, kinds=("timeline",)))
+    assert [node.kind for node in nodes] == ["timeline"] * 3
+    # GetTimelineCount and one GetTimelineByIndex per timeline, no track is listed.
+    assert calls == 4
+
+    nodes, calls = calls_of(resolve, walk_project(populated, kinds=("clip",)))
+    assert len(nodes) == 12
+    assert {node.parent.kind for node in nodes} == {"folder"}
+    # GetMediaPool, GetRootFolder, then GetClipList and GetSubFolderList per folder.
+    assert calls == 2 + 2 * 3
+
+
+def test_prune_skips_subtrees(resolve, populated):
+    nodes, calls = calls_of(
+        resolve,
+        walk_project(
+            populated,
+            kinds=("item",),
+            prune=lambda node: node.kind == "timeline" and node.index != 2,
+            track_types=("video",),
+        ),
+    )
+    assert len(nodes) == 6
+    assert {node.parent.parent.index for node in nodes} == {2}
+    # GetTimelineCount, 3 x GetTimelineByIndex, then GetTrackCount and one
+    # GetItemListInTrack per track of the second timeline only.
+    assert calls == 1 + 3 + 1 + 2
+
+    def first_bin(node):
+        return node.kind == "folder" and node.name == "Bin 1"
+
+    clips = list(walk_project(populated, kinds=("clip",), prune=first_bin))
+    assert len(clips) == 6
+    assert {node.parent.name for node in clips} == {"Bin 2"}
+
+
+def test_write_jsonl(populated):
+    file = io.StringIO()
+    count = write_jsonl(walk_project(populated, kinds=("timeline", "folder")), file)
+    records = [json.loads(line) for line in file.getvalue().splitlines()]
+    assert count == len(records) == 3 + 3
+    assert records[0] == {"kind": "timeline", "path": [records[0]["path"][0]]}
+    assert records[-1]["path"] == ["Master", "Bin 2"]
+    with pytest.raises(ValueError):
+        next(walk_project(populated, kinds=("bin",)))